@@ -13,7 +13,14 @@ Supports:
 - Validation message extraction
 """
 
-from typing import Optional, Dict, List, Any
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Optional, Dict, List, Any, Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from backend.application.session import (
     PageAnalysisResult,
     PageForm,
@@ -22,6 +29,17 @@ from backend.application.session import (
 from src.core.logger import log
 
 
+DEFAULT_ANALYSIS_CACHE_SIZE = 256
+DEFAULT_ANALYSIS_TTL_SECONDS = 600.0
+_TRACKING_PARAMS = frozenset({
+    "trk", "trkinfo", "trackingid", "refid", "lipi", "midtoken", "midsig", "ebp",
+    "originalsubdomain", "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid",
+})
+
+_SHARED_ANALYSIS_CACHE: Optional["PageAnalysisCache"] = None
+_SHARED_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+
 class PageAnalyzer:
     """Analyzes page structures and produces normalized results."""
 
@@ -314,23 +332,128 @@ class PageAnalyzer:
 
 
 class PageAnalysisCache:
-    """Caches page analysis results."""
-
-    def __init__(self):
-        """Initialize cache."""
-        self.cache: Dict[str, PageAnalysisResult] = {}
-
-    def get(self, page_url: str) -> Optional[PageAnalysisResult]:
-        """Get cached analysis for URL."""
-        return self.cache.get(page_url)
+    """
+    Bounded LRU of page analysis results with a time-to-live.
+
+    Entries are keyed by (normalized URL, digest of the page_data structure):
+    tracking query parameters do not cause misses, and a wizard step whose
+    fields change under the same URL gets a fresh analysis instead of a stale
+    one.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_ANALYSIS_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_ANALYSIS_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache.
 
-    def cache_analysis(self, url: str, analysis: PageAnalysisResult) -> None:
+        Args:
+            max_entries: Maximum cached analyses before LRU eviction
+            ttl_seconds: Age after which an entry is treated as a miss
+            clock: Monotonic time source
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.clock = clock
+        self.cache: "OrderedDict[tuple, tuple[float, PageAnalysisResult]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(page_url: str, page_data: Optional[Dict[str, Any]] = None) -> tuple:
+        """Cache key for a page: normalized URL plus structure digest."""
+        structure = {name: value for name, value in (page_data or {}).items() if name != "url"}
+        encoded = json.dumps(structure, sort_keys=True, default=str).encode("utf-8")
+        return normalize_page_url(page_url), hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def get(self, page_url: str, page_data: Optional[Dict[str, Any]] = None) -> Optional[PageAnalysisResult]:
+        """Get cached analysis for a page, or None if missing or expired."""
+        key = self.key(page_url, page_data)
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            stored_at, analysis = entry
+            if self.clock() - stored_at > self.ttl_seconds:
+                del self.cache[key]
+                self.stats["expirations"] += 1
+                self.stats["misses"] += 1
+                return None
+            self.cache.move_to_end(key)
+            self.stats["hits"] += 1
+        # Shallow copy so the result reports the URL actually visited.
+        return replace(analysis, url=page_url)
+
+    def cache_analysis(
+        self,
+        url: str,
+        analysis: PageAnalysisResult,
+        page_data: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Cache analysis result."""
-        self.cache[url] = analysis
+        key = self.key(url, page_data)
+        with self._lock:
+            self.cache[key] = (self.clock(), analysis)
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def get_or_analyze(self, page_data: Dict[str, Any], analyzer: "PageAnalyzer") -> tuple[PageAnalysisResult, bool]:
+        """
+        Return the cached analysis for page_data, analyzing it on a miss.
+
+        Returns:
+            Tuple of (analysis, cache_hit)
+        """
+        url = page_data.get("url", "")
+        cached = self.get(url, page_data)
+        if cached is not None:
+            return cached, True
+        analysis = analyzer.analyze_page(page_data)
+        self.cache_analysis(url, analysis, page_data)
+        return analysis, False
 
     def clear(self) -> None:
         """Clear cache."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
+
+    def info(self) -> dict:
+        """Hit/miss/eviction/expiration counters and current size."""
+        with self._lock:
+            return {**self.stats, "size": len(self.cache), "max_entries": self.max_entries}
+
+
+def normalize_page_url(url: str) -> str:
+    """
+    Canonical form of a page URL for caching.
+
+    Lowercases scheme and host, drops the fragment, a trailing slash and
+    tracking parameters (utm_*, LinkedIn trk/refId/trackingId, click ids),
+    and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url or "")
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in _TRACKING_PARAMS and not name.lower().startswith("utm_")
+    )
+    path = (parts.path.rstrip("/") or "/") if parts.netloc else parts.path
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def get_page_analysis_cache() -> PageAnalysisCache:
+    """Process-wide analysis cache shared by every workflow handler."""
+    global _SHARED_ANALYSIS_CACHE
+    with _SHARED_ANALYSIS_CACHE_LOCK:
+        if _SHARED_ANALYSIS_CACHE is None:
+            _SHARED_ANALYSIS_CACHE = PageAnalysisCache()
+        return _SHARED_ANALYSIS_CACHE
 
 
 def create_page_analyzer() -> PageAnalyzer:
@@ -14,9 +14,10 @@ Output: page_data dict with strict contract
 """
 
 from typing import Optional, List, Dict, Any
-from bs4 import BeautifulSoup
 import re
 
+from backend.application.parsed_page import ParsedPage, as_parsed_page
+
 
 class PageDataContract:
     """Strict page_data contract definition."""
@@ -65,7 +66,7 @@ class PageDataProducer:
         """Initialize producer."""
         pass
 
-    def produce(self, raw_page: dict) -> dict:
+    def produce(self, raw_page: dict, parsed: Optional[ParsedPage] = None) -> dict:
         """
         Transform raw page into page_data.
 
@@ -73,20 +74,20 @@ class PageDataProducer:
             raw_page: {
                 "url": str,
                 "title": str,
-                "html": str,
+                "html": str or ParsedPage,
                 "platform": str
             }
+            parsed: Already parsed page to reuse instead of raw_page["html"]
 
         Returns:
             page_data: Normalized contract
         """
         url = raw_page.get("url", "")
         title = raw_page.get("title", "")
-        html = raw_page.get("html", "")
         platform = raw_page.get("platform", "").lower()
 
-        # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
+        # Parse HTML (shared with other consumers of the same page)
+        soup = (parsed or as_parsed_page(raw_page.get("html", ""))).soup
 
         # Platform-specific extraction
         extractor_name = self.PLATFORM_EXTRACTORS.get(platform)
@@ -0,0 +1,120 @@
+"""
+Parsed Page
+
+One parse of a page's HTML shared by every consumer of that page.
+
+PageDataProducer walks a BeautifulSoup tree, while LinkedInJobParser,
+LinkedInDetector and HTMLQuestionParser scan the raw HTML with substring
+checks and regexes. A ParsedPage wraps the HTML once and exposes each of
+those views lazily: the soup (built with the fastest installed parser),
+the lowercased text, and memoized regex scans. Pages are cached by HTML
+digest, so passing the same HTML string to several consumers still costs
+one parse.
+
+Consumers accept either a str or a ParsedPage.
+"""
+
+import hashlib
+import importlib.util
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import List, Optional, Union
+
+
+DEFAULT_CACHE_SIZE = 16
+
+# lxml builds the same tree several times faster than the pure-Python parser.
+SOUP_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
+_PAGES: "OrderedDict[str, ParsedPage]" = OrderedDict()
+_PAGES_LOCK = threading.Lock()
+
+
+def html_digest(html: str) -> str:
+    """Content digest used to key parsed pages."""
+    return hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class ParsedPage:
+    """
+    Lazily parsed views over one page's HTML.
+
+    Args:
+        html: Page HTML
+        digest: Precomputed html_digest (optional)
+    """
+
+    def __init__(self, html: str, digest: Optional[str] = None):
+        self.html = html or ""
+        self.digest = digest or html_digest(self.html)
+        self._scans: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.html)
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercased HTML for case-insensitive substring checks."""
+        return self.html.lower()
+
+    @cached_property
+    def soup(self):
+        """BeautifulSoup tree, built on first access."""
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(self.html, SOUP_PARSER)
+
+    def contains(self, text: str, ignore_case: bool = False) -> bool:
+        """Substring check against the raw or lowercased HTML."""
+        if ignore_case:
+            return text.lower() in self.lower
+        return text in self.html
+
+    def findall(self, pattern: str, flags: int = 0) -> List[re.Match]:
+        """All matches of pattern over the HTML, scanned once per pattern."""
+        key = (pattern, flags)
+        matches = self._scans.get(key)
+        if matches is None:
+            matches = list(re.finditer(pattern, self.html, flags))
+            self._scans[key] = matches
+        return matches
+
+    def search(self, pattern: str, flags: int = 0) -> Optional[re.Match]:
+        """First match of pattern, memoized like findall."""
+        key = ("search", pattern, flags)
+        if key not in self._scans:
+            self._scans[key] = re.search(pattern, self.html, flags)
+        return self._scans[key]
+
+
+HTMLSource = Union[str, ParsedPage]
+
+
+def get_parsed_page(html: str, cache_size: int = DEFAULT_CACHE_SIZE) -> ParsedPage:
+    """ParsedPage for html, shared with earlier callers of the same content."""
+    digest = html_digest(html or "")
+    with _PAGES_LOCK:
+        page = _PAGES.get(digest)
+        if page is not None:
+            _PAGES.move_to_end(digest)
+            return page
+        page = ParsedPage(html, digest)
+        _PAGES[digest] = page
+        while len(_PAGES) > cache_size:
+            _PAGES.popitem(last=False)
+        return page
+
+
+def as_parsed_page(html: Optional[HTMLSource]) -> ParsedPage:
+    """Accept either raw HTML or a ParsedPage."""
+    if isinstance(html, ParsedPage):
+        return html
+    return get_parsed_page(html or "")
+
+
+def clear_parsed_pages() -> None:
+    """Drop cached pages."""
+    with _PAGES_LOCK:
+        _PAGES.clear()
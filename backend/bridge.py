@@ -10,6 +10,8 @@ from datetime import datetime
 from backend.runtime.task_model import Task, TaskStatus, TaskResult
 from backend.persistence.task_storage import TaskStorage
 from backend.queue.queue import Queue
+from backend.queue.retry_policy import RetryPolicy
+from backend.queue.scheduling import FairShareScheduler
 from backend.state.state_manager import StateManager
 from backend.events.event_bus import EventBus
 from backend.workers.browser_worker import WorkerPool, BrowserWorker
@@ -45,20 +47,24 @@ class RuntimeBridge:
         # Initialize runtime infrastructure
         self.storage = TaskStorage(db_path)
         self.event_bus = EventBus()
-        self.queue = Queue(self.storage)
-        self.state_manager = StateManager(self.storage, self.event_bus)
+        retry_policy = RetryPolicy.from_settings(settings)
+        self.queue = Queue(self.storage, retry_policy, FairShareScheduler.from_settings(settings))
+        self.state_manager = StateManager(self.storage, self.event_bus, retry_policy)
         self.manual_review_queue = ManualReviewQueue(self.storage)
 
         # Initialize worker pool
         self.worker_pool = WorkerPool()
-        browser_worker = BrowserWorker(
-            worker_id="browser-worker-1",
-            apply_functions=platforms,
-            settings=settings,
-            profile=profile,
-            resume_path=resume_path,
-        )
-        self.worker_pool.register(browser_worker)
+        browser_workers = max(1, int(settings.get("app", {}).get("browser_workers", 1)))
+        for index in range(1, browser_workers + 1):
+            browser_worker = BrowserWorker(
+                worker_id=f"browser-worker-{index}",
+                apply_functions=platforms,
+                settings=settings,
+                profile=profile,
+                resume_path=resume_path,
+                capacity=int(settings.get("app", {}).get("browser_worker_capacity", 1)),
+            )
+            self.worker_pool.register(browser_worker)
 
         # Initialize orchestrator
         self.orchestrator = RuntimeOrchestrator(
@@ -82,6 +88,10 @@ class RuntimeBridge:
 
         self.event_bus.subscribe("TASK_CREATED", log_event("TASK_CREATED"))
         self.event_bus.subscribe("TASK_QUEUED", log_event("TASK_QUEUED"))
+        self.event_bus.subscribe(
+            "TASK_QUEUED_BATCH",
+            lambda data: log(f"[Runtime] TASK_QUEUED_BATCH: {data.get('count')} tasks"),
+        )
         self.event_bus.subscribe("TASK_STARTED", log_event("TASK_STARTED"))
         self.event_bus.subscribe("TASK_COMPLETED", log_event("TASK_COMPLETED"))
         self.event_bus.subscribe("TASK_FAILED", log_event("TASK_FAILED"))
@@ -123,28 +133,60 @@ class RuntimeBridge:
         )
 
         log(f"[Bridge] Enqueued job: {job_key} platform={job.get('platform')} workflow={classification.workflow_type.value} confidence={classification.confidence_score:.0%}")
-        return taskjob.get('platform')}")
         return task.task_id
 
     def enqueue_jobs(self, jobs: list, priority: int = 0) -> list:
         """
-        Enqueue multiple jobs.
+        Enqueue multiple jobs in one transaction.
+
+        Jobs are keyed and classified in one pass; jobs whose task already
+        exists (or repeat within the batch) are skipped. New tasks, their
+        payloads and history rows are written with one commit and announced
+        with a single TASK_QUEUED_BATCH event.
 
         Args:
             jobs: List of job dicts
             priority: Task priority
 
         Returns:
-            List of task IDs
+            List of task IDs that were queued
         """
-        task_ids = []
+        from src.core.controller import _make_job_key
+
+        tasks = []
         for job in jobs:
             try:
-                task_id = self.enqueue_job(job, priority)
-                task_ids.append(task_id)
+                job_key = _make_job_key(job)
+                classification = self.classifier.classify(url=job.get("url", ""), page_title=job.get("title", ""))
             except Exception as e:
                 log(f"[Bridge] Failed to enqueue job: {e}")
-        return task_ids
+                continue
+            tasks.append(
+                Task(
+                    task_id=job_key,
+                    job_id=job_key,
+                    source_platform=job.get("platform", "unknown"),
+                    status=TaskStatus.DISCOVERED,
+                    priority=priority,
+                    metadata={
+                        "job": job,
+                        "workflow_type": classification.workflow_type.value,
+                        "workflow_confidence": classification.confidence_score,
+                        "execution_strategy": classification.execution_strategy.value,
+                        "workflow_indicators": classification.indicators,
+                    },
+                    workflow_type=classification.workflow_type.value,
+                    execution_strategy=classification.execution_strategy.value,
+                    workflow_confidence=classification.confidence_score,
+                    workflow_indicators=classification.indicators,
+                )
+            )
+
+        queued = self.state_manager.enqueue_tasks(tasks)
+        if queued:
+            self.orchestrator.notify()
+        log(f"[Bridge] Enqueued {len(queued)} jobs ({len(jobs) - len(queued)} skipped)")
+        return [task.task_id for task in queued]
 
     def get_queue_size(self) -> int:
         """Get number of queued tasks."""
@@ -6,6 +6,7 @@ class EventType(str, Enum):
     """Runtime event types."""
     TASK_CREATED = "TASK_CREATED"
     TASK_QUEUED = "TASK_QUEUED"
+    TASK_QUEUED_BATCH = "TASK_QUEUED_BATCH"
     TASK_STARTED = "TASK_STARTED"
     TASK_COMPLETED = "TASK_COMPLETED"
     TASK_FAILED = "TASK_FAILED"
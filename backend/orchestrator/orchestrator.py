@@ -4,7 +4,7 @@ from datetime import datetime
 from backend.runtime.task_model import Task, TaskStatus, TaskResult
 from backend.queue.queue import Queue
 from backend.state.state_manager import StateManager
-from backend.workers.browser_worker import WorkerPool
+from backend.workers.browser_worker import Worker, WorkerPool
 from backend.manual_review.review_queue import ManualReviewQueue
 from backend.workflow.handlers import WorkflowHandlerRegistry
 from src.core.logger import log
@@ -20,6 +20,9 @@ class RuntimeOrchestrator:
         worker_pool: WorkerPool,
         manual_review_queue: ManualReviewQueue,
         max_concurrent_tasks: int = 5,
+        max_idle_seconds: float = 30.0,
+        min_poll_seconds: float = 1.0,
+        busy_defer_seconds: float = 5.0,
     ):
         """
         Initialize orchestrator.
@@ -30,6 +33,10 @@ class RuntimeOrchestrator:
             worker_pool: Pool of available workers
             manual_review_queue: Manual review queue
             max_concurrent_tasks: Maximum concurrent task executions
+            max_idle_seconds: Longest sleep when no task is due
+            min_poll_seconds: Pause between batches while tasks are due
+            busy_defer_seconds: Delay before a task whose eligible workers
+                are all at capacity is due again
         """
         self.queue = queue
         self.state_manager = state_manager
@@ -38,23 +45,55 @@ class RuntimeOrchestrator:
         self.max_concurrent_tasks = max_concurrent_tasks
         self._active_tasks: dict[str, Task] = {}
         self._running = False
+        self.max_idle_seconds = max_idle_seconds
+        self.min_poll_seconds = min_poll_seconds
+        self.busy_defer_seconds = busy_defer_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
         # Initialize workflow routing
         self.workflow_registry = WorkflowHandlerRegistry()
 
     async def start(self) -> None:
-        """Start orchestrator event loop."""
+        """
+        Start orchestrator event loop.
+
+        Between batches the loop sleeps until the earliest queued task is
+        due (retry backoff), up to max_idle_seconds, instead of polling
+        every second. notify() wakes it early when new work is enqueued.
+        """
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         try:
             while self._running:
+                self._wakeup.clear()
                 await self._process_batch()
-                await asyncio.sleep(1)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._idle_seconds())
+                except asyncio.TimeoutError:
+                    pass
         except Exception as e:
             print(f"Orchestrator error: {e}")
             self._running = False
 
+    def _idle_seconds(self) -> float:
+        """Seconds until the next queued task is due, within the poll bounds."""
+        due = self.queue.next_due_time()
+        if due is None:
+            return self.max_idle_seconds
+        wait = (due - datetime.utcnow()).total_seconds()
+        return min(self.max_idle_seconds, max(self.min_poll_seconds, wait))
+
+    def notify(self) -> None:
+        """Wake the event loop early; safe to call from any thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+
     def stop(self) -> None:
         """Stop orchestrator."""
         self._running = False
+        self.notify()
 
     async def _process_batch(self) -> None:
         """Process batch of queued tasks."""
@@ -63,14 +102,31 @@ class RuntimeOrchestrator:
         if available_slots <= 0:
             return
 
-        # Dequeue tasks
-        tasks = self.queue.dequeue(limit=available_slots)
+        # Dequeue tasks, fair-shared across platforms when a scheduler is set
+        tasks = self.queue.dequeue(limit=available_slots, running=self._running_by_platform())
         if not tasks:
             return
 
-        # Execute tasks concurrently
-        execution_tasks = [self._execute_task(task) for task in tasks]
-        await asyncio.gather(*execution_tasks, return_exceptions=True)
+        # Mark the whole batch RUNNING in one commit before any work is awaited
+        with self.state_manager.batch():
+            started = []
+            for task in tasks:
+                start = self._start_task(task)
+                if start is not None:
+                    started.append((task, *start))
+
+        # Execute tasks concurrently; no transaction is open meanwhile
+        outcomes = await asyncio.gather(
+            *(self._run_task(task, worker) for task, worker, error in started if error is None),
+            return_exceptions=True,
+        )
+
+        # Completion transitions share one commit once every task has returned
+        outcomes = iter(outcomes)
+        with self.state_manager.batch():
+            for task, worker, error in started:
+                outcome = error if error is not None else next(outcomes)
+                await self._finish_task(task, worker, outcome)
 
     async def _execute_task(self, task: Task) -> None:
         """
@@ -79,7 +135,37 @@ class RuntimeOrchestrator:
         Args:
             task: Task to execute
         """
+        start = self._start_task(task)
+        if start is None:
+            return
+        worker, error = start
+        if error is None:
+            try:
+                outcome = await self._run_task(task, worker)
+            except Exception as e:
+                outcome = e
+        else:
+            outcome = error
+        await self._finish_task(task, worker, outcome)
+
+    def _start_task(self, task: Task) -> Optional[tuple[Optional[Worker], Optional[str]]]:
+        """
+        Route task, reserve a worker and transition it to RUNNING.
+
+        A task whose eligible workers are all at capacity stays QUEUED and is
+        deferred by busy_defer_seconds; a task no registered worker can
+        handle goes to manual review. With no workers registered, tasks run
+        under the workflow handler alone.
+
+        Args:
+            task: Dequeued task
+
+        Returns:
+            (reserved worker or None, error message if the task did not start),
+            or None if the task was deferred or escalated
+        """
         self._active_tasks[task.task_id] = task
+        worker = None
 
         try:
             # Route to workflow handler
@@ -87,25 +173,70 @@ class RuntimeOrchestrator:
 
             if not workflow_result.get("valid", False):
                 log(f"[Orchestrator] Task {task.task_id} workflow routing failed: {workflow_result.get('reason')}")
-                await self._handle_execution_error(task, workflow_result.get("reason", "Unknown error"))
-                return
+                return None, workflow_result.get("reason", "Unknown error")
 
             log(f"[Orchestrator] Task {task.task_id} routed to {workflow_result.get('handler')}")
             log(f"  - Next step: {workflow_result.get('next_step')}")
             log(f"  - Requires: {workflow_result.get('requires')}")
 
+            # Reserve a slot on the least-loaded eligible worker, if any
+            worker = self.worker_pool.acquire(task)
+            if worker is None and self.worker_pool.get_worker_count():
+                self._active_tasks.pop(task.task_id, None)
+                if self.worker_pool.has_eligible_worker(task):
+                    log(f"[Orchestrator] Task {task.task_id} deferred: no free worker slot")
+                    self.queue.defer(task, self.busy_defer_seconds)
+                else:
+                    log(f"[Orchestrator] Task {task.task_id} escalated: no worker handles {task.source_platform}")
+                    self._handle_no_worker(task)
+                return None
+
             # Transition to running
-            self.state_manager.transition_to_running(task, "workflow_handler")
+            self.state_manager.transition_to_running(task, worker.worker_id if worker else "workflow_handler")
+            return worker, None
 
-            # In Phase 3+, execute task based on workflow_result
-            # For now, just mark as completed for routing validation
-            result = TaskResult.APPLIED
-            await self._handle_result(task, result)
+        except Exception as e:
+            return worker, str(e)
+
+    async def _run_task(self, task: Task, worker: Optional[Worker]) -> TaskResult:
+        """
+        Execute a RUNNING task. Writes no state; _finish_task records the result.
+
+        Args:
+            task: Task to execute
+            worker: Reserved worker, if any
+
+        Returns:
+            Execution result
+        """
+        # In Phase 3+, execute task based on workflow_result
+        # For now, just mark as completed for routing validation
+        return TaskResult.APPLIED
+
+    async def _finish_task(self, task: Task, worker: Optional[Worker], outcome) -> None:
+        """
+        Record a task's outcome and free its worker slot.
+
+        Args:
+            task: Executed task
+            worker: Worker reserved by _start_task, if any
+            outcome: TaskResult, or the error (message or exception) that stopped the task
+        """
+        try:
+            if isinstance(outcome, TaskResult):
+                try:
+                    await self._handle_result(task, outcome)
+                    return
+                except Exception as e:
+                    outcome = e
+            await self._handle_execution_error(task, str(outcome))
 
         except Exception as e:
-            await self._handle_execution_error(task, str(e))
+            log(f"[Orchestrator] Task {task.task_id} outcome not recorded: {e}")
 
         finally:
+            if worker:
+                self.worker_pool.release(worker.worker_id)
             self._active_tasks.pop(task.task_id, None)
 
     def _route_to_workflow(self, task: Task) -> dict:
@@ -183,8 +314,7 @@ class RuntimeOrchestrator:
                 "reason": "manual_review_required",
                 "metadata": task.metadata,
             }
-            self.state_manager.transition_to_manual_review(task, context)
-            self.manual_review_queue.enqueue(task, context)
+            self.state_manager.transition_to_manual_review(task, context, record_review=True)
         elif result == TaskResult.SKIPPED:
             self.state_manager.transition_to_completed(task, result)
         elif result == TaskResult.DEFERRED:
@@ -202,8 +332,9 @@ class RuntimeOrchestrator:
         """
         if task.is_retryable():
             # Retry
-            self.state_manager.transition_to_failed(task, error)
-            self.queue.retry(task)
+            with self.state_manager.batch():
+                self.state_manager.transition_to_failed(task, error)
+                self.state_manager.retry_task(task)
         else:
             # Escalate to manual review
             context = {
@@ -213,10 +344,9 @@ class RuntimeOrchestrator:
                 "max_retries": task.max_retries,
                 "metadata": task.metadata,
             }
-            self.state_manager.transition_to_manual_review(task, context)
-            self.manual_review_queue.enqueue(task, context)
+            self.state_manager.transition_to_manual_review(task, context, record_review=True)
 
-    async def _handle_no_worker(self, task: Task) -> None:
+    def _handle_no_worker(self, task: Task) -> None:
         """
         Handle case where no suitable worker found.
 
@@ -228,8 +358,13 @@ class RuntimeOrchestrator:
             "platform": task.source_platform,
             "metadata": task.metadata,
         }
-        self.state_manager.transition_to_manual_review(task, context)
-        self.manual_review_queue.enqueue(task, context)
+        self.state_manager.transition_to_manual_review(task, context, record_review=True)
+
+    def _running_by_platform(self) -> dict:
+        running: dict[str, int] = {}
+        for task in self._active_tasks.values():
+            running[task.source_platform] = running.get(task.source_platform, 0) + 1
+        return running
 
     def get_active_task_count(self) -> int:
         """
@@ -262,6 +397,8 @@ class RuntimeOrchestrator:
             "queue_size": self.get_queue_size(),
             "max_concurrent": self.max_concurrent_tasks,
             "workers": self.worker_pool.get_worker_count(),
+            "worker_utilisation": self.worker_pool.get_utilisation()["utilisation"],
+            "platforms": self.queue.get_platform_stats(running=self._running_by_platform()),
         }
 
     async def process_single_task(self, task_id: str) -> Optional[Task]:
@@ -305,8 +442,7 @@ class RuntimeOrchestrator:
         Returns:
             Created task
         """
-        task = self.state_manager.create_task(task_id, job_id, source_platform, priority)
-        if metadata:
-            task.metadata.update(metadata)
+        task = self.state_manager.create_task(task_id, job_id, source_platform, priority, metadata=metadata)
         self.state_manager.transition_to_queued(task)
+        self.notify()
         return task
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import sqlite3
 from typing import Optional, List
 from datetime import datetime
@@ -5,8 +7,44 @@ from backend.runtime.task_model import Task, TaskStatus, TaskResult
 from backend.manual_review.review_queue import ManualReviewRecord
 
 
+_WORKFLOW_KEYS = ("_workflow_type", "_execution_strategy", "_workflow_confidence", "_workflow_indicators")
+
+# Tasks in these states are not written again in normal operation, so their
+# payload fingerprints are dropped; a later write falls back to the full overlay.
+_SETTLED_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.MANUAL_REVIEW})
+
+_TASK_COLUMNS = (
+    "t.task_id, t.job_id, t.source_platform, t.status, t.priority, t.retry_count, "
+    "t.max_retries, t.worker_id, t.result, t.error_message, t.manual_review_context, "
+    "t.metadata, t.created_at, t.updated_at, t.started_at, t.completed_at, t.not_before"
+)
+
+
+def _workflow_fields(task: Task) -> dict:
+    return {
+        "_workflow_type": task.workflow_type,
+        "_execution_strategy": task.execution_strategy,
+        "_workflow_confidence": task.workflow_confidence,
+        "_workflow_indicators": task.workflow_indicators,
+    }
+
+
+def _fingerprint(value) -> bytes:
+    """Compact digest of a metadata value, for detecting changed payload keys."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).digest()
+
+
 class TaskStorage:
-    """Persistence layer for runtime tasks, bridging to existing storage."""
+    """
+    Persistence layer for runtime tasks, bridging to existing storage.
+
+    The job payload (metadata and workflow classification) is immutable after
+    enqueue and lives in task_payloads, written once. State transitions only
+    touch the narrow mutable columns of tasks; metadata keys added after
+    enqueue (e.g. easy_apply, error), and payload keys whose value changed,
+    are kept as a small overlay in tasks.metadata.
+    """
 
     def __init__(self, db_path: str):
         """
@@ -16,6 +54,9 @@ class TaskStorage:
             db_path: Path to SQLite database
         """
         self.db_path = db_path
+        # task_id -> {payload metadata key: value fingerprint}, for unsettled
+        # tasks whose payload was written or read here
+        self._payload_keys: dict[str, dict] = {}
         self._init_schema()
 
     def _connect(self) -> sqlite3.Connection:
@@ -44,7 +85,24 @@ class TaskStorage:
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
                     started_at TEXT,
-                    completed_at TEXT
+                    completed_at TEXT,
+                    not_before TEXT
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+            if "not_before" not in columns:
+                conn.execute("ALTER TABLE tasks ADD COLUMN not_before TEXT")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_not_before ON tasks(status, not_before)")
+
+            # Immutable job payload, written once at enqueue
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS task_payloads (
+                    task_id TEXT PRIMARY KEY,
+                    metadata TEXT,
+                    workflow TEXT,
+                    stored_at TEXT NOT NULL
                 )
                 """
             )
@@ -81,6 +139,7 @@ class TaskStorage:
                 )
                 """
             )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_task_history_task ON task_history(task_id, timestamp)")
 
             conn.commit()
 
@@ -88,28 +147,22 @@ class TaskStorage:
         """
         Save task to database.
 
+        Inserts the task (or updates its mutable state if it exists) and
+        writes the job payload the first time the task is seen.
+
         Args:
             task: Task to save
         """
-        import json
-
-        # Preserve workflow fields in metadata
-        metadata_to_save = dict(task.metadata or {})
-        metadata_to_save.update({
-            "_workflow_type": task.workflow_type,
-            "_execution_strategy": task.execution_strategy,
-            "_workflow_confidence": task.workflow_confidence,
-            "_workflow_indicators": task.workflow_indicators,
-        })
-
         with self._connect() as conn:
+            if task.task_id not in self._payload_keys:
+                self._ensure_payload(conn, task)
             conn.execute(
                 """
                 INSERT INTO tasks (
                     task_id, job_id, source_platform, status, priority, retry_count,
                     max_retries, worker_id, result, error_message, manual_review_context,
-                    metadata, created_at, updated_at, started_at, completed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    metadata, created_at, updated_at, started_at, completed_at, not_before
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(task_id) DO UPDATE SET
                     status = excluded.status,
                     priority = excluded.priority,
@@ -118,92 +171,408 @@ class TaskStorage:
                     result = excluded.result,
                     error_message = excluded.error_message,
                     manual_review_context = excluded.manual_review_context,
-                    metadata = excluded.metadata,
+                    metadata = COALESCE(excluded.metadata, tasks.metadata),
                     updated_at = excluded.updated_at,
                     started_at = excluded.started_at,
-                    completed_at = excluded.completed_at
+                    completed_at = excluded.completed_at,
+                    not_before = excluded.not_before
                 """,
+                self._task_row(task),
+            )
+            conn.commit()
+        self._forget_settled([task])
+
+    def insert_tasks(self, tasks: List[Task], from_status: Optional[TaskStatus] = None) -> None:
+        """
+        Insert new tasks with their payloads in one transaction.
+
+        Tasks whose task_id already exists are left untouched; check with
+        get_existing_task_ids first to know which were skipped.
+
+        Args:
+            tasks: New tasks
+            from_status: Status to record in task_history as the transition
+                into each task's current status (None = no history rows)
+        """
+        if not tasks:
+            return
+        # Payload rows first: they record what the task rows' overlay excludes
+        payload_rows = [self._payload_row(task) for task in tasks]
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO tasks (
+                    task_id, job_id, source_platform, status, priority, retry_count,
+                    max_retries, worker_id, result, error_message, manual_review_context,
+                    metadata, created_at, updated_at, started_at, completed_at, not_before
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [self._task_row(task) for task in tasks],
+            )
+            conn.executemany(
+                """
+                INSERT INTO task_payloads (task_id, metadata, workflow, stored_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(task_id) DO NOTHING
+                """,
+                payload_rows,
+            )
+            if from_status is not None:
+                conn.executemany(
+                    "INSERT INTO task_history (task_id, from_status, to_status, timestamp) VALUES (?, ?, ?, ?)",
+                    [
+                        (task.task_id, from_status.value, task.status.value, task.updated_at.isoformat())
+                        for task in tasks
+                    ],
+                )
+            conn.commit()
+
+    def get_existing_task_ids(self, task_ids: List[str]) -> set:
+        """
+        Return the subset of task_ids already stored.
+
+        Args:
+            task_ids: Candidate task identifiers
+
+        Returns:
+            Set of task_ids present in tasks
+        """
+        existing = set()
+        unique_ids = list(dict.fromkeys(task_ids))
+        with self._connect() as conn:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique_ids), 500):
+                chunk = unique_ids[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT task_id FROM tasks WHERE task_id IN ({placeholders})", chunk)
+                existing.update(row[0] for row in rows)
+        return existing
+
+    def _task_row(self, task: Task) -> tuple:
+        return (
+            task.task_id,
+            task.job_id,
+            task.source_platform,
+            task.status.value,
+            task.priority,
+            task.retry_count,
+            task.max_retries,
+            task.worker_id,
+            task.result.value if task.result else None,
+            task.error_message,
+            json.dumps(task.manual_review_context) if task.manual_review_context else None,
+            self._metadata_overlay(task),
+            task.created_at.isoformat(),
+            task.updated_at.isoformat(),
+            task.started_at.isoformat() if task.started_at else None,
+            task.completed_at.isoformat() if task.completed_at else None,
+            task.not_before.isoformat() if task.not_before else None,
+        )
+
+    def save_task_payload(self, task: Task) -> None:
+        """
+        Replace a task's stored payload.
+
+        Payloads are immutable by convention; use this only when the job
+        data itself changed after enqueue.
+
+        Args:
+            task: Task whose metadata and workflow fields to store
+        """
+        with self._connect() as conn:
+            self._write_payload(conn, task, overwrite=True)
+            conn.execute("UPDATE tasks SET metadata = NULL WHERE task_id = ?", (task.task_id,))
+            conn.commit()
+
+    def update_task_state(self, task: Task) -> None:
+        """
+        Persist a state transition: status, timestamps, worker and result fields.
+
+        Args:
+            task: Task whose mutable state changed
+        """
+        with self._connect() as conn:
+            self._write_task_state(conn, task)
+            conn.commit()
+
+    def _write_task_state(self, conn: sqlite3.Connection, task: Task) -> None:
+        self._write_task_states(conn, [task])
+
+    def _write_task_states(self, conn: sqlite3.Connection, tasks: List[Task]) -> None:
+        conn.executemany(
+            """
+            UPDATE tasks SET
+                status = ?,
+                priority = ?,
+                retry_count = ?,
+                worker_id = ?,
+                result = ?,
+                error_message = ?,
+                manual_review_context = ?,
+                metadata = COALESCE(?, metadata),
+                updated_at = ?,
+                started_at = ?,
+                completed_at = ?,
+                not_before = ?
+            WHERE task_id = ?
+            """,
+            [
                 (
-                    task.task_id,
-                    task.job_id,
-                    task.source_platform,
                     task.status.value,
                     task.priority,
                     task.retry_count,
-                    task.max_retries,
                     task.worker_id,
                     task.result.value if task.result else None,
                     task.error_message,
                     json.dumps(task.manual_review_context) if task.manual_review_context else None,
-                    json.dumps(metadata_to_save),
-                    task.created_at.isoformat(),
+                    self._metadata_overlay(task),
                     task.updated_at.isoformat(),
                     task.started_at.isoformat() if task.started_at else None,
                     task.completed_at.isoformat() if task.completed_at else None,
-                ),
-            )
-            conn.commit()
+                    task.not_before.isoformat() if task.not_before else None,
+                    task.task_id,
+                )
+                for task in tasks
+            ],
+        )
+        self._forget_settled(tasks)
 
-    def get_task(self, task_id: str) -> Optional[Task]:
+    def unit_of_work(self) -> "TaskUnitOfWork":
+        """
+        Start a unit of work that commits staged transitions in one transaction.
+
+        Returns:
+            Empty TaskUnitOfWork bound to this storage
+        """
+        return TaskUnitOfWork(self)
+
+    def _write_payload(self, conn: sqlite3.Connection, task: Task, overwrite: bool) -> None:
+        conflict = "DO UPDATE SET metadata = excluded.metadata, workflow = excluded.workflow" if overwrite else "DO NOTHING"
+        conn.execute(
+            f"""
+            INSERT INTO task_payloads (task_id, metadata, workflow, stored_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(task_id) {conflict}
+            """,
+            self._payload_row(task),
+        )
+
+    def _payload_row(self, task: Task) -> tuple:
+        metadata = dict(task.metadata or {})
+        workflow = _workflow_fields(task)
+        self._remember_payload(task.task_id, metadata)
+        return (task.task_id, json.dumps(metadata), json.dumps(workflow), datetime.utcnow().isoformat())
+
+    def _ensure_payload(self, conn: sqlite3.Connection, task: Task) -> None:
+        """Learn the stored payload of a task, writing one if it has none."""
+        row = conn.execute("SELECT metadata FROM task_payloads WHERE task_id = ?", (task.task_id,)).fetchone()
+        if row is None:
+            self._write_payload(conn, task, overwrite=False)
+        else:
+            self._remember_payload(task.task_id, json.loads(row[0]))
+
+    def _remember_payload(self, task_id: str, metadata: dict) -> None:
+        self._payload_keys[task_id] = {key: _fingerprint(value) for key, value in metadata.items()}
+
+    def _forget_settled(self, tasks: List[Task]) -> None:
+        for task in tasks:
+            if task.status in _SETTLED_STATUSES:
+                self._payload_keys.pop(task.task_id, None)
+
+    def _metadata_overlay(self, task: Task) -> Optional[str]:
+        """
+        Serialize metadata that differs from the stored payload.
+
+        Keys added after enqueue and payload keys whose value changed go into
+        the overlay. When this instance has not seen the task's payload, the
+        whole metadata is written (reads merge it over the payload). None
+        leaves the stored overlay unchanged.
+        """
+        payload = self._payload_keys.get(task.task_id)
+        metadata = task.metadata or {}
+        if payload is None:
+            overlay = dict(metadata)
+            if task.workflow_type or task.execution_strategy:
+                # Legacy rows carry their workflow fields inline
+                overlay.update(_workflow_fields(task))
+            return json.dumps(overlay) if overlay else None
+        extra = {
+            key: value
+            for key, value in metadata.items()
+            if key not in payload or payload[key] != _fingerprint(value)
+        }
+        return json.dumps(extra)
+
+    def get_task(self, task_id: str, with_payload: bool = True) -> Optional[Task]:
         """
         Retrieve task by ID.
 
         Args:
             task_id: Task identifier
+            with_payload: Also load metadata and workflow fields; state-only
+                readers can skip the payload
 
         Returns:
             Task or None if not found
         """
-        import json
-
+        tasks = self._select_tasks("WHERE t.task_id = ?", (task_id,), with_payload)
+        return tasks[0] if tasks else None
+
+    def _select_tasks(self, where_sql: str, params: tuple, with_payload: bool = True) -> List[Task]:
+        if with_payload:
+            query = (
+                f"SELECT {_TASK_COLUMNS}, p.metadata, p.workflow FROM tasks t "
+                f"LEFT JOIN task_payloads p ON p.task_id = t.task_id {where_sql}"
+            )
+        else:
+            query = f"SELECT {_TASK_COLUMNS}, NULL, NULL FROM tasks t {where_sql}"
         with self._connect() as conn:
-            cur = conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,))
-            row = cur.fetchone()
-
-        if not row:
-            return None
-
-        return self._row_to_task(row)
+            rows = conn.execute(query, params).fetchall()
+        tasks = []
+        for row in rows:
+            task = self._row_to_task(row)
+            if with_payload and row[17] is not None and task.status not in _SETTLED_STATUSES:
+                self._remember_payload(task.task_id, json.loads(row[17]))
+            tasks.append(task)
+        return tasks
 
-    def get_queued_tasks(self, limit: int = 10, order_by: str = "priority DESC, created_at ASC") -> List[Task]:
+    def get_queued_tasks(
+        self,
+        limit: int = 10,
+        order_by: str = "priority DESC, created_at ASC",
+        now: Optional[datetime] = None,
+    ) -> List[Task]:
         """
-        Retrieve queued tasks.
+        Retrieve queued tasks that are due (not_before unset or passed).
 
         Args:
             limit: Maximum number of tasks
             order_by: SQL ORDER BY clause
+            now: Reference time for not_before (defaults to utcnow)
 
         Returns:
             List of queued tasks
         """
-        with self._connect() as conn:
-            cur = conn.execute(
-                f"SELECT * FROM tasks WHERE status = ? ORDER BY {order_by} LIMIT ?",
-                (TaskStatus.QUEUED.value, limit),
-            )
-            rows = cur.fetchall()
+        now_iso = (now or datetime.utcnow()).isoformat()
+        return self._select_tasks(
+            f"WHERE t.status = ? AND (t.not_before IS NULL OR t.not_before <= ?) ORDER BY {order_by} LIMIT ?",
+            (TaskStatus.QUEUED.value, now_iso, limit),
+        )
 
-        return [self._row_to_task(row) for row in rows]
+    def get_next_due_time(self) -> Optional[datetime]:
+        """
+        Earliest time a queued task becomes due.
 
-    def get_tasks_by_status(self, status: TaskStatus, limit: int = 100) -> List[Task]:
+        Returns:
+            The smallest not_before among queued tasks (a past or current
+            time when some task is already due), or None if nothing is queued
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT COUNT(*), MIN(not_before), SUM(not_before IS NULL)
+                FROM tasks WHERE status = ?
+                """,
+                (TaskStatus.QUEUED.value,),
+            ).fetchone()
+        if not row or not row[0]:
+            return None
+        if row[2]:
+            return datetime.utcnow()
+        return datetime.fromisoformat(row[1])
+
+    def get_tasks_by_status(self, status: TaskStatus, limit: int = 100, with_payload: bool = True) -> List[Task]:
         """
         Retrieve tasks by status.
 
         Args:
             status: Task status to filter by
             limit: Maximum number of tasks
+            with_payload: Also load metadata and workflow fields
 
         Returns:
             List of tasks with given status
         """
-        with self._connect() as conn:
-            cur = conn.execute(
-                "SELECT * FROM tasks WHERE status = ? ORDER BY created_at DESC LIMIT ?",
-                (status.value, limit),
-            )
-            rows = cur.fetchall()
+        return self._select_tasks(
+            "WHERE t.status = ? ORDER BY t.created_at DESC LIMIT ?",
+            (status.value, limit),
+            with_payload,
+        )
 
-        return [self._row_to_task(row) for row in rows]
+    def get_queued_candidates(
+        self,
+        per_platform: int = 20,
+        aging_per_minute: float = 0.0,
+        now: Optional[datetime] = None,
+    ) -> List[Task]:
+        """
+        Retrieve the top due queued tasks of every platform.
+
+        Tasks are ranked within their platform by aged priority:
+        priority + aging_per_minute * minutes since the task was created.
+
+        Args:
+            per_platform: Maximum tasks per source_platform
+            aging_per_minute: Priority points gained per minute of waiting
+            now: Reference time for not_before and aging (defaults to utcnow)
+
+        Returns:
+            Candidate tasks, grouped by platform in aged-priority order
+        """
+        now_iso = (now or datetime.utcnow()).isoformat()
+        aged = "t.priority + ? * (julianday(?) - julianday(t.created_at)) * 1440.0"
+        return self._select_tasks(
+            f"""
+            JOIN (
+                SELECT task_id, ROW_NUMBER() OVER (
+                    PARTITION BY source_platform
+                    ORDER BY priority + ? * (julianday(?) - julianday(created_at)) * 1440.0 DESC, created_at ASC
+                ) AS platform_rank
+                FROM tasks
+                WHERE status = ? AND (not_before IS NULL OR not_before <= ?)
+            ) ranked ON ranked.task_id = t.task_id
+            WHERE ranked.platform_rank <= ?
+            ORDER BY t.source_platform, {aged} DESC, t.created_at ASC
+            """,
+            (
+                aging_per_minute,
+                now_iso,
+                TaskStatus.QUEUED.value,
+                now_iso,
+                per_platform,
+                aging_per_minute,
+                now_iso,
+            ),
+        )
+
+    def get_queue_depth_by_platform(self, now: Optional[datetime] = None) -> dict:
+        """
+        Per-platform queue depth and wait time.
+
+        Args:
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Dict of platform -> {"queued", "due", "oldest_wait_seconds"}
+        """
+        now_iso = (now or datetime.utcnow()).isoformat()
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT source_platform,
+                       COUNT(*),
+                       SUM(not_before IS NULL OR not_before <= ?),
+                       (julianday(?) - julianday(MIN(created_at))) * 86400.0
+                FROM tasks
+                WHERE status = ?
+                GROUP BY source_platform
+                """,
+                (now_iso, now_iso, TaskStatus.QUEUED.value),
+            ).fetchall()
+        return {
+            row[0]: {"queued": row[1], "due": row[2] or 0, "oldest_wait_seconds": round(max(0.0, row[3] or 0.0), 1)}
+            for row in rows
+        }
 
     def count_tasks_by_status(self, status: TaskStatus) -> int:
         """
@@ -270,40 +639,42 @@ class TaskStorage:
         Args:
             record: ManualReviewRecord to save
         """
-        import json
-
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO manual_review_records (
-                    task_id, job_id, source_platform, status, context, error_message,
-                    reviewer_notes, reviewer_decision, created_at, updated_at, reviewed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(task_id) DO UPDATE SET
-                    status = excluded.status,
-                    context = excluded.context,
-                    error_message = excluded.error_message,
-                    reviewer_notes = excluded.reviewer_notes,
-                    reviewer_decision = excluded.reviewer_decision,
-                    updated_at = excluded.updated_at,
-                    reviewed_at = excluded.reviewed_at
-                """,
-                (
-                    record.task_id,
-                    record.job_id,
-                    record.source_platform,
-                    record.status,
-                    json.dumps(record.context) if record.context else None,
-                    record.error_message,
-                    record.reviewer_notes,
-                    record.reviewer_decision,
-                    record.created_at.isoformat(),
-                    record.updated_at.isoformat(),
-                    record.reviewed_at.isoformat() if record.reviewed_at else None,
-                ),
-            )
+            self._write_manual_review_record(conn, record)
             conn.commit()
 
+    @staticmethod
+    def _write_manual_review_record(conn: sqlite3.Connection, record: ManualReviewRecord) -> None:
+        conn.execute(
+            """
+            INSERT INTO manual_review_records (
+                task_id, job_id, source_platform, status, context, error_message,
+                reviewer_notes, reviewer_decision, created_at, updated_at, reviewed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(task_id) DO UPDATE SET
+                status = excluded.status,
+                context = excluded.context,
+                error_message = excluded.error_message,
+                reviewer_notes = excluded.reviewer_notes,
+                reviewer_decision = excluded.reviewer_decision,
+                updated_at = excluded.updated_at,
+                reviewed_at = excluded.reviewed_at
+            """,
+            (
+                record.task_id,
+                record.job_id,
+                record.source_platform,
+                record.status,
+                json.dumps(record.context) if record.context else None,
+                record.error_message,
+                record.reviewer_notes,
+                record.reviewer_decision,
+                record.created_at.isoformat(),
+                record.updated_at.isoformat(),
+                record.reviewed_at.isoformat() if record.reviewed_at else None,
+            ),
+        )
+
     def get_manual_review_record(self, task_id: str) -> Optional[ManualReviewRecord]:
         """
         Retrieve manual review record by task ID.
@@ -314,8 +685,6 @@ class TaskStorage:
         Returns:
             ManualReviewRecord or None if not found
         """
-        import json
-
         with self._connect() as conn:
             cur = conn.execute("SELECT * FROM manual_review_records WHERE task_id = ?", (task_id,))
             row = cur.fetchone()
@@ -354,8 +723,6 @@ class TaskStorage:
         Returns:
             List of ManualReviewRecords
         """
-        import json
-
         where_clauses = ["status = ?"]
         params = [status]
 
@@ -420,17 +787,20 @@ class TaskStorage:
 
     @staticmethod
     def _row_to_task(row: tuple) -> Task:
-        """Convert database row to Task object."""
-        import json
-
-        # Extract metadata and workflow fields
-        metadata = json.loads(row[11]) if row[11] else {}
-
-        # Extract workflow fields from metadata
-        workflow_type = metadata.pop("_workflow_type", None)
-        execution_strategy = metadata.pop("_execution_strategy", None)
-        workflow_confidence = metadata.pop("_workflow_confidence", 0.0)
-        workflow_indicators = metadata.pop("_workflow_indicators", {})
+        """Convert a tasks row (plus optional payload columns) to a Task object."""
+        payload_metadata = row[17] if len(row) > 17 else None
+        payload_workflow = row[18] if len(row) > 18 else None
+        overlay = json.loads(row[11]) if row[11] else {}
+        # Rows written before task_payloads kept workflow fields in tasks.metadata
+        inline_workflow = {key: overlay.pop(key) for key in _WORKFLOW_KEYS if key in overlay}
+
+        if payload_metadata is not None:
+            metadata = json.loads(payload_metadata)
+            metadata.update(overlay)
+            workflow = json.loads(payload_workflow) if payload_workflow else inline_workflow
+        else:
+            metadata = overlay
+            workflow = inline_workflow
 
         return Task(
             task_id=row[0],
@@ -445,12 +815,82 @@ class TaskStorage:
             error_message=row[9],
             manual_review_context=json.loads(row[10]) if row[10] else None,
             metadata=metadata,
-            workflow_type=workflow_type,
-            execution_strategy=execution_strategy,
-            workflow_confidence=workflow_confidence,
-            workflow_indicators=workflow_indicators,
+            workflow_type=workflow.get("_workflow_type"),
+            execution_strategy=workflow.get("_execution_strategy"),
+            workflow_confidence=workflow.get("_workflow_confidence", 0.0),
+            workflow_indicators=workflow.get("_workflow_indicators", {}),
             created_at=datetime.fromisoformat(row[12]),
             updated_at=datetime.fromisoformat(row[13]),
             started_at=datetime.fromisoformat(row[14]) if row[14] else None,
             completed_at=datetime.fromisoformat(row[15]) if row[15] else None,
+            not_before=datetime.fromisoformat(row[16]) if row[16] else None,
         )
+
+
+class TaskUnitOfWork:
+    """
+    Task transitions staged for a single transaction.
+
+    Stage state updates, history rows and manual review records, then
+    commit() writes them all with one connection and one COMMIT. Nothing
+    is written if commit() is never called or the transaction fails.
+    """
+
+    def __init__(self, storage: TaskStorage):
+        """
+        Initialize unit of work.
+
+        Args:
+            storage: TaskStorage to commit into
+        """
+        self.storage = storage
+        self._tasks: dict[str, Task] = {}
+        self._history: List[tuple] = []
+        self._review_records: dict[str, ManualReviewRecord] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks) + len(self._history) + len(self._review_records)
+
+    def update_task(self, task: Task, from_status: Optional[TaskStatus] = None) -> None:
+        """
+        Stage a task's current state, plus a history row when its status changed.
+
+        Args:
+            task: Task after the transition
+            from_status: Status before the transition
+        """
+        self._tasks[task.task_id] = task
+        if from_status is not None and from_status != task.status:
+            self._history.append(
+                (task.task_id, from_status.value, task.status.value, task.updated_at.isoformat())
+            )
+
+    def save_manual_review_record(self, record: ManualReviewRecord) -> None:
+        """
+        Stage a manual review record.
+
+        Args:
+            record: ManualReviewRecord to save
+        """
+        self._review_records[record.task_id] = record
+
+    def commit(self) -> None:
+        """Write every staged change in one transaction and reset."""
+        if not len(self):
+            return
+        with self.storage._connect() as conn:
+            self.storage._write_task_states(conn, list(self._tasks.values()))
+            conn.executemany(
+                "INSERT INTO task_history (task_id, from_status, to_status, timestamp) VALUES (?, ?, ?, ?)",
+                self._history,
+            )
+            for record in self._review_records.values():
+                self.storage._write_manual_review_record(conn, record)
+            conn.commit()
+        self.discard()
+
+    def discard(self) -> None:
+        """Drop staged changes without writing them."""
+        self._tasks.clear()
+        self._history.clear()
+        self._review_records.clear()
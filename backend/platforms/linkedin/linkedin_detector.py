@@ -8,6 +8,7 @@ Works with DOM content and URLs.
 import logging
 from typing import Optional
 
+from backend.application.parsed_page import HTMLSource, as_parsed_page
 from backend.platforms.linkedin.linkedin_page_data import LinkedInPageType
 
 logger = logging.getLogger(__name__)
@@ -83,13 +84,13 @@ class LinkedInDetector:
 
         return False
 
-    async def is_job_page(self, url: str, html: Optional[str] = None) -> bool:
+    async def is_job_page(self, url: str, html: Optional[HTMLSource] = None) -> bool:
         """
         Check if page is a LinkedIn job page.
 
         Args:
             url: Current page URL
-            html: Page HTML (optional)
+            html: Page HTML or ParsedPage (optional)
 
         Returns:
             True if job page
@@ -104,18 +105,19 @@ class LinkedInDetector:
 
         # Check HTML if provided
         if html:
+            page = as_parsed_page(html)
             for indicator in self.JOB_PAGE_INDICATORS:
-                if indicator.lower() in html.lower():
+                if page.contains(indicator, ignore_case=True):
                     return True
 
         return False
 
-    async def is_easy_apply(self, html: Optional[str] = None) -> bool:
+    async def is_easy_apply(self, html: Optional[HTMLSource] = None) -> bool:
         """
         Check if page has Easy Apply button.
 
         Args:
-            html: Page HTML
+            html: Page HTML or ParsedPage
 
         Returns:
             True if Easy Apply available
@@ -131,18 +133,19 @@ class LinkedInDetector:
             else:
                 return False
 
+        page = as_parsed_page(html)
         for indicator in self.EASY_APPLY_INDICATORS:
-            if indicator.lower() in html.lower():
+            if page.contains(indicator, ignore_case=True):
                 return True
 
         return False
 
-    async def is_external_apply(self, html: Optional[str] = None) -> bool:
+    async def is_external_apply(self, html: Optional[HTMLSource] = None) -> bool:
         """
         Check if page has external apply option.
 
         Args:
-            html: Page HTML
+            html: Page HTML or ParsedPage
 
         Returns:
             True if external apply available
@@ -158,23 +161,26 @@ class LinkedInDetector:
             else:
                 return False
 
+        page = as_parsed_page(html)
         for indicator in self.EXTERNAL_APPLY_INDICATORS:
-            if indicator.lower() in html.lower():
+            if page.contains(indicator, ignore_case=True):
                 return True
 
         return False
 
-    async def get_page_type(self, url: str, html: Optional[str] = None) -> LinkedInPageType:
+    async def get_page_type(self, url: str, html: Optional[HTMLSource] = None) -> LinkedInPageType:
         """
         Determine LinkedIn page type.
 
         Args:
             url: Current page URL
-            html: Page HTML (optional)
+            html: Page HTML or ParsedPage (optional)
 
         Returns:
             LinkedInPageType
         """
+        if html:
+            html = as_parsed_page(html)
         # Check if LinkedIn page
         if not await self.is_linkedin_page(url):
             return LinkedInPageType.UNKNOWN
@@ -9,6 +9,7 @@ import logging
 import re
 from typing import Optional
 
+from backend.application.parsed_page import HTMLSource, as_parsed_page
 from backend.platforms.linkedin.linkedin_page_data import LinkedInPageData, LinkedInPageType
 
 logger = logging.getLogger(__name__)
@@ -28,13 +29,13 @@ class LinkedInJobParser:
         self.adapter = adapter
         self.workflow_classifier = workflow_classifier
 
-    async def parse(self, url: str, html: Optional[str] = None) -> LinkedInPageData:
+    async def parse(self, url: str, html: Optional[HTMLSource] = None) -> LinkedInPageData:
         """
         Parse LinkedIn job page and extract metadata.
 
         Args:
             url: Current page URL
-            html: Page HTML content (optional)
+            html: Page HTML content or ParsedPage (optional)
 
         Returns:
             LinkedInPageData with extracted information
@@ -53,6 +54,9 @@ class LinkedInJobParser:
         if not html:
             return page_data
 
+        # Every extractor below scans the same parsed page
+        html = as_parsed_page(html)
+
         # Extract job information
         page_data.job_title = self._extract_job_title(html)
         page_data.company_name = self._extract_company(html)
@@ -77,8 +81,9 @@ class LinkedInJobParser:
 
         return page_data
 
-    def _extract_job_title(self, html: str) -> Optional[str]:
+    def _extract_job_title(self, html: HTMLSource) -> Optional[str]:
         """Extract job title from HTML."""
+        page = as_parsed_page(html)
         try:
             # Priority 1: H1 with job-title class
             patterns = [
@@ -89,7 +94,7 @@ class LinkedInJobParser:
             ]
 
             for pattern in patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
+                match = page.search(pattern, re.IGNORECASE)
                 if match:
                     title = match.group(1).strip()
                     if title and len(title) > 3 and not title.lower().startswith('linkedin'):
@@ -100,8 +105,9 @@ class LinkedInJobParser:
 
         return None
 
-    def _extract_company(self, html: str) -> Optional[str]:
+    def _extract_company(self, html: HTMLSource) -> Optional[str]:
         """Extract company name from HTML."""
+        page = as_parsed_page(html)
         try:
             # Priority 1: Div with company class
             patterns = [
@@ -113,7 +119,7 @@ class LinkedInJobParser:
             ]
 
             for pattern in patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
+                match = page.search(pattern, re.IGNORECASE)
                 if match:
                     company = match.group(1).strip()
                     if company and len(company) > 1:
@@ -124,8 +130,9 @@ class LinkedInJobParser:
 
         return None
 
-    def _extract_location(self, html: str) -> Optional[str]:
+    def _extract_location(self, html: HTMLSource) -> Optional[str]:
         """Extract location from HTML."""
+        page = as_parsed_page(html)
         try:
             # Priority 1: Span with location emoji or meta section
             patterns = [
@@ -136,7 +143,7 @@ class LinkedInJobParser:
             ]
 
             for pattern in patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
+                match = page.search(pattern, re.IGNORECASE)
                 if match:
                     location = match.group(1).strip()
                     if location and location != '📍':
@@ -147,8 +154,9 @@ class LinkedInJobParser:
 
         return None
 
-    def _extract_employment_type(self, html: str) -> Optional[str]:
+    def _extract_employment_type(self, html: HTMLSource) -> Optional[str]:
         """Extract employment type from HTML."""
+        page = as_parsed_page(html)
         try:
             employment_types = ["Full-time", "Part-time", "Contract", "Temporary", "Internship"]
 
@@ -156,13 +164,13 @@ class LinkedInJobParser:
             for emp_type in employment_types:
                 # Try with emoji pattern
                 pattern = rf'💼\s*{emp_type}'
-                if re.search(pattern, html, re.IGNORECASE):
+                if page.search(pattern, re.IGNORECASE):
                     logger.info(f"[Parser] Extracted employment type: {emp_type}")
                     return emp_type
 
             # Fallback to text search
             for emp_type in employment_types:
-                if emp_type.lower() in html.lower():
+                if page.contains(emp_type, ignore_case=True):
                     logger.info(f"[Parser] Extracted employment type: {emp_type}")
                     return emp_type
         except Exception as e:
@@ -170,8 +178,9 @@ class LinkedInJobParser:
 
         return None
 
-    def _extract_experience_level(self, html: str) -> Optional[str]:
+    def _extract_experience_level(self, html: HTMLSource) -> Optional[str]:
         """Extract experience level from HTML."""
+        page = as_parsed_page(html)
         try:
             experience_levels = [
                 "Entry level",
@@ -184,13 +193,13 @@ class LinkedInJobParser:
             # Look for emoji pattern first
             for level in experience_levels:
                 pattern = rf'📊\s*{level}'
-                if re.search(pattern, html, re.IGNORECASE):
+                if page.search(pattern, re.IGNORECASE):
                     logger.info(f"[Parser] Extracted experience level: {level}")
                     return level
 
             # Fallback to text search
             for level in experience_levels:
-                if level.lower() in html.lower():
+                if page.contains(level, ignore_case=True):
                     logger.info(f"[Parser] Extracted experience level: {level}")
                     return level
         except Exception as e:
@@ -198,8 +207,9 @@ class LinkedInJobParser:
 
         return None
 
-    def _extract_job_description(self, html: str) -> Optional[str]:
+    def _extract_job_description(self, html: HTMLSource) -> Optional[str]:
         """Extract job description from HTML."""
+        page = as_parsed_page(html)
         try:
             # Look for description containers
             patterns = [
@@ -209,7 +219,7 @@ class LinkedInJobParser:
             ]
 
             for pattern in patterns:
-                match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
+                match = page.search(pattern, re.IGNORECASE | re.DOTALL)
                 if match:
                     description = match.group(1).strip()
                     # Remove HTML tags
@@ -222,12 +232,13 @@ class LinkedInJobParser:
 
         return None
 
-    def _check_easy_apply(self, html: str) -> bool:
+    def _check_easy_apply(self, html: HTMLSource) -> bool:
         """Check if Easy Apply is available."""
+        page = as_parsed_page(html)
         try:
             indicators = ["Easy Apply", "easy-apply", "easyApply"]
             for indicator in indicators:
-                if indicator in html:
+                if page.contains(indicator):
                     logger.info("[Parser] Easy Apply detected")
                     return True
         except Exception as e:
@@ -235,8 +246,9 @@ class LinkedInJobParser:
 
         return False
 
-    def _check_external_apply(self, html: str) -> bool:
+    def _check_external_apply(self, html: HTMLSource) -> bool:
         """Check if external apply is available."""
+        page = as_parsed_page(html)
         try:
             indicators = [
                 "Apply on company website",
@@ -244,7 +256,7 @@ class LinkedInJobParser:
                 "external-apply",
             ]
             for indicator in indicators:
-                if indicator.lower() in html.lower():
+                if page.contains(indicator, ignore_case=True):
                     logger.info("[Parser] External apply detected")
                     return True
         except Exception as e:
@@ -252,11 +264,12 @@ class LinkedInJobParser:
 
         return False
 
-    def _determine_page_type(self, html: str) -> LinkedInPageType:
+    def _determine_page_type(self, html: HTMLSource) -> LinkedInPageType:
         """Determine page type from HTML."""
-        if self._check_easy_apply(html):
+        page = as_parsed_page(html)
+        if self._check_easy_apply(page):
             return LinkedInPageType.EASY_APPLY_PAGE
-        elif self._check_external_apply(html):
+        elif self._check_external_apply(page):
             return LinkedInPageType.EXTERNAL_APPLY_PAGE
         else:
             return LinkedInPageType.JOB_PAGE
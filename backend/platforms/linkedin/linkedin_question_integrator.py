@@ -16,6 +16,7 @@ import re
 from typing import Optional, List, Dict, Any
 from html.parser import HTMLParser
 
+from backend.application.parsed_page import HTMLSource, as_parsed_page
 from backend.application.question_detector import Question
 from backend.application.question_classifier import QuestionClassifier, QuestionCategory
 from backend.application.answer_mapper import AnswerMapper
@@ -32,23 +33,25 @@ class HTMLQuestionParser:
         """Initialize parser."""
         pass
 
-    def extract_questions(self, html: str) -> List[Question]:
+    def extract_questions(self, html: HTMLSource) -> List[Question]:
         """
         Extract questions from HTML.
 
         Args:
-            html: HTML content
+            html: HTML content or ParsedPage
 
         Returns:
             List of Question objects
         """
         questions = []
+        page = as_parsed_page(html)
+        html = page.html
 
         logger.info(f"[HTMLQuestionParser] Starting extraction from {len(html)} bytes of HTML")
 
         # Parse labels and associate with form elements
         label_pattern = r'<label[^>]*(?:for="([^"]*)")?[^>]*>([^<]+)</label>'
-        label_matches = list(re.finditer(label_pattern, html, re.IGNORECASE))
+        label_matches = page.findall(label_pattern, re.IGNORECASE)
         logger.info(f"[HTMLQuestionParser] Found {len(label_matches)} labels")
 
         label_map = {}
@@ -63,7 +66,7 @@ class HTMLQuestionParser:
         input_pattern = r'<input\s+([^>]*?)(?:type="([^"]*)"[^>]*|[^>]*type="([^"]*)"[^>]*)\s*>'
         # Better approach: match input and extract attributes separately
         input_pattern = r'<input[^>]*>'
-        input_matches = list(re.finditer(input_pattern, html, re.IGNORECASE))
+        input_matches = page.findall(input_pattern, re.IGNORECASE)
         logger.info(f"[HTMLQuestionParser] Found {len(input_matches)} input elements")
 
         for match in input_matches:
@@ -105,7 +108,7 @@ class HTMLQuestionParser:
 
         # Extract textarea fields
         textarea_pattern = r'<textarea[^>]*>'
-        textarea_matches = list(re.finditer(textarea_pattern, html, re.IGNORECASE))
+        textarea_matches = page.findall(textarea_pattern, re.IGNORECASE)
         logger.info(f"[HTMLQuestionParser] Found {len(textarea_matches)} textarea elements")
 
         for match in textarea_matches:
@@ -138,7 +141,7 @@ class HTMLQuestionParser:
 
         # Extract select fields
         select_pattern = r'<select[^>]*>(.*?)</select>'
-        select_matches = list(re.finditer(select_pattern, html, re.IGNORECASE | re.DOTALL))
+        select_matches = page.findall(select_pattern, re.IGNORECASE | re.DOTALL)
         logger.info(f"[HTMLQuestionParser] Found {len(select_matches)} select elements")
 
         for match in select_matches:
@@ -179,9 +182,8 @@ class HTMLQuestionParser:
                 questions.append(q)
                 logger.info(f"[HTMLQuestionParser] Select: {label_text} ({len(options)} options) @ {selector}")
 
-        # Extract radio buttons
-        radio_pattern = r'<input[^>]*type="radio"[^>]*>'
-        radio_matches = list(re.finditer(radio_pattern, html, re.IGNORECASE))
+        # Extract radio buttons (a subset of the input tags already scanned)
+        radio_matches = [m for m in input_matches if re.search(r'type="radio"', m.group(0), re.IGNORECASE)]
         logger.info(f"[HTMLQuestionParser] Found {len(radio_matches)} radio elements")
 
         radio_names_seen = set()
@@ -217,9 +219,8 @@ class HTMLQuestionParser:
                 questions.append(q)
                 logger.info(f"[HTMLQuestionParser] Radio: {label_text} @ {selector}")
 
-        # Extract checkboxes
-        checkbox_pattern = r'<input[^>]*type="checkbox"[^>]*>'
-        checkbox_matches = list(re.finditer(checkbox_pattern, html, re.IGNORECASE))
+        # Extract checkboxes (a subset of the input tags already scanned)
+        checkbox_matches = [m for m in input_matches if re.search(r'type="checkbox"', m.group(0), re.IGNORECASE)]
         logger.info(f"[HTMLQuestionParser] Found {len(checkbox_matches)} checkbox elements")
 
         checkbox_names_seen = set()
@@ -268,14 +269,14 @@ class LinkedInQuestionIntegrator:
         self.answer_mapper = AnswerMapper()
         self.html_parser = HTMLQuestionParser()
 
-    async def detect_linkedin_questions(self, html: str) -> List[Question]:
+    async def detect_linkedin_questions(self, html: HTMLSource) -> List[Question]:
         """
         Detect questions in LinkedIn application form.
 
         Uses HTML parsing bridge to extract questions without requiring browser adapter.
 
         Args:
-            html: Page HTML content
+            html: Page HTML content or ParsedPage
 
         Returns:
             List of detected Question objects
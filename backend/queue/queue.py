@@ -1,19 +1,31 @@
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
 from backend.runtime.task_model import Task, TaskStatus
+from backend.queue.retry_policy import RetryPolicy
+from backend.queue.scheduling import FairShareScheduler
 
 
 class Queue:
-    """Task queue system with priority and retry support."""
+    """Task queue system with priority, fair-share scheduling and delayed-retry support."""
 
-    def __init__(self, storage):
+    def __init__(
+        self,
+        storage,
+        retry_policy: Optional[RetryPolicy] = None,
+        scheduler: Optional[FairShareScheduler] = None,
+    ):
         """
         Initialize queue with storage backend.
 
         Args:
             storage: Storage layer (e.g., SQLite wrapper)
+            retry_policy: Backoff for retried tasks (default RetryPolicy())
+            scheduler: Fair-share policy across platforms; without one,
+                dequeue is strictly by priority then age
         """
         self.storage = storage
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.scheduler = scheduler
 
     def enqueue(self, task: Task) -> None:
         """
@@ -28,16 +40,24 @@ class Queue:
         task.updated_at = datetime.utcnow()
         self.storage.save_task(task)
 
-    def dequeue(self, limit: int = 1) -> List[Task]:
+    def dequeue(self, limit: int = 1, running: Optional[dict] = None) -> List[Task]:
         """
-        Retrieve tasks from queue, ordered by priority and creation time.
+        Retrieve due tasks from queue.
+
+        With a scheduler, tasks are shared across platforms by weight, within
+        per-platform caps, and aged by time waited; otherwise they are ordered
+        by priority and creation time. Tasks still waiting out a retry
+        backoff are not returned.
 
         Args:
             limit: Maximum number of tasks to retrieve
+            running: platform -> tasks currently running (for caps)
 
         Returns:
             List of tasks ready to execute
         """
+        if self.scheduler is not None:
+            return self.scheduler.select(self.storage, limit, running=running)
         return self.storage.get_queued_tasks(limit=limit, order_by="priority DESC, created_at ASC")
 
     def peek(self) -> Optional[Task]:
@@ -52,15 +72,58 @@ class Queue:
 
     def retry(self, task: Task) -> None:
         """
-        Prepare task for retry.
+        Prepare task for retry after a backoff delay.
 
         Args:
             task: Task to retry
         """
         if not task.is_retryable():
             raise ValueError(f"Task cannot be retried (retries: {task.retry_count}/{task.max_retries})")
+        error = task.error_message
         task.retry()
-        self.storage.save_task(task)
+        task.not_before = self.retry_policy.next_attempt_at(error, task.retry_count)
+        self.storage.update_task_state(task)
+
+    def defer(self, task: Task, seconds: float) -> None:
+        """
+        Push back a queued task that could not be dispatched.
+
+        The task stays QUEUED and its retry count is unchanged.
+
+        Args:
+            task: Task to defer
+            seconds: Delay before the task is due again
+        """
+        if task.status != TaskStatus.QUEUED:
+            raise ValueError(f"Cannot defer task in {task.status} state")
+        task.not_before = datetime.utcnow() + timedelta(seconds=seconds)
+        task.updated_at = datetime.utcnow()
+        self.storage.update_task_state(task)
+
+    def next_due_time(self) -> Optional[datetime]:
+        """
+        Earliest time a queued task becomes due.
+
+        Returns:
+            Due time (now or earlier if a task is ready), or None if the
+            queue is empty
+        """
+        return self.storage.get_next_due_time()
+
+    def get_platform_stats(self, running: Optional[dict] = None) -> dict:
+        """
+        Per-platform queue depth and wait time (plus dispatch stats when a
+        scheduler is configured).
+
+        Args:
+            running: platform -> tasks currently running
+
+        Returns:
+            Dict of platform -> stats
+        """
+        if self.scheduler is not None:
+            return self.scheduler.get_stats(self.storage, running=running)
+        return self.storage.get_queue_depth_by_platform()
 
     def move_to_manual_review(self, task: Task, context: dict) -> None:
         """
@@ -71,7 +134,7 @@ class Queue:
             context: Review context (state, error, etc.)
         """
         task.mark_manual_review(context)
-        self.storage.save_task(task)
+        self.storage.update_task_state(task)
         self.storage.save_manual_review_record(task)
 
     def get_task(self, task_id: str) -> Optional[Task]:
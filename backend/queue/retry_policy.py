@@ -0,0 +1,107 @@
+import random
+import re
+from datetime import datetime, timedelta
+from typing import Optional
+
+
+# Failure class -> (base delay seconds, max delay seconds)
+DEFAULT_BACKOFF = {
+    "rate_limit": (60.0, 3600.0),
+    "blocked": (300.0, 6 * 3600.0),
+    "network": (10.0, 600.0),
+    "timeout": (15.0, 900.0),
+    "default": (30.0, 1800.0),
+}
+
+_FAILURE_PATTERNS = (
+    ("rate_limit", re.compile(r"\b429\b|rate.?limit|too many requests|throttl", re.IGNORECASE)),
+    ("blocked", re.compile(r"captcha|forbidden|\b403\b|blocked|checkpoint|verify you", re.IGNORECASE)),
+    ("timeout", re.compile(r"time(d)?\s?out", re.IGNORECASE)),
+    ("network", re.compile(r"connection|network|net::err|dns|reset by peer|unreachable|\b50[234]\b", re.IGNORECASE)),
+)
+
+
+def classify_failure(error: Optional[str]) -> str:
+    """
+    Map an error message to a failure class.
+
+    Args:
+        error: Error message from the failed attempt
+
+    Returns:
+        One of the DEFAULT_BACKOFF keys
+    """
+    for failure_class, pattern in _FAILURE_PATTERNS:
+        if error and pattern.search(error):
+            return failure_class
+    return "default"
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter per failure class.
+
+    The n-th retry waits base * 2**(n-1), capped at the class maximum, then
+    jittered to between half and all of that ("equal jitter") so tasks that
+    failed together do not all come back at the same moment.
+    """
+
+    def __init__(self, backoff: Optional[dict] = None, rng: Optional[random.Random] = None):
+        """
+        Initialize retry policy.
+
+        Args:
+            backoff: Overrides of failure class -> (base_seconds, max_seconds)
+            rng: Random source for jitter
+        """
+        self.backoff = dict(DEFAULT_BACKOFF)
+        for failure_class, (base, cap) in (backoff or {}).items():
+            self.backoff[failure_class] = (float(base), float(cap))
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def from_settings(cls, settings: Optional[dict]) -> "RetryPolicy":
+        """
+        Build a policy from settings (app.retry_backoff: class -> {base, max}).
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            RetryPolicy
+        """
+        config = ((settings or {}).get("app", {}) or {}).get("retry_backoff", {}) or {}
+        overrides = {}
+        for failure_class, values in config.items():
+            default_base, default_cap = DEFAULT_BACKOFF.get(failure_class, DEFAULT_BACKOFF["default"])
+            overrides[failure_class] = (values.get("base", default_base), values.get("max", default_cap))
+        return cls(overrides)
+
+    def delay_seconds(self, error: Optional[str], attempt: int) -> float:
+        """
+        Backoff before the given retry attempt.
+
+        Args:
+            error: Error message from the failed attempt
+            attempt: Retry number, starting at 1
+
+        Returns:
+            Delay in seconds
+        """
+        base, cap = self.backoff.get(classify_failure(error), self.backoff["default"])
+        delay = min(cap, base * (2 ** max(0, attempt - 1)))
+        return delay / 2 + self.rng.uniform(0, delay / 2)
+
+    def next_attempt_at(self, error: Optional[str], attempt: int, now: Optional[datetime] = None) -> datetime:
+        """
+        Earliest time the given retry attempt may run.
+
+        Args:
+            error: Error message from the failed attempt
+            attempt: Retry number, starting at 1
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            not_before timestamp
+        """
+        return (now or datetime.utcnow()) + timedelta(seconds=self.delay_seconds(error, attempt))
@@ -0,0 +1,170 @@
+import threading
+from datetime import datetime
+from typing import Optional, List
+from backend.runtime.task_model import Task
+
+
+DEFAULT_CANDIDATES_PER_PLATFORM = 20
+
+
+class FairShareScheduler:
+    """
+    Weighted fair-share dispatch across platforms with priority aging.
+
+    Each platform has a weight and an optional concurrency cap. Dispatch
+    uses stride scheduling: every platform carries a pass value that
+    advances by 1/weight per dispatched task, and the next slot goes to the
+    eligible platform with the lowest pass. A burst on one platform
+    therefore gets its weighted share instead of the whole queue. Within a
+    platform, tasks are taken by aged priority (priority plus
+    aging_per_minute for every minute waited) so old low-priority tasks
+    eventually run. The scheduler keeps a virtual time (the pass of the
+    last dispatched task); a platform that was idle and comes back starts
+    no lower than that, so it cannot spend share it did not use.
+
+    Settings (app.scheduling):
+        platform_weights: platform -> weight (default 1 each)
+        platform_caps: platform -> max tasks running at once (default no cap)
+        aging_per_minute: Priority points gained per minute queued (default 0.1)
+        candidates_per_platform: Tasks fetched per platform per dispatch (default 20)
+    """
+
+    def __init__(
+        self,
+        weights: Optional[dict] = None,
+        caps: Optional[dict] = None,
+        aging_per_minute: float = 0.1,
+        candidates_per_platform: int = DEFAULT_CANDIDATES_PER_PLATFORM,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            weights: platform -> share weight
+            caps: platform -> concurrency cap
+            aging_per_minute: Priority points gained per minute queued
+            candidates_per_platform: Tasks fetched per platform per dispatch
+        """
+        self.weights = {platform: max(float(weight), 0.001) for platform, weight in (weights or {}).items()}
+        self.caps = {platform: int(cap) for platform, cap in (caps or {}).items() if cap is not None}
+        self.aging_per_minute = float(aging_per_minute)
+        self.candidates_per_platform = max(1, int(candidates_per_platform))
+        self._lock = threading.Lock()
+        self._passes: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._backlogged: set[str] = set()
+        self._dispatched: dict[str, int] = {}
+        self._wait_seconds: dict[str, float] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Optional[dict]) -> "FairShareScheduler":
+        """
+        Build a scheduler from settings (app.scheduling).
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            FairShareScheduler
+        """
+        config = ((settings or {}).get("app", {}) or {}).get("scheduling", {}) or {}
+        return cls(
+            weights=config.get("platform_weights"),
+            caps=config.get("platform_caps"),
+            aging_per_minute=config.get("aging_per_minute", 0.1),
+            candidates_per_platform=config.get("candidates_per_platform", DEFAULT_CANDIDATES_PER_PLATFORM),
+        )
+
+    def weight(self, platform: str) -> float:
+        return self.weights.get(platform, 1.0)
+
+    def select(
+        self,
+        storage,
+        limit: int,
+        running: Optional[dict] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Task]:
+        """
+        Choose up to limit due tasks for dispatch.
+
+        Args:
+            storage: TaskStorage to read candidates from
+            limit: Free execution slots
+            running: platform -> tasks currently running
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Tasks in dispatch order
+        """
+        if limit <= 0:
+            return []
+        now = now or datetime.utcnow()
+        by_platform: dict[str, List[Task]] = {}
+        for task in storage.get_queued_candidates(
+            per_platform=self.candidates_per_platform,
+            aging_per_minute=self.aging_per_minute,
+            now=now,
+        ):
+            by_platform.setdefault(task.source_platform, []).append(task)
+        running = dict(running or {})
+
+        selected: List[Task] = []
+        with self._lock:
+            # Platforms new or returning from idle start at the virtual time,
+            # so they cannot claim a backlog of unused share.
+            for platform in by_platform:
+                if platform not in self._backlogged:
+                    self._passes[platform] = max(self._passes.get(platform, 0.0), self._virtual_time)
+
+            while len(selected) < limit:
+                eligible = [
+                    platform
+                    for platform, tasks in by_platform.items()
+                    if tasks and (platform not in self.caps or running.get(platform, 0) < self.caps[platform])
+                ]
+                if not eligible:
+                    break
+                platform = min(eligible, key=lambda name: (self._passes[name], name))
+                task = by_platform[platform].pop(0)
+                selected.append(task)
+                self._virtual_time = max(self._virtual_time, self._passes[platform])
+                running[platform] = running.get(platform, 0) + 1
+                self._passes[platform] += 1.0 / self.weight(platform)
+                self._dispatched[platform] = self._dispatched.get(platform, 0) + 1
+                self._wait_seconds[platform] = self._wait_seconds.get(platform, 0.0) + max(
+                    0.0, (now - task.created_at).total_seconds()
+                )
+            self._backlogged = set(by_platform)
+        return selected
+
+    def get_stats(self, storage, running: Optional[dict] = None, now: Optional[datetime] = None) -> dict:
+        """
+        Per-platform queue depth, wait times, dispatch counts and limits.
+
+        Args:
+            storage: TaskStorage to read queue depth from
+            running: platform -> tasks currently running
+
+        Returns:
+            Dict of platform -> stats
+        """
+        depth = storage.get_queue_depth_by_platform(now)
+        running = running or {}
+        with self._lock:
+            platforms = set(depth) | set(self._dispatched) | set(running)
+            return {
+                platform: {
+                    **depth.get(platform, {"queued": 0, "due": 0, "oldest_wait_seconds": 0.0}),
+                    "running": running.get(platform, 0),
+                    "cap": self.caps.get(platform),
+                    "weight": self.weight(platform),
+                    "dispatched": self._dispatched.get(platform, 0),
+                    "avg_wait_seconds": round(
+                        self._wait_seconds.get(platform, 0.0) / self._dispatched[platform], 1
+                    )
+                    if self._dispatched.get(platform)
+                    else 0.0,
+                }
+                for platform in sorted(platforms)
+            }
@@ -48,6 +48,8 @@ class Task:
     execution_strategy: Optional[str] = None
     workflow_confidence: float = 0.0
     workflow_indicators: dict = field(default_factory=dict)
+    # Earliest time a queued task may be dequeued (retry backoff)
+    not_before: Optional[datetime] = None
 
     def to_dict(self) -> dict:
         """Convert task to dictionary, serializing enums and datetimes."""
@@ -61,6 +63,8 @@ class Task:
             data["started_at"] = self.started_at.isoformat()
         if self.completed_at:
             data["completed_at"] = self.completed_at.isoformat()
+        if self.not_before:
+            data["not_before"] = self.not_before.isoformat()
         return data
 
     @staticmethod
@@ -76,15 +80,19 @@ class Task:
             data["started_at"] = datetime.fromisoformat(data["started_at"])
         if data.get("completed_at"):
             data["completed_at"] = datetime.fromisoformat(data["completed_at"])
+        if data.get("not_before"):
+            data["not_before"] = datetime.fromisoformat(data["not_before"])
         return Task(**data)
 
     def is_retryable(self) -> bool:
         """Check if task can be retried."""
         return self.retry_count < self.max_retries and self.status == TaskStatus.FAILED
 
-    def can_start(self) -> bool:
-        """Check if task is ready to start."""
-        return self.status == TaskStatus.QUEUED
+    def can_start(self, now: Optional[datetime] = None) -> bool:
+        """Check if task is ready to start (queued and past any retry delay)."""
+        if self.status != TaskStatus.QUEUED:
+            return False
+        return self.not_before is None or self.not_before <= (now or datetime.utcnow())
 
     def mark_running(self, worker_id: str) -> None:
         """Transition task to running state."""
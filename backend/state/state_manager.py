@@ -1,22 +1,46 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Optional, Callable, List
 from datetime import datetime
 from backend.runtime.task_model import Task, TaskStatus, TaskResult
+from backend.manual_review.review_queue import ManualReviewRecord
+from backend.queue.retry_policy import RetryPolicy
 
 
-class StateManager:
-    """Centralized task state management with explicit transitions."""
+class _PendingBatch:
+    """Transitions staged by the outermost batch() of one context."""
+
+    def __init__(self, unit):
+        self.unit = unit
+        self.events: list = []
 
-    def __init__(self, storage, event_bus=None):
+
+class StateManager:
+    """
+    Centralized task state management with explicit transitions.
+
+    Each transition is one transaction: the task's state, its task_history
+    row and (for manual review) the review record are committed together.
+    Inside batch(), transitions are staged and committed once when the
+    outermost batch exits. Events are emitted only after the commit.
+    The open batch is tracked per context (thread or asyncio task), so
+    concurrent tasks never stage into each other's batch.
+    """
+
+    def __init__(self, storage, event_bus=None, retry_policy: Optional[RetryPolicy] = None):
         """
         Initialize state manager.
 
         Args:
             storage: Storage layer for persistence
             event_bus: Optional event bus for state change notifications
+            retry_policy: Backoff for retried tasks (default RetryPolicy())
         """
         self.storage = storage
         self.event_bus = event_bus
+        self.retry_policy = retry_policy or RetryPolicy()
         self._transition_validators: dict[tuple[TaskStatus, TaskStatus], Callable] = {}
+        self._batch: ContextVar[Optional[_PendingBatch]] = ContextVar(f"state_batch_{id(self)}", default=None)
         self._setup_validators()
 
     def _setup_validators(self) -> None:
@@ -38,6 +62,11 @@ class StateManager:
             lambda t: t.manual_review_context is not None
         )
 
+        # QUEUED -> MANUAL_REVIEW (no worker can run the task)
+        self._transition_validators[(TaskStatus.QUEUED, TaskStatus.MANUAL_REVIEW)] = (
+            lambda t: t.manual_review_context is not None
+        )
+
         # FAILED -> QUEUED (retry)
         self._transition_validators[(TaskStatus.FAILED, TaskStatus.QUEUED)] = lambda t: t.is_retryable()
 
@@ -54,15 +83,65 @@ class StateManager:
         if self.event_bus:
             self.event_bus.emit(event_type, {"task": task.to_dict()})
 
-    def create_task(self, task_id: str, job_id: str, source_platform: str, priority: int = 0) -> Task:
+    @contextmanager
+    def batch(self):
+        """
+        Group transitions into one commit.
+
+        Transitions made inside the block are staged; the outermost batch
+        commits them in one transaction and then emits their events in
+        order. If the block raises, nothing is written or emitted.
+        """
+        if self._batch.get() is not None:
+            yield
+            return
+
+        state = _PendingBatch(self.storage.unit_of_work())
+        token = self._batch.set(state)
+        try:
+            yield
+            state.unit.commit()
+        except BaseException:
+            state.unit.discard()
+            raise
+        finally:
+            self._batch.reset(token)
+        if self.event_bus:
+            for event_type, payload in state.events:
+                self.event_bus.emit(event_type, payload)
+
+    def _commit_transition(
+        self,
+        task: Task,
+        from_status: TaskStatus,
+        event_type: Optional[str],
+        review_record: Optional[ManualReviewRecord] = None,
+    ) -> None:
+        """Persist a transition with its history row, then emit its event."""
+        with self.batch():
+            state = self._batch.get()
+            state.unit.update_task(task, from_status)
+            if review_record is not None:
+                state.unit.save_manual_review_record(review_record)
+            if event_type and self.event_bus:
+                # Snapshot now: a later transition in the same batch mutates the task
+                state.events.append((event_type, {"task": task.to_dict()}))
+
+    def create_task(
+        self, task_id: str, job_id: str, source_platform: str, priority: int = 0, metadata: Optional[dict] = None
+    ) -> Task:
         """
         Create new task in DISCOVERED state.
 
+        The job payload is written once here; later transitions only update
+        the task's mutable state.
+
         Args:
             task_id: Unique task identifier
             job_id: Job identifier
             source_platform: Platform name (linkedin, indeed, naukri)
             priority: Task priority (higher = earlier execution)
+            metadata: Job payload (job data, workflow hints)
 
         Returns:
             Created task
@@ -73,6 +152,7 @@ class StateManager:
             source_platform=source_platform,
             status=TaskStatus.DISCOVERED,
             priority=priority,
+            metadata=dict(metadata or {}),
         )
         self.storage.save_task(task)
         self._emit_event("TASK_CREATED", task)
@@ -87,10 +167,45 @@ class StateManager:
         """
         if not self._is_valid_transition(task.status, TaskStatus.QUEUED, task):
             raise ValueError(f"Cannot transition from {task.status} to QUEUED")
+        from_status = task.status
         task.status = TaskStatus.QUEUED
         task.updated_at = datetime.utcnow()
-        self.storage.save_task(task)
-        self._emit_event("TASK_QUEUED", task)
+        self._commit_transition(task, from_status, "TASK_QUEUED")
+
+    def enqueue_tasks(self, tasks: List[Task]) -> List[Task]:
+        """
+        Queue new DISCOVERED tasks in one transaction.
+
+        Tasks whose task_id is already stored are skipped, as are repeats
+        within the list. The rest are marked QUEUED and inserted with their
+        payloads and history rows in one commit, followed by a single
+        TASK_QUEUED_BATCH event.
+
+        Args:
+            tasks: New tasks in DISCOVERED state
+
+        Returns:
+            The tasks that were queued
+        """
+        existing = self.storage.get_existing_task_ids([task.task_id for task in tasks])
+        queued = []
+        for task in tasks:
+            if task.task_id in existing:
+                continue
+            if not self._is_valid_transition(task.status, TaskStatus.QUEUED, task):
+                raise ValueError(f"Cannot transition from {task.status} to QUEUED")
+            existing.add(task.task_id)
+            task.status = TaskStatus.QUEUED
+            task.updated_at = datetime.utcnow()
+            queued.append(task)
+
+        self.storage.insert_tasks(queued, from_status=TaskStatus.DISCOVERED)
+        if queued and self.event_bus:
+            self.event_bus.emit(
+                "TASK_QUEUED_BATCH",
+                {"count": len(queued), "tasks": [task.to_dict() for task in queued]},
+            )
+        return queued
 
     def transition_to_running(self, task: Task, worker_id: str) -> None:
         """
@@ -103,9 +218,9 @@ class StateManager:
         task.worker_id = worker_id
         if not self._is_valid_transition(task.status, TaskStatus.RUNNING, task):
             raise ValueError(f"Cannot transition from {task.status} to RUNNING")
+        from_status = task.status
         task.mark_running(worker_id)
-        self.storage.save_task(task)
-        self._emit_event("TASK_STARTED", task)
+        self._commit_transition(task, from_status, "TASK_STARTED")
 
     def transition_to_completed(self, task: Task, result: TaskResult) -> None:
         """
@@ -118,9 +233,9 @@ class StateManager:
         task.result = result
         if not self._is_valid_transition(task.status, TaskStatus.COMPLETED, task):
             raise ValueError(f"Cannot transition from {task.status} to COMPLETED")
+        from_status = task.status
         task.mark_completed(result)
-        self.storage.save_task(task)
-        self._emit_event("TASK_COMPLETED", task)
+        self._commit_transition(task, from_status, "TASK_COMPLETED")
 
     def transition_to_failed(self, task: Task, error: str) -> None:
         """
@@ -133,36 +248,54 @@ class StateManager:
         task.error_message = error
         if not self._is_valid_transition(task.status, TaskStatus.FAILED, task):
             raise ValueError(f"Cannot transition from {task.status} to FAILED")
+        from_status = task.status
         task.mark_failed(error)
-        self.storage.save_task(task)
-        self._emit_event("TASK_FAILED", task)
+        self._commit_transition(task, from_status, "TASK_FAILED")
 
-    def transition_to_manual_review(self, task: Task, context: dict) -> None:
+    def transition_to_manual_review(
+        self, task: Task, context: dict, record_review: bool = False
+    ) -> Optional[ManualReviewRecord]:
         """
-        Transition task from RUNNING to MANUAL_REVIEW.
+        Transition task from RUNNING (or QUEUED, when no worker can run it) to MANUAL_REVIEW.
 
         Args:
             task: Task to transition
             context: Review context (state, error, etc.)
+            record_review: Also write the pending manual review record in the
+                same transaction
+
+        Returns:
+            The ManualReviewRecord when record_review is set, else None
         """
         task.manual_review_context = context
         if not self._is_valid_transition(task.status, TaskStatus.MANUAL_REVIEW, task):
             raise ValueError(f"Cannot transition from {task.status} to MANUAL_REVIEW")
+        from_status = task.status
         task.mark_manual_review(context)
-        self.storage.save_task(task)
+        record = None
+        if record_review:
+            record = ManualReviewRecord.from_task(task)
+            record.context = context
+        self._commit_transition(task, from_status, "MANUAL_REVIEW_REQUIRED" if record else None, record)
+        return record
 
     def retry_task(self, task: Task) -> None:
         """
         Transition task from FAILED back to QUEUED for retry.
 
+        The task is not dequeued again until its backoff (by failure class
+        and retry count) has passed.
+
         Args:
             task: Task to retry
         """
         if not self._is_valid_transition(task.status, TaskStatus.QUEUED, task):
             raise ValueError(f"Cannot retry task in {task.status} state")
+        from_status = task.status
+        error = task.error_message
         task.retry()
-        self.storage.save_task(task)
-        self._emit_event("TASK_RETRIED", task)
+        task.not_before = self.retry_policy.next_attempt_at(error, task.retry_count)
+        self._commit_transition(task, from_status, "TASK_RETRIED")
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """
@@ -0,0 +1,65 @@
+"""
+Tests for bulk task enqueue.
+
+Validates:
+- enqueue_tasks queues new tasks with payloads and history in one pass
+- Existing task_ids and repeats within the batch are skipped
+- One TASK_QUEUED_BATCH event is emitted instead of per-task events
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.events.event_bus import EventBus
+from backend.persistence.task_storage import TaskStorage
+from backend.runtime.task_model import Task, TaskStatus
+from backend.state.state_manager import StateManager
+
+
+def _task(index: int) -> Task:
+    return Task(
+        task_id=f"job-{index}",
+        job_id=f"job-{index}",
+        source_platform="linkedin",
+        status=TaskStatus.DISCOVERED,
+        metadata={"job": {"title": f"Analyst {index}"}},
+        workflow_type="easy_apply",
+        execution_strategy="linkedin_easy_apply",
+        workflow_confidence=0.9,
+    )
+
+
+def test_bulk_enqueue_skips_existing():
+    """Only unseen task_ids are inserted; the rest are reported as skipped."""
+    print("\n=== Bulk Enqueue Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        bus = EventBus()
+        manager = StateManager(storage, event_bus=bus)
+
+        first = manager.enqueue_tasks([_task(i) for i in range(200)])
+        assert len(first) == 200
+        second = manager.enqueue_tasks([_task(i) for i in range(150, 260)] + [_task(300), _task(300)])
+        assert [task.task_id for task in second] == [f"job-{i}" for i in range(200, 260)] + ["job-300"]
+
+        assert storage.count_tasks_by_status(TaskStatus.QUEUED) == 261
+        assert storage.get_existing_task_ids(["job-0", "job-300", "missing"]) == {"job-0", "job-300"}
+
+        loaded = storage.get_task("job-250")
+        assert loaded.status == TaskStatus.QUEUED
+        assert loaded.workflow_type == "easy_apply"
+        assert loaded.metadata == {"job": {"title": "Analyst 250"}}
+        assert [(row["from_status"], row["to_status"]) for row in storage.get_task_history("job-250")] == [
+            ("discovered", "queued")
+        ]
+
+        batches = bus.get_history("TASK_QUEUED_BATCH")
+        assert [event.data["count"] for event in batches] == [200, 61]
+        assert bus.get_history("TASK_QUEUED") == []
+        assert manager.enqueue_tasks([_task(0)]) == []
+        assert len(bus.get_history("TASK_QUEUED_BATCH")) == 2
+        print("✓ 261 tasks queued in two transactions, duplicates skipped")
@@ -0,0 +1,175 @@
+"""
+Tests for fair-share dispatch across platforms.
+
+Validates:
+- A burst on one platform does not starve the others
+- Platform weights set each platform's share of dispatch slots
+- Platform caps bound concurrent tasks per platform
+- A platform returning from idle gets its share, not a backlog of passes
+- Priority aging lets old low-priority tasks overtake fresh high-priority ones
+- Per-platform queue depth and wait time are reported
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.persistence.task_storage import TaskStorage
+from backend.queue.queue import Queue
+from backend.queue.scheduling import FairShareScheduler
+from backend.runtime.task_model import Task, TaskStatus
+
+
+NOW = datetime(2026, 5, 1, 12, 0, 0)
+
+
+def _seed(storage, platform, count, priority=0, age_minutes=0, prefix=None):
+    prefix = prefix or platform
+    tasks = [
+        Task(
+            task_id=f"{prefix}-{index:03d}",
+            job_id=f"{prefix}-job-{index:03d}",
+            source_platform=platform,
+            status=TaskStatus.QUEUED,
+            priority=priority,
+            created_at=NOW - timedelta(minutes=age_minutes, seconds=index),
+        )
+        for index in range(count)
+    ]
+    storage.insert_tasks(tasks, from_status=None)
+
+
+def _tasks(platform, count):
+    return [
+        Task(
+            task_id=f"{platform}-{index:03d}",
+            job_id=f"{platform}-job-{index:03d}",
+            source_platform=platform,
+            status=TaskStatus.QUEUED,
+            created_at=NOW,
+        )
+        for index in range(count)
+    ]
+
+
+class _Candidates:
+    """Storage stub returning a fixed candidate list on every dispatch."""
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+
+    def get_queued_candidates(self, **kwargs):
+        return list(self.tasks)
+
+
+def _platforms(tasks):
+    counts = {}
+    for task in tasks:
+        counts[task.source_platform] = counts.get(task.source_platform, 0) + 1
+    return counts
+
+
+def test_burst_does_not_starve_other_platforms():
+    """A large burst on one platform still leaves slots for the rest."""
+    print("\n=== Fair Share Burst Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        _seed(storage, "linkedin", 200, priority=5)
+        _seed(storage, "indeed", 3)
+        _seed(storage, "glassdoor", 3)
+
+        strict = Queue(storage).dequeue(limit=6)
+        assert _platforms(strict) == {"linkedin": 6}
+
+        scheduler = FairShareScheduler(aging_per_minute=0)
+        selected = scheduler.select(storage, limit=6, now=NOW)
+        assert _platforms(selected) == {"linkedin": 2, "indeed": 2, "glassdoor": 2}
+        print("✓ Burst shares slots evenly instead of filling the batch")
+
+
+def test_weights_and_caps():
+    """Weights scale each share; caps stop dispatch at the running limit."""
+    print("\n=== Fair Share Weights and Caps Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        _seed(storage, "linkedin", 30)
+        _seed(storage, "indeed", 30)
+
+        weighted = FairShareScheduler(weights={"linkedin": 3}, aging_per_minute=0)
+        assert _platforms(weighted.select(storage, limit=8, now=NOW)) == {"linkedin": 6, "indeed": 2}
+
+        capped = FairShareScheduler(caps={"linkedin": 2}, aging_per_minute=0)
+        selected = capped.select(storage, limit=10, running={"linkedin": 1}, now=NOW)
+        assert _platforms(selected) == {"linkedin": 1, "indeed": 9}
+
+        configured = FairShareScheduler.from_settings(
+            {"app": {"scheduling": {"platform_weights": {"indeed": 2}, "platform_caps": {"linkedin": 4}}}}
+        )
+        assert configured.weight("indeed") == 2.0 and configured.weight("linkedin") == 1.0
+        assert configured.caps == {"linkedin": 4}
+        print("✓ 3:1 weight gives 6:2 split, cap of 2 allows one more")
+
+
+def test_returning_platform_does_not_starve_others():
+    """A platform idle for many rounds resumes at the current virtual time."""
+    print("\n=== Fair Share Idle Return Test ===\n")
+
+    scheduler = FairShareScheduler(aging_per_minute=0)
+    both = _Candidates(_tasks("a", 10) + _tasks("b", 10))
+    assert _platforms(scheduler.select(both, limit=2, now=NOW)) == {"a": 1, "b": 1}
+
+    only_a = _Candidates(_tasks("a", 1))
+    for _ in range(100):
+        assert _platforms(scheduler.select(only_a, limit=1, now=NOW)) == {"a": 1}
+
+    assert _platforms(scheduler.select(both, limit=10, now=NOW)) == {"a": 5, "b": 5}
+    print("✓ Returning platform shares slots instead of claiming 100 idle rounds")
+
+
+def test_priority_aging():
+    """Old low-priority tasks overtake new high-priority ones once aged."""
+    print("\n=== Priority Aging Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        _seed(storage, "linkedin", 2, priority=0, age_minutes=120, prefix="old")
+        _seed(storage, "linkedin", 2, priority=5, prefix="new")
+
+        no_aging = FairShareScheduler(aging_per_minute=0)
+        assert [task.task_id for task in no_aging.select(storage, limit=2, now=NOW)] == ["new-001", "new-000"]
+
+        aging = FairShareScheduler(aging_per_minute=0.1)
+        selected = aging.select(storage, limit=2, now=NOW)
+        assert [task.task_id for task in selected] == ["old-001", "old-000"]
+        print("✓ Two hours at 0.1/minute outranks +5 priority")
+
+
+def test_queue_depth_stats():
+    """Depth, due count and wait time are reported per platform."""
+    print("\n=== Fair Share Stats Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        _seed(storage, "linkedin", 4, age_minutes=10)
+        _seed(storage, "indeed", 1)
+        delayed = storage.get_task("indeed-000")
+        delayed.not_before = NOW + timedelta(minutes=5)
+        storage.update_task_state(delayed)
+
+        scheduler = FairShareScheduler(caps={"linkedin": 3}, aging_per_minute=0)
+        selected = scheduler.select(storage, limit=4, running={"linkedin": 1}, now=NOW)
+        assert _platforms(selected) == {"linkedin": 2}
+
+        stats = scheduler.get_stats(storage, running={"linkedin": 3}, now=NOW)
+        assert stats["linkedin"]["queued"] == 4
+        assert stats["linkedin"]["due"] == 4
+        assert stats["linkedin"]["oldest_wait_seconds"] >= 600
+        assert stats["linkedin"]["running"] == 3 and stats["linkedin"]["cap"] == 3
+        assert stats["linkedin"]["dispatched"] == 2
+        assert stats["indeed"]["queued"] == 1 and stats["indeed"]["due"] == 0
+        print("✓ Per-platform depth, due count, waits and dispatch totals")
@@ -0,0 +1,122 @@
+"""
+Tests for the bounded page analysis cache.
+
+Validates:
+- Tracking query parameters normalize away; meaningful ones are kept
+- A wizard step whose structure changes under the same URL misses
+- Entries expire after the TTL and the LRU stays bounded
+- analyze_page_and_plan reuses the analysis of an identical step
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.application.page_analyzer import PageAnalysisCache, PageAnalyzer, normalize_page_url
+from backend.application.session import ApplicationSession
+from backend.workflow.handlers import LinkedInEasyApplyHandler
+
+
+STEP_URL = "https://www.linkedin.com/jobs/view/123/apply"
+
+
+def _step(fields, url=STEP_URL):
+    return {
+        "url": url,
+        "title": "Apply - LinkedIn",
+        "platform": "linkedin",
+        "forms": [
+            {
+                "id": "easy-apply",
+                "name": "questions",
+                "elements": [{"id": name, "type": "input", "label": name, "required": True} for name in fields],
+            }
+        ],
+        "buttons": [{"id": "next", "type": "button", "text": "Next"}],
+    }
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _CountingAnalyzer(PageAnalyzer):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def analyze_page(self, page_data):
+        self.calls += 1
+        return super().analyze_page(page_data)
+
+
+def test_url_normalization():
+    """Tracking parameters and fragments do not split cache entries."""
+    print("\n=== Page URL Normalization Test ===\n")
+
+    canonical = normalize_page_url(STEP_URL)
+    assert normalize_page_url(STEP_URL + "/?trk=public_jobs&refId=abc%3D%3D&trackingId=x#modal") == canonical
+    assert normalize_page_url("HTTPS://WWW.LinkedIn.com/jobs/view/123/apply?utm_source=mail") == canonical
+    assert normalize_page_url(STEP_URL + "?b=2&a=1") == normalize_page_url(STEP_URL + "?a=1&b=2")
+    assert normalize_page_url(STEP_URL + "?currentJobId=9") != canonical
+    print(f"✓ Canonical URL: {canonical}")
+
+
+def test_structure_keyed_ttl_and_lru():
+    """Structure changes miss, old entries expire, size stays bounded."""
+    print("\n=== Page Analysis Cache Test ===\n")
+
+    clock = _Clock()
+    cache = PageAnalysisCache(max_entries=2, ttl_seconds=60, clock=clock)
+    analyzer = _CountingAnalyzer()
+
+    first, hit = cache.get_or_analyze(_step(["email"]), analyzer)
+    assert not hit
+    tracked = _step(["email"], url=STEP_URL + "?trk=flow")
+    again, hit = cache.get_or_analyze(tracked, analyzer)
+    assert hit and analyzer.calls == 1
+    assert again.url == tracked["url"] and again.visible_fields == first.visible_fields
+
+    changed, hit = cache.get_or_analyze(_step(["email", "phone"]), analyzer)
+    assert not hit and len(changed.visible_fields) == 2
+
+    clock.now = 61
+    _, hit = cache.get_or_analyze(_step(["email"]), analyzer)
+    assert not hit
+
+    cache.get_or_analyze(_step(["city"]), analyzer)
+    info = cache.info()
+    assert info["size"] == 2
+    assert info["evictions"] == 1 and info["expirations"] == 1
+    assert info["hits"] == 1 and info["misses"] == 4
+    print(f"✓ Counters: {info}")
+
+
+def test_handler_reuses_identical_step():
+    """Re-analyzing the same wizard step skips the analyzer."""
+    print("\n=== Handler Analysis Cache Test ===\n")
+
+    handler = LinkedInEasyApplyHandler()
+    handler.analysis_cache = PageAnalysisCache()
+    handler.page_analyzer = _CountingAnalyzer()
+    session = ApplicationSession(
+        session_id="session_cache",
+        job_id="job_1",
+        task_id="task_1",
+        workflow_type="linkedin_easy_apply",
+        current_url=STEP_URL,
+    )
+
+    first = handler.analyze_page_and_plan(session, _step(["email", "phone"]))
+    second = handler.analyze_page_and_plan(session, _step(["email", "phone"], url=STEP_URL + "?trk=x"))
+    assert handler.page_analyzer.calls == 1
+    assert second["ready_for_execution"] and second["execution_plan"] is not None
+    assert second["page_analysis"].page_type == first["page_analysis"].page_type
+    assert session.current_url == STEP_URL + "?trk=x"
+    assert len(session.page_analyses) == 2
+    print("✓ Second identical step planned without re-analysis")
@@ -0,0 +1,101 @@
+"""
+Tests for the shared parsed page.
+
+Validates:
+- Pages are cached by HTML digest and the soup is built once
+- Regex scans are memoized per pattern
+- PageDataProducer, LinkedInJobParser, LinkedInDetector and HTMLQuestionParser
+  accept a ParsedPage and give the same results as with raw HTML
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.application.page_data_producer import PageDataProducer
+from backend.application.parsed_page import ParsedPage, as_parsed_page, clear_parsed_pages, get_parsed_page
+from backend.platforms.linkedin.linkedin_detector import LinkedInDetector
+from backend.platforms.linkedin.linkedin_job_parser import LinkedInJobParser
+from backend.platforms.linkedin.linkedin_question_integrator import HTMLQuestionParser
+
+
+URL = "https://www.linkedin.com/jobs/view/4242/"
+
+HTML = """
+<html><head><title>SOC Analyst - LinkedIn</title></head>
+<body>
+  <h1 class="job-title">SOC Analyst</h1>
+  <div class="company-name">Acme Security</div>
+  <span class="job-location">Remote</span>
+  <span>💼 Full-time</span>
+  <section class="description">Monitor alerts, triage incidents and tune detections across the SIEM estate.</section>
+  <button class="easy-apply-button">Easy Apply</button>
+  <form id="apply">
+    <label for="phone">Mobile phone number</label>
+    <input id="phone" name="phone" type="tel" required>
+    <input type="radio" name="sponsorship" id="sponsor-yes" value="yes">
+    <input type="radio" name="sponsorship" id="sponsor-no" value="no">
+    <input type="CHECKBOX" name="follow_company" id="follow">
+    <textarea id="cover" name="cover_letter"></textarea>
+    <select id="years" name="years"><option value="1">1</option><option value="3">3+</option></select>
+    <button type="submit" name="submit">Submit</button>
+  </form>
+</body></html>
+"""
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def test_pages_cached_by_digest():
+    """Same HTML yields the same page; views are computed once."""
+    print("\n=== Parsed Page Cache Test ===\n")
+
+    clear_parsed_pages()
+    page = get_parsed_page(HTML)
+    assert get_parsed_page(str(HTML)) is page
+    assert as_parsed_page(HTML) is page and as_parsed_page(page) is page
+    assert get_parsed_page("<p>other</p>") is not page
+
+    assert page.soup is page.soup
+    assert page.findall(r"<input[^>]*>") is page.findall(r"<input[^>]*>")
+    assert len(page.findall(r"<input[^>]*>")) == 4
+    assert page.contains("EASY APPLY", ignore_case=True) and not page.contains("EASY APPLY")
+    assert not ParsedPage("")
+    print(f"✓ Digest {page.digest[:8]} shared, soup and scans memoized")
+
+
+def test_consumers_share_one_parse():
+    """Every consumer accepts the ParsedPage and matches its raw-HTML result."""
+    print("\n=== Parsed Page Consumers Test ===\n")
+
+    clear_parsed_pages()
+    page = ParsedPage(HTML)
+    raw_page = {"url": URL, "title": "SOC Analyst - LinkedIn", "html": HTML, "platform": "linkedin"}
+
+    producer = PageDataProducer()
+    assert producer.produce(raw_page, parsed=page) == producer.produce(raw_page)
+    assert producer.produce({**raw_page, "html": page}) == producer.produce(raw_page)
+
+    parser = LinkedInJobParser()
+    shared = _run(parser.parse(URL, page))
+    direct = _run(parser.parse(URL, HTML))
+    assert shared.job_title == direct.job_title == "SOC Analyst"
+    assert shared.company_name == direct.company_name == "Acme Security"
+    assert shared.employment_type == "Full-time"
+    assert shared.easy_apply_available and shared.page_type == direct.page_type
+
+    detector = LinkedInDetector()
+    assert _run(detector.is_easy_apply(page)) and not _run(detector.is_external_apply(page))
+    assert _run(detector.get_page_type(URL, page)) == _run(detector.get_page_type(URL, HTML))
+
+    questions = HTMLQuestionParser().extract_questions(page)
+    assert [(q.text, q.field_type) for q in questions] == [
+        (q.text, q.field_type) for q in HTMLQuestionParser().extract_questions(HTML)
+    ]
+    assert {q.field_type for q in questions} >= {"tel", "textarea", "radio", "checkbox"}
+    assert "soup" in page.__dict__
+    print(f"✓ {len(questions)} questions, job metadata and page_data from one parse")
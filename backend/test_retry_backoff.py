@@ -0,0 +1,107 @@
+"""
+Tests for delayed retries with backoff.
+
+Validates:
+- Failures are classified and back off exponentially with jitter, capped per class
+- Retried tasks carry not_before and are not dequeued until it passes
+- The queue reports the earliest due time for the orchestrator's sleep
+- Databases created before not_before existed are migrated
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.persistence.task_storage import TaskStorage
+from backend.queue.queue import Queue
+from backend.queue.retry_policy import RetryPolicy, classify_failure
+from backend.runtime.task_model import TaskStatus
+from backend.state.state_manager import StateManager
+
+
+def test_backoff_by_failure_class():
+    """Delays grow per attempt, stay within jitter bounds and respect caps."""
+    print("\n=== Retry Backoff Policy Test ===\n")
+
+    assert classify_failure("HTTP 429 Too Many Requests") == "rate_limit"
+    assert classify_failure("Timeout 30000ms exceeded") == "timeout"
+    assert classify_failure("net::ERR_CONNECTION_RESET") == "network"
+    assert classify_failure("LinkedIn checkpoint: verify you are human") == "blocked"
+    assert classify_failure("Submit button missing") == "default"
+    assert classify_failure(None) == "default"
+
+    policy = RetryPolicy({"network": (10, 60)}, rng=random.Random(7))
+    for attempt, full in [(1, 10), (2, 20), (3, 40), (4, 60), (8, 60)]:
+        delays = [policy.delay_seconds("connection refused", attempt) for _ in range(50)]
+        assert all(full / 2 <= delay <= full for delay in delays)
+        assert len(set(delays)) > 1
+    assert policy.delay_seconds("429", 1) >= 30
+
+    configured = RetryPolicy.from_settings({"app": {"retry_backoff": {"timeout": {"base": 1}}}})
+    assert configured.backoff["timeout"] == (1.0, 900.0)
+    print("✓ Exponential backoff with equal jitter per failure class")
+
+
+def test_retried_task_waits_for_not_before():
+    """A retried task stays queued but is not dequeued until due."""
+    print("\n=== Retry Not-before Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        manager = StateManager(storage, retry_policy=RetryPolicy(rng=random.Random(1)))
+        queue = Queue(storage)
+
+        ready = manager.create_task("ready", "j0", "linkedin")
+        manager.transition_to_queued(ready)
+        task = manager.create_task("t1", "j1", "linkedin", priority=5)
+        manager.transition_to_queued(task)
+        manager.transition_to_running(task, "worker-1")
+        manager.transition_to_failed(task, "HTTP 429 rate limited")
+        manager.retry_task(task)
+
+        stored = storage.get_task("t1")
+        assert stored.status == TaskStatus.QUEUED and stored.retry_count == 1
+        assert stored.not_before == task.not_before
+        wait = (stored.not_before - datetime.utcnow()).total_seconds()
+        assert 25 <= wait <= 60
+        assert not stored.can_start()
+
+        assert [t.task_id for t in queue.dequeue(limit=5)] == ["ready"]
+        later = stored.not_before + timedelta(seconds=1)
+        assert [t.task_id for t in storage.get_queued_tasks(limit=5, now=later)] == ["t1", "ready"]
+        assert stored.can_start(now=later)
+
+        assert queue.next_due_time() <= datetime.utcnow()
+        manager.transition_to_running(ready, "worker-1")
+        assert queue.next_due_time() == stored.not_before
+        print(f"✓ Rate-limited retry delayed {wait:.0f}s; other work still dequeued")
+
+
+def test_not_before_column_migrates():
+    """Existing task tables gain the not_before column."""
+    print("\n=== Retry Not-before Migration Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "tasks.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE tasks (task_id TEXT PRIMARY KEY, job_id TEXT NOT NULL, source_platform TEXT NOT NULL, "
+                "status TEXT NOT NULL, priority INTEGER, retry_count INTEGER, max_retries INTEGER, worker_id TEXT, "
+                "result TEXT, error_message TEXT, manual_review_context TEXT, metadata TEXT, created_at TEXT NOT NULL, "
+                "updated_at TEXT NOT NULL, started_at TEXT, completed_at TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO tasks VALUES ('old', 'j', 'indeed', 'queued', 0, 0, 3, NULL, NULL, NULL, NULL, NULL, "
+                "'2026-01-01T00:00:00', '2026-01-01T00:00:00', NULL, NULL)"
+            )
+            conn.commit()
+
+        storage = TaskStorage(db_path)
+        assert [t.task_id for t in storage.get_queued_tasks()] == ["old"]
+        assert storage.get_task("old").not_before is None
+        print("✓ not_before added to an existing tasks table")
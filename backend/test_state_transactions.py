@@ -0,0 +1,187 @@
+"""
+Tests for transactional state transitions.
+
+Validates:
+- Every transition appends a task_history row
+- batch() stages transitions and commits them together on exit
+- Events are emitted only after the commit, with per-transition snapshots
+- A failing batch writes and emits nothing
+- Manual review escalation writes the task state and review record together
+- Concurrent asyncio tasks never share a batch
+- The orchestrator commits RUNNING before executing and completions after
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.events.event_bus import EventBus
+from backend.manual_review.review_queue import ManualReviewQueue
+from backend.orchestrator.orchestrator import RuntimeOrchestrator
+from backend.persistence.task_storage import TaskStorage
+from backend.queue.queue import Queue
+from backend.runtime.task_model import Task, TaskResult, TaskStatus
+from backend.state.state_manager import StateManager
+from backend.workers.browser_worker import WorkerPool
+
+
+def _manager(tmpdir: str):
+    storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+    bus = EventBus()
+    return storage, bus, StateManager(storage, event_bus=bus)
+
+
+def test_transitions_record_history():
+    """Each transition lands in task_history."""
+    print("\n=== State Transition History Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage, bus, manager = _manager(tmpdir)
+        task = manager.create_task("t1", "j1", "linkedin")
+        manager.transition_to_queued(task)
+        manager.transition_to_running(task, "worker-1")
+        manager.transition_to_failed(task, "timeout")
+        manager.retry_task(task)
+
+        history = [(row["from_status"], row["to_status"]) for row in storage.get_task_history("t1")]
+        assert history == [
+            ("discovered", "queued"),
+            ("queued", "running"),
+            ("running", "failed"),
+            ("failed", "queued"),
+        ]
+        assert storage.get_task("t1").retry_count == 1
+        print(f"✓ {len(history)} history rows recorded")
+
+
+def test_batch_commits_once_and_emits_after_commit():
+    """Batched transitions are invisible until the batch exits."""
+    print("\n=== State Transition Batch Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage, bus, manager = _manager(tmpdir)
+        tasks = [manager.create_task(f"t{i}", f"j{i}", "indeed") for i in range(3)]
+        seen = []
+        bus.subscribe("TASK_COMPLETED", lambda data: seen.append(storage.get_task(data["task"]["task_id"]).status))
+        bus.clear_history()
+
+        with manager.batch():
+            for task in tasks:
+                manager.transition_to_queued(task)
+                manager.transition_to_running(task, "worker-1")
+                manager.transition_to_completed(task, TaskResult.APPLIED)
+            assert storage.get_task("t0").status == TaskStatus.DISCOVERED
+            assert storage.get_task_history("t0") == []
+            assert bus.get_history() == []
+
+        assert [task.status for task in storage.get_tasks_by_status(TaskStatus.COMPLETED)] == [TaskStatus.COMPLETED] * 3
+        assert seen == [TaskStatus.COMPLETED] * 3
+        events = [(event.event_type, event.data["task"]["status"]) for event in bus.get_history()]
+        assert events[:3] == [("TASK_QUEUED", "queued"), ("TASK_STARTED", "running"), ("TASK_COMPLETED", "completed")]
+        assert len(storage.get_task_history("t2")) == 3
+        print(f"✓ {len(events)} events emitted after a single commit")
+
+
+def test_failed_batch_writes_nothing():
+    """An exception inside batch() discards staged transitions and events."""
+    print("\n=== State Transition Rollback Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage, bus, manager = _manager(tmpdir)
+        task = manager.create_task("t1", "j1", "naukri")
+        bus.clear_history()
+        try:
+            with manager.batch():
+                manager.transition_to_queued(task)
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert storage.get_task("t1").status == TaskStatus.DISCOVERED
+        assert storage.get_task_history("t1") == []
+        assert bus.get_history() == []
+        print("✓ Nothing written or emitted")
+
+
+def test_manual_review_written_with_transition():
+    """record_review stores the review record in the same transaction."""
+    print("\n=== State Transition Manual Review Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage, bus, manager = _manager(tmpdir)
+        task = manager.create_task("t1", "j1", "linkedin")
+        manager.transition_to_queued(task)
+        manager.transition_to_running(task, "worker-1")
+        record = manager.transition_to_manual_review(task, {"reason": "captcha"}, record_review=True)
+
+        stored = storage.get_manual_review_record("t1")
+        assert record.task_id == stored.task_id == "t1"
+        assert stored.context == {"reason": "captcha"}
+        assert storage.get_task("t1").status == TaskStatus.MANUAL_REVIEW
+        assert bus.get_history("MANUAL_REVIEW_REQUIRED")[0].data["task"]["task_id"] == "t1"
+        print("✓ Review record and task state committed together")
+
+
+def test_concurrent_tasks_batch_separately():
+    """Each asyncio task stages into its own batch."""
+    print("\n=== State Transition Context Isolation Test ===\n")
+
+    async def transition(manager, task, fail: bool):
+        with manager.batch():
+            manager.transition_to_queued(task)
+            await asyncio.sleep(0)
+            if fail:
+                raise RuntimeError("boom")
+
+    async def scenario(manager, tasks):
+        return await asyncio.gather(
+            transition(manager, tasks[0], fail=False),
+            transition(manager, tasks[1], fail=True),
+            return_exceptions=True,
+        )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage, bus, manager = _manager(tmpdir)
+        tasks = [manager.create_task(f"t{i}", f"j{i}", "linkedin") for i in range(2)]
+        results = asyncio.run(scenario(manager, tasks))
+
+        assert results[0] is None and isinstance(results[1], RuntimeError)
+        assert storage.get_task("t0").status == TaskStatus.QUEUED
+        assert storage.get_task("t1").status == TaskStatus.DISCOVERED
+        print("✓ A failing task does not discard another task's batch")
+
+
+def test_orchestrator_commits_running_before_execution():
+    """The RUNNING transitions are committed before any task executes."""
+    print("\n=== Orchestrator Batch Boundary Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage, bus, manager = _manager(tmpdir)
+        orchestrator = RuntimeOrchestrator(Queue(storage), manager, WorkerPool(), ManualReviewQueue(storage))
+        manager.enqueue_tasks([
+            Task(
+                task_id=f"t{i}",
+                job_id=f"j{i}",
+                source_platform="linkedin",
+                status=TaskStatus.DISCOVERED,
+                workflow_type="linkedin_easy_apply",
+                execution_strategy="linkedin_easy_apply_flow",
+            )
+            for i in range(3)
+        ])
+
+        seen = {}
+
+        async def run_task(task, worker):
+            seen[task.task_id] = storage.get_task(task.task_id).status
+            return TaskResult.APPLIED
+
+        orchestrator._run_task = run_task
+        asyncio.run(orchestrator._process_batch())
+
+        assert seen == {f"t{i}": TaskStatus.RUNNING for i in range(3)}
+        assert [task.status for task in storage.get_tasks_by_status(TaskStatus.COMPLETED)] == [TaskStatus.COMPLETED] * 3
+        print("✓ Tasks were RUNNING in storage while executing, COMPLETED after")
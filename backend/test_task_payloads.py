@@ -0,0 +1,215 @@
+"""
+Tests for the immutable task payload / mutable task state split.
+
+Validates:
+- The job payload is written once and not rewritten by transitions
+- Transitions only update the narrow state columns
+- Metadata keys added after enqueue survive as an overlay
+- Rows stored before task_payloads still hydrate metadata and workflow fields
+- Payload fingerprints are dropped once a task settles
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.persistence.task_storage import TaskStorage
+from backend.runtime.task_model import Task, TaskResult, TaskStatus
+from backend.state.state_manager import StateManager
+
+
+def _payload_row(db_path: str, task_id: str):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(
+            "SELECT metadata, workflow, stored_at FROM task_payloads WHERE task_id = ?", (task_id,)
+        ).fetchone()
+
+
+def test_payload_written_once_across_transitions():
+    """Transitions leave the payload row untouched."""
+    print("\n=== Task Payload Write-once Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "tasks.db")
+        storage = TaskStorage(db_path)
+        manager = StateManager(storage)
+        job = {"title": "SOC Analyst", "description": "triage " * 500}
+
+        task = manager.create_task("t1", "j1", "linkedin", priority=2, metadata={"job": job})
+        manager.transition_to_queued(task)
+        before = _payload_row(db_path, "t1")
+
+        manager.transition_to_running(task, "worker-1")
+        task.metadata["easy_apply"] = True
+        manager.transition_to_completed(task, TaskResult.APPLIED)
+
+        assert _payload_row(db_path, "t1") == before
+        with sqlite3.connect(db_path) as conn:
+            overlay = conn.execute("SELECT metadata FROM tasks WHERE task_id = 't1'").fetchone()[0]
+        assert json.loads(overlay) == {"easy_apply": True}
+
+        loaded = TaskStorage(db_path).get_task("t1")
+        assert loaded.status == TaskStatus.COMPLETED
+        assert loaded.result == TaskResult.APPLIED
+        assert loaded.worker_id == "worker-1"
+        assert loaded.metadata == {"job": job, "easy_apply": True}
+
+        bare = storage.get_task("t1", with_payload=False)
+        assert bare.status == TaskStatus.COMPLETED and bare.metadata == {"easy_apply": True}
+        print("✓ Payload stored once, overlay holds post-enqueue keys")
+
+
+def test_workflow_fields_round_trip():
+    """Workflow classification lives in the payload and hydrates on read."""
+    print("\n=== Task Payload Workflow Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "tasks.db")
+        storage = TaskStorage(db_path)
+        task = Task(task_id="t2", job_id="j2", source_platform="indeed", status=TaskStatus.DISCOVERED)
+        task.workflow_type = "external_ats"
+        task.execution_strategy = "ats_handler"
+        task.workflow_confidence = 0.9
+        task.workflow_indicators = {"domain": "greenhouse.io"}
+        storage.save_task(task)
+
+        task.status = TaskStatus.QUEUED
+        storage.update_task_state(task)
+        queued = storage.get_queued_tasks(limit=5)
+        assert [t.task_id for t in queued] == ["t2"]
+        assert queued[0].workflow_type == "external_ats"
+        assert queued[0].workflow_indicators == {"domain": "greenhouse.io"}
+
+        task.metadata = {"job": {"title": "Engineer"}}
+        storage.save_task_payload(task)
+        assert storage.get_task("t2").metadata == {"job": {"title": "Engineer"}}
+        print("✓ Workflow fields preserved through state updates")
+
+
+def test_legacy_rows_hydrate():
+    """Tasks stored with metadata inline still load their fields."""
+    print("\n=== Task Payload Legacy Row Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "tasks.db")
+        storage = TaskStorage(db_path)
+        metadata = {"job": {"title": "Old"}, "_workflow_type": "easy_apply", "_workflow_confidence": 0.7}
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO tasks (task_id, job_id, source_platform, status, priority, retry_count, max_retries, "
+                "metadata, created_at, updated_at) VALUES ('old', 'j', 'linkedin', 'queued', 0, 0, 3, ?, "
+                "'2026-01-01T00:00:00', '2026-01-01T00:00:00')",
+                (json.dumps(metadata),),
+            )
+            conn.commit()
+
+        task = storage.get_task("old")
+        assert task.metadata == {"job": {"title": "Old"}}
+        assert task.workflow_type == "easy_apply"
+        assert task.workflow_confidence == 0.7
+
+        task.status = TaskStatus.RUNNING
+        storage.update_task_state(task)
+        assert storage.get_task("old").metadata == {"job": {"title": "Old"}}
+        print("✓ Legacy inline metadata still hydrates")
+
+
+def test_metadata_changes_persist():
+    """Changed payload keys and keys added to unseen payloads are stored."""
+    print("\n=== Task Payload Metadata Update Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "tasks.db")
+        storage = TaskStorage(db_path)
+        task = Task(
+            task_id="t1",
+            job_id="j1",
+            source_platform="linkedin",
+            status=TaskStatus.QUEUED,
+            metadata={"job": {"title": "SOC"}, "easy_apply": False},
+            workflow_type="linkedin_easy_apply",
+        )
+        storage.insert_tasks([task])
+
+        task.metadata["easy_apply"] = True
+        storage.update_task_state(task)
+        assert storage.get_task("t1").metadata == {"job": {"title": "SOC"}, "easy_apply": True}
+
+        # State-only read: payload keys unknown to the loaded task
+        state_only = storage.get_task("t1", with_payload=False)
+        state_only.metadata["error"] = "timeout"
+        storage.update_task_state(state_only)
+        expected = {"job": {"title": "SOC"}, "easy_apply": True, "error": "timeout"}
+        assert storage.get_task("t1").metadata == expected
+
+        # A fresh storage instance that never read the payload
+        fresh = TaskStorage(db_path)
+        task = fresh.get_task("t1", with_payload=False)
+        task.metadata["attempt"] = 2
+        fresh.update_task_state(task)
+        reloaded = TaskStorage(db_path).get_task("t1")
+        assert reloaded.metadata == {**expected, "attempt": 2}
+        assert reloaded.workflow_type == "linkedin_easy_apply"
+
+        # Payload itself is untouched
+        assert json.loads(_payload_row(db_path, "t1")[0]) == {"job": {"title": "SOC"}, "easy_apply": False}
+        print("✓ Changed and added metadata survive, payload stays immutable")
+
+
+def test_legacy_row_metadata_update():
+    """Keys added to a legacy row keep its inline workflow fields."""
+    print("\n=== Task Payload Legacy Update Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "tasks.db")
+        with sqlite3.connect(db_path) as conn:
+            TaskStorage(db_path)
+            conn.execute(
+                "INSERT INTO tasks (task_id, job_id, source_platform, status, priority, retry_count, max_retries, "
+                "metadata, created_at, updated_at) VALUES ('old', 'j', 'linkedin', 'queued', 0, 0, 3, ?, "
+                "'2026-01-01T00:00:00', '2026-01-01T00:00:00')",
+                (json.dumps({"job": {"title": "Old"}, "_workflow_type": "easy_apply"}),),
+            )
+            conn.commit()
+
+        storage = TaskStorage(db_path)
+        task = storage.get_task("old")
+        task.metadata["error"] = "blocked"
+        storage.update_task_state(task)
+
+        reloaded = TaskStorage(db_path).get_task("old")
+        assert reloaded.metadata == {"job": {"title": "Old"}, "error": "blocked"}
+        assert reloaded.workflow_type == "easy_apply"
+        print("✓ Legacy row keeps workflow fields and gains new keys")
+
+
+def test_settled_tasks_release_fingerprints():
+    """Completed and manual-review tasks are not kept in the fingerprint map."""
+    print("\n=== Task Payload Fingerprint Eviction Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "tasks.db")
+        storage = TaskStorage(db_path)
+        manager = StateManager(storage)
+        for index in range(3):
+            task = manager.create_task(f"t{index}", f"j{index}", "linkedin", metadata={"job": {"id": index}})
+            manager.transition_to_queued(task)
+            manager.transition_to_running(task, "worker-1")
+            if index == 2:
+                manager.transition_to_manual_review(task, {"reason": "captcha"})
+            elif index == 1:
+                manager.transition_to_completed(task, TaskResult.APPLIED)
+        assert set(storage._payload_keys) == {"t0"}
+
+        settled = storage.get_task("t2")
+        assert set(storage._payload_keys) == {"t0"}
+
+        # Without a fingerprint the full metadata is written, so nothing is lost
+        settled.metadata["resolution"] = "solved"
+        storage.update_task_state(settled)
+        assert TaskStorage(db_path).get_task("t2").metadata == {"job": {"id": 2}, "resolution": "solved"}
+        print("✓ Only the running task keeps payload fingerprints")
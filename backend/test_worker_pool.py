@@ -0,0 +1,173 @@
+"""
+Tests for the capability-indexed WorkerPool.
+
+Validates:
+- Tasks spread across several workers for the same platform
+- Workers at capacity are skipped; release() frees their slot
+- Workflow-specific capabilities and can_handle() fallbacks both match
+- Utilisation metrics reflect in-flight work
+- The orchestrator defers tasks while their workers are at capacity
+- Tasks no registered worker can handle go to manual review
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.manual_review.review_queue import ManualReviewQueue
+from backend.orchestrator.orchestrator import RuntimeOrchestrator
+from backend.persistence.task_storage import TaskStorage
+from backend.queue.queue import Queue
+from backend.runtime.task_model import Task, TaskResult, TaskStatus
+from backend.state.state_manager import StateManager
+from backend.workers.browser_worker import BrowserWorker, Worker, WorkerPool
+
+
+class LegacyWorker(Worker):
+    """Worker without declared capabilities."""
+
+    def can_handle(self, task: Task) -> bool:
+        return task.source_platform == "naukri"
+
+    async def execute(self, task: Task) -> TaskResult:
+        return TaskResult.APPLIED
+
+
+class AtsWorker(Worker):
+    """Worker for one workflow type on any platform."""
+
+    def capabilities(self):
+        return [("*", "external_ats")]
+
+    def can_handle(self, task: Task) -> bool:
+        return task.workflow_type == "external_ats"
+
+    async def execute(self, task: Task) -> TaskResult:
+        return TaskResult.APPLIED
+
+
+def _task(index: int, platform: str = "linkedin", workflow_type: str = "easy_apply") -> Task:
+    return Task(
+        task_id=f"t{index}",
+        job_id=f"j{index}",
+        source_platform=platform,
+        status=TaskStatus.QUEUED,
+        workflow_type=workflow_type,
+    )
+
+
+def _browser(worker_id: str, capacity: int = 2) -> BrowserWorker:
+    return BrowserWorker(worker_id, {"linkedin": None, "indeed": None}, {}, {}, "", capacity=capacity)
+
+
+def test_work_spreads_across_workers():
+    """Acquisitions go to the least-loaded worker until every slot is taken."""
+    print("\n=== Worker Pool Spread Test ===\n")
+
+    pool = WorkerPool()
+    for index in range(3):
+        pool.register(_browser(f"browser-{index}"))
+
+    acquired = [pool.acquire(_task(index)) for index in range(6)]
+    assert sorted(worker.worker_id for worker in acquired[:3]) == ["browser-0", "browser-1", "browser-2"]
+    assert {worker.worker_id for worker in acquired[3:]} == {"browser-0", "browser-1", "browser-2"}
+    assert pool.acquire(_task(7)) is None
+    assert pool.find_worker_for_task(_task(7)) is None
+
+    metrics = pool.get_utilisation()
+    assert (metrics["in_flight"], metrics["capacity"], metrics["utilisation"]) == (6, 6, 1.0)
+
+    pool.release("browser-1")
+    assert pool.find_worker_for_task(_task(8)).worker_id == "browser-1"
+    assert pool.acquire(_task(8)).worker_id == "browser-1"
+    assert pool.get_utilisation()["workers"]["browser-1"]["completed"] == 1
+    assert pool.acquire(_task(9, platform="naukri")) is None
+    print("✓ Six tasks spread two per worker, full pool refuses the seventh")
+
+
+def test_capability_and_fallback_matching():
+    """Workflow-specific, wildcard and undeclared workers are all found."""
+    print("\n=== Worker Pool Capability Test ===\n")
+
+    pool = WorkerPool()
+    pool.register(_browser("browser-0", capacity=1))
+    pool.register(AtsWorker("ats-0", capacity=4))
+    pool.register(LegacyWorker("legacy-0"))
+
+    assert pool.acquire(_task(1, platform="glassdoor", workflow_type="external_ats")).worker_id == "ats-0"
+    assert pool.acquire(_task(2, platform="naukri")).worker_id == "legacy-0"
+    assert pool.acquire(_task(3, platform="naukri")) is None
+    assert pool.acquire(_task(4, platform="linkedin")).worker_id == "browser-0"
+    assert pool.acquire(_task(5, platform="linkedin")) is None
+
+    pool.unregister("browser-0")
+    pool.register(_browser("browser-0", capacity=1))
+    assert pool.acquire(_task(6, platform="linkedin")).worker_id == "browser-0"
+    assert pool.get_worker_count() == 3
+    print("✓ Index, wildcard and can_handle fallback all dispatch")
+
+
+def test_orchestrator_defers_at_capacity():
+    """A task with no free worker slot stays QUEUED and is pushed back."""
+    print("\n=== Worker Pool At Capacity Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        manager = StateManager(storage)
+        pool = WorkerPool()
+        pool.register(_browser("browser-0", capacity=1))
+        orchestrator = RuntimeOrchestrator(Queue(storage), manager, pool, ManualReviewQueue(storage))
+        tasks = [_task(index, workflow_type="linkedin_easy_apply") for index in range(2)]
+        for task in tasks:
+            task.status = TaskStatus.DISCOVERED
+            task.execution_strategy = "linkedin_easy_apply_flow"
+        manager.enqueue_tasks(tasks)
+
+        dispatched = []
+
+        async def run_task(task, worker):
+            dispatched.append((task.task_id, worker.worker_id))
+            return TaskResult.APPLIED
+
+        orchestrator._run_task = run_task
+        asyncio.run(orchestrator._process_batch())
+
+        assert dispatched == [("t0", "browser-0")]
+        assert storage.get_task("t0").status == TaskStatus.COMPLETED
+        deferred = storage.get_task("t1")
+        assert deferred.status == TaskStatus.QUEUED and deferred.retry_count == 0
+        assert deferred.not_before is not None and not deferred.can_start()
+        assert [row["to_status"] for row in storage.get_task_history("t1")] == ["queued"]
+        assert pool.get_utilisation()["in_flight"] == 0
+        print("✓ Second task left QUEUED until a slot frees up")
+
+
+def test_orchestrator_escalates_without_eligible_worker():
+    """A task no registered worker handles is escalated, not deferred forever."""
+    print("\n=== Worker Pool No Eligible Worker Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = TaskStorage(os.path.join(tmpdir, "tasks.db"))
+        manager = StateManager(storage)
+        pool = WorkerPool()
+        pool.register(_browser("browser-0", capacity=1))
+        assert pool.has_eligible_worker(_task(0, platform="linkedin"))
+        assert not pool.has_eligible_worker(_task(0, platform="unknown"))
+
+        orchestrator = RuntimeOrchestrator(Queue(storage), manager, pool, ManualReviewQueue(storage))
+        task = _task(0, platform="unknown", workflow_type="linkedin_easy_apply")
+        task.status = TaskStatus.DISCOVERED
+        task.execution_strategy = "linkedin_easy_apply_flow"
+        manager.enqueue_tasks([task])
+
+        asyncio.run(orchestrator._process_batch())
+
+        stored = storage.get_task("t0")
+        assert stored.status == TaskStatus.MANUAL_REVIEW
+        assert stored.manual_review_context["reason"] == "no_worker_available"
+        assert storage.get_manual_review_record("t0") is not None
+        assert [row["to_status"] for row in storage.get_task_history("t0")] == ["queued", "manual_review"]
+        print("✓ Unhandled platform escalated to manual review")
@@ -0,0 +1,76 @@
+"""
+Tests for memoized workflow classification.
+
+Validates:
+- URLs reduce to a host+path pattern without query strings or job ids
+- Repeat classifications of the same board are served from the cache
+- Cached results are copies, so callers cannot corrupt the cache
+- The LRU stays bounded and evicts the least recently used signature
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.workflow_classification import WorkflowClassifier, WorkflowType, url_pattern
+
+
+def test_url_pattern_normalization():
+    """Tracking parameters and job ids do not change the pattern."""
+    print("\n=== Workflow URL Pattern Test ===\n")
+
+    first = url_pattern("https://www.LinkedIn.com/jobs/view/1234567890/?trk=abc&refId=x")
+    second = url_pattern("https://www.linkedin.com/jobs/view/987/#apply")
+    assert first == second == "//www.linkedin.com/jobs/view/#/"
+    assert url_pattern("") == ""
+    print(f"✓ Pattern: {first}")
+
+
+def test_repeat_classification_hits_cache():
+    """Jobs on the same board classify once."""
+    print("\n=== Workflow Classifier Cache Test ===\n")
+
+    classifier = WorkflowClassifier()
+    for job_id in range(50):
+        result = classifier.classify(
+            url=f"https://www.linkedin.com/jobs/view/{job_id}?trk={job_id}",
+            page_title=f"Analyst {job_id} | LinkedIn",
+        )
+        assert result.workflow_type == WorkflowType.LINKEDIN_EASY_APPLY
+        assert result.indicators == {"linkedin_url": True, "jobs_path": True, "linkedin_title": True}
+
+    info = classifier.cache_info()
+    assert info["misses"] == 1 and info["hits"] == 49 and info["size"] == 1
+
+    result.indicators["mutated"] = True
+    again = classifier.classify(url="https://www.linkedin.com/jobs/view/1", page_title="LinkedIn")
+    assert "mutated" not in again.indicators
+
+    with_dom = classifier.classify(
+        url="https://www.linkedin.com/jobs/view/1", page_title="LinkedIn", dom_info={"easy_apply_button": True}
+    )
+    assert with_dom.confidence_score > again.confidence_score
+    assert classifier.cache_info()["size"] == 2
+    print(f"✓ {info['hits']} hits for {info['misses']} miss, DOM signature keyed separately")
+
+
+def test_cache_is_bounded():
+    """The LRU evicts the least recently used signature."""
+    print("\n=== Workflow Classifier LRU Test ===\n")
+
+    classifier = WorkflowClassifier(cache_size=2)
+    classifier.classify(url="https://boards.greenhouse.io/a")
+    classifier.classify(url="https://jobs.lever.co/b")
+    classifier.classify(url="https://boards.greenhouse.io/a")
+    classifier.classify(url="https://oracle.com/careers")
+
+    info = classifier.cache_info()
+    assert info["size"] == 2 and info["evictions"] == 1
+    classifier.classify(url="https://boards.greenhouse.io/a")
+    assert classifier.cache_info()["hits"] == 2
+
+    uncached = WorkflowClassifier(cache_size=0)
+    uncached.classify(url="https://jobs.lever.co/b")
+    assert uncached.cache_info()["size"] == 0
+    print("✓ Bounded at 2 entries with LRU eviction")
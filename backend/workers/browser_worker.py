@@ -1,19 +1,40 @@
+import heapq
+import itertools
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 from backend.runtime.task_model import Task, TaskResult
 
 
+# Wildcard for a capability that matches any platform or workflow type
+ANY = "*"
+
+
 class Worker(ABC):
     """Base worker class for task execution."""
 
-    def __init__(self, worker_id: str):
+    def __init__(self, worker_id: str, capacity: int = 1):
         """
         Initialize worker.
 
         Args:
             worker_id: Unique worker identifier
+            capacity: Tasks the worker can run at once
         """
         self.worker_id = worker_id
+        self.capacity = max(1, int(capacity))
+
+    def capabilities(self) -> Optional[Iterable[tuple[str, str]]]:
+        """
+        Declare the (platform, workflow_type) pairs this worker handles.
+
+        Either element may be ANY. Returning None means the worker does not
+        declare capabilities and the pool falls back to can_handle().
+
+        Returns:
+            Capability pairs, or None
+        """
+        return None
 
     @abstractmethod
     async def execute(self, task: Task) -> TaskResult:
@@ -45,7 +66,15 @@ class Worker(ABC):
 class BrowserWorker(Worker):
     """Worker that executes job applications via browser automation."""
 
-    def __init__(self, worker_id: str, apply_functions: dict, settings: dict, profile: dict, resume_path: str):
+    def __init__(
+        self,
+        worker_id: str,
+        apply_functions: dict,
+        settings: dict,
+        profile: dict,
+        resume_path: str,
+        capacity: int = 1,
+    ):
         """
         Initialize browser worker.
 
@@ -55,13 +84,18 @@ class BrowserWorker(Worker):
             settings: Application settings
             profile: User profile
             resume_path: Path to resume file
+            capacity: Browser sessions the worker can run at once
         """
-        super().__init__(worker_id)
+        super().__init__(worker_id, capacity)
         self.apply_functions = apply_functions
         self.settings = settings
         self.profile = profile
         self.resume_path = resume_path
 
+    def capabilities(self) -> list[tuple[str, str]]:
+        """Every platform with an apply function, for any workflow type."""
+        return [(platform, ANY) for platform in self.apply_functions]
+
     def can_handle(self, task: Task) -> bool:
         """Check if platform has apply function."""
         return task.source_platform in self.apply_functions
@@ -151,11 +185,30 @@ class RecoveryWorker(Worker):
 
 
 class WorkerPool:
-    """Pool of workers for task execution."""
+    """
+    Pool of workers for task execution.
+
+    Workers that declare capabilities are indexed by (platform,
+    workflow_type), so finding eligible workers is a dict lookup instead of
+    a can_handle() scan. Each capability keeps a heap of its workers ordered
+    by utilisation (in-flight tasks / capacity); acquire() takes the
+    least-loaded worker with a free slot and release() returns the slot,
+    so tasks spread evenly across workers for the same platform. Workers
+    without declared capabilities are still matched with can_handle().
+    """
 
     def __init__(self):
         """Initialize worker pool."""
         self._workers: dict[str, Worker] = {}
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, int] = {}
+        self._completed: dict[str, int] = {}
+        # Load version per worker; heap entries with an older version are stale
+        self._versions: dict[str, int] = {}
+        self._index: dict[tuple[str, str], list] = {}
+        self._capabilities: dict[str, list[tuple[str, str]]] = {}
+        self._unindexed: list[str] = []
+        self._sequence = itertools.count()
 
     def register(self, worker: Worker) -> None:
         """
@@ -164,7 +217,19 @@ class WorkerPool:
         Args:
             worker: Worker to register
         """
-        self._workers[worker.worker_id] = worker
+        with self._lock:
+            self._remove(worker.worker_id)
+            self._workers[worker.worker_id] = worker
+            self._in_flight[worker.worker_id] = 0
+            self._completed.setdefault(worker.worker_id, 0)
+            capabilities = worker.capabilities()
+            if capabilities is None:
+                self._unindexed.append(worker.worker_id)
+            else:
+                self._capabilities[worker.worker_id] = list(dict.fromkeys(capabilities))
+                for key in self._capabilities[worker.worker_id]:
+                    self._index.setdefault(key, [])
+            self._push(worker.worker_id)
 
     def unregister(self, worker_id: str) -> None:
         """
@@ -173,8 +238,60 @@ class WorkerPool:
         Args:
             worker_id: Worker identifier
         """
-        if worker_id in self._workers:
-            del self._workers[worker_id]
+        with self._lock:
+            self._remove(worker_id)
+
+    def _remove(self, worker_id: str) -> None:
+        if worker_id not in self._workers:
+            return
+        del self._workers[worker_id]
+        self._in_flight.pop(worker_id, None)
+        self._versions.pop(worker_id, None)
+        self._capabilities.pop(worker_id, None)
+        if worker_id in self._unindexed:
+            self._unindexed.remove(worker_id)
+        # Heap entries for the worker go stale and are dropped lazily
+
+    def _load(self, worker_id: str) -> float:
+        return self._in_flight[worker_id] / self._workers[worker_id].capacity
+
+    def _push(self, worker_id: str) -> None:
+        """Publish the worker's current load to each of its capability heaps."""
+        # Versions come from one counter, so a re-registered worker never
+        # revives its old entries
+        entry_version = self._versions[worker_id] = next(self._sequence)
+        load = self._load(worker_id)
+        for key in self._capabilities.get(worker_id, ()):
+            heap = self._index[key]
+            heapq.heappush(heap, (load, next(self._sequence), worker_id, entry_version))
+            if len(heap) > 4 * max(1, len(self._workers)) + 16:
+                self._index[key] = heap = [entry for entry in heap if self._is_current(entry)]
+                heapq.heapify(heap)
+
+    def _is_current(self, entry: tuple) -> bool:
+        return self._versions.get(entry[2]) == entry[3]
+
+    def _least_loaded(self, task: Task) -> Optional[str]:
+        platform = task.source_platform
+        workflow_type = task.workflow_type or ANY
+        best = None
+        for key in {(platform, workflow_type), (platform, ANY), (ANY, workflow_type), (ANY, ANY)}:
+            heap = self._index.get(key)
+            if not heap:
+                continue
+            while heap and not self._is_current(heap[0]):
+                heapq.heappop(heap)
+            if heap and (best is None or heap[0][:2] < best[:2]):
+                best = heap[0]
+        for worker_id in self._unindexed:
+            worker = self._workers[worker_id]
+            if worker.can_handle(task):
+                entry = (self._load(worker_id), -1, worker_id, self._versions[worker_id])
+                if best is None or entry[:2] < best[:2]:
+                    best = entry
+        if best is None or best[0] >= 1.0:
+            return None
+        return best[2]
 
     def get_worker(self, worker_id: str) -> Optional[Worker]:
         """
@@ -190,7 +307,9 @@ class WorkerPool:
 
     def find_worker_for_task(self, task: Task) -> Optional[Worker]:
         """
-        Find suitable worker for task.
+        Find the least-loaded worker with a free slot for task.
+
+        Does not reserve the slot; use acquire() when dispatching.
 
         Args:
             task: Task to execute
@@ -198,10 +317,88 @@ class WorkerPool:
         Returns:
             Worker that can handle task, or None
         """
-        for worker in self._workers.values():
-            if worker.can_handle(task):
-                return worker
-        return None
+        with self._lock:
+            worker_id = self._least_loaded(task)
+            return self._workers[worker_id] if worker_id else None
+
+    def has_eligible_worker(self, task: Task) -> bool:
+        """
+        Check whether any registered worker can handle task, busy or not.
+
+        Args:
+            task: Task to check
+
+        Returns:
+            True if some worker matches the task's platform and workflow
+        """
+        platform = task.source_platform
+        workflow_type = task.workflow_type or ANY
+        keys = {(platform, workflow_type), (platform, ANY), (ANY, workflow_type), (ANY, ANY)}
+        with self._lock:
+            if any(keys.intersection(capabilities) for capabilities in self._capabilities.values()):
+                return True
+            return any(self._workers[worker_id].can_handle(task) for worker_id in self._unindexed)
+
+    def acquire(self, task: Task) -> Optional[Worker]:
+        """
+        Reserve a slot on the least-loaded eligible worker.
+
+        Args:
+            task: Task to dispatch
+
+        Returns:
+            Worker to run the task (release() it when done), or None if every
+            eligible worker is at capacity or none is eligible
+            (see has_eligible_worker)
+        """
+        with self._lock:
+            worker_id = self._least_loaded(task)
+            if worker_id is None:
+                return None
+            self._in_flight[worker_id] += 1
+            self._push(worker_id)
+            return self._workers[worker_id]
+
+    def release(self, worker_id: str) -> None:
+        """
+        Return a slot reserved with acquire().
+
+        Args:
+            worker_id: Worker that finished a task
+        """
+        with self._lock:
+            if not self._in_flight.get(worker_id):
+                return
+            self._in_flight[worker_id] -= 1
+            self._completed[worker_id] = self._completed.get(worker_id, 0) + 1
+            self._push(worker_id)
+
+    def get_utilisation(self) -> dict:
+        """
+        Get per-worker and pool-wide load.
+
+        Returns:
+            Dict with in_flight, capacity and utilisation totals plus a
+            per-worker breakdown
+        """
+        with self._lock:
+            workers = {
+                worker_id: {
+                    "in_flight": self._in_flight[worker_id],
+                    "capacity": worker.capacity,
+                    "utilisation": round(self._load(worker_id), 3),
+                    "completed": self._completed.get(worker_id, 0),
+                }
+                for worker_id, worker in self._workers.items()
+            }
+        in_flight = sum(stats["in_flight"] for stats in workers.values())
+        capacity = sum(stats["capacity"] for stats in workers.values())
+        return {
+            "in_flight": in_flight,
+            "capacity": capacity,
+            "utilisation": round(in_flight / capacity, 3) if capacity else 0.0,
+            "workers": workers,
+        }
 
     def get_all_workers(self) -> list[Worker]:
         """
@@ -19,7 +19,7 @@ import uuid
 from abc import ABC, abstractmethod
 from backend.runtime.task_model import Task
 from backend.application.session import ApplicationSession
-from backend.application.page_analyzer import create_page_analyzer
+from backend.application.page_analyzer import create_page_analyzer, get_page_analysis_cache
 from backend.application.execution_planner import create_execution_planner
 from backend.application.page_data_producer import create_page_data_producer
 from src.core.logger import log
@@ -37,6 +37,7 @@ class WorkflowHandler(ABC):
         """
         self.workflow_type = workflow_type
         self.page_analyzer = create_page_analyzer()
+        self.analysis_cache = get_page_analysis_cache()
 
     @abstractmethod
     def can_handle(self, task: Task) -> bool:
@@ -102,11 +103,11 @@ class WorkflowHandler(ABC):
         Returns:
             Dict with analysis result and execution plan
         """
-        # Analyze page
-        analysis = self.page_analyzer.analyze_page(page_data)
+        # Analyze page (identical wizard steps are served from the cache)
+        analysis, cached = self.analysis_cache.get_or_analyze(page_data, self.page_analyzer)
         session.record_page_analysis(analysis)
 
-        log(f"[{self.__class__.__name__}] Analyzed page: {analysis.page_type}")
+        log(f"[{self.__class__.__name__}] Analyzed page: {analysis.page_type}{' (cached)' if cached else ''}")
         log(f"  - Found {len(analysis.forms)} form(s)")
         log(f"  - Found {len(analysis.visible_fields)} field(s)")
 
@@ -15,9 +15,13 @@ Input: URL, page metadata, DOM information
 Output: workflow_type, confidence_score, execution_strategy
 """
 
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from enum import Enum
-from dataclasses import dataclass
 from typing import Optional
+from urllib.parse import urlsplit
 
 
 class WorkflowType(Enum):
@@ -52,19 +56,143 @@ class WorkflowClassification:
     reasoning: str  # Explanation of classification
 
 
+@dataclass(frozen=True)
+class WorkflowRule:
+    """
+    Indicator weights for one workflow type.
+
+    url/title/site entries are (needle, indicator, weight) substring checks on
+    the lowercased URL host+path, page title and og:site_name; dom entries are
+    (dom_info key, weight) truthiness checks. Rules are evaluated in table
+    order, which also breaks confidence ties.
+    """
+    workflow_type: WorkflowType
+    strategy: ExecutionStrategy
+    label: str
+    url: tuple = ()
+    title: tuple = ()
+    site: tuple = ()
+    dom: tuple = ()
+
+
+WORKFLOW_RULES = (
+    WorkflowRule(
+        WorkflowType.LINKEDIN_EASY_APPLY,
+        ExecutionStrategy.LINKEDIN_EASY_APPLY_FLOW,
+        "LinkedIn Easy Apply",
+        url=(("linkedin.com", "linkedin_url", 0.3), ("/jobs/", "jobs_path", 0.2)),
+        title=(("linkedin", "linkedin_title", 0.1),),
+        dom=(("easy_apply_button", 0.3), ("linkedin_job_card", 0.2)),
+    ),
+    WorkflowRule(
+        WorkflowType.WORKDAY,
+        ExecutionStrategy.WORKDAY_FLOW,
+        "Workday",
+        url=(("workday.com", "workday_domain", 0.4), (("/careers", "/jobs"), "careers_path", 0.2)),
+        title=(("workday", "workday_title", 0.2),),
+        site=(("workday", "workday_og_site", 0.2),),
+        dom=(("workday_form", 0.3), ("workday_iframe", 0.2)),
+    ),
+    WorkflowRule(
+        WorkflowType.GREENHOUSE,
+        ExecutionStrategy.GREENHOUSE_FLOW,
+        "Greenhouse",
+        url=(("greenhouse.io", "greenhouse_domain", 0.4), ("boards.greenhouse.io", "greenhouse_boards", 0.2)),
+        title=(("greenhouse", "greenhouse_title", 0.2),),
+        site=(("greenhouse", "greenhouse_og_site", 0.2),),
+        dom=(("greenhouse_form", 0.3), ("greenhouse_job_board", 0.2)),
+    ),
+    WorkflowRule(
+        WorkflowType.LEVER,
+        ExecutionStrategy.LEVER_FLOW,
+        "Lever",
+        url=(("lever.co", "lever_domain", 0.4), ("/jobs/", "jobs_path", 0.1)),
+        title=(("lever", "lever_title", 0.2),),
+        site=(("lever", "lever_og_site", 0.2),),
+        dom=(("lever_form", 0.3), ("lever_job_posting", 0.2)),
+    ),
+    WorkflowRule(
+        WorkflowType.ORACLE,
+        ExecutionStrategy.ORACLE_FLOW,
+        "Oracle",
+        url=(("oracle.com", "oracle_domain", 0.3), (("/careers", "/jobs"), "careers_path", 0.1)),
+        title=(("oracle", "oracle_title", 0.2),),
+        site=(("oracle", "oracle_og_site", 0.2),),
+        dom=(("oracle_form", 0.3), ("oracle_careers_portal", 0.2)),
+    ),
+    WorkflowRule(
+        WorkflowType.GENERIC,
+        ExecutionStrategy.GENERIC_FORM_FLOW,
+        "Generic workflow",
+        dom=(
+            ("form_fields", 0.2),
+            ("submit_button", 0.2),
+            ("application_form", 0.3),
+            ("job_title", 0.1),
+            ("job_description", 0.1),
+        ),
+    ),
+)
+
+
+def _needles(entries) -> tuple:
+    needles = []
+    for needle, _, _ in entries:
+        needles.extend(needle if isinstance(needle, tuple) else (needle,))
+    return tuple(dict.fromkeys(needles))
+
+
+_URL_NEEDLES = _needles(entry for rule in WORKFLOW_RULES for entry in rule.url)
+_TITLE_NEEDLES = _needles(entry for rule in WORKFLOW_RULES for entry in rule.title)
+_SITE_NEEDLES = _needles(entry for rule in WORKFLOW_RULES for entry in rule.site)
+_DOM_KEYS = tuple(dict.fromkeys(key for rule in WORKFLOW_RULES for key, _ in rule.dom))
+_DIGITS = re.compile(r"\d+")
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def url_pattern(url: str) -> str:
+    """
+    Lowercased host+path with digit runs collapsed.
+
+    Query strings and fragments (tracking parameters) are dropped, and job
+    ids collapse to '#', so every posting on a board shares one pattern. The
+    leading '//' is kept because path rules such as '/jobs' also match a
+    'jobs.' subdomain.
+    """
+    parts = urlsplit((url or "").strip().lower())
+    prefix = "//" if parts.netloc else ""
+    return _DIGITS.sub("#", prefix + parts.netloc + parts.path)
+
+
+def _matched(needle, hits: frozenset) -> bool:
+    if isinstance(needle, tuple):
+        return any(option in hits for option in needle)
+    return needle in hits
+
+
 class WorkflowClassifier:
-    """Classifies application workflows and selects execution strategies."""
-
-    def __init__(self):
-        """Initialize workflow classifier."""
-        self.classifiers = {
-            WorkflowType.LINKEDIN_EASY_APPLY: self._classify_linkedin_easy_apply,
-            WorkflowType.WORKDAY: self._classify_workday,
-            WorkflowType.GREENHOUSE: self._classify_greenhouse,
-            WorkflowType.LEVER: self._classify_lever,
-            WorkflowType.ORACLE: self._classify_oracle,
-            WorkflowType.GENERIC: self._classify_generic,
-        }
+    """
+    Classifies application workflows and selects execution strategies.
+
+    Inputs are reduced to a signature first: the URL host+path pattern, the
+    workflow keywords found in the title and og:site_name, and the DOM
+    indicators present. Every rule only looks at those features, so results
+    are memoized per signature in a bounded LRU and repeat classifications
+    (every job on the same board) skip rule evaluation entirely.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize workflow classifier.
+
+        Args:
+            cache_size: Maximum memoized signatures (0 disables the cache)
+        """
+        self.cache_size = max(0, int(cache_size))
+        self._cache: "OrderedDict[tuple, WorkflowClassification]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
 
     def classify(
         self,
@@ -85,29 +213,108 @@ class WorkflowClassifier:
         Returns:
             WorkflowClassification with type, confidence, and strategy
         """
-        # Normalize inputs
-        page_metadata = page_metadata or {}
+        key = self.signature(url, page_title, page_metadata, dom_info)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return replace(cached, indicators=dict(cached.indicators))
+            self.stats["misses"] += 1
+
+        result = self._classify_signature(*key)
+        if self.cache_size:
+            with self._lock:
+                self._cache[key] = result
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                    self.stats["evictions"] += 1
+        return replace(result, indicators=dict(result.indicators))
+
+    def signature(
+        self,
+        url: str,
+        page_title: Optional[str] = None,
+        page_metadata: Optional[dict] = None,
+        dom_info: Optional[dict] = None,
+    ) -> tuple:
+        """
+        Reduce classification inputs to the features the rules read.
+
+        Returns:
+            (url_pattern, title_hits, site_hits, site_is_linkedin, dom_hits)
+        """
+        pattern = url_pattern(url)
+        title = (page_title or "").lower()
+        site_name = (page_metadata or {}).get("og:site_name", "")
+        site = site_name.lower()
         dom_info = dom_info or {}
+        return (
+            pattern,
+            frozenset(needle for needle in _TITLE_NEEDLES if needle in title),
+            frozenset(needle for needle in _SITE_NEEDLES if needle in site),
+            site_name == "LinkedIn",
+            frozenset(key for key in _DOM_KEYS if dom_info.get(key)),
+        )
 
-        # Run all classifiers
-        results = []
-        for workflow_type, classifier in self.classifiers.items():
-            result = classifier(url, page_title, page_metadata, dom_info)
-            if result:
-                results.append(result)
+    def cache_info(self) -> dict:
+        """Hit/miss/eviction counters and current cache size."""
+        with self._lock:
+            return {**self.stats, "size": len(self._cache), "max_size": self.cache_size}
+
+    def clear_cache(self) -> None:
+        """Drop memoized classifications."""
+        with self._lock:
+            self._cache.clear()
 
-        # Sort by confidence (highest first)
-        results.sort(key=lambda x: x["confidence"], reverse=True)
+    def _classify_signature(
+        self,
+        pattern: str,
+        title_hits: frozenset,
+        site_hits: frozenset,
+        site_is_linkedin: bool,
+        dom_hits: frozenset,
+    ) -> WorkflowClassification:
+        url_hits = frozenset(needle for needle in _URL_NEEDLES if needle in pattern)
 
-        # Return best match or generic fallback
-        if results and results[0]["confidence"] > 0.0:
-            best = results[0]
+        results = []
+        for rule in WORKFLOW_RULES:
+            indicators = {}
+            confidence = 0.0
+            for needle, indicator, weight in rule.url:
+                if _matched(needle, url_hits):
+                    indicators[indicator] = True
+                    confidence += weight
+            for needle, indicator, weight in rule.title:
+                if _matched(needle, title_hits):
+                    indicators[indicator] = True
+                    confidence += weight
+            if rule.workflow_type == WorkflowType.LINKEDIN_EASY_APPLY and site_is_linkedin:
+                indicators["linkedin_og_site"] = True
+                confidence += 0.2
+            for needle, indicator, weight in rule.site:
+                if _matched(needle, site_hits):
+                    indicators[indicator] = True
+                    confidence += weight
+            for key, weight in rule.dom:
+                if key in dom_hits:
+                    indicators[key] = True
+                    confidence += weight
+            if confidence > 0.0:
+                results.append((rule, min(confidence, 1.0), indicators))
+
+        # Sort by confidence (highest first); ties keep rule order
+        results.sort(key=lambda item: item[1], reverse=True)
+
+        if results:
+            rule, confidence, indicators = results[0]
             return WorkflowClassification(
-                workflow_type=best["type"],
-                confidence_score=best["confidence"],
-                execution_strategy=best["strategy"],
-                indicators=best["indicators"],
-                reasoning=best["reasoning"],
+                workflow_type=rule.workflow_type,
+                confidence_score=confidence,
+                execution_strategy=rule.strategy,
+                indicators=indicators,
+                reasoning=f"{rule.label} detected with {len(indicators)} indicators",
             )
 
         return WorkflowClassification(
@@ -118,277 +325,7 @@ class WorkflowClassifier:
             reasoning="Could not classify specifically, treating as generic form",
         )
 
-    def _classify_linkedin_easy_apply(
-        self, url: str, page_title: Optional[str], page_metadata: dict, dom_info: dict
-    ) -> Optional[dict]:
-        """Classify LinkedIn Easy Apply workflow."""
-        indicators = {}
-        confidence = 0.0
-
-        # URL indicators
-        if "linkedin.com" in url.lower():
-            indicators["linkedin_url"] = True
-            confidence += 0.3
-
-        if "/jobs/" in url.lower():
-            indicators["jobs_path"] = True
-            confidence += 0.2
-
-        # Page title indicators
-        if page_title and "linkedin" in page_title.lower():
-            indicators["linkedin_title"] = True
-            confidence += 0.1
-
-        # Metadata indicators
-        if page_metadata.get("og:site_name") == "LinkedIn":
-            indicators["linkedin_og_site"] = True
-            confidence += 0.2
-
-        # DOM indicators
-        if dom_info.get("easy_apply_button"):
-            indicators["easy_apply_button"] = True
-            confidence += 0.3
-
-        if dom_info.get("linkedin_job_card"):
-            indicators["linkedin_job_card"] = True
-            confidence += 0.2
-
-        if confidence > 0.0:
-            return {
-                "type": WorkflowType.LINKEDIN_EASY_APPLY,
-                "confidence": min(confidence, 1.0),
-                "strategy": ExecutionStrategy.LINKEDIN_EASY_APPLY_FLOW,
-                "indicators": indicators,
-                "reasoning": f"LinkedIn Easy Apply detected with {len(indicators)} indicators",
-            }
-
-        return None
-
-    def _classify_workday(
-        self, url: str, page_title: Optional[str], page_metadata: dict, dom_info: dict
-    ) -> Optional[dict]:
-        """Classify Workday workflow."""
-        indicators = {}
-        confidence = 0.0
-
-        # URL indicators
-        if "workday.com" in url.lower():
-            indicators["workday_domain"] = True
-            confidence += 0.4
-
-        if "/careers" in url.lower() or "/jobs" in url.lower():
-            indicators["careers_path"] = True
-            confidence += 0.2
-
-        # Page title indicators
-        if page_title and "workday" in page_title.lower():
-            indicators["workday_title"] = True
-            confidence += 0.2
-
-        # Metadata indicators
-        if "workday" in page_metadata.get("og:site_name", "").lower():
-            indicators["workday_og_site"] = True
-            confidence += 0.2
-
-        # DOM indicators
-        if dom_info.get("workday_form"):
-            indicators["workday_form"] = True
-            confidence += 0.3
-
-        if dom_info.get("workday_iframe"):
-            indicators["workday_iframe"] = True
-            confidence += 0.2
-
-        if confidence > 0.0:
-            return {
-                "type": WorkflowType.WORKDAY,
-                "confidence": min(confidence, 1.0),
-                "strategy": ExecutionStrategy.WORKDAY_FLOW,
-                "indicators": indicators,
-                "reasoning": f"Workday detected with {len(indicators)} indicators",
-            }
-
-        return None
-
-    def _classify_greenhouse(
-        self, url: str, page_title: Optional[str], page_metadata: dict, dom_info: dict
-    ) -> Optional[dict]:
-        """Classify Greenhouse workflow."""
-        indicators = {}
-        confidence = 0.0
-
-        # URL indicators
-        if "greenhouse.io" in url.lower():
-            indicators["greenhouse_domain"] = True
-            confidence += 0.4
-
-        if "boards.greenhouse.io" in url.lower():
-            indicators["greenhouse_boards"] = True
-            confidence += 0.2
-
-        # Page title indicators
-        if page_title and "greenhouse" in page_title.lower():
-            indicators["greenhouse_title"] = True
-            confidence += 0.2
-
-        # Metadata indicators
-        if "greenhouse" in page_metadata.get("og:site_name", "").lower():
-            indicators["greenhouse_og_site"] = True
-            confidence += 0.2
-
-        # DOM indicators
-        if dom_info.get("greenhouse_form"):
-            indicators["greenhouse_form"] = True
-            confidence += 0.3
-
-        if dom_info.get("greenhouse_job_board"):
-            indicators["greenhouse_job_board"] = True
-            confidence += 0.2
-
-        if confidence > 0.0:
-            return {
-                "type": WorkflowType.GREENHOUSE,
-                "confidence": min(confidence, 1.0),
-                "strategy": ExecutionStrategy.GREENHOUSE_FLOW,
-                "indicators": indicators,
-                "reasoning": f"Greenhouse detected with {len(indicators)} indicators",
-            }
-
-        return None
-
-    def _classify_lever(
-        self, url: str, page_title: Optional[str], page_metadata: dict, dom_info: dict
-    ) -> Optional[dict]:
-        """Classify Lever workflow."""
-        indicators = {}
-        confidence = 0.0
-
-        # URL indicators
-        if "lever.co" in url.lower():
-            indicators["lever_domain"] = True
-            confidence += 0.4
-
-        if "/jobs/" in url.lower():
-            indicators["jobs_path"] = True
-            confidence += 0.1
-
-        # Page title indicators
-        if page_title and "lever" in page_title.lower():
-            indicators["lever_title"] = True
-            confidence += 0.2
-
-        # Metadata indicators
-        if "lever" in page_metadata.get("og:site_name", "").lower():
-            indicators["lever_og_site"] = True
-            confidence += 0.2
-
-        # DOM indicators
-        if dom_info.get("lever_form"):
-            indicators["lever_form"] = True
-            confidence += 0.3
-
-        if dom_info.get("lever_job_posting"):
-            indicators["lever_job_posting"] = True
-            confidence += 0.2
-
-        if confidence > 0.0:
-            return {
-                "type": WorkflowType.LEVER,
-                "confidence": min(confidence, 1.0),
-                "strategy": ExecutionStrategy.LEVER_FLOW,
-                "indicators": indicators,
-                "reasoning": f"Lever detected with {len(indicators)} indicators",
-            }
-
-        return None
-
-    def _classify_oracle(
-        self, url: str, page_title: Optional[str], page_metadata: dict, dom_info: dict
-    ) -> Optional[dict]:
-        """Classify Oracle workflow."""
-        indicators = {}
-        confidence = 0.0
-
-        # URL indicators
-        if "oracle.com" in url.lower():
-            indicators["oracle_domain"] = True
-            confidence += 0.3
-
-        if "/careers" in url.lower() or "/jobs" in url.lower():
-            indicators["careers_path"] = True
-            confidence += 0.1
-
-        # Page title indicators
-        if page_title and "oracle" in page_title.lower():
-            indicators["oracle_title"] = True
-            confidence += 0.2
-
-        # Metadata indicators
-        if "oracle" in page_metadata.get("og:site_name", "").lower():
-            indicators["oracle_og_site"] = True
-            confidence += 0.2
-
-        # DOM indicators
-        if dom_info.get("oracle_form"):
-            indicators["oracle_form"] = True
-            confidence += 0.3
-
-        if dom_info.get("oracle_careers_portal"):
-            indicators["oracle_careers_portal"] = True
-            confidence += 0.2
-
-        if confidence > 0.0:
-            return {
-                "type": WorkflowType.ORACLE,
-                "confidence": min(confidence, 1.0),
-                "strategy": ExecutionStrategy.ORACLE_FLOW,
-                "indicators": indicators,
-                "reasoning": f"Oracle detected with {len(indicators)} indicators",
-            }
-
-        return None
-
-    def _classify_generic(
-        self, url: str, page_title: Optional[str], page_metadata: dict, dom_info: dict
-    ) -> Optional[dict]:
-        """Classify Generic/Unknown workflow."""
-        indicators = {}
-        confidence = 0.0
-
-        # Generic form indicators
-        if dom_info.get("form_fields"):
-            indicators["form_fields"] = True
-            confidence += 0.2
-
-        if dom_info.get("submit_button"):
-            indicators["submit_button"] = True
-            confidence += 0.2
-
-        if dom_info.get("application_form"):
-            indicators["application_form"] = True
-            confidence += 0.3
-
-        # Generic job posting indicators
-        if dom_info.get("job_title"):
-            indicators["job_title"] = True
-            confidence += 0.1
-
-        if dom_info.get("job_description"):
-            indicators["job_description"] = True
-            confidence += 0.1
-
-        if confidence > 0.0:
-            return {
-                "type": WorkflowType.GENERIC,
-                "confidence": min(confidence, 1.0),
-                "strategy": ExecutionStrategy.GENERIC_FORM_FLOW,
-                "indicators": indicators,
-                "reasoning": f"Generic workflow detected with {len(indicators)} indicators",
-            }
-
-        return None
-
-
-def create_classifier() -> WorkflowClassifier:
+
+def create_classifier(cache_size: int = DEFAULT_CACHE_SIZE) -> WorkflowClassifier:
     """Factory function to create workflow classifier."""
-    return WorkflowClassifier()
+    return WorkflowClassifier(cache_size=cache_size)
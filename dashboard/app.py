@@ -1,19 +1,21 @@
-import csv
-import io
+import copy
 import os
+import queue
 import sqlite3
+import threading
 import time
 from datetime import datetime, timezone
 
 import docker
-from flask import Flask, request, redirect, url_for, render_template, Response
+from flask import Flask, request, redirect, url_for, render_template, Response, jsonify, stream_with_context
 from flask_socketio import SocketIO
 
 from src.ai.agent_registry import build_agent_registry, ensure_agent_controls, set_agent_enabled
 from src.ai.profile_store import save_profile
-from src.ai.scorer import update_model
+from src.ai.model_trainer import schedule_training
 from src.ai.chat import handle_chat, _load_recent_log
 from src.core.config import default_profile_name, load_profile, load_settings, save_settings
+from src.core.export import EXPORT_FORMATS, iter_export
 from src.core.logger import get_recent_agent_events, log
 from src.core.platform_registry import get_platforms
 from src.services.session_manager import (
@@ -26,14 +28,17 @@ from src.services.session_manager import (
     validate_saved_session,
 )
 from src.core.storage import (
+    bulk_record_feedback,
     get_approved_count,
     get_feedback_label,
     get_job,
+    get_job_stats,
     get_model_state,
     init_db,
     list_jobs,
+    list_jobs_page,
     record_feedback,
-    save_model_state,
+    search_jobs,
     update_job,
 )
 
@@ -42,6 +47,17 @@ app.config['SECRET_KEY'] = 'jobsentinel-secret-key-change-in-production'
 socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 START_TIME = time.time()
 
+_STATS_CACHE_TTL_SECONDS = 2.0
+_STATS_CACHE: dict[str, tuple[float, dict]] = {}
+_STATS_CACHE_LOCK = threading.Lock()
+_SETTINGS_CACHE: dict[str, tuple[int | None, dict]] = {}
+_SETTINGS_CACHE_LOCK = threading.Lock()
+_INITIALIZED_DBS: set[str] = set()
+# Approved jobs waiting for a browser apply in direct_latest mode
+_APPLY_QUEUE: "queue.Queue[tuple[str, dict, str, str]]" = queue.Queue()
+_APPLY_WORKER: threading.Thread | None = None
+_APPLY_WORKER_LOCK = threading.Lock()
+
 
 def _base_dir() -> str:
     return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -54,11 +70,29 @@ def _resolve_db_path(base_dir: str, settings: dict) -> str:
     return os.path.join(base_dir, db_path)
 
 
+def _cached_settings(base_dir: str) -> dict:
+    """Load settings.yaml, re-parsing it only when the file changes."""
+    path = os.path.join(base_dir, "configs", "settings.yaml")
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    with _SETTINGS_CACHE_LOCK:
+        cached = _SETTINGS_CACHE.get(base_dir)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, load_settings(base_dir))
+        with _SETTINGS_CACHE_LOCK:
+            _SETTINGS_CACHE[base_dir] = cached
+    return copy.deepcopy(cached[1])
+
+
 def _load_settings_and_db() -> tuple[str, dict, str]:
     base_dir = _base_dir()
-    settings = load_settings(base_dir)
+    settings = _cached_settings(base_dir)
     db_path = _resolve_db_path(base_dir, settings)
-    init_db(db_path)
+    if db_path not in _INITIALIZED_DBS or not os.path.exists(db_path):
+        init_db(db_path)
+        _INITIALIZED_DBS.add(db_path)
     return base_dir, settings, db_path
 
 
@@ -114,7 +148,21 @@ def _human_duration(seconds: float) -> str:
     return f"{minutes}m {sec:02d}s"
 
 
+def _cached_job_stats(db_path: str) -> dict:
+    """Return the materialized job counters, re-reading them at most once per TTL."""
+    now = time.monotonic()
+    with _STATS_CACHE_LOCK:
+        cached = _STATS_CACHE.get(db_path)
+        if cached and now - cached[0] < _STATS_CACHE_TTL_SECONDS:
+            return cached[1]
+    stats = get_job_stats(db_path)
+    with _STATS_CACHE_LOCK:
+        _STATS_CACHE[db_path] = (now, stats)
+    return stats
+
+
 def _job_stats(db_path: str) -> dict:
+    job_stats = _cached_job_stats(db_path)
     stats: dict[str, int] = {
         "total": 0,
         "queued": 0,
@@ -123,40 +171,16 @@ def _job_stats(db_path: str) -> dict:
         "rejected": 0,
         "skipped": 0,
         "deferred": 0,
+        "duplicate": 0,
     }
-    last_updated = None
-    applied_today = 0
-
-    with sqlite3.connect(db_path) as conn:
-        cur = conn.execute("SELECT status, COUNT(1) FROM jobs GROUP BY status")
-        for status, count in cur.fetchall():
-            if status in stats:
-                stats[status] = int(count)
-            else:
-                stats[status] = int(count)
-        stats["total"] = sum(v for k, v in stats.items() if k != "total")
-
-        row = conn.execute("SELECT MAX(updated_at) FROM jobs").fetchone()
-        if row:
-            last_updated = row[0]
-
-        today = datetime.now(timezone.utc).date().isoformat()
-        row = conn.execute(
-            """
-            SELECT COUNT(1)
-            FROM jobs
-            WHERE status = 'applied'
-              AND substr(applied_at, 1, 10) = ?
-            """,
-            (today,),
-        ).fetchone()
-        if row and row[0] is not None:
-            applied_today = int(row[0])
+    stats.update(job_stats["status"])
+    stats["total"] = job_stats["total"]
 
+    today = datetime.now(timezone.utc).date().isoformat()
     return {
         "counts": stats,
-        "last_updated": last_updated,
-        "applied_today": applied_today,
+        "last_updated": job_stats["last_updated"],
+        "applied_today": job_stats["applied_day"].get(today, 0),
     }
 
 
@@ -275,19 +299,11 @@ def _model_info(db_path: str) -> dict:
         "trained_examples": int(state.get("trained_examples", 0) or 0),
         "feature_count": len(state.get("weights", {}) or {}),
         "bias": round(float(state.get("bias", 0.0) or 0.0), 2),
+        "version": int(state.get("version", 0) or 0),
         "approved_count": get_approved_count(db_path),
     }
 
 
-def _inverse_feedback_label(label: str | None) -> str | None:
-    normalized = (label or "").strip().lower()
-    if normalized in {"approved", "applied", "positive"}:
-        return "rejected"
-    if normalized in {"rejected", "negative", "skipped"}:
-        return "approved"
-    return None
-
-
 def _load_recent_text_log(base_dir: str, limit: int = 200) -> list[str]:
     log_path = os.path.join(base_dir, "data", "jobsentinel.log")
     if not os.path.exists(log_path):
@@ -358,61 +374,54 @@ def _get_analytics_data(db_path: str) -> dict:
     """Get analytics data for charts and metrics."""
     from datetime import datetime, timedelta
 
-    with sqlite3.connect(db_path) as conn:
-        # Pipeline data
-        pipeline_data = []
-        for status in ['total', 'queued', 'review', 'applied', 'rejected', 'skipped']:
-            if status == 'total':
-                count = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
-            else:
-                count = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
-            pipeline_data.append(count)
-
-        # Trends data (last 7 days)
-        trends_labels = []
-        trends_data = []
-        for i in range(6, -1, -1):
-            date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-            trends_labels.append(date)
-            count = conn.execute(
-                "SELECT COUNT(*) FROM jobs WHERE status = 'applied' AND substr(applied_at, 1, 10) = ?",
-                (date,)
-            ).fetchone()[0]
-            trends_data.append(count)
-
-        # Platform data
-        platform_labels = []
-        platform_data = []
-        platforms = conn.execute(
-            "SELECT platform, COUNT(*) FROM jobs WHERE status = 'applied' GROUP BY platform"
-        ).fetchall()
-        for platform, count in platforms:
-            platform_labels.append((platform or 'unknown').capitalize())
-            platform_data.append(count)
-
-        # Agent stats
-        total_evals = conn.execute("SELECT COUNT(*) FROM jobs WHERE score IS NOT NULL").fetchone()[0] or 1
-
-        avg_confidence = 0  # Confidence data not available in current schema
-
-        apply_count = conn.execute("SELECT COUNT(*) FROM jobs WHERE decision = 'APPLY'").fetchone()[0] or 0
-        review_count = conn.execute("SELECT COUNT(*) FROM jobs WHERE decision = 'REVIEW'").fetchone()[0] or 0
-
-        applied_count = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'applied'").fetchone()[0] or 0
-        rejected_count = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'rejected'").fetchone()[0] or 0
-
-        success_rate = round((applied_count / max(applied_count + rejected_count, 1)) * 100, 1)
-
-        agent_stats = {
-            'total_evaluations': total_evals,
-            'avg_confidence': round(avg_confidence, 1),
-            'apply_count': apply_count,
-            'apply_rate': round((apply_count / total_evals) * 100, 1),
-            'review_count': review_count,
-            'review_rate': round((review_count / total_evals) * 100, 1),
-            'success_rate': success_rate
-        }
+    job_stats = _cached_job_stats(db_path)
+    status_counts = job_stats["status"]
+    decision_counts = job_stats["decision"]
+
+    # Pipeline data
+    pipeline_data = [job_stats["total"]]
+    for status in ['queued', 'review', 'applied', 'rejected', 'skipped']:
+        pipeline_data.append(status_counts.get(status, 0))
+
+    # Trends data (last 7 days)
+    trends_labels = []
+    trends_data = []
+    for i in range(6, -1, -1):
+        date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
+        trends_labels.append(date)
+        trends_data.append(job_stats["applied_day"].get(date, 0))
+
+    # Platform data
+    platform_labels = []
+    platform_data = []
+    for platform, count in sorted(job_stats["applied_platform"].items()):
+        platform_labels.append((platform or 'unknown').capitalize())
+        platform_data.append(count)
+
+    # Agent stats
+    total_evals = job_stats["scored"] or 1
+
+    avg_confidence = 0  # Confidence data not available in current schema
+
+    apply_count = decision_counts.get('APPLY', 0)
+    review_count = decision_counts.get('REVIEW', 0)
+
+    applied_count = status_counts.get('applied', 0)
+    rejected_count = status_counts.get('rejected', 0)
+
+    success_rate = round((applied_count / max(applied_count + rejected_count, 1)) * 100, 1)
+
+    agent_stats = {
+        'total_evaluations': total_evals,
+        'avg_confidence': round(avg_confidence, 1),
+        'apply_count': apply_count,
+        'apply_rate': round((apply_count / total_evals) * 100, 1),
+        'review_count': review_count,
+        'review_rate': round((review_count / total_evals) * 100, 1),
+        'success_rate': success_rate
+    }
 
+    with sqlite3.connect(db_path) as conn:
         # Recent decisions
         recent_decisions = []
         try:
@@ -519,26 +528,20 @@ def _dashboard_context(base_dir: str, settings: dict, db_path: str) -> dict:
     }
 
 
-def _apply_feedback_learning(base_dir: str, db_path: str, job_key: str, label: str, source: str) -> None:
+def _record_feedback_label(db_path: str, job_key: str, label: str, source: str) -> bool:
+    """Record feedback and return True when the label changed."""
     previous_label = get_feedback_label(db_path, job_key)
     record_feedback(db_path, job_key, label, source=source)
-    if previous_label == label:
-        return
-    job = get_job(db_path, job_key)
-    if not job:
-        return
-    profile = load_profile(base_dir)
-    updated_state = get_model_state(db_path)
-    undo_label = _inverse_feedback_label(previous_label)
-    if undo_label:
-        updated_state = update_model(job, profile, undo_label, updated_state)
-    updated_state = update_model(job, profile, label, updated_state)
-    save_model_state(
-        db_path,
-        updated_state.get("weights", {}),
-        float(updated_state.get("bias", 0.0) or 0.0),
-        int(updated_state.get("trained_examples", 0) or 0),
-    )
+    return previous_label != label
+
+
+def _retrain_model(base_dir: str, db_path: str) -> None:
+    schedule_training(db_path, load_profile(base_dir))
+
+
+def _apply_feedback_learning(base_dir: str, db_path: str, job_key: str, label: str, source: str) -> None:
+    if _record_feedback_label(db_path, job_key, label, source):
+        _retrain_model(base_dir, db_path)
 
 
 def _run_dashboard_apply(base_dir: str, settings: dict, db_path: str, job: dict) -> tuple[str, str, str]:
@@ -606,6 +609,31 @@ def _run_dashboard_apply(base_dir: str, settings: dict, db_path: str, job: dict)
     return "warn", "review", "Apply flow ended in an unresolved state and needs review."
 
 
+def _dashboard_apply_worker() -> None:
+    """Apply approved jobs one at a time, off the request thread."""
+    while True:
+        base_dir, settings, db_path, job_key = _APPLY_QUEUE.get()
+        try:
+            job = get_job(db_path, job_key)
+            # Skip jobs rejected or applied since they were approved.
+            if job and job.get("status") == "queued":
+                _run_dashboard_apply(base_dir, settings, db_path, job)
+        except Exception as exc:
+            log(f"Dashboard background apply failed for {job_key}: {exc}")
+        finally:
+            _APPLY_QUEUE.task_done()
+
+
+def _enqueue_dashboard_applies(base_dir: str, settings: dict, db_path: str, job_keys: list[str]) -> None:
+    global _APPLY_WORKER
+    with _APPLY_WORKER_LOCK:
+        if _APPLY_WORKER is None or not _APPLY_WORKER.is_alive():
+            _APPLY_WORKER = threading.Thread(target=_dashboard_apply_worker, name="dashboard-apply", daemon=True)
+            _APPLY_WORKER.start()
+    for job_key in job_keys:
+        _APPLY_QUEUE.put((base_dir, settings, db_path, job_key))
+
+
 
 
 @app.route("/")
@@ -620,7 +648,7 @@ def command_center():
     context = _dashboard_context(base_dir, settings, db_path)
 
     # Get jobs for queue (review, queued, deferred)
-    jobs = list_jobs(db_path, statuses=['review', 'queued', 'deferred'], limit=50)
+    jobs = list_jobs(db_path, statuses=['review', 'queued', 'deferred'], limit=50, columns="summary")
 
     # Get recent agent activity (mock for now, will be populated by real agent logs)
     agent_activity = _get_agent_activity(db_path)
@@ -708,39 +736,24 @@ def profile_page():
 def bulk_approve():
     base_dir, settings, db_path = _load_settings_and_db()
     data = request.get_json()
-    job_keys = data.get('job_keys', [])
-    results = []
+    job_keys = [key for key in dict.fromkeys(data.get('job_keys', [])) if key]
 
-    for job_key in job_keys:
-        _apply_feedback_learning(base_dir, db_path, job_key, "approved", "bulk")
-        if _pipeline_mode(settings) == "direct_latest":
-            job = get_job(db_path, job_key)
-            if job:
-                level, result_status, message = _run_dashboard_apply(base_dir, settings, db_path, job)
-                results.append({
-                    "job_key": job_key,
-                    "level": level,
-                    "result": result_status,
-                    "message": message,
-                })
-            else:
-                results.append({
-                    "job_key": job_key,
-                    "level": "warn",
-                    "result": "review",
-                    "message": "Job was not found for apply retry.",
-                })
-        else:
-            update_job(db_path, job_key, status="queued")
-            results.append({
-                "job_key": job_key,
-                "level": "ok",
-                "result": "queued",
-                "message": "Job approved and queued for the next apply cycle.",
-            })
+    # Feedback and status land in one transaction; applying happens later.
+    if bulk_record_feedback(db_path, job_keys, "approved", source="bulk", status="queued"):
+        _retrain_model(base_dir, db_path)
 
-    overall_status = "success" if all(item["level"] == "ok" for item in results) else "warning"
-    return {"status": overall_status, "count": len(job_keys), "results": results}
+    if _pipeline_mode(settings) == "direct_latest":
+        # direct_latest cycles do not drain the queue, so apply in the background.
+        _enqueue_dashboard_applies(base_dir, settings, db_path, job_keys)
+        message = "Job approved; applying in the background."
+    else:
+        message = "Job approved and queued for the next apply cycle."
+
+    results = [
+        {"job_key": job_key, "level": "ok", "result": "queued", "message": message}
+        for job_key in job_keys
+    ]
+    return {"status": "success", "count": len(job_keys), "results": results}
 
 
 @app.post("/bulk-reject")
@@ -749,9 +762,8 @@ def bulk_reject():
     data = request.get_json()
     job_keys = data.get('job_keys', [])
 
-    for job_key in job_keys:
-        _apply_feedback_learning(base_dir, db_path, job_key, "rejected", "bulk")
-        update_job(db_path, job_key, status="rejected")
+    if bulk_record_feedback(db_path, job_keys, "rejected", source="bulk", status="rejected"):
+        _retrain_model(base_dir, db_path)
 
     return {"status": "success", "count": len(job_keys)}
 
@@ -850,7 +862,7 @@ def all_jobs():
 def jobs(status: str):
     base_dir, settings, db_path = _load_settings_and_db()
 
-    allowed = {"all", "applied", "queued", "review", "rejected", "skipped", "deferred"}
+    allowed = {"all", "applied", "queued", "review", "rejected", "skipped", "deferred", "duplicate"}
     if status not in allowed:
         status = "all"
     statuses = None if status == "all" else [status]
@@ -858,14 +870,46 @@ def jobs(status: str):
     platform_filter = None
     if platform in {"linkedin", "indeed", "naukri"}:
         platform_filter = platform
-    jobs = list_jobs(db_path, statuses=statuses, platform=platform_filter, limit=200)
+    query = (request.args.get("q") or "").strip()
+    cursor = (request.args.get("cursor") or "").strip() or None
+
+    def _page(page_cursor):
+        if query:
+            return search_jobs(
+                db_path,
+                query,
+                statuses=statuses,
+                platform=platform_filter,
+                cursor=page_cursor,
+                limit=100,
+                columns="summary",
+            )
+        return list_jobs_page(
+            db_path,
+            statuses=statuses,
+            platform=platform_filter,
+            cursor=page_cursor,
+            limit=100,
+            columns="summary",
+        )
+
+    try:
+        page = _page(cursor)
+    except ValueError:
+        cursor = None
+        page = _page(None)
+    jobs = page["jobs"]
+    next_cursor = page["next_cursor"]
 
     return render_template(
         "jobs.html",
         jobs=jobs,
+        query=query,
+        cursor=cursor,
+        next_cursor=next_cursor,
         current_status=status,
         current_platform=platform_filter or "all",
-        statuses=["all", "review", "applied", "deferred", "rejected", "skipped", "queued"],
+        statuses=["all", "review", "applied", "deferred", "rejected", "skipped", "queued", "duplicate"],
         platforms=["all", "linkedin", "indeed", "naukri"],
         pipeline_mode=_pipeline_mode(settings),
         notice=(request.args.get("notice") or "").strip(),
@@ -876,6 +920,15 @@ def jobs(status: str):
     )
 
 
+@app.get("/job/<job_key>/description")
+def job_description(job_key: str):
+    _base_dir, _settings, db_path = _load_settings_and_db()
+    job = get_job(db_path, job_key)
+    if not job:
+        return jsonify({"error": "not found"}), 404
+    return jsonify({"job_key": job_key, "description": job.get("description") or ""})
+
+
 @app.route("/logs")
 def logs():
     base_dir, settings, db_path = _load_settings_and_db()
@@ -892,6 +945,7 @@ def logs():
 
 
 @app.get("/export.csv")
+@app.get("/export.ndjson")
 def export_csv():
     _base_dir, settings, db_path = _load_settings_and_db()
 
@@ -899,54 +953,21 @@ def export_csv():
     platform = request.args.get("platform", "").strip().lower()
     statuses = None if status == "all" else [status]
     platform_filter = platform if platform in {"linkedin", "indeed", "naukri"} else None
-    jobs = list_jobs(db_path, statuses=statuses, platform=platform_filter, limit=1000)
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "job_key",
-            "platform",
-            "title",
-            "company",
-            "location",
-            "job_url",
-            "status",
-            "easy_apply",
-            "score",
-            "decision",
-            "feedback_label",
-            "posted_at",
-            "posted_text",
-            "created_at",
-            "updated_at",
-            "applied_at",
-        ]
-    )
-    for job in jobs:
-        writer.writerow(
-            [
-                job.get("job_key"),
-                job.get("platform"),
-                job.get("title"),
-                job.get("company"),
-                job.get("location"),
-                job.get("job_url"),
-                job.get("status"),
-                job.get("easy_apply"),
-                job.get("score"),
-                job.get("decision"),
-                job.get("feedback_label"),
-                job.get("posted_at"),
-                job.get("posted_text"),
-                job.get("created_at"),
-                job.get("updated_at"),
-                job.get("applied_at"),
-            ]
-        )
+    since = (request.args.get("since") or "").strip() or None
+    export_format = "ndjson" if request.path.endswith(".ndjson") else "csv"
+    export_format = (request.args.get("format") or export_format).strip().lower()
+    if export_format not in EXPORT_FORMATS:
+        return Response(f"Unsupported export format: {export_format}", status=400, mimetype="text/plain")
 
-    response = Response(output.getvalue(), mimetype="text/csv")
-    response.headers["Content-Disposition"] = 'attachment; filename="jobs.csv"'
+    chunks = iter_export(
+        db_path,
+        export_format,
+        statuses=statuses,
+        platform=platform_filter,
+        since=since,
+    )
+    response = Response(stream_with_context(chunks), mimetype=EXPORT_FORMATS[export_format])
+    response.headers["Content-Disposition"] = f'attachment; filename="jobs.{export_format}"'
     return response
 
 
@@ -71,7 +71,7 @@ def start_background_updates(socketio, db_path, interval=10):
         while True:
             try:
                 # Get latest jobs
-                recent_jobs = list_jobs(db_path, limit=5)
+                recent_jobs = list_jobs(db_path, limit=5, columns="summary")
 
                 # Broadcast to all clients
                 socketio.emit('recent_jobs_update', {
@@ -14,6 +14,7 @@ from typing import Dict, List, Optional
 
 from src.ai.agent_registry import build_agent_registry, get_agent_definition, is_agent_enabled, runtime_status_map
 from src.ai.cloud_llm import create_llm_client
+from src.ai.compiled_profile import compile_profile
 
 
 class BaseAgent:
@@ -47,10 +48,10 @@ class JobEvaluatorAgent(BaseAgent):
         self._system_prompt = None  # Cache system prompt
         self._blocklist_patterns = self._compile_blocklist()
 
-    def _compile_blocklist(self) -> list:
+    def _compile_blocklist(self):
         """Compile seniority blocklist patterns for fast pre-filtering."""
         blocklist = self.settings.get("app", {}).get("seniority_blocklist", [])
-        return [pattern.lower() for pattern in blocklist]
+        return compile_profile(self.profile, blocklist).seniority
 
     def pre_filter(self, job: dict) -> dict:
         """
@@ -61,21 +62,21 @@ class JobEvaluatorAgent(BaseAgent):
         description = job.get("description", "").lower()
 
         # Check seniority blocklist
-        for blocked in self._blocklist_patterns:
-            if blocked in title or blocked in description[:500]:
-                return {
-                    "apply": False,
-                    "confused": False,
-                    "decision": "REJECT",
-                    "score": 20,
-                    "confidence": 95,
-                    "priority_score": 20,
-                    "reasoning": f"Blocked seniority level: {blocked}",
-                    "match_factors": [],
-                    "concerns": [f"Contains blocked keyword: {blocked}"],
-                    "agent": "JobEvaluatorAgent",
-                    "pre_filtered": True
-                }
+        blocked = self._blocklist_patterns.first_match(title, description[:500])
+        if blocked is not None:
+            return {
+                "apply": False,
+                "confused": False,
+                "decision": "REJECT",
+                "score": 20,
+                "confidence": 95,
+                "priority_score": 20,
+                "reasoning": f"Blocked seniority level: {blocked}",
+                "match_factors": [],
+                "concerns": [f"Contains blocked keyword: {blocked}"],
+                "agent": "JobEvaluatorAgent",
+                "pre_filtered": True
+            }
 
         return None  # No pre-filter match, needs LLM evaluation
 
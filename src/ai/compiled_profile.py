@@ -0,0 +1,148 @@
+"""
+Compiled Profile Matcher
+
+Normalizes the candidate profile (skills, keywords, role, location) and the
+seniority blocklist once per profile version, so the scorer, quality scorer,
+evaluator pre-filter, controller and resume tailor stop re-normalizing the
+same terms for every job.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+_CACHE_SIZE = 16
+_CACHE: "OrderedDict[str, CompiledProfile]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and collapse it to space-separated alphanumeric tokens."""
+    return " ".join(re.findall(r"[a-z0-9]+", (text or "").lower()))
+
+
+def _unique(terms) -> tuple[str, ...]:
+    return tuple(term for term in dict.fromkeys(terms) if term)
+
+
+class TermMatcher:
+    """
+    Multi-pattern substring matcher over a fixed, ordered term list.
+
+    Terms are checked with ``str.__contains__`` which, in CPython, beats a
+    combined regex alternation for the short term lists profiles carry.
+    """
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms):
+        self.terms = tuple(terms)
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def contains_any(self, text: str) -> bool:
+        """Return True if any term occurs in text."""
+        return any(term in text for term in self.terms)
+
+    def first_match(self, *texts: str) -> str | None:
+        """Return the first term (in list order) found in any of the texts."""
+        for term in self.terms:
+            for text in texts:
+                if term in text:
+                    return term
+        return None
+
+    def matches(self, text: str) -> list[str]:
+        """Return every term found in text, in list order."""
+        return [term for term in self.terms if term in text]
+
+
+@dataclass(frozen=True)
+class CompiledProfile:
+    """Profile terms normalized once and shared by every scorer and filter."""
+
+    version: str
+    skills: tuple[str, ...]
+    keywords: tuple[str, ...]
+    skill_terms: tuple[str, ...]
+    keyword_terms: tuple[str, ...]
+    skills_lower: tuple[str, ...]
+    keywords_lower: tuple[str, ...]
+    lower_term_set: frozenset
+    role: str
+    location: str
+    seniority: TermMatcher
+
+
+def profile_version(profile: dict, seniority_blocklist=None) -> str:
+    """Hash the profile fields (and blocklist) that compiled matchers depend on."""
+    payload = {
+        "skills": list(profile.get("skills", []) or []),
+        "keywords": list(profile.get("keywords", []) or []),
+        "role": profile.get("role", "") or "",
+        "location": profile.get("location", "") or "",
+        "seniority_blocklist": list(seniority_blocklist or []),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def _build(profile: dict, seniority_blocklist, version: str) -> CompiledProfile:
+    skills = [str(skill or "") for skill in profile.get("skills", []) or []]
+    keywords = [str(keyword or "") for keyword in profile.get("keywords", []) or []]
+    skill_terms = tuple(normalize_text(skill) for skill in skills)
+    keyword_terms = tuple(normalize_text(keyword) for keyword in keywords)
+    skills_lower = tuple(skill.lower() for skill in skills)
+    keywords_lower = tuple(keyword.lower() for keyword in keywords)
+    return CompiledProfile(
+        version=version,
+        skills=_unique(skill_terms),
+        keywords=_unique(keyword_terms),
+        skill_terms=skill_terms,
+        keyword_terms=keyword_terms,
+        skills_lower=skills_lower,
+        keywords_lower=keywords_lower,
+        lower_term_set=frozenset(skills_lower + keywords_lower),
+        role=normalize_text(profile.get("role", "")),
+        location=normalize_text(profile.get("location", "")),
+        seniority=TermMatcher(str(term).lower() for term in seniority_blocklist or []),
+    )
+
+
+def compile_profile(profile: dict, seniority_blocklist=None) -> CompiledProfile:
+    """
+    Return the compiled form of a profile, building it at most once per version.
+
+    Args:
+        profile: Candidate profile
+        seniority_blocklist: Optional seniority terms to compile alongside the
+            profile (e.g. settings["app"]["seniority_blocklist"])
+
+    Returns:
+        Cached CompiledProfile keyed by the profile version hash
+    """
+    version = profile_version(profile or {}, seniority_blocklist)
+    with _CACHE_LOCK:
+        compiled = _CACHE.get(version)
+        if compiled is not None:
+            _CACHE.move_to_end(version)
+            return compiled
+
+    compiled = _build(profile or {}, seniority_blocklist, version)
+    with _CACHE_LOCK:
+        _CACHE[version] = compiled
+        _CACHE.move_to_end(version)
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_profiles() -> None:
+    """Drop every cached compiled profile."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -0,0 +1,210 @@
+"""
+Learned Scorer Trainer
+
+Replays the feedback table in mini-batches to fit the learned weights that
+evaluate_job adds on top of the heuristic score. Each training pass is saved
+as a versioned checkpoint, and scoring reads the current model from an
+in-memory cache that is reloaded only when the stored version changes.
+"""
+
+import math
+import threading
+from datetime import datetime, timezone
+from types import MappingProxyType
+
+from src.ai.compiled_profile import compile_profile
+from src.ai.scorer import NEGATIVE_LABELS, POSITIVE_LABELS, _feature_map, _normalize_term
+from src.core.storage import get_model_state, get_model_version, iter_feedback_examples, save_model_state
+
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_EPOCHS = 8
+DEFAULT_LEARNING_RATE = 0.5
+DEFAULT_L2_PENALTY = 0.01
+
+_MODEL_CACHE: dict[str, dict] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _freeze(model_state: dict) -> dict:
+    """Cache entry for a model state, with read-only weights."""
+    frozen = dict(model_state)
+    frozen["weights"] = MappingProxyType(dict(model_state.get("weights") or {}))
+    return frozen
+
+
+def _label_target(label: str | None) -> int | None:
+    normalized = _normalize_term(label or "")
+    if normalized in POSITIVE_LABELS:
+        return 1
+    if normalized in NEGATIVE_LABELS:
+        return 0
+    return None
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    raw = (value or "").strip()
+    if not raw:
+        return None
+    try:
+        parsed = datetime.fromisoformat(raw[:-1] + "+00:00" if raw.endswith("Z") else raw)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _sigmoid(margin: float) -> float:
+    if margin >= 0:
+        return 1.0 / (1.0 + math.exp(-margin))
+    exp_margin = math.exp(margin)
+    return exp_margin / (1.0 + exp_margin)
+
+
+def load_training_examples(db_path: str, profile: dict, batch_size: int = DEFAULT_BATCH_SIZE) -> list[tuple[dict, int]]:
+    """
+    Read labeled feedback as sparse feature rows.
+
+    Features are computed as of the time each label was recorded, so
+    freshness signals match what the reviewer saw.
+
+    Returns: List of (features, target) with target 1 for positive labels
+    """
+    compiled = compile_profile(profile)
+    examples = []
+    for batch in iter_feedback_examples(db_path, batch_size):
+        for row in batch:
+            target = _label_target(row.get("label"))
+            if target is None:
+                continue
+            features, _matched_terms, _signals = _feature_map(
+                row, profile, compiled, now=_parse_timestamp(row.get("labeled_at"))
+            )
+            examples.append((features, target))
+    return examples
+
+
+def fit_weights(
+    examples: list[tuple[dict, int]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    epochs: int = DEFAULT_EPOCHS,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    l2_penalty: float = DEFAULT_L2_PENALTY,
+) -> tuple[dict[str, float], float]:
+    """
+    Fit logistic weights over sparse features with mini-batch gradient steps.
+
+    Returns: (weights, bias)
+    """
+    weights: dict[str, float] = {}
+    bias = 0.0
+    batch_size = max(1, int(batch_size or 1))
+    decay = 1.0 - (learning_rate * l2_penalty)
+
+    for _epoch in range(max(0, int(epochs))):
+        for start in range(0, len(examples), batch_size):
+            batch = examples[start:start + batch_size]
+            gradient: dict[str, float] = {}
+            bias_gradient = 0.0
+            for features, target in batch:
+                margin = bias
+                for name, value in features.items():
+                    margin += weights.get(name, 0.0) * value
+                error = target - _sigmoid(margin)
+                bias_gradient += error
+                for name, value in features.items():
+                    gradient[name] = gradient.get(name, 0.0) + (error * value)
+
+            step = learning_rate / len(batch)
+            for name in weights:
+                weights[name] *= decay
+            for name, value in gradient.items():
+                weights[name] = weights.get(name, 0.0) + (step * value)
+            bias += step * bias_gradient
+
+    rounded = {name: round(value, 6) for name, value in weights.items() if abs(value) >= 1e-6}
+    return rounded, round(bias, 6)
+
+
+def train_model(
+    db_path: str,
+    profile: dict,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    epochs: int = DEFAULT_EPOCHS,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    l2_penalty: float = DEFAULT_L2_PENALTY,
+) -> dict:
+    """
+    Retrain the learned scorer from the whole feedback table in one pass.
+
+    Training always starts from zero, so relabeled jobs never need their
+    previous update undone. The result is checkpointed as a new model version
+    and becomes the cached scoring model.
+
+    Returns: Saved model state including its version
+    """
+    examples = load_training_examples(db_path, profile, batch_size)
+    weights, bias = fit_weights(examples, batch_size, epochs, learning_rate, l2_penalty)
+    version = save_model_state(db_path, weights, bias, len(examples))
+    model_state = {
+        "weights": weights,
+        "bias": bias,
+        "trained_examples": len(examples),
+        "version": version,
+    }
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE[db_path] = _freeze(model_state)
+    return model_state
+
+
+def get_scoring_model(db_path: str) -> dict:
+    """
+    Return the current model, reloading it only when its version changed.
+
+    Each caller gets its own dict; the weights mapping is shared and
+    read-only, so callers cannot alter the cached model.
+    """
+    version = get_model_version(db_path)
+    with _MODEL_CACHE_LOCK:
+        cached = _MODEL_CACHE.get(db_path)
+        if cached is not None and cached.get("version") == version:
+            return dict(cached)
+    model_state = _freeze(get_model_state(db_path))
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE[db_path] = model_state
+    return dict(model_state)
+
+
+_PENDING_TRAINING: dict[str, dict] = {}
+_RUNNING_TRAINING: set[str] = set()
+_TRAINING_LOCK = threading.Lock()
+
+
+def _training_worker(db_path: str) -> None:
+    while True:
+        with _TRAINING_LOCK:
+            profile = _PENDING_TRAINING.pop(db_path, None)
+            if profile is None:
+                _RUNNING_TRAINING.discard(db_path)
+                return
+        try:
+            train_model(db_path, profile)
+        except Exception as exc:
+            from src.core.logger import log
+            log(f"Model training failed: {exc}", level="error")
+
+
+def schedule_training(db_path: str, profile: dict) -> None:
+    """
+    Run a training pass in the background.
+
+    Requests that arrive while a pass is running coalesce into a single
+    follow-up pass, so a burst of feedback costs at most two passes.
+    """
+    with _TRAINING_LOCK:
+        _PENDING_TRAINING[db_path] = profile
+        if db_path in _RUNNING_TRAINING:
+            return
+        _RUNNING_TRAINING.add(db_path)
+    threading.Thread(target=_training_worker, args=(db_path,), daemon=True).start()
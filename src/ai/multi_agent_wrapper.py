@@ -11,6 +11,7 @@ from src.ai.agents import create_orchestrator
 from src.ai.task_context import create_task_context, TaskStatus
 from src.core.browser import open_context, close_context
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
 
 
 async def apply_with_agents(
@@ -53,7 +54,10 @@ async def apply_with_agents(
     headless = settings.get("app", {}).get("headless", True)
 
     # Open browser context
-    playwright, browser, context = await open_context(headless=headless)
+    playwright, browser, context = await open_context(
+        headless=headless,
+        resource_policy=build_resource_policy("apply", settings),
+    )
 
     try:
         page = await context.new_page()
@@ -164,7 +168,10 @@ async def test_navigation_only(
     orchestrator = create_orchestrator(profile, settings)
 
     headless = settings.get("app", {}).get("headless", True)
-    playwright, browser, context = await open_context(headless=headless)
+    playwright, browser, context = await open_context(
+        headless=headless,
+        resource_policy=build_resource_policy("apply", settings),
+    )
 
     try:
         page = await context.new_page()
@@ -7,14 +7,17 @@ Evaluates job fit quality before application to maximize shortlist probability.
 import re
 from typing import Dict, List, Tuple
 
+from src.ai.compiled_profile import CompiledProfile, compile_profile
 
-def evaluate_fit(profile: dict, job: dict) -> dict:
+
+def evaluate_fit(profile: dict, job: dict, compiled: CompiledProfile | None = None) -> dict:
     """
     Comprehensive job fit evaluation with quality metrics.
 
     Args:
         profile: Candidate profile
         job: Job details
+        compiled: compile_profile(profile), when the caller scores many jobs
 
     Returns:
         {
@@ -33,9 +36,10 @@ def evaluate_fit(profile: dict, job: dict) -> dict:
     description = _normalize(job.get("description", ""))
     job_text = f"{title} {description}"
 
-    profile_skills = [_normalize(s) for s in profile.get("skills", [])]
-    profile_keywords = [_normalize(k) for k in profile.get("keywords", [])]
-    profile_role = _normalize(profile.get("role", ""))
+    compiled = compiled or compile_profile(profile)
+    profile_skills = compiled.skill_terms
+    profile_keywords = compiled.keyword_terms
+    profile_role = compiled.role
     profile_experience = profile.get("experience", "")
 
     # Calculate individual metrics
@@ -12,12 +12,15 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from collections import Counter
 
+from src.ai.compiled_profile import CompiledProfile, compile_profile
+
 
 class ResumeTailor:
     """Tailors resume content to match job requirements."""
 
-    def __init__(self, profile: dict):
+    def __init__(self, profile: dict, compiled: Optional[CompiledProfile] = None):
         self.profile = profile
+        self.compiled = compiled or compile_profile(profile)
         self.tailored_resumes_dir = "data/tailored_resumes"
         os.makedirs(self.tailored_resumes_dir, exist_ok=True)
 
@@ -134,12 +137,11 @@ class ResumeTailor:
                 filtered_freq[word] *= 3
 
         # Extract technical terms and skills from profile
-        profile_skills = [s.lower() for s in self.profile.get("skills", [])]
-        profile_keywords = [k.lower() for k in self.profile.get("keywords", [])]
+        profile_terms = self.compiled.lower_term_set
 
         # Boost profile-matching keywords
         for word in filtered_freq:
-            if word in profile_skills or word in profile_keywords:
+            if word in profile_terms:
                 filtered_freq[word] *= 2
 
         # Get top keywords
@@ -169,7 +171,7 @@ class ResumeTailor:
     def _extract_required_skills(self, description: str) -> List[str]:
         """Extract required skills from job description."""
         description_lower = description.lower()
-        profile_skills = [s.lower() for s in self.profile.get("skills", [])]
+        profile_skills = self.compiled.skills_lower
 
         # Find skills mentioned in job description
         required = []
@@ -182,7 +184,7 @@ class ResumeTailor:
     def _extract_keywords(self, title: str, description: str) -> List[str]:
         """Extract key keywords from job posting."""
         text = f"{title} {description}".lower()
-        profile_keywords = [k.lower() for k in self.profile.get("keywords", [])]
+        profile_keywords = self.compiled.keywords_lower
 
         # Find keywords mentioned in job
         relevant = []
@@ -1,28 +1,41 @@
 import re
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from src.ai.compiled_profile import CompiledProfile, compile_profile
+
 
 POSITIVE_LABELS = {"approve", "approved", "applied", "positive", "accept", "accepted", "good"}
 NEGATIVE_LABELS = {"reject", "rejected", "negative", "skip", "skipped", "decline", "bad"}
 
+ENTRY_TERMS = ("intern", "junior", "entry level", "fresher", "trainee")
+SENIORITY_TERMS = ("senior", "lead", "manager", "principal", "director", "staff", "architect")
 
-def _normalize_term(term: str) -> str:
-    return " ".join(re.findall(r"[a-z0-9]+", (term or "").lower()))
+_BIAS_COLUMN = "__bias__"
 
+# Flat heuristic bonuses, applied in this order when the feature is present.
+HEURISTIC_BONUSES = (
+    ("profile_role_match", 10),
+    ("location_match", 4),
+    ("remote_signal", 2),
+    ("entry_signal", 5),
+    ("easy_apply_signal", 8),
+    ("fresh_24h_signal", 6),
+    ("fresh_7d_signal", 3),
+    ("seniority_signal", -18),
+)
 
-def _unique_terms(terms: list[str]) -> list[str]:
-    seen = set()
-    ordered = []
-    for term in terms:
-        normalized = _normalize_term(term)
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        ordered.append(normalized)
-    return ordered
+
+def _normalize_term(term: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", (term or "").lower()))
 
 
-def _posted_minutes_ago(job: dict) -> int | None:
+def _posted_minutes_ago(job: dict, now: datetime | None = None) -> int | None:
+    now = now or datetime.now(timezone.utc)
     posted_at = (job.get("posted_at") or "").strip()
     if posted_at:
         try:
@@ -30,7 +43,7 @@ def _posted_minutes_ago(job: dict) -> int | None:
             parsed = datetime.fromisoformat(normalized)
             if parsed.tzinfo is None:
                 parsed = parsed.replace(tzinfo=timezone.utc)
-            minutes = int((datetime.now(timezone.utc) - parsed.astimezone(timezone.utc)).total_seconds() // 60)
+            minutes = int((now - parsed.astimezone(timezone.utc)).total_seconds() // 60)
             return max(0, minutes)
         except ValueError:
             pass
@@ -67,7 +80,13 @@ def _posted_minutes_ago(job: dict) -> int | None:
     return amount * unit_minutes[unit]
 
 
-def _feature_map(job: dict, profile: dict) -> tuple[dict[str, float], list[str], list[str]]:
+def _feature_map(
+    job: dict,
+    profile: dict,
+    compiled: CompiledProfile | None = None,
+    now: datetime | None = None,
+) -> tuple[dict[str, float], list[str], list[str]]:
+    compiled = compiled or compile_profile(profile)
     title = _normalize_term(job.get("title", ""))
     description = _normalize_term(job.get("description", ""))
     location = _normalize_term(job.get("location", ""))
@@ -77,12 +96,7 @@ def _feature_map(job: dict, profile: dict) -> tuple[dict[str, float], list[str],
     matched_terms: list[str] = []
     signals: list[str] = []
 
-    skills = _unique_terms(profile.get("skills", []) or [])
-    keywords = _unique_terms(profile.get("keywords", []) or [])
-    role = _normalize_term(profile.get("role", ""))
-    preferred_location = _normalize_term(profile.get("location", ""))
-
-    for skill in skills:
+    for skill in compiled.skills:
         score = 0.0
         if skill in title:
             score += 1.2
@@ -92,7 +106,7 @@ def _feature_map(job: dict, profile: dict) -> tuple[dict[str, float], list[str],
             features[f"skill:{skill}"] = score
             matched_terms.append(skill)
 
-    for keyword in keywords:
+    for keyword in compiled.keywords:
         score = 0.0
         if keyword in title:
             score += 1.3
@@ -102,21 +116,22 @@ def _feature_map(job: dict, profile: dict) -> tuple[dict[str, float], list[str],
             features[f"keyword:{keyword}"] = score
             matched_terms.append(keyword)
 
+    role = compiled.role
     if role and (role in title or role in description):
         features["profile_role_match"] = 1.0
 
-    if preferred_location and preferred_location in location:
+    if compiled.location and compiled.location in location:
         features["location_match"] = 0.8
 
     if "remote" in corpus:
         features["remote_signal"] = 0.4
         signals.append("remote")
 
-    if any(term in corpus for term in ("intern", "junior", "entry level", "fresher", "trainee")):
+    if any(term in corpus for term in ENTRY_TERMS):
         features["entry_signal"] = 0.8
         signals.append("entry")
 
-    if any(term in corpus for term in ("senior", "lead", "manager", "principal", "director", "staff", "architect")):
+    if any(term in corpus for term in SENIORITY_TERMS):
         features["seniority_signal"] = 1.0
         signals.append("senior")
 
@@ -124,7 +139,7 @@ def _feature_map(job: dict, profile: dict) -> tuple[dict[str, float], list[str],
         features["easy_apply_signal"] = 1.0
         signals.append("easy_apply")
 
-    posted_minutes_ago = _posted_minutes_ago(job)
+    posted_minutes_ago = _posted_minutes_ago(job, now)
     if posted_minutes_ago is not None and posted_minutes_ago <= 24 * 60:
         features["fresh_24h_signal"] = 0.9
         signals.append("fresh_24h")
@@ -135,28 +150,14 @@ def _feature_map(job: dict, profile: dict) -> tuple[dict[str, float], list[str],
     return features, list(dict.fromkeys(matched_terms)), list(dict.fromkeys(signals))
 
 
-def _heuristic_evaluate_job(job: dict, profile: dict) -> dict:
-    model_state = {}
-    features, matched_terms, signals = _feature_map(job, profile)
-
-    heuristic_score = 42
-    heuristic_score += sum(value * 8 for name, value in features.items() if name.startswith("skill:"))
-    heuristic_score += sum(value * 9 for name, value in features.items() if name.startswith("keyword:"))
-    heuristic_score += 10 if "profile_role_match" in features else 0
-    heuristic_score += 4 if "location_match" in features else 0
-    heuristic_score += 2 if "remote_signal" in features else 0
-    heuristic_score += 5 if "entry_signal" in features else 0
-    heuristic_score += 8 if "easy_apply_signal" in features else 0
-    heuristic_score += 6 if "fresh_24h_signal" in features else 0
-    heuristic_score += 3 if "fresh_7d_signal" in features else 0
-    heuristic_score -= 18 if "seniority_signal" in features else 0
-
-    weights = model_state.get("weights", {}) or {}
-    bias = float(model_state.get("bias", 0.0) or 0.0)
-    learned_adjustment = bias
-    for name, value in features.items():
-        learned_adjustment += float(weights.get(name, 0.0) or 0.0) * value
-
+def _decision(
+    features: dict[str, float],
+    matched_terms: list[str],
+    signals: list[str],
+    heuristic_score: float,
+    learned_adjustment: float,
+    trained_examples: int,
+) -> dict:
     score = round(max(0, min(100, heuristic_score + (learned_adjustment * 10))))
     priority_score = score
     priority_score += 8 if "easy_apply_signal" in features else 0
@@ -172,10 +173,135 @@ def _heuristic_evaluate_job(job: dict, profile: dict) -> dict:
         "learned_adjustment": round(learned_adjustment * 10, 2),
         "matched_terms": matched_terms[:6],
         "signals": signals[:6],
-        "trained_examples": int(model_state.get("trained_examples", 0) or 0),
+        "trained_examples": trained_examples,
     }
 
 
+def _score_features(
+    features: dict[str, float],
+    matched_terms: list[str],
+    signals: list[str],
+    model_state: dict,
+) -> dict:
+    heuristic_score = 42
+    heuristic_score += sum(value * 8 for name, value in features.items() if name.startswith("skill:"))
+    heuristic_score += sum(value * 9 for name, value in features.items() if name.startswith("keyword:"))
+    for name, bonus in HEURISTIC_BONUSES:
+        heuristic_score += bonus if name in features else 0
+
+    weights = model_state.get("weights", {}) or {}
+    bias = float(model_state.get("bias", 0.0) or 0.0)
+    learned_adjustment = bias
+    for name, value in features.items():
+        learned_adjustment += float(weights.get(name, 0.0) or 0.0) * value
+
+    return _decision(
+        features,
+        matched_terms,
+        signals,
+        heuristic_score,
+        learned_adjustment,
+        int(model_state.get("trained_examples", 0) or 0),
+    )
+
+
+def _heuristic_evaluate_job(
+    job: dict,
+    profile: dict,
+    model_state: dict | None = None,
+    compiled: CompiledProfile | None = None,
+) -> dict:
+    features, matched_terms, signals = _feature_map(job, profile, compiled)
+    return _score_features(features, matched_terms, signals, model_state or {})
+
+
+def _score_feature_matrix(
+    rows: list[tuple[dict[str, float], list[str], list[str]]],
+    model_state: dict,
+) -> list[dict]:
+    """Score a batch of feature maps as sparse job x feature products.
+
+    Each job contributes one CSR-style row whose first entry is a constant
+    bias column. Heuristic and learned weights are applied as sparse
+    matrix-vector products via ``np.bincount``; entries are accumulated in the
+    same order as ``_score_features`` so the rounded results are identical.
+    """
+    weights = model_state.get("weights", {}) or {}
+    bias = float(model_state.get("bias", 0.0) or 0.0)
+    trained_examples = int(model_state.get("trained_examples", 0) or 0)
+    job_count = len(rows)
+
+    columns: dict[str, int] = {_BIAS_COLUMN: 0}
+    row_ids: list[int] = []
+    col_ids: list[int] = []
+    values: list[float] = []
+    for row, (features, _matched_terms, _signals) in enumerate(rows):
+        row_ids.append(row)
+        col_ids.append(0)
+        values.append(1.0)
+        for name, value in features.items():
+            row_ids.append(row)
+            col_ids.append(columns.setdefault(name, len(columns)))
+            values.append(value)
+
+    names = list(columns)
+    row_idx = np.asarray(row_ids, dtype=np.intp)
+    col_idx = np.asarray(col_ids, dtype=np.intp)
+    data = np.asarray(values, dtype=np.float64)
+
+    is_skill = np.asarray([name.startswith("skill:") for name in names], dtype=bool)[col_idx]
+    is_keyword = np.asarray([name.startswith("keyword:") for name in names], dtype=bool)[col_idx]
+
+    heuristic = np.full(job_count, 42.0)
+    heuristic = heuristic + np.bincount(row_idx[is_skill], weights=data[is_skill] * 8, minlength=job_count)
+    heuristic = heuristic + np.bincount(row_idx[is_keyword], weights=data[is_keyword] * 9, minlength=job_count)
+    for name, bonus in HEURISTIC_BONUSES:
+        column = columns.get(name)
+        if column is None:
+            continue
+        present = np.zeros(job_count)
+        present[row_idx[col_idx == column]] = 1.0
+        heuristic = heuristic + present * bonus
+
+    weight_vector = np.asarray(
+        [bias] + [float(weights.get(name, 0.0) or 0.0) for name in names[1:]],
+        dtype=np.float64,
+    )
+    learned = np.bincount(row_idx, weights=weight_vector[col_idx] * data, minlength=job_count)
+
+    has_term = np.bincount(row_idx[is_skill | is_keyword], minlength=job_count) > 0
+    results = []
+    for row, (heuristic_score, learned_adjustment, term_matched) in enumerate(
+        zip(heuristic.tolist(), learned.tolist(), has_term.tolist())
+    ):
+        features, matched_terms, signals = rows[row]
+        if not term_matched:
+            heuristic_score = int(heuristic_score)
+        results.append(
+            _decision(features, matched_terms, signals, heuristic_score, learned_adjustment, trained_examples)
+        )
+    return results
+
+
+def evaluate_jobs(
+    jobs: list[dict],
+    profile: dict,
+    model_state: dict | None = None,
+) -> list[dict]:
+    """Evaluate a batch of jobs, returning one ``evaluate_job`` dict per job.
+
+    The profile is compiled once for the whole batch and, when numpy is
+    available, heuristic and learned weights are applied as sparse
+    matrix-vector products instead of per-job dict walks.
+    """
+    model_state = model_state or {}
+    compiled = compile_profile(profile)
+    rows = [_feature_map(job, profile, compiled) for job in jobs]
+    if np is None or not rows:
+        return [_score_features(features, matched, signals, model_state) for features, matched, signals in rows]
+    return _score_feature_matrix(rows, model_state)
+
+
 def _build_job_prompt(job: dict, profile: dict) -> str:
     skills = ", ".join(profile.get("skills", []) or ["security"])
     keywords = ", ".join(profile.get("keywords", []) or ["security"])
@@ -224,9 +350,10 @@ def evaluate_job(
     min_score: int = 70,
     uncertainty_margin: int = 5,
     model_state: dict | None = None,
+    compiled: CompiledProfile | None = None,
 ) -> dict:
     """Evaluate if a job matches the candidate profile."""
-    return _heuristic_evaluate_job(job, profile)
+    return _heuristic_evaluate_job(job, profile, model_state, compiled)
 
 
 def update_model(
@@ -0,0 +1,126 @@
+"""
+Tests for the batch job scorer.
+
+Validates:
+- evaluate_jobs returns the same dicts as evaluate_job
+- Learned weights from model_state are applied identically in batch mode
+- The pure-Python fallback matches the numpy path
+- Throughput at 10k jobs (benchmark, printed)
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.ai import scorer
+from src.ai.scorer import _heuristic_evaluate_job, evaluate_job, evaluate_jobs, update_model
+
+
+PROFILE = {
+    "role": "Security Analyst",
+    "location": "Bengaluru",
+    "skills": ["Python", "SIEM", "Splunk", "Incident Response", "SOC", "soc analyst", "python"],
+    "keywords": ["SOC Analyst", "Threat Intel", "Cloud Security", "Pen", "Pentest"],
+}
+
+_WORDS = (
+    "python siem splunk incident response soc analyst threat intel cloud security pentest "
+    "vulnerability remote junior senior lead intern engineer team data network linux aws"
+).split()
+
+
+def _make_jobs(count: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    jobs = []
+    for index in range(count):
+        posted_at = ""
+        posted_text = ""
+        roll = rng.random()
+        if roll < 0.3:
+            posted_at = (now - timedelta(hours=rng.randint(0, 400))).isoformat()
+        elif roll < 0.6:
+            posted_text = f"{rng.randint(1, 30)} {rng.choice(['hours', 'days', 'weeks'])} ago"
+        jobs.append(
+            {
+                "title": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 6))).title(),
+                "company": f"Company {index}",
+                "location": rng.choice(["Bengaluru, India", "Remote", "Pune", ""]),
+                "description": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 120))),
+                "easy_apply": rng.choice([0, 1, None]),
+                "posted_at": posted_at,
+                "posted_text": posted_text,
+            }
+        )
+    return jobs
+
+
+def _trained_model_state(jobs: list[dict]) -> dict:
+    model_state = {"bias": 0.05}
+    for index, job in enumerate(jobs[:40]):
+        label = "approved" if index % 3 else "rejected"
+        model_state = update_model(job, PROFILE, label, model_state)
+    return model_state
+
+
+def test_batch_matches_single_job_evaluation():
+    """evaluate_jobs must return exactly what evaluate_job returns per job."""
+    print("\n=== Batch Scorer Equivalence Test ===\n")
+
+    jobs = _make_jobs(500)
+    expected = [evaluate_job(job, PROFILE) for job in jobs]
+    actual = evaluate_jobs(jobs, PROFILE)
+
+    assert actual == expected
+    print(f"✓ {len(jobs)} batch results match evaluate_job")
+
+
+def test_batch_applies_learned_weights():
+    """Learned weights are applied identically in batch and per-job scoring."""
+    print("\n=== Batch Scorer Learned Weights Test ===\n")
+
+    jobs = _make_jobs(500, seed=11)
+    model_state = _trained_model_state(jobs)
+    expected = [_heuristic_evaluate_job(job, PROFILE, model_state) for job in jobs]
+    actual = evaluate_jobs(jobs, PROFILE, model_state)
+
+    assert actual == expected
+    assert any(result["learned_adjustment"] for result in actual)
+    print(f"✓ Learned adjustments match for {len(jobs)} jobs")
+
+
+def test_batch_fallback_without_numpy(monkeypatch):
+    """The pure-Python path returns the same results as the numpy path."""
+    print("\n=== Batch Scorer Fallback Test ===\n")
+
+    jobs = _make_jobs(200, seed=3)
+    model_state = _trained_model_state(jobs)
+    with_numpy = evaluate_jobs(jobs, PROFILE, model_state)
+    monkeypatch.setattr(scorer, "np", None)
+    without_numpy = evaluate_jobs(jobs, PROFILE, model_state)
+
+    assert with_numpy == without_numpy
+    assert evaluate_jobs([], PROFILE) == []
+    print("✓ Fallback results match")
+
+
+def test_batch_scorer_benchmark_10k():
+    """Benchmark batch scoring against per-job scoring at 10k jobs."""
+    print("\n=== Batch Scorer Benchmark (10k jobs) ===\n")
+
+    jobs = _make_jobs(10_000, seed=42)
+    model_state = _trained_model_state(jobs)
+
+    start = time.perf_counter()
+    expected = [_heuristic_evaluate_job(job, PROFILE, model_state) for job in jobs]
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = evaluate_jobs(jobs, PROFILE, model_state)
+    batch_seconds = time.perf_counter() - start
+
+    print(f"  - numpy available: {scorer.np is not None}")
+    print(f"  - per-job: {single_seconds:.3f}s")
+    print(f"  - batch:   {batch_seconds:.3f}s")
+    assert actual == expected
+    print("✓ Benchmark results match")
@@ -0,0 +1,109 @@
+"""
+Tests for the compiled profile matcher cache.
+
+Validates:
+- One compiled profile per profile version (LRU cache)
+- Version changes when matching-relevant fields change
+- Seniority matcher semantics used by the pre-filter and controller
+- Per-job scorers reuse a compiled profile passed in by the caller
+"""
+
+from src.ai import compiled_profile, quality_scorer, resume_tailor, scorer
+from src.ai.compiled_profile import TermMatcher, clear_compiled_profiles, compile_profile
+
+
+PROFILE = {
+    "name": "Test Candidate",
+    "role": "Security Analyst",
+    "location": "Bengaluru",
+    "skills": ["Python", "SIEM", "python", ""],
+    "keywords": ["SOC Analyst", "Threat-Intel"],
+}
+
+
+def test_compile_profile_is_cached_per_version():
+    """The same profile content returns the same compiled object."""
+    print("\n=== Compiled Profile Cache Test ===\n")
+
+    clear_compiled_profiles()
+    first = compile_profile(PROFILE)
+    second = compile_profile(dict(PROFILE, name="Other Name"))
+    assert first is second
+    print(f"✓ Cached by version {first.version[:12]}")
+
+    changed = compile_profile(dict(PROFILE, skills=["Python", "Splunk"]))
+    assert changed is not first
+    assert changed.version != first.version
+    print("✓ Skill change produces a new version")
+
+    with_blocklist = compile_profile(PROFILE, ["Senior"])
+    assert with_blocklist.version != first.version
+    assert with_blocklist.seniority.terms == ("senior",)
+    print("✓ Blocklist is part of the version")
+
+
+def test_compiled_terms():
+    """Normalized term views match what each consumer used to build."""
+    print("\n=== Compiled Profile Terms Test ===\n")
+
+    compiled = compile_profile(PROFILE)
+    assert compiled.skills == ("python", "siem")
+    assert compiled.skill_terms == ("python", "siem", "python", "")
+    assert compiled.keywords == ("soc analyst", "threat intel")
+    assert compiled.keywords_lower == ("soc analyst", "threat-intel")
+    assert "siem" in compiled.lower_term_set
+    assert compiled.role == "security analyst"
+    assert compiled.location == "bengaluru"
+    print("✓ Term views verified")
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    """The cache holds a bounded number of profile versions."""
+    print("\n=== Compiled Profile LRU Test ===\n")
+
+    clear_compiled_profiles()
+    monkeypatch.setattr(compiled_profile, "_CACHE_SIZE", 2)
+    oldest = compile_profile({"skills": ["a"]})
+    compile_profile({"skills": ["b"]})
+    compile_profile({"skills": ["c"]})
+    assert len(compiled_profile._CACHE) == 2
+    assert compile_profile({"skills": ["a"]}) is not oldest
+    print("✓ Oldest version evicted")
+
+
+def test_term_matcher():
+    """TermMatcher keeps list-order semantics."""
+    print("\n=== Term Matcher Test ===\n")
+
+    matcher = TermMatcher(["senior", "lead"])
+    assert matcher.first_match("team lead", "senior engineer") == "senior"
+    assert matcher.first_match("analyst", "junior") is None
+    assert matcher.contains_any("lead analyst")
+    assert not matcher.contains_any("analyst")
+    assert matcher.matches("senior lead") == ["senior", "lead"]
+    assert not TermMatcher([])
+    print("✓ Matcher semantics verified")
+
+
+def test_callers_reuse_compiled_profile(monkeypatch, tmp_path):
+    """evaluate_fit, evaluate_job and ResumeTailor never recompile a passed-in profile."""
+    print("\n=== Compiled Profile Reuse Test ===\n")
+
+    job = {"title": "SOC Analyst", "description": "Python and SIEM monitoring"}
+    compiled = compile_profile(PROFILE)
+    expected_fit = quality_scorer.evaluate_fit(PROFILE, job)
+    expected_decision = scorer.evaluate_job(job, PROFILE)
+    monkeypatch.chdir(tmp_path)
+    expected_skills = resume_tailor.ResumeTailor(PROFILE)._extract_required_skills(job["description"])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("profile compiled per job")
+
+    for module in (quality_scorer, scorer, resume_tailor):
+        monkeypatch.setattr(module, "compile_profile", fail)
+
+    assert quality_scorer.evaluate_fit(PROFILE, job, compiled) == expected_fit
+    assert scorer.evaluate_job(job, PROFILE, compiled=compiled) == expected_decision
+    tailor = resume_tailor.ResumeTailor(PROFILE, compiled)
+    assert tailor._extract_required_skills(job["description"]) == expected_skills
+    print("✓ Scorers used the caller's compiled profile")
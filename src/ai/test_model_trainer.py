@@ -0,0 +1,131 @@
+"""
+Tests for the mini-batch learned scorer trainer.
+
+Validates:
+- Replaying the feedback table produces versioned checkpoints
+- Relabeling a job is handled by retraining, without undo updates
+- The cached scoring model reloads only when the version changes
+- evaluate_job applies the learned weights
+"""
+
+import os
+import tempfile
+
+from src.ai.model_trainer import get_scoring_model, train_model
+from src.ai.scorer import evaluate_job
+from src.core.storage import (
+    get_model_checkpoint,
+    get_model_state,
+    init_db,
+    record_feedback,
+    upsert_job,
+)
+
+
+PROFILE = {"role": "Security Analyst", "skills": ["Splunk", "Python"], "keywords": ["SOC"]}
+
+
+def _seed_jobs(db_path: str) -> None:
+    init_db(db_path)
+    for index in range(30):
+        upsert_job(
+            db_path,
+            {
+                "job_key": f"splunk-{index}",
+                "platform": "linkedin",
+                "title": "SOC Analyst",
+                "description": "Splunk monitoring and triage",
+            },
+            status="review",
+        )
+        upsert_job(
+            db_path,
+            {
+                "job_key": f"python-{index}",
+                "platform": "linkedin",
+                "title": "Python Developer",
+                "description": "Python backend services",
+            },
+            status="review",
+        )
+
+
+def test_train_model_checkpoints_versions():
+    """Each training pass stores a new checkpoint and becomes current."""
+    print("\n=== Trainer Checkpoint Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed_jobs(db_path)
+        for index in range(30):
+            record_feedback(db_path, f"splunk-{index}", "approved")
+            record_feedback(db_path, f"python-{index}", "rejected")
+
+        first = train_model(db_path, PROFILE, batch_size=16)
+        assert first["trained_examples"] == 60
+        assert first["weights"]["skill:splunk"] > 0
+        assert first["weights"]["skill:python"] < 0
+        print(f"✓ Trained version {first['version']} on {first['trained_examples']} examples")
+
+        second = train_model(db_path, PROFILE, batch_size=16)
+        assert second["version"] == first["version"] + 1
+        assert get_model_state(db_path)["version"] == second["version"]
+        assert get_model_checkpoint(db_path, first["version"])["weights"] == first["weights"]
+        print("✓ Checkpoints are versioned")
+
+
+def test_relabel_retrains_from_feedback():
+    """Changing labels flips the learned weights on the next pass."""
+    print("\n=== Trainer Relabel Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed_jobs(db_path)
+        for index in range(30):
+            record_feedback(db_path, f"splunk-{index}", "approved")
+        before = train_model(db_path, PROFILE)
+        for index in range(30):
+            record_feedback(db_path, f"splunk-{index}", "rejected")
+        after = train_model(db_path, PROFILE)
+
+        assert before["weights"]["skill:splunk"] > 0
+        assert after["weights"]["skill:splunk"] < 0
+        assert after["trained_examples"] == 30
+        print("✓ Relabeled feedback replaces earlier labels")
+
+
+def test_scoring_model_cache_and_evaluation():
+    """Scoring reads the cached model and applies its weights."""
+    print("\n=== Trainer Scoring Model Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed_jobs(db_path)
+        assert get_scoring_model(db_path)["version"] == 0
+
+        for index in range(30):
+            record_feedback(db_path, f"splunk-{index}", "approved")
+            record_feedback(db_path, f"python-{index}", "rejected")
+        trained = train_model(db_path, PROFILE)
+
+        model = get_scoring_model(db_path)
+        assert model == trained and model is not trained
+        assert get_scoring_model(db_path)["weights"] is model["weights"]
+        print("✓ Cached model reused while version is unchanged")
+
+        model["bias"] = 99.0
+        try:
+            model["weights"]["skill:splunk"] = 99.0
+        except TypeError:
+            pass
+        assert get_scoring_model(db_path)["bias"] == trained["bias"]
+        assert get_scoring_model(db_path)["weights"]["skill:splunk"] == trained["weights"]["skill:splunk"]
+        print("✓ Callers cannot modify the cached model")
+
+        job = {"title": "SOC Analyst", "description": "Splunk monitoring"}
+        baseline = evaluate_job(job, PROFILE)
+        learned = evaluate_job(job, PROFILE, model_state=model)
+        assert baseline["learned_adjustment"] == 0
+        assert learned["learned_adjustment"] > 0
+        assert learned["trained_examples"] == 60
+        print(f"✓ Learned adjustment applied: {learned['learned_adjustment']:+}")
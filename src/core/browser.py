@@ -8,6 +8,7 @@ async def open_context(
     headless: bool,
     storage_state_path: str | None = None,
     browser_type: str = "firefox",
+    resource_policy=None,
 ) -> Tuple[Playwright, Browser, BrowserContext]:
     """
     Open a browser context with anti-detection features.
@@ -16,6 +17,8 @@ async def open_context(
         headless: Run browser in headless mode
         storage_state_path: Path to saved session cookies
         browser_type: Browser to use - "firefox", "chromium", or "webkit"
+        resource_policy: Optional ResourcePolicy (see src.core.resource_policy)
+            installed via context.route to abort unneeded requests
 
     Returns:
         Tuple of (playwright, browser, context)
@@ -160,6 +163,9 @@ async def open_context(
         """)
     # Webkit doesn't need much anti-detection as it's less scrutinized
 
+    if resource_policy is not None:
+        await resource_policy.install(context)
+
     return playwright, browser, context
 
 
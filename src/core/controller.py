@@ -6,26 +6,20 @@ import re
 import time
 from datetime import datetime, timezone
 
-from src.ai.scorer import evaluate_job
-from src.ai.agents_wrapper import evaluate_job_with_agents
-from src.ai.quality_scorer import evaluate_fit
-from src.ai.shortlist_predictor import predict_shortlist
-from src.ai.adaptive_strategy import get_adaptive_strategy
-from src.ai.feedback_learner import get_feedback_learner
-from src.ai.visibility_predictor import predict_visibility
-from src.ai.diversity_controller import get_diversity_controller
+from src.ai.model_trainer import get_scoring_model, train_model
 from src.core.config import load_profile, load_settings
+from src.core.filter_chain import build_filter_chain
 from src.core.logger import log
+from src.core.near_duplicates import link_near_duplicate
 from src.core.platform_registry import get_enrichers, get_platforms
-from src.core.policy import policy_allows
+from src.core.seen_keys import get_seen_index
 from src.core.storage import (
+    archive_jobs,
+    get_archived_job,
     get_job,
-    get_model_state,
     init_db,
-    has_seen_job,
     enqueue_job,
     next_queued_job,
-    prune_jobs,
     record_decision,
     upsert_job,
     update_job,
@@ -58,9 +52,22 @@ def _make_job_key(job: dict) -> str:
     return hashlib.md5(raw.encode("utf-8")).hexdigest()
 
 
-def _is_entry_level(job: dict, blocklist: list[str]) -> bool:
-    text = f"{job.get('title') or ''} {job.get('description') or ''}".lower()
-    return not any(term in text for term in blocklist)
+def _record_duplicate(db_path: str, job: dict, canonical: dict) -> None:
+    """Store a near-duplicate with the canonical job's score and decision."""
+    upsert_job(
+        db_path,
+        job,
+        status="duplicate",
+        easy_apply=job.get("easy_apply"),
+        score=canonical.get("score"),
+        decision=canonical.get("decision"),
+    )
+    log(
+        "Near-duplicate: "
+        f"platform={job.get('platform')} title={job.get('title')} "
+        f"canonical={canonical.get('platform')}:{canonical['job_key']} "
+        f"canonical_status={canonical.get('status')} similarity={canonical.get('similarity')}"
+    )
 
 
 def _parse_posted_at(value: str | None) -> datetime | None:
@@ -367,7 +374,6 @@ def _run_queue_cycle(
 ) -> None:
     jobs = collect_jobs(settings, profile, enabled_override)
     log(f"Collected {len(jobs)} jobs")
-    policy = settings.get("policy", {})
     resume_path = settings.get("app", {}).get("resume_path", "resumes/resume.pdf")
     apply_all = settings.get("app", {}).get("apply_all", False)
     use_ai = settings.get("app", {}).get("use_ai", False)
@@ -377,24 +383,15 @@ def _run_queue_cycle(
     use_quality_filter = settings.get("ai", {}).get("use_quality_filter", False)
     use_visibility_filter = settings.get("ai", {}).get("use_visibility_filter", False)
     use_diversity_control = settings.get("ai", {}).get("use_diversity_control", False)
-    seniority_blocklist = settings.get("app", {}).get(
-        "seniority_blocklist",
-        ["senior", "lead", "manager", "principal", "director", "head", "staff", "architect"],
-    )
     if not os.path.isabs(resume_path):
         resume_path = os.path.join(base_dir, resume_path)
 
-    # Initialize intelligent filtering components
-    adaptive_strategy = None
-    feedback_learner = None
-    diversity_controller = None
+    # Filters run cheapest-first and reorder by observed reject rate per cost
     if use_quality_filter:
-        adaptive_strategy = get_adaptive_strategy()
-        feedback_learner = get_feedback_learner()
         log("Quality filtering enabled with adaptive strategy and feedback learning")
     if use_diversity_control:
-        diversity_controller = get_diversity_controller()
         log("Diversity control enabled")
+    filter_chain = build_filter_chain(settings, profile, model_state, verbose=True)
 
     log(
         "Cycle config: "
@@ -405,19 +402,19 @@ def _run_queue_cycle(
 
     # Phase 1: collect + enqueue
     seen_count = 0
+    duplicate_count = 0
     enqueued_count = 0
     entry_skipped_count = 0
     policy_skipped_count = 0
     ai_skipped_count = 0
     review_count = 0
+    seen_index = get_seen_index(db_path, settings)
+    seen_index.resync()
     for job in jobs:
         job["job_key"] = _make_job_key(job)
-        if has_seen_job(db_path, job["job_key"]):
+        if seen_index.has_seen(job["job_key"]):
             seen_count += 1
             continue
-        enqueue_job(db_path, job)
-        enqueued_count += 1
-
         platform = job.get("platform")
         enricher = enrichers.get(platform)
         if use_ai and enrich_before_ai and enricher and not (job.get("description") or "").strip():
@@ -425,13 +422,6 @@ def _run_queue_cycle(
                 enrich_fields = enricher(job, settings) or {}
                 if enrich_fields:
                     job.update({k: v for k, v in enrich_fields.items() if v})
-                    update_job(
-                        db_path,
-                        job["job_key"],
-                        description=job.get("description", ""),
-                        company=job.get("company", ""),
-                        location=job.get("location", ""),
-                    )
                     log(
                         "Enriched job: "
                         f"platform={platform} description_len={len(job.get('description') or '')}"
@@ -439,109 +429,35 @@ def _run_queue_cycle(
             except Exception as exc:
                 log(f"Enricher failed for {platform}: {exc}")
 
-        if entry_level_only and not _is_entry_level(job, seniority_blocklist):
-            update_job(db_path, job["job_key"], status="skipped")
-            record_decision(db_path, job["job_key"], "seniority_reject", 0)
-            entry_skipped_count += 1
-            continue
-
-        if use_policy and not policy_allows(job, policy):
-            update_job(db_path, job["job_key"], status="skipped")
-            record_decision(db_path, job["job_key"], "policy_reject", 0)
-            policy_skipped_count += 1
+        # Signed after enrichment, so the description is part of the signature
+        canonical = link_near_duplicate(db_path, job, settings)
+        if canonical:
+            _record_duplicate(db_path, job, canonical)
+            seen_index.add(job["job_key"])
+            duplicate_count += 1
             continue
+        enqueue_job(db_path, job)
+        seen_index.add(job["job_key"])
+        enqueued_count += 1
 
-        if use_ai:
-            use_agents = settings.get("ai", {}).get("use_agents", False)
-            if use_agents:
-                decision = evaluate_job_with_agents(job, profile, settings)
+        outcome = filter_chain.run(job)
+        if not outcome.accepted:
+            update_job(db_path, job["job_key"], status=outcome.status)
+            record_decision(db_path, job["job_key"], outcome.reason, outcome.score or 0)
+            if outcome.message:
+                log(outcome.message)
+            if outcome.stage == "seniority":
+                entry_skipped_count += 1
+            elif outcome.stage == "policy":
+                policy_skipped_count += 1
+            elif outcome.status == "review":
+                review_count += 1
             else:
-                min_score = settings.get("ai", {}).get("min_score", 70)
-                uncertainty_margin = settings.get("ai", {}).get("uncertainty_margin", 5)
-                decision = evaluate_job(job, profile, min_score, uncertainty_margin, model_state=model_state)
-
-            # Apply diversity control if enabled
-            if use_diversity_control and diversity_controller:
-                diversity_check = diversity_controller.should_skip_for_diversity(job, settings)
-                if diversity_check["should_skip"]:
-                    update_job(db_path, job["job_key"], status="skipped")
-                    record_decision(db_path, job["job_key"], "diversity_reject", 0)
-                    log(f"Diversity rejected: {diversity_check['reason']}")
-                    ai_skipped_count += 1
-                    continue
-
-            # Apply visibility filter if enabled
-            if use_visibility_filter:
-                platform = job.get("platform", "unknown")
-                timing = {"hour_of_day": datetime.now().hour, "day_of_week": datetime.now().weekday()}
-                visibility_prediction = predict_visibility(job, platform, timing)
-
-                log(
-                    f"Visibility check: title={job.get('title')} "
-                    f"probability={visibility_prediction['visibility_probability']:.2%} "
-                    f"recommendation={visibility_prediction['recommendation']}"
-                )
-
-                # Skip if visibility is too low
-                if visibility_prediction["recommendation"] == "skip":
-                    update_job(db_path, job["job_key"], status="skipped")
-                    record_decision(db_path, job["job_key"], "visibility_reject", int(visibility_prediction["visibility_probability"] * 100))
-                    log(f"Visibility rejected: low visibility probability ({visibility_prediction['visibility_probability']:.2%})")
-                    ai_skipped_count += 1
-                    continue
-
-            # Apply quality filtering if enabled
-            if use_quality_filter:
-                quality_score = evaluate_fit(profile, job)
-                shortlist_prediction = predict_shortlist(profile, job, quality_score)
-                strategy_decision = adaptive_strategy.should_apply(quality_score, shortlist_prediction)
-
-                # Get feedback learner recommendations
-                recommendations = feedback_learner.get_recommendations(job, profile)
-
-                # Log quality metrics
-                log(
-                    f"Quality check: title={job.get('title')} "
-                    f"overall={quality_score['overall_score']:.0f} tier={quality_score['quality_tier']} "
-                    f"probability={shortlist_prediction['probability']:.2%} "
-                    f"strategy={strategy_decision['strategy_applied']} "
-                    f"confidence_boost={recommendations['confidence_boost']:+.2f}"
-                )
-
-                # Skip if quality filter rejects
-                if not strategy_decision["should_apply"]:
-                    update_job(db_path, job["job_key"], status="skipped")
-                    record_decision(db_path, job["job_key"], "quality_reject", quality_score["overall_score"])
-                    log(
-                        f"Quality rejected: {strategy_decision['reason']} "
-                        f"(skill_match={quality_score['skill_match_percent']:.0f}% "
-                        f"role_align={quality_score['role_alignment']:.0f}%)"
-                    )
-                    ai_skipped_count += 1
-                    continue
-
-            if not decision["apply"] and not decision["confused"]:
-                update_job(db_path, job["job_key"], status="skipped")
-                record_decision(db_path, job["job_key"], "ai_reject", decision["score"])
-                log(
-                    "AI rejected: "
-                    f"title={job.get('title')} score={decision['score']} "
-                    f"heuristic={decision['heuristic_score']} learned={decision['learned_adjustment']} "
-                    f"terms={decision['matched_terms']}"
-                )
                 ai_skipped_count += 1
-                continue
-            if decision["confused"]:
-                update_job(db_path, job["job_key"], status="review")
-                record_decision(db_path, job["job_key"], "ai_review", decision["score"])
-                log(
-                    "AI review: "
-                    f"title={job.get('title')} score={decision['score']} "
-                    f"heuristic={decision['heuristic_score']} learned={decision['learned_adjustment']} "
-                    f"terms={decision['matched_terms']}"
-                )
-                review_count += 1
-                continue
+            continue
+
+        decision = outcome.decision
+        if decision:
             record_decision(db_path, job["job_key"], "ai_accept", decision["score"])
             log(
                 "AI accepted: "
@@ -552,10 +468,12 @@ def _run_queue_cycle(
 
     log(
         "Phase 1 summary: "
-        f"seen={seen_count} enqueued={enqueued_count} "
+        f"seen={seen_count} duplicates={duplicate_count} enqueued={enqueued_count} "
         f"entry_skipped={entry_skipped_count} policy_skipped={policy_skipped_count} "
         f"ai_skipped={ai_skipped_count} review={review_count}"
     )
+    log(seen_index.summary())
+    log(filter_chain.summary())
 
     # Phase 2: apply jobs from the queue
     applied_count = 0
@@ -634,7 +552,6 @@ def _run_direct_latest_cycle(
     history_limit = int(settings.get("storage", {}).get("history_limit", 400))
     jobs = _select_latest_jobs(collected_jobs, latest_results_limit)
 
-    policy = settings.get("policy", {})
     resume_path = settings.get("app", {}).get("resume_path", "resumes/resume.pdf")
     apply_all = settings.get("app", {}).get("apply_all", False)
     use_ai = settings.get("app", {}).get("use_ai", False)
@@ -644,24 +561,15 @@ def _run_direct_latest_cycle(
     use_quality_filter = settings.get("ai", {}).get("use_quality_filter", False)
     use_visibility_filter = settings.get("ai", {}).get("use_visibility_filter", False)
     use_diversity_control = settings.get("ai", {}).get("use_diversity_control", False)
-    seniority_blocklist = settings.get("app", {}).get(
-        "seniority_blocklist",
-        ["senior", "lead", "manager", "principal", "director", "head", "staff", "architect"],
-    )
     if not os.path.isabs(resume_path):
         resume_path = os.path.join(base_dir, resume_path)
 
-    # Initialize intelligent filtering components
-    adaptive_strategy = None
-    feedback_learner = None
-    diversity_controller = None
+    # Filters run cheapest-first and reorder by observed reject rate per cost
     if use_quality_filter:
-        adaptive_strategy = get_adaptive_strategy()
-        feedback_learner = get_feedback_learner()
         log("Quality filtering enabled with adaptive strategy and feedback learning")
     if use_diversity_control:
-        diversity_controller = get_diversity_controller()
         log("Diversity control enabled")
+    filter_chain = build_filter_chain(settings, profile, model_state, verbose=True)
 
     log(
         "Direct cycle config: "
@@ -677,6 +585,7 @@ def _run_direct_latest_cycle(
 
     counts = {
         "tracked": 0,
+        "duplicates": 0,
         "entry_skipped": 0,
         "policy_skipped": 0,
         "ai_skipped": 0,
@@ -689,11 +598,20 @@ def _run_direct_latest_cycle(
     }
     apply_candidates: list[dict] = []
 
+    seen_index = get_seen_index(db_path, settings)
+    seen_index.resync()
     for job in jobs:
-        existing_job = get_job(db_path, job["job_key"])
+        # Jobs the filter rules out are new: skip both record lookups.
+        known = seen_index.might_contain(job["job_key"])
+        existing_job = get_job(db_path, job["job_key"]) if known else None
+        if existing_job is None and known:
+            archived_job = get_archived_job(db_path, job["job_key"])
+            if archived_job and archived_job.get("status") in {"applied", "rejected", "skipped", "review", "duplicate"}:
+                counts["tracked"] += 1
+                continue
         job = _merge_existing_job(job, existing_job)
         existing_status = (existing_job or {}).get("status")
-        if existing_status in {"applied", "rejected", "skipped", "review"}:
+        if existing_status in {"applied", "rejected", "skipped", "review", "duplicate"}:
             upsert_job(
                 db_path,
                 job,
@@ -705,6 +623,9 @@ def _run_direct_latest_cycle(
             counts["tracked"] += 1
             continue
 
+        # Every branch below stores the job, so it is known from here on.
+        seen_index.add(job["job_key"])
+
         platform = job.get("platform")
         enricher = enrichers.get(platform)
         if use_ai and enrich_before_ai and enricher and not (job.get("description") or "").strip():
@@ -719,27 +640,30 @@ def _run_direct_latest_cycle(
             except Exception as exc:
                 log(f"Enricher failed for {platform}: {exc}")
 
-        if entry_level_only and not _is_entry_level(job, seniority_blocklist):
-            upsert_job(db_path, job, status="skipped", score=0, decision="seniority_reject")
-            counts["entry_skipped"] += 1
+        # Signed after enrichment, so the description is part of the signature
+        canonical = link_near_duplicate(db_path, job, settings)
+        if canonical:
+            _record_duplicate(db_path, job, canonical)
+            counts["duplicates"] += 1
             continue
 
-        if use_policy and not policy_allows(job, policy):
-            upsert_job(db_path, job, status="skipped", score=0, decision="policy_reject")
-            counts["policy_skipped"] += 1
+        outcome = filter_chain.run(job)
+        if not outcome.accepted:
+            upsert_job(db_path, job, status=outcome.status, score=outcome.score, decision=outcome.reason)
+            if outcome.message:
+                log(outcome.message)
+            if outcome.stage == "seniority":
+                counts["entry_skipped"] += 1
+            elif outcome.stage == "policy":
+                counts["policy_skipped"] += 1
+            elif outcome.status == "review":
+                counts["review"] += 1
+            else:
+                counts["ai_skipped"] += 1
             continue
 
-        decision = None
-        score = None
-        priority_score = 0.0
-        if use_ai:
-            use_agents = settings.get("ai", {}).get("use_agents", False)
-            if use_agents:
-                decision = evaluate_job_with_agents(job, profile, settings)
-            else:
-                min_score = settings.get("ai", {}).get("min_score", 70)
-                uncertainty_margin = settings.get("ai", {}).get("uncertainty_margin", 5)
-                decision = evaluate_job(job, profile, min_score, uncertainty_margin, model_state=model_state)
+        decision = outcome.decision
+        if decision:
             score = decision["score"]
             priority_score = float(decision.get("priority_score") or score or 0)
 
@@ -751,83 +675,6 @@ def _run_direct_latest_cycle(
                     priority_score += recency_boost
                     log(f"Recency boost: +{recency_boost} for fresh posting")
 
-            # Apply diversity control if enabled
-            if use_diversity_control and diversity_controller:
-                diversity_check = diversity_controller.should_skip_for_diversity(job, settings)
-                if diversity_check["should_skip"]:
-                    upsert_job(db_path, job, status="skipped", score=score, decision="diversity_reject")
-                    log(f"Diversity rejected: {diversity_check['reason']}")
-                    counts["ai_skipped"] += 1
-                    continue
-
-            # Apply visibility filter if enabled
-            if use_visibility_filter:
-                platform = job.get("platform", "unknown")
-                timing = {"hour_of_day": datetime.now().hour, "day_of_week": datetime.now().weekday()}
-                visibility_prediction = predict_visibility(job, platform, timing)
-
-                log(
-                    f"Visibility check: title={job.get('title')} "
-                    f"probability={visibility_prediction['visibility_probability']:.2%} "
-                    f"recommendation={visibility_prediction['recommendation']}"
-                )
-
-                # Skip if visibility is too low
-                if visibility_prediction["recommendation"] == "skip":
-                    upsert_job(db_path, job, status="skipped", score=int(visibility_prediction["visibility_probability"] * 100), decision="visibility_reject")
-                    log(f"Visibility rejected: low visibility probability ({visibility_prediction['visibility_probability']:.2%})")
-                    counts["ai_skipped"] += 1
-                    continue
-
-            # Apply quality filtering if enabled
-            if use_quality_filter:
-                quality_score = evaluate_fit(profile, job)
-                shortlist_prediction = predict_shortlist(profile, job, quality_score)
-                strategy_decision = adaptive_strategy.should_apply(quality_score, shortlist_prediction)
-
-                # Get feedback learner recommendations
-                recommendations = feedback_learner.get_recommendations(job, profile)
-
-                # Log quality metrics
-                log(
-                    f"Quality check: title={job.get('title')} "
-                    f"overall={quality_score['overall_score']:.0f} tier={quality_score['quality_tier']} "
-                    f"probability={shortlist_prediction['probability']:.2%} "
-                    f"strategy={strategy_decision['strategy_applied']} "
-                    f"confidence_boost={recommendations['confidence_boost']:+.2f}"
-                )
-
-                # Skip if quality filter rejects
-                if not strategy_decision["should_apply"]:
-                    upsert_job(db_path, job, status="skipped", score=quality_score["overall_score"], decision="quality_reject")
-                    log(
-                        f"Quality rejected: {strategy_decision['reason']} "
-                        f"(skill_match={quality_score['skill_match_percent']:.0f}% "
-                        f"role_align={quality_score['role_alignment']:.0f}%)"
-                    )
-                    counts["ai_skipped"] += 1
-                    continue
-
-            if not decision["apply"] and not decision["confused"]:
-                upsert_job(db_path, job, status="skipped", score=score, decision="ai_reject")
-                log(
-                    "AI rejected: "
-                    f"title={job.get('title')} score={decision['score']} "
-                    f"heuristic={decision['heuristic_score']} learned={decision['learned_adjustment']} "
-                    f"terms={decision['matched_terms']} signals={decision.get('signals', [])}"
-                )
-                counts["ai_skipped"] += 1
-                continue
-            if decision["confused"]:
-                upsert_job(db_path, job, status="review", score=score, decision="ai_review")
-                log(
-                    "AI review: "
-                    f"title={job.get('title')} score={decision['score']} "
-                    f"heuristic={decision['heuristic_score']} learned={decision['learned_adjustment']} "
-                    f"terms={decision['matched_terms']} signals={decision.get('signals', [])}"
-                )
-                counts["review"] += 1
-                continue
             log(
                 "AI accepted: "
                 f"title={job.get('title')} score={decision['score']} "
@@ -863,6 +710,8 @@ def _run_direct_latest_cycle(
         counts["ranked"] += 1
         counts["easy_apply_candidates"] += int(job.get("easy_apply") or 0)
 
+    log(filter_chain.summary())
+
     ranked_candidates = _rank_apply_candidates(apply_candidates)
     if ranked_candidates:
         preview = ", ".join(
@@ -900,10 +749,16 @@ def _run_direct_latest_cycle(
     for key in ("applied", "review", "skipped", "deferred"):
         counts[key] += lane_counts[key]
 
-    prune_jobs(db_path, history_limit)
+    archived_count = archive_jobs(
+        db_path,
+        history_limit,
+        batch_size=int(settings.get("storage", {}).get("archive_batch_size", 500)),
+    )
+    if archived_count:
+        log(f"Archived {archived_count} jobs beyond history_limit={history_limit}")
     log(
         "Direct cycle summary: "
-        f"tracked={counts['tracked']} entry_skipped={counts['entry_skipped']} "
+        f"tracked={counts['tracked']} duplicates={counts['duplicates']} entry_skipped={counts['entry_skipped']} "
         f"policy_skipped={counts['policy_skipped']} ai_skipped={counts['ai_skipped']} "
         f"ranked={counts['ranked']} easy_apply_candidates={counts['easy_apply_candidates']} "
         f"applied={counts['applied']} review={counts['review']} "
@@ -920,7 +775,10 @@ def run_cycle(enabled_override: list[str] | None = None) -> None:
 
     db_path = _resolve_db_path(base_dir, settings)
     init_db(db_path)
-    model_state = get_model_state(db_path)
+    model_state = get_scoring_model(db_path)
+    if not model_state.get("version"):
+        # Unversioned state predates the trainer; rebuild it from feedback once.
+        model_state = train_model(db_path, profile)
 
     pipeline_mode = (settings.get("app", {}).get("pipeline_mode") or "direct_latest").strip().lower()
     if pipeline_mode == "direct_latest":
@@ -0,0 +1,77 @@
+"""
+Job Export
+
+Streams stored jobs as CSV or NDJSON. Rows come from storage.iter_jobs in
+id-ordered batches and are encoded one batch at a time, so a full-history
+export runs in constant memory and can be returned as a generator response.
+"""
+
+import csv
+import io
+import json
+
+from src.core.storage import iter_jobs
+
+
+EXPORT_COLUMNS = (
+    "job_key",
+    "platform",
+    "title",
+    "company",
+    "location",
+    "job_url",
+    "status",
+    "easy_apply",
+    "score",
+    "decision",
+    "feedback_label",
+    "posted_at",
+    "posted_text",
+    "created_at",
+    "updated_at",
+    "applied_at",
+)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def iter_export(
+    db_path: str,
+    export_format: str = "csv",
+    statuses: list[str] | None = None,
+    platform: str | None = None,
+    since: str | None = None,
+    batch_size: int = 500,
+):
+    """
+    Yield encoded export text, one chunk per storage batch.
+
+    Args:
+        export_format: "csv" (with a header row) or "ndjson"
+        since: Only jobs updated after this ISO timestamp
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format!r}")
+    if export_format == "csv":
+        yield _csv_chunk([EXPORT_COLUMNS])
+    for batch in iter_jobs(
+        db_path, statuses=statuses, platform=platform, since=since, columns="summary", batch_size=batch_size
+    ):
+        if export_format == "csv":
+            yield _csv_chunk([job.get(column) for column in EXPORT_COLUMNS] for job in batch)
+        else:
+            yield "".join(
+                json.dumps({column: job.get(column) for column in EXPORT_COLUMNS}) + "\n" for job in batch
+            )
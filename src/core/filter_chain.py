@@ -0,0 +1,387 @@
+"""
+Job Filter Chain
+
+Collected jobs pass through the seniority, policy, diversity, visibility,
+quality and AI filters before they are applied to. Each filter is a
+FilterStage with a declared cost (expected seconds per job), and the chain
+runs them cheapest-first so a keyword or policy rule drops a job before
+any JSON-history predictor or LLM evaluation is spent on it.
+
+Every stage records calls, rejections and latency in process-wide counters
+shared by all chains. With adaptive ordering on, the chain periodically
+re-sorts its stages by rejection rate per second of observed latency, the
+order that minimizes expected cost when filters are independent. Stages
+start from an even rejection prior, so the initial order is the declared
+cost order. Reordering never crosses cost tiers: stages declared at
+EXPENSIVE_STAGE_COST or more (the LLM evaluation) always run after every
+cheap stage, so no LLM call is spent on a job a cheap rule would drop.
+
+The AI stage also returns "review" when the model is unsure; its decision
+is carried on the outcome so callers can record scores and rank accepted
+jobs.
+
+Settings (app.filter_chain):
+    adaptive: Reorder stages by observed rejection rate and cost (default True)
+    reorder_interval: Jobs between reorders (default 20)
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from src.ai.adaptive_strategy import get_adaptive_strategy
+from src.ai.agents_wrapper import evaluate_job_with_agents
+from src.ai.compiled_profile import compile_profile
+from src.ai.diversity_controller import get_diversity_controller
+from src.ai.feedback_learner import get_feedback_learner
+from src.ai.quality_scorer import evaluate_fit
+from src.ai.scorer import evaluate_job
+from src.ai.shortlist_predictor import predict_shortlist
+from src.ai.visibility_predictor import predict_visibility
+from src.core.logger import log
+from src.core.policy import policy_allows
+
+
+DEFAULT_REORDER_INTERVAL = 20
+# Observed latency replaces the declared cost once a stage has this many calls.
+MIN_SAMPLES = 10
+# Stages declared at or above this cost (seconds) stay behind all cheaper ones.
+EXPENSIVE_STAGE_COST = 0.1
+
+DEFAULT_SENIORITY_BLOCKLIST = ["senior", "lead", "manager", "principal", "director", "head", "staff", "architect"]
+
+# Declared costs in expected seconds per job.
+STAGE_COSTS = {
+    "seniority": 0.00002,
+    "policy": 0.00005,
+    "diversity": 0.001,
+    "visibility": 0.002,
+    "quality": 0.005,
+    "ai": 1.0,
+}
+
+_STATS_LOCK = threading.Lock()
+_STAGE_STATS: dict[str, "StageStats"] = {}
+
+
+@dataclass
+class StageStats:
+    """Counters for one filter stage, shared by every chain in the process."""
+
+    calls: int = 0
+    rejects: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+def get_stage_stats() -> dict[str, dict]:
+    """Snapshot of per-stage counters, keyed by stage name."""
+    with _STATS_LOCK:
+        return {
+            name: {"calls": stats.calls, "rejects": stats.rejects, "mean_ms": round(stats.mean_seconds * 1000, 3)}
+            for name, stats in _STAGE_STATS.items()
+        }
+
+
+def reset_stage_stats() -> None:
+    """Clear per-stage counters."""
+    with _STATS_LOCK:
+        _STAGE_STATS.clear()
+
+
+@dataclass
+class FilterOutcome:
+    """
+    Result of running a job through the chain.
+
+    Attributes:
+        reason: Decision to record ("accepted", "policy_reject", "ai_review", ...)
+        status: Job status for a rejected job ("skipped" or "review"), None if accepted
+        score: Score to record with the decision
+        stage: Stage that stopped the job, None if accepted
+        message: Log line describing the rejection
+        decision: AI evaluation, when the AI stage ran
+    """
+
+    reason: str = "accepted"
+    status: str | None = None
+    score: int | None = 0
+    stage: str | None = None
+    message: str | None = None
+    decision: dict | None = field(default=None, repr=False)
+
+    @property
+    def accepted(self) -> bool:
+        return self.status is None
+
+
+def reject(reason: str, score: int | None = 0, message: str | None = None, status: str = "skipped") -> FilterOutcome:
+    """Outcome for a stage that stops the job."""
+    return FilterOutcome(reason=reason, status=status, score=score, message=message)
+
+
+class FilterStage:
+    """
+    One filter with a declared cost.
+
+    Args:
+        name: Stage name; counters are shared across chains by name
+        cost: Expected seconds per job, used until enough calls are observed
+        check: Callable(job, context) returning None to pass the job or a
+            FilterOutcome to stop it; context is a per-job dict stages can
+            use to hand results to the caller (e.g. "decision")
+    """
+
+    def __init__(self, name: str, cost: float, check: Callable[[dict, dict], FilterOutcome | None]):
+        self.name = name
+        self.cost = float(cost)
+        self.check = check
+        with _STATS_LOCK:
+            self.stats = _STAGE_STATS.setdefault(name, StageStats())
+
+    @property
+    def tier(self) -> int:
+        """0 for cheap stages, 1 for expensive ones; tiers never reorder."""
+        return 1 if self.cost >= EXPENSIVE_STAGE_COST else 0
+
+    def expected_cost(self) -> float:
+        if self.stats.calls >= MIN_SAMPLES:
+            return max(self.stats.mean_seconds, 1e-9)
+        return self.cost
+
+    def rank(self) -> float:
+        """Expected rejections per second spent; higher runs earlier."""
+        reject_rate = (self.stats.rejects + 1) / (self.stats.calls + 2)
+        return reject_rate / self.expected_cost()
+
+    def run(self, job: dict, context: dict) -> FilterOutcome | None:
+        started = time.perf_counter()
+        outcome = self.check(job, context)
+        elapsed = time.perf_counter() - started
+        with _STATS_LOCK:
+            self.stats.calls += 1
+            self.stats.seconds += elapsed
+            if outcome is not None:
+                self.stats.rejects += 1
+        if outcome is not None:
+            outcome.stage = self.name
+        return outcome
+
+
+class FilterChain:
+    """
+    Ordered filter stages, cheapest (or best reject-per-cost) first.
+
+    Args:
+        stages: Filter stages; initially sorted by declared cost
+        adaptive: Re-sort stages by observed rejection rate per unit cost
+        reorder_interval: Jobs between reorders when adaptive
+    """
+
+    def __init__(
+        self,
+        stages: list[FilterStage],
+        adaptive: bool = True,
+        reorder_interval: int = DEFAULT_REORDER_INTERVAL,
+    ):
+        self.stages = sorted(stages, key=lambda stage: stage.cost)
+        self.adaptive = adaptive
+        self.reorder_interval = max(1, int(reorder_interval))
+        self._runs = 0
+
+    @property
+    def order(self) -> list[str]:
+        return [stage.name for stage in self.stages]
+
+    def reorder(self) -> None:
+        """Sort stages by rank within each cost tier, highest first (stable for ties)."""
+        self.stages.sort(key=lambda stage: (stage.tier, -stage.rank()))
+
+    def run(self, job: dict) -> FilterOutcome:
+        """Run a job through the stages until one stops it."""
+        self._runs += 1
+        if self.adaptive and self._runs % self.reorder_interval == 0:
+            self.reorder()
+        context: dict = {}
+        for stage in self.stages:
+            outcome = stage.run(job, context)
+            if outcome is not None:
+                outcome.decision = context.get("decision")
+                return outcome
+        decision = context.get("decision")
+        return FilterOutcome(score=decision["score"] if decision else None, decision=decision)
+
+    def summary(self) -> str:
+        parts = [
+            f"{stage.name}(calls={stage.stats.calls} rejects={stage.stats.rejects} "
+            f"mean={stage.stats.mean_seconds * 1000:.2f}ms)"
+            for stage in self.stages
+        ]
+        return "Filter chain: " + (" > ".join(parts) if parts else "no stages")
+
+
+def _seniority_stage(settings: dict, profile: dict) -> FilterStage:
+    blocklist = settings.get("app", {}).get("seniority_blocklist", DEFAULT_SENIORITY_BLOCKLIST)
+    seniority = compile_profile(profile, blocklist).seniority
+
+    def check(job: dict, context: dict) -> FilterOutcome | None:
+        text = f"{job.get('title') or ''} {job.get('description') or ''}".lower()
+        return reject("seniority_reject") if seniority.contains_any(text) else None
+
+    return FilterStage("seniority", STAGE_COSTS["seniority"], check)
+
+
+def _policy_stage(settings: dict) -> FilterStage:
+    policy = settings.get("policy", {})
+
+    def check(job: dict, context: dict) -> FilterOutcome | None:
+        return None if policy_allows(job, policy) else reject("policy_reject")
+
+    return FilterStage("policy", STAGE_COSTS["policy"], check)
+
+
+def _diversity_stage(settings: dict) -> FilterStage:
+    controller = get_diversity_controller()
+
+    def check(job: dict, context: dict) -> FilterOutcome | None:
+        diversity_check = controller.should_skip_for_diversity(job, settings)
+        if diversity_check["should_skip"]:
+            return reject("diversity_reject", message=f"Diversity rejected: {diversity_check['reason']}")
+        return None
+
+    return FilterStage("diversity", STAGE_COSTS["diversity"], check)
+
+
+def _visibility_stage(verbose: bool) -> FilterStage:
+    def check(job: dict, context: dict) -> FilterOutcome | None:
+        now = datetime.now()
+        timing = {"hour_of_day": now.hour, "day_of_week": now.weekday()}
+        prediction = predict_visibility(job, job.get("platform", "unknown"), timing)
+        probability = prediction["visibility_probability"]
+        if verbose:
+            log(
+                f"Visibility check: title={job.get('title')} "
+                f"probability={probability:.2%} "
+                f"recommendation={prediction['recommendation']}"
+            )
+        if prediction["recommendation"] == "skip":
+            return reject(
+                "visibility_reject",
+                score=int(probability * 100),
+                message=f"Visibility rejected: low visibility probability ({probability:.2%})",
+            )
+        return None
+
+    return FilterStage("visibility", STAGE_COSTS["visibility"], check)
+
+
+def _quality_stage(profile: dict, verbose: bool) -> FilterStage:
+    strategy = get_adaptive_strategy()
+    learner = get_feedback_learner() if verbose else None
+    compiled = compile_profile(profile)
+
+    def check(job: dict, context: dict) -> FilterOutcome | None:
+        quality_score = evaluate_fit(profile, job, compiled)
+        shortlist_prediction = predict_shortlist(profile, job, quality_score)
+        strategy_decision = strategy.should_apply(quality_score, shortlist_prediction)
+        if learner is not None:
+            recommendations = learner.get_recommendations(job, profile)
+            log(
+                f"Quality check: title={job.get('title')} "
+                f"overall={quality_score['overall_score']:.0f} tier={quality_score['quality_tier']} "
+                f"probability={shortlist_prediction['probability']:.2%} "
+                f"strategy={strategy_decision['strategy_applied']} "
+                f"confidence_boost={recommendations['confidence_boost']:+.2f}"
+            )
+        if not strategy_decision["should_apply"]:
+            return reject(
+                "quality_reject",
+                score=quality_score["overall_score"],
+                message=(
+                    f"Quality rejected: {strategy_decision['reason']} "
+                    f"(skill_match={quality_score['skill_match_percent']:.0f}% "
+                    f"role_align={quality_score['role_alignment']:.0f}%)"
+                ),
+            )
+        return None
+
+    return FilterStage("quality", STAGE_COSTS["quality"], check)
+
+
+def _ai_stage(settings: dict, profile: dict, model_state: dict | None) -> FilterStage:
+    ai_settings = settings.get("ai", {})
+    use_agents = ai_settings.get("use_agents", False)
+    min_score = ai_settings.get("min_score", 70)
+    uncertainty_margin = ai_settings.get("uncertainty_margin", 5)
+    compiled = compile_profile(profile)
+
+    def check(job: dict, context: dict) -> FilterOutcome | None:
+        if use_agents:
+            decision = evaluate_job_with_agents(job, profile, settings)
+        else:
+            decision = evaluate_job(job, profile, min_score, uncertainty_margin, model_state=model_state, compiled=compiled)
+        context["decision"] = decision
+        details = (
+            f"title={job.get('title')} score={decision['score']} "
+            f"heuristic={decision['heuristic_score']} learned={decision['learned_adjustment']} "
+            f"terms={decision['matched_terms']} signals={decision.get('signals', [])}"
+        )
+        if decision["confused"]:
+            return reject("ai_review", score=decision["score"], message=f"AI review: {details}", status="review")
+        if not decision["apply"]:
+            return reject("ai_reject", score=decision["score"], message=f"AI rejected: {details}")
+        return None
+
+    return FilterStage("ai", STAGE_COSTS["ai"], check)
+
+
+def build_filter_chain(
+    settings: dict,
+    profile: dict,
+    model_state: dict | None = None,
+    verbose: bool = False,
+) -> FilterChain:
+    """
+    Build the standard job filter chain from settings.
+
+    The diversity, visibility and quality stages only run alongside AI
+    evaluation (app.use_ai), as before.
+
+    Args:
+        settings: App settings (app, ai, policy, app.filter_chain)
+        profile: User profile
+        model_state: Trained scoring model for the AI stage
+        verbose: Log per-job visibility and quality checks
+
+    Returns:
+        FilterChain with the enabled stages
+    """
+    app_settings = settings.get("app", {})
+    ai_settings = settings.get("ai", {})
+    use_ai = app_settings.get("use_ai", False)
+
+    stages = []
+    if app_settings.get("entry_level_only", True):
+        stages.append(_seniority_stage(settings, profile))
+    if app_settings.get("use_policy", False):
+        stages.append(_policy_stage(settings))
+    if use_ai:
+        if ai_settings.get("use_diversity_control", False):
+            stages.append(_diversity_stage(settings))
+        if ai_settings.get("use_visibility_filter", False):
+            stages.append(_visibility_stage(verbose))
+        if ai_settings.get("use_quality_filter", False):
+            stages.append(_quality_stage(profile, verbose))
+        stages.append(_ai_stage(settings, profile, model_state))
+
+    config = app_settings.get("filter_chain", {}) or {}
+    return FilterChain(
+        stages,
+        adaptive=bool(config.get("adaptive", True)),
+        reorder_interval=int(config.get("reorder_interval", DEFAULT_REORDER_INTERVAL)),
+    )
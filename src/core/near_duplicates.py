@@ -0,0 +1,143 @@
+"""
+Near-duplicate Job Detection
+
+The same role is often reposted on LinkedIn, Indeed and Naukri, or re-listed
+under a new URL, and _make_job_key only catches exact repeats. This module
+builds a MinHash signature over word shingles of the normalized title,
+company and description, and splits it into LSH bands stored in SQLite. A new
+job is looked up by its band keys (one indexed probe per band, independent of
+how many jobs are stored), candidates are verified by estimated Jaccard
+similarity, and a match is linked to the canonical job so its evaluation and
+apply outcome are reused instead of spending another LLM call or browser
+session.
+
+Settings (app.near_duplicates):
+    enabled: Turn detection on or off (default True)
+    threshold: Minimum estimated Jaccard similarity for a match (default 0.8)
+    min_shingles: Jobs with fewer shingles are too short to compare (default 5)
+"""
+
+import hashlib
+import random
+
+from src.ai.compiled_profile import normalize_text
+from src.core.storage import find_signature_candidates, get_archived_job, get_job, record_job_signature
+
+
+SHINGLE_SIZE = 3
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_MIN_SHINGLES = 5
+
+# Canonical outcomes worth reusing; a deferred canonical failed to apply, so
+# its duplicates are still evaluated and applied on their own platform.
+REUSABLE_STATUSES = {"queued", "applied", "review", "skipped", "rejected", "duplicate"}
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Fixed seed: signatures are persisted, so the permutations must be stable
+# across processes.
+_RNG = random.Random(1_000_003)
+_PERMUTATIONS = tuple(
+    (_RNG.randint(1, _MERSENNE_PRIME - 1), _RNG.randint(0, _MERSENNE_PRIME - 1)) for _ in range(NUM_PERM)
+)
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def job_shingles(job: dict, size: int = SHINGLE_SIZE) -> set[str]:
+    """Word shingles over the normalized title, company and description."""
+    text = normalize_text(
+        f"{job.get('title') or ''} {job.get('company') or ''} {job.get('description') or ''}"
+    )
+    tokens = text.split()
+    if len(tokens) < size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash_signature(shingles: set[str]) -> list[int]:
+    """MinHash signature of NUM_PERM values for a shingle set."""
+    hashes = [_hash64(shingle) for shingle in shingles]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [
+        min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def band_keys(signature: list[int]) -> list[str]:
+    """One "band:hash" key per LSH band of ROWS signature values."""
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS : (band + 1) * ROWS]
+        digest = hashlib.blake2b(",".join(map(str, rows)).encode("ascii"), digest_size=8).hexdigest()
+        keys.append(f"{band}:{digest}")
+    return keys
+
+
+def estimate_similarity(left: list[int], right: list[int]) -> float:
+    """Estimated Jaccard similarity from two MinHash signatures."""
+    if not left or len(left) != len(right):
+        return 0.0
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+def _config(settings: dict | None) -> dict:
+    return ((settings or {}).get("app", {}) or {}).get("near_duplicates", {}) or {}
+
+
+def is_enabled(settings: dict | None) -> bool:
+    return bool(_config(settings).get("enabled", True))
+
+
+def link_near_duplicate(db_path: str, job: dict, settings: dict | None = None) -> dict | None:
+    """
+    Index a job and return the canonical job it duplicates, if any.
+
+    The job's signature is always recorded (under the matched canonical key,
+    or as its own canonical) so later reposts can match it.
+
+    Args:
+        db_path: SQLite database path
+        job: Collected job with job_key, title, company and description
+        settings: App settings; reads app.near_duplicates
+
+    Returns:
+        The canonical job dict (hot or archived) plus "similarity", or None when
+        there is no match, the job is too short to compare, or the canonical
+        outcome is not reusable
+    """
+    config = _config(settings)
+    if not config.get("enabled", True):
+        return None
+    shingles = job_shingles(job)
+    if len(shingles) < int(config.get("min_shingles", DEFAULT_MIN_SHINGLES)):
+        return None
+    threshold = float(config.get("threshold", DEFAULT_THRESHOLD))
+    signature = minhash_signature(shingles)
+    keys = band_keys(signature)
+
+    best_key = None
+    best_similarity = 0.0
+    for candidate in find_signature_candidates(db_path, keys, exclude_job_key=job["job_key"]):
+        root_key = candidate["canonical_key"] or candidate["job_key"]
+        if root_key == job["job_key"]:
+            continue
+        similarity = estimate_similarity(signature, candidate["signature"])
+        if similarity >= threshold and similarity > best_similarity:
+            best_key = root_key
+            best_similarity = similarity
+
+    canonical = (get_job(db_path, best_key) or get_archived_job(db_path, best_key)) if best_key else None
+    if canonical is None or canonical.get("status") not in REUSABLE_STATUSES:
+        record_job_signature(db_path, job["job_key"], signature, keys, canonical_key=None)
+        return None
+    record_job_signature(db_path, job["job_key"], signature, keys, canonical_key=canonical["job_key"])
+    canonical["similarity"] = round(best_similarity, 3)
+    return canonical
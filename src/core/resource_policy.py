@@ -0,0 +1,158 @@
+"""
+Browser Resource Policy
+
+Aborts requests a page does not need (images, fonts, media, analytics and
+ad beacons) through context.route, with one profile per use case:
+
+- collect: search result pages, only HTML + XHR matter
+- enrich: job detail pages, same as collect
+- apply: application flows, only media and trackers are blocked so form
+  rendering and uploads are untouched
+
+Profiles can be tuned or disabled under app.resource_policy in settings.yaml.
+"""
+
+import threading
+from dataclasses import dataclass, field
+
+from src.core.logger import log
+
+
+DEFAULT_PROFILES = {
+    "collect": {"block_types": ["image", "font", "media"], "block_trackers": True},
+    "enrich": {"block_types": ["image", "font", "media"], "block_trackers": True},
+    "apply": {"block_types": ["media"], "block_trackers": True},
+}
+
+TRACKER_PATTERNS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "adservice.google.",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "bat.bing.com",
+    "px.ads.linkedin.com",
+    "snap.licdn.com",
+    "linkedin.com/li/track",
+    "linkedin.com/sensorCollect",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "criteo.com",
+    "nr-data.net",
+    "segment.io",
+    "omtrdc.net",
+)
+
+# Rough transfer sizes used to estimate what blocking saved; aborted requests
+# are never downloaded, so their real size is unknown.
+_TYPICAL_BYTES = {
+    "image": 40_000,
+    "font": 60_000,
+    "media": 500_000,
+    "script": 30_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+}
+_DEFAULT_TYPICAL_BYTES = 5_000
+
+_TOTALS: dict[str, dict] = {}
+_TOTALS_LOCK = threading.Lock()
+
+
+@dataclass
+class ResourcePolicy:
+    """Decides which requests to abort and counts what was blocked."""
+
+    name: str
+    block_types: frozenset = frozenset()
+    tracker_patterns: tuple[str, ...] = ()
+    stats: dict = field(default_factory=lambda: {
+        "allowed_requests": 0,
+        "blocked_requests": 0,
+        "blocked_bytes_estimate": 0,
+        "blocked_by_type": {},
+    })
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.block_types:
+            return True
+        return any(pattern in url for pattern in self.tracker_patterns)
+
+    def record(self, resource_type: str, blocked: bool) -> None:
+        if not blocked:
+            self.stats["allowed_requests"] += 1
+            return
+        size = _TYPICAL_BYTES.get(resource_type, _DEFAULT_TYPICAL_BYTES)
+        self.stats["blocked_requests"] += 1
+        self.stats["blocked_bytes_estimate"] += size
+        by_type = self.stats["blocked_by_type"]
+        by_type[resource_type] = by_type.get(resource_type, 0) + 1
+        with _TOTALS_LOCK:
+            totals = _TOTALS.setdefault(
+                self.name, {"blocked_requests": 0, "blocked_bytes_estimate": 0, "blocked_by_type": {}}
+            )
+            totals["blocked_requests"] += 1
+            totals["blocked_bytes_estimate"] += size
+            totals["blocked_by_type"][resource_type] = totals["blocked_by_type"].get(resource_type, 0) + 1
+
+    async def handle(self, route) -> None:
+        """context.route handler: abort blocked requests, continue the rest."""
+        request = route.request
+        resource_type = request.resource_type
+        blocked = self.should_block(resource_type, request.url)
+        self.record(resource_type, blocked)
+        if blocked:
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    def summary(self) -> str:
+        by_type = ", ".join(f"{kind}={count}" for kind, count in sorted(self.stats["blocked_by_type"].items()))
+        return (
+            f"Resource policy {self.name}: blocked={self.stats['blocked_requests']} "
+            f"allowed={self.stats['allowed_requests']} "
+            f"saved~{self.stats['blocked_bytes_estimate'] // 1024}KB ({by_type or 'none'})"
+        )
+
+    async def install(self, context) -> None:
+        await context.route("**/*", self.handle)
+        context.on("close", lambda _context: log(self.summary()))
+
+
+def build_resource_policy(use_case: str, settings: dict | None = None) -> ResourcePolicy | None:
+    """
+    Build the policy for a use case ("collect", "enrich" or "apply").
+
+    Args:
+        use_case: Profile name
+        settings: App settings; app.resource_policy may set "enabled" or
+            override a profile's "block_types" / "block_trackers"
+
+    Returns:
+        ResourcePolicy, or None when blocking is disabled or the profile is unknown
+    """
+    config = ((settings or {}).get("app", {}) or {}).get("resource_policy", {}) or {}
+    if not config.get("enabled", True):
+        return None
+    profile = dict(DEFAULT_PROFILES.get(use_case) or {})
+    profile.update(config.get(use_case) or {})
+    if not profile:
+        return None
+    return ResourcePolicy(
+        name=use_case,
+        block_types=frozenset(profile.get("block_types") or []),
+        tracker_patterns=TRACKER_PATTERNS if profile.get("block_trackers", True) else (),
+    )
+
+
+def get_resource_stats() -> dict:
+    """Blocked request and estimated byte totals per use case since start-up."""
+    with _TOTALS_LOCK:
+        return {
+            name: {**totals, "blocked_by_type": dict(totals["blocked_by_type"])}
+            for name, totals in _TOTALS.items()
+        }
@@ -0,0 +1,132 @@
+"""
+Response Harvester
+
+Subscribes to page.on("response") and decodes job records straight from the
+JSON listing/search API responses a jobs page loads, so collectors can skip
+per-card DOM scraping. Collectors fall back to the DOM when nothing was
+harvested.
+"""
+
+import asyncio
+import time
+from typing import Callable, Iterable
+
+
+class ResponseHarvester:
+    """
+    Collect jobs decoded from matching JSON responses on a page.
+
+    Args:
+        url_patterns: Substrings identifying the platform's listing API URLs
+        decode: Callable turning one JSON payload into a list of job dicts
+    """
+
+    def __init__(self, url_patterns: Iterable[str], decode: Callable[[object], list[dict]]):
+        self.url_patterns = tuple(url_patterns)
+        self.decode = decode
+        self.jobs: list[dict] = []
+        self.responses = 0
+        self.errors = 0
+        self._seen: set[str] = set()
+        self._pending: set[asyncio.Task] = set()
+
+    def attach(self, page) -> "ResponseHarvester":
+        page.on("response", self._on_response)
+        return self
+
+    def detach(self, page) -> None:
+        try:
+            page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+
+    def matches(self, url: str) -> bool:
+        return any(pattern in url for pattern in self.url_patterns)
+
+    def _on_response(self, response) -> None:
+        if not self.matches(response.url or ""):
+            return
+        task = asyncio.ensure_future(self._harvest(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _harvest(self, response) -> None:
+        try:
+            headers = response.headers or {}
+            if "json" not in (headers.get("content-type") or ""):
+                return
+            payload = await response.json()
+            jobs = self.decode(payload)
+        except Exception:
+            # Bodies of redirected or aborted responses are not retrievable.
+            self.errors += 1
+            return
+        self.responses += 1
+        self.add_jobs(jobs)
+
+    def add_jobs(self, jobs: Iterable[dict]) -> int:
+        """Add decoded jobs, skipping URLs already harvested. Returns the number added."""
+        added = 0
+        for job in jobs or []:
+            job_url = job.get("job_url")
+            if not job_url or job_url in self._seen:
+                continue
+            self._seen.add(job_url)
+            self.jobs.append(job)
+            added += 1
+        return added
+
+    async def settle(self, timeout: float = 5.0) -> None:
+        """Wait for response bodies that are still being decoded."""
+        if self._pending:
+            await asyncio.wait(set(self._pending), timeout=timeout)
+
+    async def collect(
+        self,
+        page,
+        max_results: int,
+        scroll_script: str | None = None,
+        accept: Callable[[dict], bool] | None = None,
+        max_rounds: int = 10,
+        stagnant_limit: int = 3,
+        wait_ms: int = 1200,
+    ) -> list[dict]:
+        """
+        Scroll the results until enough jobs were harvested or no new API
+        responses arrive.
+
+        Args:
+            page: Page the harvester is attached to
+            max_results: Stop once this many accepted jobs were harvested
+            scroll_script: JS evaluated to load the next results; None disables scrolling
+            accept: Optional filter applied to harvested jobs
+            wait_ms: Longest wait for new results after each scroll
+
+        Returns:
+            Up to max_results accepted jobs, in harvest order
+        """
+        def _accepted() -> list[dict]:
+            return [job for job in self.jobs if accept is None or accept(job)]
+
+        stagnant_rounds = 0
+        for _ in range(max_rounds):
+            await self.settle()
+            before = len(self.jobs)
+            if not self.responses or len(_accepted()) >= max_results or not scroll_script:
+                # Nothing intercepted at all means the page did not use the
+                # listing API; leave it to the DOM fallback.
+                break
+            await page.evaluate(scroll_script)
+            # Return as soon as the next API page lands instead of sleeping
+            # for the full wait.
+            deadline = time.monotonic() + wait_ms / 1000
+            while len(self.jobs) == before and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            await self.settle()
+            if len(self.jobs) == before:
+                stagnant_rounds += 1
+                if stagnant_rounds >= stagnant_limit:
+                    break
+            else:
+                stagnant_rounds = 0
+        return _accepted()[:max_results]
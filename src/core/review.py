@@ -1,16 +1,13 @@
 import argparse
 import os
 
-from src.ai.scorer import update_model
+from src.ai.model_trainer import train_model
 from src.core.config import load_profile, load_settings
 from src.core.storage import (
     get_feedback_label,
-    get_job,
-    get_model_state,
     init_db,
     list_jobs,
     record_feedback,
-    save_model_state,
     update_job,
 )
 
@@ -39,35 +36,12 @@ def _print_jobs(jobs: list[dict]) -> None:
         )
 
 
-def _inverse_feedback_label(label: str | None) -> str | None:
-    normalized = (label or "").strip().lower()
-    if normalized in {"approved", "applied", "positive"}:
-        return "rejected"
-    if normalized in {"rejected", "negative", "skipped"}:
-        return "approved"
-    return None
-
-
 def _apply_feedback_learning(base_dir: str, db_path: str, job_key: str, label: str) -> None:
     previous_label = get_feedback_label(db_path, job_key)
     record_feedback(db_path, job_key, label, source="review-cli")
     if previous_label == label:
         return
-    job = get_job(db_path, job_key)
-    if not job:
-        return
-    profile = load_profile(base_dir)
-    updated_state = get_model_state(db_path)
-    undo_label = _inverse_feedback_label(previous_label)
-    if undo_label:
-        updated_state = update_model(job, profile, undo_label, updated_state)
-    updated_state = update_model(job, profile, label, updated_state)
-    save_model_state(
-        db_path,
-        updated_state.get("weights", {}),
-        float(updated_state.get("bias", 0.0) or 0.0),
-        int(updated_state.get("trained_examples", 0) or 0),
-    )
+    train_model(db_path, load_profile(base_dir))
 
 
 def main() -> None:
@@ -102,7 +76,7 @@ def main() -> None:
 
     if args.command == "list":
         statuses = None if args.status == "all" else [args.status]
-        jobs = list_jobs(db_path, statuses=statuses, platform=args.platform, limit=args.limit)
+        jobs = list_jobs(db_path, statuses=statuses, platform=args.platform, limit=args.limit, columns="summary")
         _print_jobs(jobs)
         return
 
@@ -0,0 +1,205 @@
+"""
+Seen-job Key Index
+
+Collectors re-return mostly the same listings every cycle, so has_seen_job
+used to cost one SQLite round trip per collected job. SeenKeyIndex keeps a
+Bloom filter of every stored job_key (hot and archived), loaded once per
+process. A negative answer is definitive and skips the database entirely.
+A positive answer is confirmed with has_seen_job, so false positives cost
+one query and never wrongly hide a new job.
+
+Other containers write to the same database, so the index loads keys added
+since its last sync at the start of every cycle and every resync_seconds.
+It rebuilds from scratch once it outgrows its capacity and its
+false-positive rate would rise.
+
+Settings (storage.seen_filter):
+    enabled: Use the in-memory filter (default True)
+    error_rate: Target false-positive rate (default 0.001)
+    resync_seconds: Interval for picking up other writers' keys (default 300)
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+from src.core.storage import has_seen_job, iter_job_keys
+
+
+DEFAULT_ERROR_RATE = 0.001
+DEFAULT_RESYNC_SECONDS = 300
+MIN_CAPACITY = 10_000
+# Headroom so keys added between rebuilds do not push the filter past capacity.
+CAPACITY_GROWTH = 2
+
+_INDEXES: dict[str, "SeenKeyIndex"] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing."""
+
+    __slots__ = ("capacity", "error_rate", "num_bits", "num_hashes", "bits", "count")
+
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_ERROR_RATE):
+        self.capacity = max(1, int(capacity))
+        self.error_rate = float(error_rate)
+        self.num_bits = max(8, int(math.ceil(-self.capacity * math.log(self.error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.num_hashes):
+            yield (first + index * second) % self.num_bits
+
+    def add(self, key: str) -> None:
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.bits)
+
+
+class SeenKeyIndex:
+    """
+    Bloom-filter front for has_seen_job on one database.
+
+    Args:
+        db_path: SQLite database path
+        error_rate: Target false-positive rate
+        resync_seconds: How often to load keys written by other processes
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        resync_seconds: float = DEFAULT_RESYNC_SECONDS,
+    ):
+        self.db_path = db_path
+        self.error_rate = error_rate
+        self.resync_seconds = resync_seconds
+        self.stats = {"lookups": 0, "filtered": 0, "db_checks": 0, "false_positives": 0, "rebuilds": 0}
+        self._lock = threading.Lock()
+        self._filter: BloomFilter | None = None
+        self._last_id = 0
+        self._synced_at = 0.0
+
+    def _load_keys(self, after_id: int, include_archive: bool) -> list[str]:
+        keys = []
+        for last_id, batch in iter_job_keys(self.db_path, after_id=after_id, include_archive=include_archive):
+            keys.extend(batch)
+            self._last_id = max(self._last_id, last_id)
+        return keys
+
+    def rebuild(self) -> None:
+        """Reload every hot and archived key into a freshly sized filter."""
+        with self._lock:
+            self._last_id = 0
+            keys = self._load_keys(0, include_archive=True)
+            bloom = BloomFilter(max(MIN_CAPACITY, len(keys) * CAPACITY_GROWTH), self.error_rate)
+            for key in keys:
+                bloom.add(key)
+            self._filter = bloom
+            self._synced_at = time.monotonic()
+            self.stats["rebuilds"] += 1
+
+    def resync(self) -> None:
+        """Add keys other writers inserted since the last sync."""
+        if self._filter is None:
+            self.rebuild()
+            return
+        with self._lock:
+            for key in self._load_keys(self._last_id, include_archive=False):
+                self._filter.add(key)
+            self._synced_at = time.monotonic()
+            needs_rebuild = self._filter.count > self._filter.capacity
+        if needs_rebuild:
+            self.rebuild()
+
+    def _maybe_resync(self) -> None:
+        if self._filter is None or time.monotonic() - self._synced_at >= self.resync_seconds:
+            self.resync()
+
+    def might_contain(self, job_key: str) -> bool:
+        """False means the key is definitely not stored; True needs confirming."""
+        self._maybe_resync()
+        return job_key in self._filter
+
+    def has_seen(self, job_key: str) -> bool:
+        """has_seen_job, answered from memory whenever the filter rules the key out."""
+        self.stats["lookups"] += 1
+        if not self.might_contain(job_key):
+            self.stats["filtered"] += 1
+            return False
+        self.stats["db_checks"] += 1
+        seen = has_seen_job(self.db_path, job_key)
+        if not seen:
+            self.stats["false_positives"] += 1
+        return seen
+
+    def add(self, job_key: str) -> None:
+        """Record a key this process just stored."""
+        self._maybe_resync()
+        with self._lock:
+            self._filter.add(job_key)
+
+    def summary(self) -> str:
+        bloom = self._filter
+        size = f"{bloom.size_bytes // 1024}KB keys={bloom.count}" if bloom else "unloaded"
+        return (
+            f"Seen-key filter: {size} lookups={self.stats['lookups']} "
+            f"filtered={self.stats['filtered']} db_checks={self.stats['db_checks']} "
+            f"false_positives={self.stats['false_positives']}"
+        )
+
+
+class _DirectSeenKeys:
+    """Pass-through used when the filter is disabled."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+
+    def resync(self) -> None:
+        return None
+
+    def might_contain(self, job_key: str) -> bool:
+        return True
+
+    def has_seen(self, job_key: str) -> bool:
+        return has_seen_job(self.db_path, job_key)
+
+    def add(self, job_key: str) -> None:
+        return None
+
+    def summary(self) -> str:
+        return "Seen-key filter: disabled"
+
+
+def get_seen_index(db_path: str, settings: dict | None = None):
+    """Process-wide seen-key index for a database, built on first use."""
+    config = ((settings or {}).get("storage", {}) or {}).get("seen_filter", {}) or {}
+    if not config.get("enabled", True):
+        return _DirectSeenKeys(db_path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(db_path)
+        if index is None:
+            index = SeenKeyIndex(
+                db_path,
+                error_rate=float(config.get("error_rate", DEFAULT_ERROR_RATE)),
+                resync_seconds=float(config.get("resync_seconds", DEFAULT_RESYNC_SECONDS)),
+            )
+            _INDEXES[db_path] = index
+        return index
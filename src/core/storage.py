@@ -1,10 +1,27 @@
 import json
 import os
+import re
 import sqlite3
+import zlib
 from datetime import datetime
 
 
 _SQLITE_TIMEOUT_SECONDS = 30
+_MODEL_CHECKPOINTS_KEPT = 20
+_SQLITE_MAX_PARAMS = 500
+_ARCHIVE_BATCH_SIZE = 500
+_ARCHIVE_MAX_BATCHES = 10
+
+# (dimension, bucket expression, condition) for the materialized job_stats
+# counters. "{row}" is replaced with NEW or OLD inside the jobs triggers.
+_JOB_STATS_DIMENSIONS = (
+    ("status", "COALESCE({row}.status, '')", "1"),
+    ("platform", "COALESCE({row}.platform, '')", "1"),
+    ("decision", "{row}.decision", "{row}.decision IS NOT NULL"),
+    ("scored", "''", "{row}.score IS NOT NULL"),
+    ("applied_platform", "COALESCE({row}.platform, '')", "{row}.status = 'applied'"),
+    ("applied_day", "substr({row}.applied_at, 1, 10)", "{row}.status = 'applied' AND {row}.applied_at IS NOT NULL"),
+)
 
 
 def _connect(db_path: str) -> sqlite3.Connection:
@@ -31,6 +48,8 @@ def init_db(db_path: str) -> None:
                 decision TEXT,
                 posted_at TEXT,
                 posted_text TEXT,
+                applicant_count INTEGER,
+                apply_type TEXT,
                 created_at TEXT,
                 updated_at TEXT,
                 applied_at TEXT
@@ -60,6 +79,21 @@ def init_db(db_path: str) -> None:
             );
             """
         )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS model_checkpoints (
+                version INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                weights_json TEXT,
+                bias REAL,
+                trained_examples INTEGER,
+                created_at TEXT
+            );
+            """
+        )
+        cur = conn.execute("PRAGMA table_info(model_state)")
+        if "version" not in {row[1] for row in cur.fetchall()}:
+            conn.execute("ALTER TABLE model_state ADD COLUMN version INTEGER")
         cur = conn.execute("PRAGMA table_info(jobs)")
         columns = {row[1] for row in cur.fetchall()}
         if "easy_apply" not in columns:
@@ -68,15 +102,348 @@ def init_db(db_path: str) -> None:
             conn.execute("ALTER TABLE jobs ADD COLUMN posted_at TEXT")
         if "posted_text" not in columns:
             conn.execute("ALTER TABLE jobs ADD COLUMN posted_text TEXT")
+        if "applicant_count" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN applicant_count INTEGER")
+        if "apply_type" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN apply_type TEXT")
+        if "sort_key" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN sort_key TEXT")
+            conn.execute("UPDATE jobs SET sort_key = COALESCE(NULLIF(posted_at, ''), created_at)")
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS jobs_sort_key_insert AFTER INSERT ON jobs
+            BEGIN
+                UPDATE jobs SET sort_key = COALESCE(NULLIF(NEW.posted_at, ''), NEW.created_at)
+                WHERE id = NEW.id;
+            END;
+            """
+        )
+        conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS jobs_sort_key_update AFTER UPDATE OF posted_at, created_at ON jobs
+            BEGIN
+                UPDATE jobs SET sort_key = COALESCE(NULLIF(NEW.posted_at, ''), NEW.created_at)
+                WHERE id = NEW.id;
+            END;
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_sort_key ON jobs(sort_key, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_sort_key ON jobs(status, sort_key, id)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_signatures (
+                job_key TEXT PRIMARY KEY,
+                canonical_key TEXT,
+                signature TEXT,
+                created_at TEXT
+            );
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_signature_bands (
+                band_key TEXT NOT NULL,
+                job_key TEXT NOT NULL,
+                PRIMARY KEY (band_key, job_key)
+            ) WITHOUT ROWID;
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_job_signatures_canonical ON job_signatures(canonical_key)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs_archive (
+                job_key TEXT PRIMARY KEY,
+                platform TEXT,
+                status TEXT,
+                sort_key TEXT,
+                archived_at TEXT,
+                payload BLOB
+            );
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_updated_at ON jobs(updated_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at)")
+        _init_job_stats(conn)
+        _init_jobs_fts(conn)
+        conn.commit()
+
+
+def _job_stats_statements(row: str, delta: int) -> str:
+    statements = []
+    for dimension, bucket, condition in _JOB_STATS_DIMENSIONS:
+        statements.append(
+            f"""
+                INSERT INTO job_stats (dimension, bucket, count)
+                SELECT '{dimension}', {bucket.format(row=row)}, {delta}
+                WHERE {condition.format(row=row)}
+                ON CONFLICT(dimension, bucket) DO UPDATE SET count = count + excluded.count;"""
+        )
+    return "".join(statements)
+
+
+def _init_job_stats(conn: sqlite3.Connection) -> None:
+    cur = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_stats'")
+    existed = cur.fetchone() is not None
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_stats (
+            dimension TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (dimension, bucket)
+        );
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS jobs_stats_insert AFTER INSERT ON jobs
+        BEGIN{_job_stats_statements("NEW", 1)}
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS jobs_stats_delete AFTER DELETE ON jobs
+        BEGIN{_job_stats_statements("OLD", -1)}
+        END;
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS jobs_stats_update
+        AFTER UPDATE OF status, platform, decision, score, applied_at ON jobs
+        BEGIN{_job_stats_statements("OLD", -1)}{_job_stats_statements("NEW", 1)}
+        END;
+        """
+    )
+    if not existed:
+        _rebuild_job_stats(conn)
+
+
+def _rebuild_job_stats(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM job_stats")
+    for dimension, bucket, condition in _JOB_STATS_DIMENSIONS:
+        bucket_sql = bucket.format(row="jobs")
+        conn.execute(
+            f"""
+            INSERT INTO job_stats (dimension, bucket, count)
+            SELECT '{dimension}', {bucket_sql}, COUNT(1)
+            FROM jobs
+            WHERE {condition.format(row="jobs")}
+            GROUP BY {bucket_sql}
+            """
+        )
+
+
+def _init_jobs_fts(conn: sqlite3.Connection) -> None:
+    cur = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+    existed = cur.fetchone() is not None
+    try:
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, company, location, description,
+                content = 'jobs',
+                content_rowid = 'id',
+                tokenize = 'unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            );
+            """
+        )
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5; search_jobs falls back to LIKE scans.
+        return
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, location, description)
+            VALUES (NEW.id, NEW.title, NEW.company, NEW.location, NEW.description);
+        END;
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.location, OLD.description);
+        END;
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update
+        AFTER UPDATE OF title, company, location, description ON jobs
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.location, OLD.description);
+            INSERT INTO jobs_fts (rowid, title, company, location, description)
+            VALUES (NEW.id, NEW.title, NEW.company, NEW.location, NEW.description);
+        END;
+        """
+    )
+    if not existed:
+        conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+
+def _has_jobs_fts(conn: sqlite3.Connection) -> bool:
+    cur = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+    return cur.fetchone() is not None
+
+
+def rebuild_job_stats(db_path: str) -> None:
+    """Recompute the job_stats counters from the jobs table."""
+    with _connect(db_path) as conn:
+        _rebuild_job_stats(conn)
         conn.commit()
 
 
+def get_job_stats(db_path: str) -> dict:
+    """
+    Read the materialized job counters kept up to date by the jobs triggers.
+
+    Returns:
+        Dict with one {bucket: count} mapping per dimension ("status",
+        "platform", "decision", "applied_platform", "applied_day"), plus
+        "total", "scored" and "last_updated"
+    """
+    stats: dict = {dimension: {} for dimension, _bucket, _condition in _JOB_STATS_DIMENSIONS}
+    with _connect(db_path) as conn:
+        cur = conn.execute("SELECT dimension, bucket, count FROM job_stats WHERE count != 0")
+        for dimension, bucket, count in cur.fetchall():
+            stats.setdefault(dimension, {})[bucket] = int(count)
+        row = conn.execute("SELECT MAX(updated_at) FROM jobs").fetchone()
+    stats["total"] = sum(stats["status"].values())
+    stats["scored"] = sum(stats.pop("scored", {}).values())
+    stats["last_updated"] = row[0] if row else None
+    return stats
+
+
 def has_seen_job(db_path: str, job_key: str) -> bool:
+    """True if the job is in the hot jobs table or has been archived."""
     with _connect(db_path) as conn:
-        cur = conn.execute("SELECT 1 FROM jobs WHERE job_key = ? LIMIT 1", (job_key,))
+        cur = conn.execute(
+            """
+            SELECT 1 FROM jobs WHERE job_key = ?
+            UNION ALL
+            SELECT 1 FROM jobs_archive WHERE job_key = ?
+            LIMIT 1
+            """,
+            (job_key, job_key),
+        )
         return cur.fetchone() is not None
 
 
+def find_signature_candidates(
+    db_path: str, band_keys: list[str], exclude_job_key: str | None = None
+) -> list[dict]:
+    """
+    Jobs sharing at least one LSH band key, with their stored signatures.
+
+    Returns:
+        List of {"job_key", "canonical_key", "signature"} dicts
+    """
+    if not band_keys:
+        return []
+    placeholders = ",".join(["?"] * len(band_keys))
+    with _connect(db_path) as conn:
+        cur = conn.execute(
+            f"""
+            SELECT s.job_key, s.canonical_key, s.signature
+            FROM job_signatures s
+            WHERE s.job_key IN (
+                SELECT job_key FROM job_signature_bands WHERE band_key IN ({placeholders})
+            )
+            AND s.job_key != ?
+            """,
+            (*band_keys, exclude_job_key or ""),
+        )
+        rows = cur.fetchall()
+    return [
+        {"job_key": row[0], "canonical_key": row[1], "signature": json.loads(row[2] or "[]")}
+        for row in rows
+    ]
+
+
+def record_job_signature(
+    db_path: str,
+    job_key: str,
+    signature: list[int],
+    band_keys: list[str],
+    canonical_key: str | None = None,
+) -> None:
+    """Store a job's MinHash signature and band keys, linked to its canonical job."""
+    now = datetime.utcnow().isoformat()
+    with _connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT INTO job_signatures (job_key, canonical_key, signature, created_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(job_key) DO UPDATE SET
+                canonical_key = excluded.canonical_key,
+                signature = excluded.signature
+            """,
+            (job_key, canonical_key, json.dumps(signature), now),
+        )
+        conn.execute("DELETE FROM job_signature_bands WHERE job_key = ?", (job_key,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO job_signature_bands (band_key, job_key) VALUES (?, ?)",
+            [(band_key, job_key) for band_key in band_keys],
+        )
+        conn.commit()
+
+
+def get_duplicate_keys(db_path: str, canonical_key: str) -> list[str]:
+    """Job keys linked to a canonical job as near-duplicates."""
+    with _connect(db_path) as conn:
+        cur = conn.execute(
+            "SELECT job_key FROM job_signatures WHERE canonical_key = ? ORDER BY created_at",
+            (canonical_key,),
+        )
+        return [row[0] for row in cur.fetchall()]
+
+
+def iter_job_keys(db_path: str, after_id: int = 0, include_archive: bool = True, batch_size: int = 5000):
+    """
+    Yield (last_id, job_keys) batches for jobs with id > after_id.
+
+    With include_archive, archived keys are yielded first with last_id 0,
+    so a caller can track the highest jobs.id seen for incremental reloads.
+    """
+    batch_size = max(1, int(batch_size or 1))
+    if include_archive:
+        last_key = ""
+        while True:
+            with _connect(db_path) as conn:
+                keys = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT job_key FROM jobs_archive WHERE job_key > ? ORDER BY job_key LIMIT ?",
+                        (last_key, batch_size),
+                    )
+                ]
+            if not keys:
+                break
+            last_key = keys[-1]
+            yield 0, keys
+            if len(keys) < batch_size:
+                break
+    last_id = int(after_id or 0)
+    while True:
+        with _connect(db_path) as conn:
+            rows = conn.execute(
+                "SELECT id, job_key FROM jobs WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size),
+            ).fetchall()
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield last_id, [row[1] for row in rows]
+        if len(rows) < batch_size:
+            return
+
+
 def upsert_job(
     db_path: str,
     job: dict,
@@ -98,8 +465,8 @@ def upsert_job(
             INSERT INTO jobs (
                 job_key, platform, title, company, location, description, job_url,
                 status, easy_apply, score, decision, posted_at, posted_text,
-                created_at, updated_at, applied_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                applicant_count, apply_type, created_at, updated_at, applied_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(job_key) DO UPDATE SET
                 platform = excluded.platform,
                 title = COALESCE(NULLIF(excluded.title, ''), jobs.title),
@@ -113,6 +480,8 @@ def upsert_job(
                 decision = COALESCE(NULLIF(excluded.decision, ''), jobs.decision),
                 posted_at = COALESCE(NULLIF(excluded.posted_at, ''), jobs.posted_at),
                 posted_text = COALESCE(NULLIF(excluded.posted_text, ''), jobs.posted_text),
+                applicant_count = COALESCE(excluded.applicant_count, jobs.applicant_count),
+                apply_type = COALESCE(NULLIF(excluded.apply_type, ''), jobs.apply_type),
                 updated_at = excluded.updated_at,
                 applied_at = COALESCE(excluded.applied_at, jobs.applied_at)
             """,
@@ -130,6 +499,8 @@ def upsert_job(
                 decision,
                 posted_at,
                 posted_text,
+                job.get("applicant_count"),
+                job.get("apply_type") or None,
                 now,
                 now,
                 applied_at,
@@ -174,7 +545,7 @@ def get_job(db_path: str, job_key: str) -> dict | None:
             SELECT
                 j.job_key, j.platform, j.title, j.company, j.location, j.description, j.job_url,
                 j.status, j.easy_apply, j.score, j.decision, j.posted_at, j.posted_text,
-                j.created_at, j.updated_at, j.applied_at, f.label
+                j.created_at, j.updated_at, j.applied_at, f.label, j.applicant_count, j.apply_type
             FROM jobs j
             LEFT JOIN feedback f ON f.job_key = j.job_key
             WHERE j.job_key = ?
@@ -203,6 +574,8 @@ def get_job(db_path: str, job_key: str) -> dict | None:
         "updated_at": row[14],
         "applied_at": row[15],
         "feedback_label": row[16],
+        "applicant_count": row[17],
+        "apply_type": row[18],
     }
 
 
@@ -220,6 +593,29 @@ def update_job(db_path: str, job_key: str, **fields) -> None:
         conn.commit()
 
 
+def bulk_update_status(db_path: str, job_keys: list[str], status: str) -> None:
+    """Set the status of many jobs in a single transaction."""
+    job_keys = [key for key in dict.fromkeys(job_keys) if key]
+    if not job_keys:
+        return
+    with _connect(db_path) as conn:
+        _write_statuses(conn, job_keys, status)
+        conn.commit()
+
+
+def _write_statuses(conn: sqlite3.Connection, job_keys: list[str], status: str) -> None:
+    now = datetime.utcnow().isoformat()
+    applied_at = now if status == "applied" else None
+    conn.executemany(
+        """
+        UPDATE jobs
+        SET status = ?, updated_at = ?, applied_at = COALESCE(?, applied_at)
+        WHERE job_key = ?
+        """,
+        [(status, now, applied_at, job_key) for job_key in job_keys],
+    )
+
+
 def record_decision(db_path: str, job_key: str, decision: str, score: int) -> None:
     update_job(db_path, job_key, decision=decision, score=score)
 
@@ -263,6 +659,51 @@ def record_feedback(
         conn.commit()
 
 
+def bulk_record_feedback(
+    db_path: str,
+    job_keys: list[str],
+    label: str,
+    notes: str = "",
+    source: str = "user",
+    status: str | None = None,
+) -> list[str]:
+    """Record one feedback label for many jobs in a single transaction.
+
+    When status is given, the jobs' status is set in the same transaction.
+    Returns the job keys whose stored label changed.
+    """
+    job_keys = list(dict.fromkeys(key for key in job_keys if key))
+    if not job_keys:
+        return []
+    now = datetime.utcnow().isoformat()
+    previous: dict[str, str] = {}
+    with _connect(db_path) as conn:
+        for start in range(0, len(job_keys), _SQLITE_MAX_PARAMS):
+            chunk = job_keys[start:start + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join(["?"] * len(chunk))
+            cur = conn.execute(
+                f"SELECT job_key, label FROM feedback WHERE job_key IN ({placeholders})",
+                chunk,
+            )
+            previous.update({row[0]: row[1] for row in cur.fetchall()})
+        conn.executemany(
+            """
+            INSERT INTO feedback (job_key, label, notes, source, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(job_key) DO UPDATE SET
+                label = excluded.label,
+                notes = excluded.notes,
+                source = excluded.source,
+                updated_at = excluded.updated_at
+            """,
+            [(job_key, label, notes, source, now, now) for job_key in job_keys],
+        )
+        if status is not None:
+            _write_statuses(conn, job_keys, status)
+        conn.commit()
+    return [job_key for job_key in job_keys if previous.get(job_key) != label]
+
+
 def get_feedback_label(db_path: str, job_key: str) -> str | None:
     with _connect(db_path) as conn:
         cur = conn.execute("SELECT label FROM feedback WHERE job_key = ? LIMIT 1", (job_key,))
@@ -283,11 +724,56 @@ def get_approved_count(db_path: str) -> int:
         return int(row[0]) if row else 0
 
 
+def iter_feedback_examples(db_path: str, batch_size: int = 64):
+    """Yield feedback rows joined with their jobs, ``batch_size`` rows at a time."""
+    batch_size = max(1, int(batch_size or 1))
+    last_rowid = 0
+    while True:
+        with _connect(db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT f.rowid, f.label, f.updated_at, j.job_key, j.title, j.description,
+                       j.location, j.easy_apply, j.posted_at, j.posted_text
+                FROM feedback f
+                JOIN jobs j ON j.job_key = f.job_key
+                WHERE f.rowid > ?
+                ORDER BY f.rowid
+                LIMIT ?
+                """,
+                (last_rowid, batch_size),
+            ).fetchall()
+        if not rows:
+            return
+        last_rowid = rows[-1][0]
+        yield [
+            {
+                "label": row[1],
+                "labeled_at": row[2],
+                "job_key": row[3],
+                "title": row[4],
+                "description": row[5],
+                "location": row[6],
+                "easy_apply": row[7],
+                "posted_at": row[8],
+                "posted_text": row[9],
+            }
+            for row in rows
+        ]
+        if len(rows) < batch_size:
+            return
+
+
+def get_model_version(db_path: str) -> int:
+    with _connect(db_path) as conn:
+        row = conn.execute("SELECT version FROM model_state WHERE name = 'default' LIMIT 1").fetchone()
+    return int(row[0] or 0) if row else 0
+
+
 def get_model_state(db_path: str) -> dict:
     with _connect(db_path) as conn:
         cur = conn.execute(
             """
-            SELECT weights_json, bias, trained_examples
+            SELECT weights_json, bias, trained_examples, version
             FROM model_state
             WHERE name = 'default'
             LIMIT 1
@@ -295,8 +781,8 @@ def get_model_state(db_path: str) -> dict:
         )
         row = cur.fetchone()
     if not row:
-        return {"weights": {}, "bias": 0.0, "trained_examples": 0}
-    weights_json, bias, trained_examples = row
+        return {"weights": {}, "bias": 0.0, "trained_examples": 0, "version": 0}
+    weights_json, bias, trained_examples, version = row
     try:
         weights = json.loads(weights_json or "{}")
     except json.JSONDecodeError:
@@ -305,6 +791,7 @@ def get_model_state(db_path: str) -> dict:
         "weights": weights,
         "bias": float(bias or 0.0),
         "trained_examples": int(trained_examples or 0),
+        "version": int(version or 0),
     }
 
 
@@ -313,22 +800,167 @@ def save_model_state(
     weights: dict,
     bias: float,
     trained_examples: int = 0,
-) -> None:
+) -> int:
+    """Checkpoint model weights and make them the current model; returns the new version."""
     now = datetime.utcnow().isoformat()
+    weights_json = json.dumps(weights)
     with _connect(db_path) as conn:
-        conn.execute(
+        cur = conn.execute(
             """
-            INSERT INTO model_state (name, weights_json, bias, trained_examples, updated_at)
+            INSERT INTO model_checkpoints (name, weights_json, bias, trained_examples, created_at)
             VALUES ('default', ?, ?, ?, ?)
+            """,
+            (weights_json, bias, trained_examples, now),
+        )
+        version = int(cur.lastrowid)
+        conn.execute(
+            """
+            INSERT INTO model_state (name, weights_json, bias, trained_examples, updated_at, version)
+            VALUES ('default', ?, ?, ?, ?, ?)
             ON CONFLICT(name) DO UPDATE SET
                 weights_json = excluded.weights_json,
                 bias = excluded.bias,
                 trained_examples = excluded.trained_examples,
-                updated_at = excluded.updated_at
+                updated_at = excluded.updated_at,
+                version = excluded.version
             """,
-            (json.dumps(weights), bias, trained_examples, now),
+            (weights_json, bias, trained_examples, now, version),
+        )
+        conn.execute(
+            "DELETE FROM model_checkpoints WHERE name = 'default' AND version <= ?",
+            (version - _MODEL_CHECKPOINTS_KEPT,),
         )
         conn.commit()
+    return version
+
+
+def get_model_checkpoint(db_path: str, version: int) -> dict | None:
+    with _connect(db_path) as conn:
+        row = conn.execute(
+            """
+            SELECT weights_json, bias, trained_examples, created_at
+            FROM model_checkpoints
+            WHERE name = 'default' AND version = ?
+            LIMIT 1
+            """,
+            (version,),
+        ).fetchone()
+    if not row:
+        return None
+    try:
+        weights = json.loads(row[0] or "{}")
+    except json.JSONDecodeError:
+        weights = {}
+    return {
+        "weights": weights,
+        "bias": float(row[1] or 0.0),
+        "trained_examples": int(row[2] or 0),
+        "created_at": row[3],
+        "version": int(version),
+    }
+
+
+def archive_jobs(
+    db_path: str,
+    keep_latest: int,
+    batch_size: int = _ARCHIVE_BATCH_SIZE,
+    max_batches: int = _ARCHIVE_MAX_BATCHES,
+) -> int:
+    """
+    Move jobs beyond the newest ``keep_latest`` into jobs_archive.
+
+    Rows are archived oldest first in batches of ``batch_size``, each in its
+    own transaction, and at most ``max_batches`` per call, so a large backlog
+    drains over several cycles instead of stalling one. Archived rows keep
+    their full record as zlib-compressed JSON; their job_key stays visible
+    to has_seen_job. Jobs with feedback labels stay in the hot table because
+    the model trains on them.
+
+    Returns:
+        Number of jobs archived
+    """
+    keep_latest = int(keep_latest or 0)
+    if keep_latest <= 0:
+        return 0
+    batch_size = max(1, int(batch_size or 1))
+    archived = 0
+    for _ in range(max(1, int(max_batches or 1))):
+        with _connect(db_path) as conn:
+            cutoff = conn.execute(
+                "SELECT sort_key, id FROM jobs ORDER BY sort_key DESC, id DESC LIMIT 1 OFFSET ?",
+                (keep_latest,),
+            ).fetchone()
+            if not cutoff:
+                break
+            if cutoff[0] is None:
+                older_sql = "j.sort_key IS NULL AND j.id <= ?"
+                older_params = (cutoff[1],)
+            else:
+                older_sql = "((j.sort_key, j.id) <= (?, ?) OR j.sort_key IS NULL)"
+                older_params = (cutoff[0], cutoff[1])
+            cur = conn.execute(
+                f"""
+                SELECT j.*
+                FROM jobs j
+                WHERE {older_sql}
+                AND NOT EXISTS (SELECT 1 FROM feedback f WHERE f.job_key = j.job_key)
+                ORDER BY j.sort_key, j.id
+                LIMIT ?
+                """,
+                (*older_params, batch_size),
+            )
+            names = [column[0] for column in cur.description]
+            rows = [dict(zip(names, row)) for row in cur.fetchall()]
+            if not rows:
+                break
+            now = datetime.utcnow().isoformat()
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO jobs_archive (job_key, platform, status, sort_key, archived_at, payload)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        row["job_key"],
+                        row.get("platform"),
+                        row.get("status"),
+                        row.get("sort_key"),
+                        now,
+                        zlib.compress(json.dumps(row).encode("utf-8")),
+                    )
+                    for row in rows
+                ],
+            )
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(row["id"],) for row in rows])
+            conn.commit()
+        archived += len(rows)
+        if len(rows) < batch_size:
+            break
+    return archived
+
+
+def get_archived_job(db_path: str, job_key: str) -> dict | None:
+    """Full record of an archived job, with "archived_at" added."""
+    with _connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT payload, archived_at FROM jobs_archive WHERE job_key = ?",
+            (job_key,),
+        ).fetchone()
+    if not row:
+        return None
+    job = json.loads(zlib.decompress(row[0]).decode("utf-8"))
+    job.pop("id", None)
+    job["archived_at"] = row[1]
+    return job
+
+
+def get_archive_stats(db_path: str) -> dict:
+    """Archived job count and compressed payload size."""
+    with _connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT COUNT(1), COALESCE(SUM(LENGTH(payload)), 0), MAX(archived_at) FROM jobs_archive"
+        ).fetchone()
+    return {"archived": int(row[0]), "payload_bytes": int(row[1]), "last_archived_at": row[2]}
 
 
 def prune_jobs(db_path: str, keep_latest: int) -> None:
@@ -342,7 +974,7 @@ def prune_jobs(db_path: str, keep_latest: int) -> None:
             WHERE id NOT IN (
                 SELECT id
                 FROM jobs
-                ORDER BY COALESCE(NULLIF(posted_at, ''), created_at) DESC, id DESC
+                ORDER BY sort_key DESC, id DESC
                 LIMIT ?
             )
             """,
@@ -354,66 +986,261 @@ def prune_jobs(db_path: str, keep_latest: int) -> None:
             WHERE job_key NOT IN (SELECT job_key FROM jobs)
             """
         )
+        conn.execute("DELETE FROM job_signatures WHERE job_key NOT IN (SELECT job_key FROM jobs)")
+        conn.execute("DELETE FROM job_signature_bands WHERE job_key NOT IN (SELECT job_key FROM jobs)")
         conn.commit()
 
 
+# Listing projections: "summary" leaves out the description, which list
+# pages never render; get_job loads it on demand.
+_JOB_PROJECTIONS = {
+    "summary": (
+        "job_key", "platform", "title", "company", "location", "job_url",
+        "status", "easy_apply", "score", "decision", "posted_at", "posted_text",
+        "applicant_count", "apply_type", "created_at", "updated_at", "applied_at",
+    ),
+    "full": (
+        "job_key", "platform", "title", "company", "location", "description", "job_url",
+        "status", "easy_apply", "score", "decision", "posted_at", "posted_text",
+        "applicant_count", "apply_type", "created_at", "updated_at", "applied_at",
+    ),
+}
+
+
+def _projection(columns: str) -> tuple[str, ...]:
+    try:
+        return _JOB_PROJECTIONS[columns]
+    except KeyError:
+        raise ValueError(f"Unknown job projection: {columns!r}") from None
+
+
+def _projection_sql(names: tuple[str, ...]) -> str:
+    return ", ".join(f"j.{name}" for name in names) + ", f.label"
+
+
+def _job_from_row(names: tuple[str, ...], row) -> dict:
+    job = dict(zip(names, row))
+    job["feedback_label"] = row[len(names)]
+    return job
+
+
+def _job_filters(
+    statuses: list[str] | None,
+    easy_apply: bool | None,
+    platform: str | None,
+) -> tuple[list[str], list]:
+    where = []
+    params: list = []
+    if statuses:
+        where.append(f"j.status IN ({','.join(['?'] * len(statuses))})")
+        params.extend(statuses)
+    if easy_apply is True:
+        where.append("j.easy_apply = 1")
+    if easy_apply is False:
+        where.append("(j.easy_apply = 0 OR j.easy_apply IS NULL)")
+    if platform:
+        where.append("j.platform = ?")
+        params.append(platform)
+    return where, params
+
+
+def list_jobs_page(
+    db_path: str,
+    statuses: list[str] | None = None,
+    easy_apply: bool | None = None,
+    platform: str | None = None,
+    cursor: str | None = None,
+    limit: int = 100,
+    columns: str = "summary",
+) -> dict:
+    """
+    One page of jobs, newest first, with a keyset cursor.
+
+    Rows are ordered by the stored sort_key (posted_at, else created_at) and
+    id, so each page is an index range scan no matter how deep it is.
+
+    Args:
+        cursor: next_cursor from the previous page, or None for the first page
+        columns: "summary" (no description) or "full"
+
+    Returns:
+        Dict with "jobs" and "next_cursor" (None on the last page)
+    """
+    names = _projection(columns)
+    where, params = _job_filters(statuses, easy_apply, platform)
+    if cursor:
+        sort_key, sep, id_text = cursor.rpartition("|")
+        if not sep or not id_text.isdigit():
+            raise ValueError(f"Invalid job cursor: {cursor!r}")
+        where.append("(j.sort_key, j.id) < (?, ?)")
+        params.extend([sort_key, int(id_text)])
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+    with _connect(db_path) as conn:
+        cur = conn.execute(
+            f"""
+            SELECT {_projection_sql(names)}, j.sort_key, j.id
+            FROM jobs j
+            LEFT JOIN feedback f ON f.job_key = j.job_key
+            {where_sql}
+            ORDER BY j.sort_key DESC, j.id DESC
+            LIMIT ?
+            """,
+            (*params, limit + 1),
+        )
+        rows = cur.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = f"{rows[-1][-2] or ''}|{rows[-1][-1]}"
+    return {"jobs": [_job_from_row(names, row) for row in rows], "next_cursor": next_cursor}
+
+
 def list_jobs(
     db_path: str,
     statuses: list[str] | None = None,
     easy_apply: bool | None = None,
     platform: str | None = None,
     limit: int = 100,
+    columns: str = "full",
 ) -> list[dict]:
+    return list_jobs_page(
+        db_path,
+        statuses=statuses,
+        easy_apply=easy_apply,
+        platform=platform,
+        limit=limit,
+        columns=columns,
+    )["jobs"]
+
+
+def iter_jobs(
+    db_path: str,
+    statuses: list[str] | None = None,
+    platform: str | None = None,
+    since: str | None = None,
+    columns: str = "summary",
+    batch_size: int = 500,
+):
+    """
+    Yield every matching job in id order, ``batch_size`` rows at a time.
+
+    Each batch is read on its own short connection and resumes after the
+    last id, so a long export neither holds a read lock nor loads the whole
+    table.
+
+    Args:
+        since: Only jobs updated after this ISO timestamp (incremental export)
+        columns: "summary" or "full"
+    """
+    names = _projection(columns)
+    batch_size = max(1, int(batch_size or 1))
+    where, params = _job_filters(statuses, None, platform)
+    if since:
+        where.append("j.updated_at > ?")
+        params.append(since)
+    where.append("j.id > ?")
+    last_id = 0
+    while True:
+        with _connect(db_path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_projection_sql(names)}, j.id
+                FROM jobs j
+                LEFT JOIN feedback f ON f.job_key = j.job_key
+                WHERE {' AND '.join(where)}
+                ORDER BY j.id
+                LIMIT ?
+                """,
+                (*params, last_id, batch_size),
+            ).fetchall()
+        if not rows:
+            return
+        last_id = rows[-1][-1]
+        yield [_job_from_row(names, row) for row in rows]
+        if len(rows) < batch_size:
+            return
+
+
+# Column weights for bm25 ranking: title, company, location, description.
+_SEARCH_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+
+def _search_terms(query: str) -> list[str]:
+    return re.findall(r"\w+", (query or "").lower())
+
+
+def search_jobs(
+    db_path: str,
+    query: str,
+    statuses: list[str] | None = None,
+    platform: str | None = None,
+    cursor: str | None = None,
+    limit: int = 50,
+    columns: str = "full",
+) -> dict:
+    """
+    Full-text search over job title, company, location and description.
+
+    Every query term must match (as a prefix), and results are ranked by
+    bm25 with title and company weighted highest. Pages are keyset-based:
+    pass the returned next_cursor to fetch the following page.
+
+    Returns:
+        Dict with "jobs" (list_jobs-shaped dicts) and "next_cursor" (None on
+        the last page)
+    """
+    terms = _search_terms(query)
+    if not terms:
+        return {"jobs": [], "next_cursor": None}
+    names = _projection(columns)
+    where, params = _job_filters(statuses, None, platform)
+    if cursor:
+        try:
+            rank_text, id_text = cursor.split(":", 1)
+            after_rank, after_id = float(rank_text), int(id_text)
+        except ValueError:
+            raise ValueError(f"Invalid search cursor: {cursor!r}") from None
+        where.append("(m.rank > ? OR (m.rank = ? AND j.id > ?))")
+        params.extend([after_rank, after_rank, after_id])
+    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+
     with _connect(db_path) as conn:
-        where = []
-        params: list = []
-        if statuses:
-            placeholders = ",".join(["?"] * len(statuses))
-            where.append(f"status IN ({placeholders})")
-            params.extend(statuses)
-        if easy_apply is True:
-            where.append("easy_apply = 1")
-        if easy_apply is False:
-            where.append("(easy_apply = 0 OR easy_apply IS NULL)")
-        if platform:
-            where.append("platform = ?")
-            params.append(platform)
-        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
-        query = (
-            "SELECT "
-            "j.job_key, j.platform, j.title, j.company, j.location, j.description, j.job_url, "
-            "j.status, j.easy_apply, j.score, j.decision, j.posted_at, j.posted_text, "
-            "j.created_at, j.updated_at, j.applied_at, f.label "
-            "FROM jobs j "
-            "LEFT JOIN feedback f ON f.job_key = j.job_key "
-            f"{where_sql.replace('platform = ?', 'j.platform = ?').replace('status IN', 'j.status IN')} "
-            "ORDER BY COALESCE(NULLIF(j.posted_at, ''), j.created_at) DESC LIMIT ?"
-        )
-        params.append(limit)
-        cur = conn.execute(query, params)
+        if _has_jobs_fts(conn):
+            match = " ".join(f'"{term}"*' for term in terms)
+            weights = ", ".join(str(weight) for weight in _SEARCH_WEIGHTS)
+            matches_sql = (
+                f"SELECT rowid AS id, bm25(jobs_fts, {weights}) AS rank "
+                "FROM jobs_fts WHERE jobs_fts MATCH ?"
+            )
+            match_params = [match]
+        else:
+            like = " AND ".join(
+                [
+                    "(COALESCE(title, '') || ' ' || COALESCE(company, '') || ' ' || "
+                    "COALESCE(location, '') || ' ' || COALESCE(description, '')) LIKE ?"
+                ]
+                * len(terms)
+            )
+            matches_sql = f"SELECT id, 0.0 AS rank FROM jobs WHERE {like}"
+            match_params = [f"%{term}%" for term in terms]
+        cur = conn.execute(
+            f"""
+            WITH m AS ({matches_sql})
+            SELECT {_projection_sql(names)}, m.rank, j.id
+            FROM m
+            JOIN jobs j ON j.id = m.id
+            LEFT JOIN feedback f ON f.job_key = j.job_key
+            {where_sql}
+            ORDER BY m.rank, j.id
+            LIMIT ?
+            """,
+            (*match_params, *params, limit + 1),
+        )
         rows = cur.fetchall()
 
-    jobs = []
-    for row in rows:
-        jobs.append(
-            {
-                "job_key": row[0],
-                "platform": row[1],
-                "title": row[2],
-                "company": row[3],
-                "location": row[4],
-                "description": row[5],
-                "job_url": row[6],
-                "status": row[7],
-                "easy_apply": row[8],
-                "score": row[9],
-                "decision": row[10],
-                "posted_at": row[11],
-                "posted_text": row[12],
-                "created_at": row[13],
-                "updated_at": row[14],
-                "applied_at": row[15],
-                "feedback_label": row[16],
-            }
-        )
-    return jobs
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = f"{rows[-1][-2]!r}:{rows[-1][-1]}"
+    return {"jobs": [_job_from_row(names, row) for row in rows], "next_cursor": next_cursor}
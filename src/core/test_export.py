@@ -0,0 +1,80 @@
+"""
+Tests for streaming job export.
+
+Validates:
+- CSV output has a header and one row per job, across batch boundaries
+- NDJSON output has one JSON object per line
+- Status/platform filters and the since timestamp narrow the export
+- Export is produced one batch at a time rather than all at once
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+
+from src.core.export import EXPORT_COLUMNS, iter_export
+from src.core.storage import init_db, update_job, upsert_job
+
+
+def _seed(db_path: str, count: int) -> None:
+    init_db(db_path)
+    for index in range(count):
+        upsert_job(
+            db_path,
+            {
+                "job_key": f"job-{index}",
+                "platform": "indeed" if index % 2 else "linkedin",
+                "title": f'Analyst "{index}", L1',
+                "description": "never exported",
+            },
+            status="review",
+        )
+
+
+def test_csv_export_streams_batches():
+    """Every job is exported, in chunks of batch_size rows."""
+    print("\n=== CSV Export Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed(db_path, 23)
+        chunks = list(iter_export(db_path, "csv", batch_size=5))
+        assert len(chunks) == 1 + 5  # header + ceil(23 / 5) batches
+
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+        assert tuple(rows[0]) == EXPORT_COLUMNS
+        assert len(rows) == 24
+        assert rows[1][2] == 'Analyst "0", L1'
+        assert "never exported" not in "".join(chunks)
+        print(f"✓ {len(rows) - 1} rows in {len(chunks)} chunks")
+
+
+def test_ndjson_export_with_filters_and_since():
+    """NDJSON lines honour platform, status and since filters."""
+    print("\n=== NDJSON Export Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed(db_path, 10)
+
+        lines = "".join(iter_export(db_path, "ndjson", platform="indeed")).splitlines()
+        jobs = [json.loads(line) for line in lines]
+        assert len(jobs) == 5
+        assert all(job["platform"] == "indeed" for job in jobs)
+        assert set(jobs[0]) == set(EXPORT_COLUMNS)
+
+        marker = max(job["updated_at"] for job in jobs)
+        update_job(db_path, "job-4", status="applied")
+        incremental = [json.loads(line) for line in "".join(iter_export(db_path, "ndjson", since=marker)).splitlines()]
+        assert [job["job_key"] for job in incremental] == ["job-4"]
+        assert incremental[0]["status"] == "applied"
+
+        assert "".join(iter_export(db_path, "ndjson", statuses=["rejected"])) == ""
+        try:
+            list(iter_export(db_path, "xml"))
+            raise AssertionError("expected ValueError")
+        except ValueError:
+            pass
+        print("✓ Filters and incremental since export applied")
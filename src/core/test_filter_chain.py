@@ -0,0 +1,135 @@
+"""
+Tests for the cost-ordered job filter chain.
+
+Validates:
+- Stages run cheapest-first and stop at the first rejection
+- A cheap rejection never reaches the expensive stage
+- Adaptive ordering moves a high-rejection stage ahead of a similar-cost one
+- Adaptive ordering never moves the expensive AI stage ahead of cheap rules
+- build_filter_chain drops senior roles before AI evaluation
+"""
+
+from src.core.filter_chain import (
+    STAGE_COSTS,
+    FilterChain,
+    FilterStage,
+    build_filter_chain,
+    get_stage_stats,
+    reject,
+    reset_stage_stats,
+)
+
+
+def _stage(name: str, cost: float, rejects, calls: list) -> FilterStage:
+    def check(job: dict, context: dict):
+        calls.append(name)
+        return reject(f"{name}_reject") if rejects(job) else None
+
+    return FilterStage(name, cost, check)
+
+
+def test_cheap_rejections_skip_expensive_stages():
+    """The expensive stage only sees jobs every cheap stage let through."""
+    print("\n=== Filter Chain Order Test ===\n")
+
+    reset_stage_stats()
+    calls = []
+    chain = FilterChain(
+        [
+            _stage("llm", 1.0, lambda job: False, calls),
+            _stage("keyword", 0.0001, lambda job: "senior" in job["title"], calls),
+            _stage("history", 0.01, lambda job: job["id"] % 3 == 0, calls),
+        ],
+        adaptive=False,
+    )
+    assert chain.order == ["keyword", "history", "llm"]
+
+    jobs = [{"id": i, "title": "senior analyst" if i % 2 else "analyst"} for i in range(60)]
+    outcomes = [chain.run(job) for job in jobs]
+
+    survivors = [job for job in jobs if job["id"] % 2 == 0 and job["id"] % 3 != 0]
+    assert calls.count("llm") == len(survivors)
+    assert calls.count("keyword") == 60
+    assert sum(outcome.accepted for outcome in outcomes) == len(survivors)
+    assert outcomes[1].reason == "keyword_reject" and outcomes[1].stage == "keyword"
+    assert outcomes[0].reason == "history_reject"
+    assert outcomes[2].accepted and outcomes[2].reason == "accepted"
+
+    stats = get_stage_stats()
+    assert stats["keyword"] == {"calls": 60, "rejects": 30, "mean_ms": stats["keyword"]["mean_ms"]}
+    assert stats["llm"]["rejects"] == 0
+    print(f"✓ LLM stage ran for {calls.count('llm')}/60 jobs")
+    print(f"  {chain.summary()}")
+
+
+def test_adaptive_reorder_prefers_rejecting_stage():
+    """Among similar-cost stages, the one that rejects more moves first."""
+    print("\n=== Filter Chain Adaptive Order Test ===\n")
+
+    reset_stage_stats()
+    calls = []
+    chain = FilterChain(
+        [
+            _stage("lenient", 0.001, lambda job: False, calls),
+            _stage("strict", 0.0012, lambda job: job["id"] % 5 != 0, calls),
+        ],
+        adaptive=True,
+        reorder_interval=10,
+    )
+    assert chain.order == ["lenient", "strict"]
+    for index in range(50):
+        chain.run({"id": index})
+    assert chain.order == ["strict", "lenient"]
+    assert calls.count("lenient") < 50
+    print(f"✓ Reordered to {chain.order}; lenient stage ran {calls.count('lenient')}/50 times")
+
+
+def test_built_chain_rejects_seniority_before_ai():
+    """Senior titles are dropped by the keyword stage without an AI call."""
+    print("\n=== Filter Chain Settings Test ===\n")
+
+    reset_stage_stats()
+    settings = {"app": {"entry_level_only": True, "use_ai": True}, "ai": {"use_agents": False}}
+    chain = build_filter_chain(settings, {})
+    assert chain.order == ["seniority", "ai"]
+
+    outcome = chain.run({"title": "Senior SOC Analyst", "description": "Lead a team"})
+    assert not outcome.accepted
+    assert (outcome.reason, outcome.status, outcome.stage) == ("seniority_reject", "skipped", "seniority")
+    assert get_stage_stats()["ai"]["calls"] == 0
+
+    assert build_filter_chain({"app": {"entry_level_only": False}}, {}).order == []
+    assert build_filter_chain({"app": {"entry_level_only": False}}, {}).run({"title": "x"}).accepted
+    print("✓ Seniority rejection spent no AI evaluation")
+
+
+def test_adaptive_reorder_keeps_ai_last():
+    """A high-rejection LLM stage still runs after rarely-rejecting cheap stages."""
+    print("\n=== Filter Chain Cost Tier Test ===\n")
+
+    reset_stage_stats()
+    calls = []
+    chain = FilterChain(
+        [
+            _stage("ai", STAGE_COSTS["ai"], lambda job: True, calls),
+            _stage("policy", STAGE_COSTS["policy"], lambda job: False, calls),
+            _stage("seniority", STAGE_COSTS["seniority"], lambda job: False, calls),
+        ],
+        reorder_interval=1,
+    )
+    stages = {stage.name: stage for stage in chain.stages}
+    # Counters as a long-running process would accumulate them
+    stages["policy"].stats.calls = 50_000
+    stages["policy"].stats.seconds = 50_000 * 0.00005
+    stages["seniority"].stats.calls, stages["seniority"].stats.seconds = 50_000, 50_000 * 0.0005
+    stages["ai"].stats.calls, stages["ai"].stats.rejects = 1_000, 900
+    stages["ai"].stats.seconds = 1_000 * 2.0
+    assert stages["ai"].rank() > stages["policy"].rank()
+
+    chain.reorder()
+    assert chain.order[-1] == "ai"
+    assert chain.order == ["policy", "seniority", "ai"]
+
+    chain.run({"title": "analyst"})
+    assert calls == ["policy", "seniority", "ai"]
+    print(f"✓ Order after reorder: {chain.order}")
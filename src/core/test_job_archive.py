@@ -0,0 +1,93 @@
+"""
+Tests for tiered job archival.
+
+Validates:
+- archive_jobs keeps the newest keep_latest jobs hot and moves the rest
+- Work is bounded by batch_size * max_batches per call
+- Archived keys still count as seen and their records can be read back
+- Labeled jobs stay hot for training
+"""
+
+import os
+import sqlite3
+import tempfile
+
+from src.core.storage import (
+    archive_jobs,
+    get_archive_stats,
+    get_archived_job,
+    get_job,
+    get_job_stats,
+    has_seen_job,
+    init_db,
+    record_feedback,
+    upsert_job,
+)
+
+
+def _seed(db_path: str, count: int) -> None:
+    init_db(db_path)
+    for index in range(count):
+        upsert_job(
+            db_path,
+            {
+                "job_key": f"job-{index:03d}",
+                "platform": "linkedin",
+                "title": f"Analyst {index}",
+                "description": "SOC monitoring and triage " * 40,
+                "posted_at": f"2026-{1 + index // 28:02d}-{1 + index % 28:02d}T00:00:00",
+            },
+            status="applied" if index % 5 == 0 else "skipped",
+        )
+
+
+def _hot_keys(db_path: str) -> list[str]:
+    with sqlite3.connect(db_path) as conn:
+        return [row[0] for row in conn.execute("SELECT job_key FROM jobs ORDER BY job_key")]
+
+
+def test_archive_moves_oldest_in_bounded_batches():
+    """Old rows drain into the archive over several bounded calls."""
+    print("\n=== Job Archive Batch Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed(db_path, 60)
+
+        assert archive_jobs(db_path, keep_latest=20, batch_size=10, max_batches=2) == 20
+        assert len(_hot_keys(db_path)) == 40
+        assert archive_jobs(db_path, keep_latest=20, batch_size=10, max_batches=5) == 20
+        assert archive_jobs(db_path, keep_latest=20, batch_size=10) == 0
+
+        hot = _hot_keys(db_path)
+        assert hot == [f"job-{index:03d}" for index in range(40, 60)]
+        assert get_job_stats(db_path)["total"] == 20
+
+        stats = get_archive_stats(db_path)
+        assert stats["archived"] == 40
+        assert stats["payload_bytes"] < 40 * len("SOC monitoring and triage " * 40)
+        print(f"✓ 40 jobs archived into {stats['payload_bytes']} compressed bytes")
+
+
+def test_archived_jobs_stay_seen():
+    """Dedup lookups and record reads reach archived jobs."""
+    print("\n=== Job Archive Lookup Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed(db_path, 12)
+        record_feedback(db_path, "job-001", "approved", source="test")
+        archive_jobs(db_path, keep_latest=4)
+
+        assert get_job(db_path, "job-000") is None
+        assert has_seen_job(db_path, "job-000")
+        assert not has_seen_job(db_path, "job-999")
+        archived = get_archived_job(db_path, "job-000")
+        assert archived["status"] == "applied"
+        assert archived["title"] == "Analyst 0"
+        assert archived["archived_at"]
+        assert get_archived_job(db_path, "job-011") is None
+
+        assert get_job(db_path, "job-001")["feedback_label"] == "approved"
+        assert len(_hot_keys(db_path)) == 5
+        print("✓ Archived keys seen, labeled job kept hot")
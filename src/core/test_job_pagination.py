@@ -0,0 +1,114 @@
+"""
+Tests for keyset job pagination and column projection.
+
+Validates:
+- list_jobs_page walks every job once, newest first, by posted_at then created_at
+- Summary projection leaves the description out; full projection keeps it
+- New jobs inserted while paging do not shift later pages
+- sort_key is back-filled for databases created before the column existed
+"""
+
+import os
+import sqlite3
+import tempfile
+
+from src.core.storage import get_job, init_db, list_jobs, list_jobs_page, update_job, upsert_job
+
+
+def _seed(db_path: str, count: int) -> None:
+    init_db(db_path)
+    for index in range(count):
+        upsert_job(
+            db_path,
+            {
+                "job_key": f"job-{index}",
+                "platform": "naukri" if index % 3 == 0 else "linkedin",
+                "title": f"Analyst {index}",
+                "description": "x" * 2000,
+                "posted_at": f"2026-10-{1 + index % 18:02d}T09:00:00",
+            },
+            status="review" if index % 2 else "queued",
+        )
+
+
+def test_pages_cover_every_job_in_order():
+    """Cursors page through the listing without gaps or repeats."""
+    print("\n=== Job Pagination Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed(db_path, 45)
+
+        seen = []
+        sort_keys = []
+        cursor = None
+        pages = 0
+        while True:
+            page = list_jobs_page(db_path, cursor=cursor, limit=10)
+            pages += 1
+            seen.extend(job["job_key"] for job in page["jobs"])
+            sort_keys.extend(job["posted_at"] for job in page["jobs"])
+            if pages == 2:
+                upsert_job(db_path, {"job_key": "late", "title": "Late", "posted_at": "2026-10-30T00:00:00"}, status="queued")
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+
+        assert pages == 5
+        assert len(seen) == len(set(seen)) == 45
+        assert "late" not in seen
+        assert sort_keys == sorted(sort_keys, reverse=True)
+        assert list_jobs(db_path, limit=1)[0]["job_key"] == "late"
+
+        review = list_jobs_page(db_path, statuses=["review"], platform="linkedin", limit=100)
+        assert review["next_cursor"] is None
+        assert all(job["status"] == "review" and job["platform"] == "linkedin" for job in review["jobs"])
+        try:
+            list_jobs_page(db_path, cursor="no-separator")
+            raise AssertionError("expected ValueError")
+        except ValueError:
+            pass
+        print(f"✓ {len(seen)} jobs over {pages} pages, no repeats")
+
+
+def test_summary_projection_skips_description():
+    """Summary rows omit the description; get_job still returns it."""
+    print("\n=== Job Projection Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        _seed(db_path, 5)
+        summary = list_jobs_page(db_path, limit=5)["jobs"]
+        full = list_jobs_page(db_path, limit=5, columns="full")["jobs"]
+        assert "description" not in summary[0]
+        assert full[0]["description"] == "x" * 2000
+        assert {key for key in full[0] if key != "description"} == set(summary[0])
+        assert get_job(db_path, summary[0]["job_key"])["description"] == "x" * 2000
+        assert "description" in list_jobs(db_path, limit=1)[0]
+        print("✓ Summary rows carry no description")
+
+
+def test_sort_key_backfill_and_updates():
+    """Old databases get sort_key on init; posted_at edits keep it current."""
+    print("\n=== Job Sort Key Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, job_key TEXT UNIQUE, platform TEXT, "
+                "title TEXT, company TEXT, location TEXT, description TEXT, job_url TEXT, status TEXT, "
+                "score INTEGER, decision TEXT, created_at TEXT, updated_at TEXT, applied_at TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO jobs (job_key, title, status, created_at) VALUES ('old', 'Old', 'review', '2026-01-01T00:00:00')"
+            )
+            conn.commit()
+        init_db(db_path)
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT sort_key FROM jobs WHERE job_key = 'old'").fetchone()[0] == "2026-01-01T00:00:00"
+
+        update_job(db_path, "old", posted_at="2026-02-02T00:00:00")
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT sort_key FROM jobs WHERE job_key = 'old'").fetchone()[0] == "2026-02-02T00:00:00"
+        print("✓ sort_key back-filled and maintained")
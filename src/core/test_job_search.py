@@ -0,0 +1,138 @@
+"""
+Tests for full-text job search.
+
+Validates:
+- The FTS5 index follows upsert_job / update_job / prune_jobs through triggers
+- Terms match as prefixes across title, company, location and description
+- Status and platform filters and keyset cursors page through results
+- Searching 20,000 stored jobs stays in the millisecond range (benchmark, printed)
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+
+from src.core.storage import init_db, prune_jobs, search_jobs, update_job, upsert_job
+
+
+def _job(key: str, title: str, company: str, description: str, platform: str = "linkedin") -> dict:
+    return {
+        "job_key": key,
+        "platform": platform,
+        "title": title,
+        "company": company,
+        "location": "Pune",
+        "description": description,
+        "job_url": f"https://example.com/{key}",
+    }
+
+
+def test_search_follows_job_writes():
+    """Inserts, description updates and deletes are reflected in search."""
+    print("\n=== Job Search Sync Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        upsert_job(db_path, _job("a", "SOC Analyst", "Acme", "Monitor Splunk alerts"), status="queued")
+        upsert_job(db_path, _job("b", "Frontend Developer", "Pixel", "React and TypeScript"), status="review")
+
+        assert [job["job_key"] for job in search_jobs(db_path, "splunk")["jobs"]] == ["a"]
+        assert [job["job_key"] for job in search_jobs(db_path, "analy acme")["jobs"]] == ["a"]
+        assert search_jobs(db_path, "analyst pixel")["jobs"] == []
+        assert search_jobs(db_path, "  ")["jobs"] == []
+        # FTS syntax in user input is treated as plain terms, never as operators.
+        assert search_jobs(db_path, 'react" NEAR(*')["jobs"] == []
+        assert search_jobs(db_path, '"react*')["jobs"][0]["job_key"] == "b"
+
+        update_job(db_path, "b", description="Sentinel detection engineering")
+        assert search_jobs(db_path, "react")["jobs"] == []
+        assert [job["job_key"] for job in search_jobs(db_path, "sentinel")["jobs"]] == ["b"]
+
+        upsert_job(db_path, _job("b", "Frontend Developer", "Pixel", ""), status="skipped")
+        assert [job["job_key"] for job in search_jobs(db_path, "sentinel")["jobs"]] == ["b"]
+        assert search_jobs(db_path, "sentinel", statuses=["queued"])["jobs"] == []
+
+        prune_jobs(db_path, keep_latest=1)
+        remaining = search_jobs(db_path, "splunk")["jobs"] + search_jobs(db_path, "sentinel")["jobs"]
+        assert len(remaining) == 1
+        print("✓ Index kept in sync by triggers")
+
+
+def test_search_ranking_and_cursor_pages():
+    """Title matches rank first and cursors walk every result exactly once."""
+    print("\n=== Job Search Cursor Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        upsert_job(db_path, _job("desc", "Analyst", "Acme", "Some SIEM tuning work"), status="review")
+        upsert_job(db_path, _job("title", "SIEM Engineer", "Acme", "Detection content"), status="review")
+        for index in range(7):
+            upsert_job(
+                db_path,
+                _job(f"n{index}", "Analyst", "Redline", "SIEM triage", platform="naukri"),
+                status="queued",
+            )
+
+        first = search_jobs(db_path, "siem", limit=4)
+        assert first["jobs"][0]["job_key"] == "title"
+        seen = [job["job_key"] for job in first["jobs"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = search_jobs(db_path, "siem", cursor=cursor, limit=4)
+            seen.extend(job["job_key"] for job in page["jobs"])
+            cursor = page["next_cursor"]
+        assert len(seen) == len(set(seen)) == 9
+
+        naukri = search_jobs(db_path, "siem", platform="naukri", limit=100)
+        assert len(naukri["jobs"]) == 7 and naukri["next_cursor"] is None
+        try:
+            search_jobs(db_path, "siem", cursor="garbage")
+            raise AssertionError("expected ValueError")
+        except ValueError:
+            pass
+        print(f"✓ {len(seen)} results paged without overlap")
+
+
+def test_search_benchmark():
+    """Full-text search over 20,000 jobs."""
+    print("\n=== Job Search Benchmark ===\n")
+
+    words = ["soc", "siem", "cloud", "react", "python", "network", "forensics", "devops", "audit", "sales"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        now = datetime.utcnow().isoformat()
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO jobs (job_key, platform, title, company, location, description, status, created_at, updated_at)
+                VALUES (?, 'linkedin', ?, ?, 'Remote', ?, 'review', ?, ?)
+                """,
+                [
+                    (
+                        f"job-{index}",
+                        f"{words[index % 10]} specialist {index}",
+                        f"Company {index % 500}",
+                        " ".join(words[(index * 7 + offset) % 10] for offset in range(3)) + f" unique{index}",
+                        now,
+                        now,
+                    )
+                    for index in range(20_000)
+                ],
+            )
+            conn.commit()
+
+        timings = {}
+        for query in ("forensics audit", "unique12345"):
+            started = time.perf_counter()
+            for _ in range(20):
+                results = search_jobs(db_path, query, limit=50)
+            timings[query] = (time.perf_counter() - started) * 1000 / 20
+            assert results["jobs"]
+        assert results["jobs"][0]["job_key"] == "job-12345"
+        for query, elapsed_ms in timings.items():
+            print(f"✓ Search {query!r} over 20,000 jobs: {elapsed_ms:.1f}ms per query")
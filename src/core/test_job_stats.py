@@ -0,0 +1,113 @@
+"""
+Tests for the materialized job_stats counters.
+
+Validates:
+- Inserts, updates, bulk updates and deletes keep the counters in sync
+- Counters match a full recount after a mixed workload
+- Existing databases are backfilled when job_stats is first created
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+
+from src.core.storage import (
+    bulk_update_status,
+    get_job_stats,
+    init_db,
+    prune_jobs,
+    rebuild_job_stats,
+    update_job,
+    upsert_job,
+)
+
+
+def _recount(db_path: str) -> dict:
+    rebuild_job_stats(db_path)
+    return get_job_stats(db_path)
+
+
+def test_job_stats_track_writes():
+    """Every write path updates the per-status, per-platform and per-day counters."""
+    print("\n=== Job Stats Write Path Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        upsert_job(db_path, {"job_key": "a", "platform": "linkedin"}, status="review", score=60, decision="REVIEW")
+        upsert_job(db_path, {"job_key": "b", "platform": "indeed"}, status="queued", score=80, decision="APPLY")
+        upsert_job(db_path, {"job_key": "c", "platform": "indeed"}, status="skipped")
+
+        stats = get_job_stats(db_path)
+        assert stats["total"] == 3
+        assert stats["status"] == {"review": 1, "queued": 1, "skipped": 1}
+        assert stats["platform"] == {"linkedin": 1, "indeed": 2}
+        assert stats["decision"] == {"REVIEW": 1, "APPLY": 1}
+        assert stats["scored"] == 2
+        print("✓ Inserts counted")
+
+        update_job(db_path, "b", status="applied")
+        bulk_update_status(db_path, ["a", "c"], "rejected")
+        stats = get_job_stats(db_path)
+        assert stats["status"] == {"applied": 1, "rejected": 2}
+        assert stats["applied_platform"] == {"indeed": 1}
+        assert sum(stats["applied_day"].values()) == 1
+        print("✓ Status changes counted")
+
+        prune_jobs(db_path, 1)
+        stats = get_job_stats(db_path)
+        assert stats["total"] == 1
+        assert stats == _recount(db_path)
+        print("✓ Deletes counted")
+
+
+def test_job_stats_match_recount():
+    """A random mix of writes leaves the counters equal to a full recount."""
+    print("\n=== Job Stats Consistency Test ===\n")
+
+    rng = random.Random(5)
+    statuses = ["queued", "review", "applied", "rejected", "skipped"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        for index in range(300):
+            key = f"job-{rng.randint(0, 120)}"
+            action = rng.random()
+            if action < 0.6:
+                upsert_job(
+                    db_path,
+                    {"job_key": key, "platform": rng.choice(["linkedin", "indeed", "naukri"])},
+                    status=rng.choice(statuses),
+                    score=rng.choice([None, rng.randint(0, 100)]),
+                    decision=rng.choice([None, "APPLY", "REVIEW", "SKIP"]),
+                )
+            elif action < 0.9:
+                update_job(db_path, key, status=rng.choice(statuses))
+            else:
+                bulk_update_status(db_path, [key, f"job-{index}"], rng.choice(statuses))
+
+        incremental = get_job_stats(db_path)
+        assert incremental == _recount(db_path)
+        print(f"✓ Counters match recount for {incremental['total']} jobs")
+
+
+def test_job_stats_backfill_existing_db():
+    """Databases created before job_stats existed are backfilled on init."""
+    print("\n=== Job Stats Backfill Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        upsert_job(db_path, {"job_key": "a", "platform": "linkedin"}, status="applied")
+        upsert_job(db_path, {"job_key": "b", "platform": "linkedin"}, status="review")
+        with sqlite3.connect(db_path) as conn:
+            for trigger in ("jobs_stats_insert", "jobs_stats_delete", "jobs_stats_update"):
+                conn.execute(f"DROP TRIGGER {trigger}")
+            conn.execute("DROP TABLE job_stats")
+
+        init_db(db_path)
+        stats = get_job_stats(db_path)
+        assert stats["total"] == 2
+        assert stats["applied_platform"] == {"linkedin": 1}
+        print("✓ Existing jobs backfilled")
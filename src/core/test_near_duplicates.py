@@ -0,0 +1,125 @@
+"""
+Tests for near-duplicate job detection.
+
+Validates:
+- Reposts with small wording changes get close MinHash signatures
+- Unrelated jobs do not share band keys
+- link_near_duplicate links a repost to the canonical job via SQLite bands
+- Deferred canonicals are not reused, and detection can be disabled
+"""
+
+import os
+import tempfile
+
+from src.core.near_duplicates import (
+    band_keys,
+    estimate_similarity,
+    job_shingles,
+    link_near_duplicate,
+    minhash_signature,
+)
+from src.core.storage import get_duplicate_keys, init_db, prune_jobs, update_job, upsert_job
+
+
+DESCRIPTION = (
+    "We are hiring a SOC Analyst to monitor SIEM alerts, triage incidents, tune detection "
+    "rules in Splunk and Sentinel, and escalate confirmed threats to the incident response "
+    "team. You will work shifts in our Bengaluru security operations center, write clear "
+    "incident reports, and help improve playbooks. Experience with EDR tools, phishing "
+    "analysis and basic scripting in Python is a plus. Freshers with a security "
+    "certification such as Security+ or CEH are welcome to apply."
+)
+
+CANONICAL = {
+    "job_key": "linkedin-1",
+    "platform": "linkedin",
+    "title": "SOC Analyst L1",
+    "company": "Acme Security",
+    "description": DESCRIPTION,
+    "job_url": "https://www.linkedin.com/jobs/view/1/",
+}
+
+REPOST = {
+    "job_key": "naukri-1",
+    "platform": "naukri",
+    "title": "SOC Analyst - L1",
+    "company": "Acme Security Pvt Ltd",
+    "description": DESCRIPTION.replace("Freshers", "Fresh graduates"),
+    "job_url": "https://www.naukri.com/job-listings-soc-analyst-acme-1",
+}
+
+UNRELATED = {
+    "job_key": "indeed-1",
+    "platform": "indeed",
+    "title": "Frontend Developer",
+    "company": "Pixel Works",
+    "description": (
+        "Build responsive React interfaces, own the design system, write unit tests with Jest, "
+        "and collaborate with product designers on accessible user experiences for our "
+        "e-commerce storefront used by millions of shoppers every month."
+    ),
+}
+
+SETTINGS = {"app": {"near_duplicates": {"enabled": True, "threshold": 0.7}}}
+
+
+def test_signatures_track_similarity():
+    """Reposts score high, unrelated jobs share no bands."""
+    print("\n=== Near-duplicate Signature Test ===\n")
+
+    canonical = minhash_signature(job_shingles(CANONICAL))
+    repost = minhash_signature(job_shingles(REPOST))
+    unrelated = minhash_signature(job_shingles(UNRELATED))
+
+    repost_similarity = estimate_similarity(canonical, repost)
+    unrelated_similarity = estimate_similarity(canonical, unrelated)
+    assert repost_similarity >= 0.7
+    assert unrelated_similarity < 0.1
+    assert set(band_keys(canonical)) & set(band_keys(repost))
+    assert not set(band_keys(canonical)) & set(band_keys(unrelated))
+    assert minhash_signature(job_shingles(CANONICAL)) == canonical
+    print(f"✓ repost={repost_similarity:.2f} unrelated={unrelated_similarity:.2f}")
+
+
+def test_link_near_duplicate_reuses_canonical():
+    """A cross-platform repost resolves to the canonical job stored earlier."""
+    print("\n=== Near-duplicate Link Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+
+        assert link_near_duplicate(db_path, CANONICAL, SETTINGS) is None
+        upsert_job(db_path, CANONICAL, status="applied", score=88, decision="ai_accept")
+        assert link_near_duplicate(db_path, UNRELATED, SETTINGS) is None
+
+        canonical = link_near_duplicate(db_path, REPOST, SETTINGS)
+        assert canonical is not None
+        assert canonical["job_key"] == "linkedin-1"
+        assert (canonical["status"], canonical["score"]) == ("applied", 88)
+        assert canonical["similarity"] >= 0.7
+        assert get_duplicate_keys(db_path, "linkedin-1") == ["naukri-1"]
+
+        # Re-linking the canonical itself never matches its own signature.
+        assert link_near_duplicate(db_path, CANONICAL, SETTINGS) is None
+
+        update_job(db_path, "linkedin-1", status="deferred")
+        assert link_near_duplicate(db_path, dict(REPOST, job_key="indeed-2"), SETTINGS) is None
+        assert link_near_duplicate(db_path, REPOST, {"app": {"near_duplicates": {"enabled": False}}}) is None
+
+        prune_jobs(db_path, keep_latest=1)
+        assert get_duplicate_keys(db_path, "linkedin-1") == []
+        print(f"✓ Repost linked to canonical (similarity {canonical['similarity']:.2f})")
+
+
+def test_short_jobs_are_not_compared():
+    """Title-only jobs are too short for a reliable signature."""
+    print("\n=== Near-duplicate Short Job Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        job = {"job_key": "short", "title": "SOC Analyst", "company": "Acme"}
+        assert link_near_duplicate(db_path, job, SETTINGS) is None
+        assert link_near_duplicate(db_path, dict(job, job_key="short-2"), SETTINGS) is None
+        print("✓ Short jobs skipped")
@@ -0,0 +1,101 @@
+"""
+Tests for the browser resource policy.
+
+Validates:
+- Per-use-case profiles block the right resource types and trackers
+- Settings can override or disable a profile
+- The route handler aborts or continues requests and keeps counters
+"""
+
+import asyncio
+
+from src.core.resource_policy import build_resource_policy, get_resource_stats
+
+
+class _FakeRequest:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class _FakeRoute:
+    def __init__(self, url: str, resource_type: str):
+        self.request = _FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = "abort"
+
+    async def continue_(self):
+        self.outcome = "continue"
+
+
+REQUESTS = [
+    ("https://www.linkedin.com/jobs/search/?keywords=soc", "document"),
+    ("https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards", "fetch"),
+    ("https://media.licdn.com/dms/image/logo.png", "image"),
+    ("https://static.licdn.com/fonts/source-sans.woff2", "font"),
+    ("https://www.linkedin.com/li/track", "xhr"),
+    ("https://www.googletagmanager.com/gtm.js", "script"),
+    ("https://static.licdn.com/aero-v1/app.js", "script"),
+    ("https://video.licdn.com/clip.mp4", "media"),
+]
+
+
+def _run(policy) -> dict:
+    async def _route_all():
+        outcomes = {}
+        for url, resource_type in REQUESTS:
+            route = _FakeRoute(url, resource_type)
+            await policy.handle(route)
+            outcomes[url] = route.outcome
+        return outcomes
+
+    return asyncio.run(_route_all())
+
+
+def test_collect_profile_blocks_heavy_resources():
+    """Collection keeps HTML, XHR and first-party scripts only."""
+    print("\n=== Resource Policy Collect Test ===\n")
+
+    before = get_resource_stats().get("collect", {}).get("blocked_requests", 0)
+    policy = build_resource_policy("collect", {})
+    outcomes = _run(policy)
+
+    allowed = [url for url, outcome in outcomes.items() if outcome == "continue"]
+    assert allowed == [
+        "https://www.linkedin.com/jobs/search/?keywords=soc",
+        "https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards",
+        "https://static.licdn.com/aero-v1/app.js",
+    ]
+    assert policy.stats["blocked_requests"] == 5
+    assert policy.stats["blocked_by_type"] == {"image": 1, "font": 1, "xhr": 1, "script": 1, "media": 1}
+    assert policy.stats["blocked_bytes_estimate"] > 0
+    assert get_resource_stats()["collect"]["blocked_requests"] == before + 5
+    print(f"✓ {policy.summary()}")
+
+
+def test_apply_profile_keeps_form_assets():
+    """Application flows only lose media and tracker requests."""
+    print("\n=== Resource Policy Apply Test ===\n")
+
+    outcomes = _run(build_resource_policy("apply", {}))
+    assert outcomes["https://media.licdn.com/dms/image/logo.png"] == "continue"
+    assert outcomes["https://static.licdn.com/fonts/source-sans.woff2"] == "continue"
+    assert outcomes["https://video.licdn.com/clip.mp4"] == "abort"
+    assert outcomes["https://www.googletagmanager.com/gtm.js"] == "abort"
+    print("✓ Images and fonts load during apply")
+
+
+def test_settings_override_and_disable():
+    """app.resource_policy can retune a profile or switch blocking off."""
+    print("\n=== Resource Policy Settings Test ===\n")
+
+    settings = {"app": {"resource_policy": {"enrich": {"block_types": ["image", "stylesheet"], "block_trackers": False}}}}
+    policy = build_resource_policy("enrich", settings)
+    assert policy.block_types == frozenset({"image", "stylesheet"})
+    assert not policy.should_block("script", "https://www.googletagmanager.com/gtm.js")
+
+    assert build_resource_policy("collect", {"app": {"resource_policy": {"enabled": False}}}) is None
+    assert build_resource_policy("unknown", {}) is None
+    print("✓ Overrides and disable switch honoured")
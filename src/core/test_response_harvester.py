@@ -0,0 +1,220 @@
+"""
+Tests for network-response job harvesting.
+
+Validates:
+- LinkedIn Voyager card/posting entities decode into collector job dicts
+- Naukri search responses decode into collector job dicts
+- Applicant count and apply type are stored with the job, also in older databases
+- ResponseHarvester only decodes matching JSON responses and de-duplicates
+- collect() scrolls until max_results and stops early when nothing matched
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+
+from src.core.response_harvester import ResponseHarvester
+from src.core.storage import get_job, init_db, list_jobs, upsert_job
+from src.platforms.linkedin.api_decoder import JOBS_API_PATTERNS, decode_job_cards
+from src.platforms.naukri.api_decoder import decode_search_results
+
+
+def _linkedin_payload(start: int, count: int) -> dict:
+    included = []
+    for job_id in range(start, start + count):
+        included.append(
+            {
+                "$type": "com.linkedin.voyager.dash.jobs.JobPostingCard",
+                "entityUrn": f"urn:li:fsd_jobPostingCard:({job_id},JOBS_SEARCH)",
+                "jobPostingUrn": f"urn:li:fsd_jobPosting:{job_id}",
+                "jobPostingTitle": f"SOC Analyst {job_id}",
+                "primaryDescription": {"text": "Acme Security"},
+                "secondaryDescription": {"text": "Bengaluru, Karnataka, India (Remote)"},
+                "tertiaryDescription": {"text": "Over 100 applicants"},
+                "footerItems": [
+                    {"type": "LISTED_DATE", "timeAt": 1792382400000},
+                    {"type": "EASY_APPLY_TEXT"} if job_id % 2 else {"type": "PROMOTED"},
+                ],
+            }
+        )
+    return {"data": {}, "included": included}
+
+
+class _FakeResponse:
+    def __init__(self, url: str, payload, content_type: str = "application/json"):
+        self.url = url
+        self.headers = {"content-type": content_type}
+        self._payload = payload
+
+    async def json(self):
+        return self._payload
+
+
+class _FakePage:
+    """Page stand-in that emits one search API response per scroll."""
+
+    def __init__(self, pages: list):
+        self._pages = list(pages)
+        self._listeners = []
+        self.scrolls = 0
+
+    def on(self, event, handler):
+        self._listeners.append(handler)
+
+    def remove_listener(self, event, handler):
+        self._listeners.remove(handler)
+
+    def emit(self, response):
+        for handler in list(self._listeners):
+            handler(response)
+
+    async def evaluate(self, script):
+        self.scrolls += 1
+        if self._pages:
+            self.emit(self._pages.pop(0))
+
+    async def wait_for_timeout(self, ms):
+        await asyncio.sleep(0)
+
+
+def test_decode_linkedin_job_cards():
+    """Voyager cards map onto the collector job dict, with richer fields."""
+    print("\n=== LinkedIn API Decoder Test ===\n")
+
+    payload = _linkedin_payload(101, 2)
+    payload["included"].append(
+        {
+            "$type": "com.linkedin.voyager.dash.jobs.JobPosting",
+            "entityUrn": "urn:li:fsd_jobPosting:102",
+            "title": "Ignored because the card has a title",
+        }
+    )
+    jobs = decode_job_cards(payload)
+
+    assert [job["job_url"] for job in jobs] == [
+        "https://www.linkedin.com/jobs/view/101/",
+        "https://www.linkedin.com/jobs/view/102/",
+    ]
+    first = jobs[0]
+    assert first["title"] == "SOC Analyst 101"
+    assert first["company"] == "Acme Security"
+    assert first["location"].startswith("Bengaluru")
+    assert first["posted_at"] == "2026-10-19T04:00:00+00:00"
+    assert first["applicant_count"] == 100
+    assert (first["easy_apply"], first["apply_type"]) == (1, "easy_apply")
+    assert (jobs[1]["easy_apply"], jobs[1]["apply_type"]) == (0, None)
+    assert decode_job_cards([]) == []
+    print("✓ Title, company, location, posted_at, applicants and apply type decoded")
+
+
+def test_decode_naukri_search_results():
+    """Naukri jobDetails map onto the collector job dict."""
+    print("\n=== Naukri API Decoder Test ===\n")
+
+    payload = {
+        "jobDetails": [
+            {
+                "title": "Security Analyst",
+                "jobId": "180925",
+                "companyName": "Redline",
+                "jdURL": "/job-listings-security-analyst-redline-180925?src=srp",
+                "placeholders": [
+                    {"type": "experience", "label": "0-2 Yrs"},
+                    {"type": "location", "label": "Pune"},
+                ],
+                "createdDate": 1792382400000,
+                "footerPlaceholderLabel": "2 Days Ago",
+                "jobDescription": "<p>SIEM &amp; SOC work</p>",
+                "applyRedirectUrl": "https://careers.redline.example/apply",
+            },
+            {"title": "", "jdURL": "/job-listings-missing-title"},
+        ]
+    }
+    jobs = decode_search_results(payload)
+
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job["job_url"] == "https://www.naukri.com/job-listings-security-analyst-redline-180925"
+    assert (job["company"], job["location"]) == ("Redline", "Pune")
+    assert job["description"] == "SIEM & SOC work"
+    assert job["posted_text"] == "2 Days Ago"
+    assert job["apply_type"] == "external"
+    print("✓ Naukri search results decoded")
+
+
+def test_decoded_fields_are_stored():
+    """applicant_count and apply_type survive upsert_job, including on a migrated table."""
+    print("\n=== Harvested Fields Storage Test ===\n")
+
+    job = decode_job_cards(_linkedin_payload(101, 1))[0]
+    job["job_key"] = "linkedin-101"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        with sqlite3.connect(db_path) as conn:
+            # Jobs table as created before applicant_count and apply_type existed
+            conn.execute(
+                """
+                CREATE TABLE jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, job_key TEXT UNIQUE, platform TEXT, title TEXT,
+                    company TEXT, location TEXT, description TEXT, job_url TEXT, status TEXT,
+                    easy_apply INTEGER, score INTEGER, decision TEXT, posted_at TEXT, posted_text TEXT,
+                    created_at TEXT, updated_at TEXT, applied_at TEXT
+                )
+                """
+            )
+        init_db(db_path)
+
+        upsert_job(db_path, job, status="queued")
+        stored = get_job(db_path, "linkedin-101")
+        assert (stored["applicant_count"], stored["apply_type"]) == (100, "easy_apply")
+
+        upsert_job(db_path, dict(job, applicant_count=None, apply_type=None), status="review")
+        listed = list_jobs(db_path, statuses=["review"], columns="summary")[0]
+        assert (listed["applicant_count"], listed["apply_type"]) == (100, "easy_apply")
+        print("✓ Applicant count and apply type persisted and kept on later upserts")
+
+
+def test_harvester_collects_until_max_results():
+    """collect() scrolls for more API pages and de-duplicates by job URL."""
+    print("\n=== Response Harvester Collect Test ===\n")
+
+    async def _run():
+        page = _FakePage(
+            [
+                _FakeResponse("https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards?start=25", _linkedin_payload(125, 25)),
+                _FakeResponse("https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards?start=50", _linkedin_payload(140, 25)),
+            ]
+        )
+        harvester = ResponseHarvester(JOBS_API_PATTERNS, decode_job_cards).attach(page)
+        page.emit(_FakeResponse("https://www.linkedin.com/li/track", {"included": []}))
+        page.emit(_FakeResponse("https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards?start=0", "<html>", "text/html"))
+        page.emit(_FakeResponse("https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards?start=0", _linkedin_payload(100, 25)))
+        jobs = await harvester.collect(
+            page, 60, scroll_script="() => {}", accept=lambda job: job["easy_apply"], wait_ms=100
+        )
+        harvester.detach(page)
+        return page, harvester, jobs
+
+    page, harvester, jobs = asyncio.run(_run())
+    assert harvester.responses == 3
+    assert len(harvester.jobs) == 65
+    assert len(jobs) == 32
+    assert all(job["easy_apply"] for job in jobs)
+    assert page.scrolls == 5  # two productive scrolls, then the stagnant limit
+    print(f"✓ {len(jobs)} easy-apply jobs from {harvester.responses} API responses")
+
+
+def test_harvester_without_api_traffic_returns_fast():
+    """No matching responses means no scrolling; the DOM fallback takes over."""
+    print("\n=== Response Harvester Fallback Test ===\n")
+
+    async def _run():
+        page = _FakePage([])
+        harvester = ResponseHarvester(JOBS_API_PATTERNS, decode_job_cards).attach(page)
+        return page, await harvester.collect(page, 10, scroll_script="() => {}")
+
+    page, jobs = asyncio.run(_run())
+    assert jobs == []
+    assert page.scrolls == 0
+    print("✓ Empty harvest returns immediately")
@@ -0,0 +1,95 @@
+"""
+Tests for the in-memory seen-job key filter.
+
+Validates:
+- Bloom filters never return false negatives and stay near their target rate
+- SeenKeyIndex answers unseen keys without a database check
+- Archived keys and keys written by other processes are picked up on resync
+- Memory and false-positive benchmark for 100,000 keys (printed)
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+
+from src.core.seen_keys import BloomFilter, SeenKeyIndex
+from src.core.storage import archive_jobs, init_db, upsert_job
+
+
+def _key(index: int) -> str:
+    return hashlib.md5(f"job-{index}".encode("utf-8")).hexdigest()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Every added key is found; unseen keys rarely are."""
+    print("\n=== Bloom Filter Test ===\n")
+
+    bloom = BloomFilter(5_000, error_rate=0.01)
+    for index in range(5_000):
+        bloom.add(_key(index))
+    assert all(_key(index) in bloom for index in range(5_000))
+    false_positives = sum(1 for index in range(5_000, 15_000) if _key(index) in bloom)
+    assert false_positives / 10_000 < 0.03
+    print(f"✓ {false_positives} false positives in 10,000 probes at 1% target")
+
+
+def test_seen_index_filters_and_resyncs():
+    """Unseen keys skip SQLite; other writers' and archived keys are seen."""
+    print("\n=== Seen Key Index Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        for index in range(30):
+            upsert_job(db_path, {"job_key": _key(index), "title": f"Job {index}"}, status="skipped")
+        archive_jobs(db_path, keep_latest=10)
+
+        index = SeenKeyIndex(db_path, resync_seconds=3600)
+        assert index.has_seen(_key(0))  # archived
+        assert index.has_seen(_key(29))  # hot
+        assert not index.has_seen(_key(500))
+        assert index.stats["filtered"] == 1
+
+        # Another container stores a job; the next cycle's resync picks it up.
+        upsert_job(db_path, {"job_key": _key(31), "title": "Job 31"}, status="queued")
+        assert not index.might_contain(_key(31))
+        index.resync()
+        assert index.has_seen(_key(31))
+
+        index.add(_key(40))
+        assert index.might_contain(_key(40))
+        assert not index.has_seen(_key(40))  # confirmed against the DB
+        print(f"✓ {index.summary()}")
+
+
+def test_seen_index_benchmark():
+    """Memory and false-positive rate for 100,000 stored keys."""
+    print("\n=== Seen Key Index Benchmark ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        init_db(db_path)
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                "INSERT INTO jobs (job_key, title, status, created_at) VALUES (?, 'Job', 'skipped', '2026-10-19')",
+                [(_key(index),) for index in range(100_000)],
+            )
+            conn.commit()
+
+        started = time.perf_counter()
+        index = SeenKeyIndex(db_path)
+        index.rebuild()
+        load_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        hits = sum(1 for key_index in range(100_000, 120_000) if index.might_contain(_key(key_index)))
+        probe_us = (time.perf_counter() - started) * 1e6 / 20_000
+        rate = hits / 20_000
+        assert rate < 0.005
+        assert all(index.might_contain(_key(key_index)) for key_index in range(0, 100_000, 997))
+        print(
+            f"✓ 100,000 keys: {index._filter.size_bytes / 1024:.0f}KB, load {load_ms:.0f}ms, "
+            f"probe {probe_us:.1f}us, false positives {rate:.3%}"
+        )
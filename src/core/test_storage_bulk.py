@@ -0,0 +1,101 @@
+"""
+Tests for single-transaction bulk storage writes.
+
+Validates:
+- bulk_record_feedback upserts labels and reports only changed keys
+- bulk_update_status updates many jobs at once
+- bulk_record_feedback can set status in the same transaction
+- 500-job selections complete quickly (benchmark, printed)
+"""
+
+import os
+import tempfile
+import time
+
+from src.core.storage import (
+    bulk_record_feedback,
+    bulk_update_status,
+    get_feedback_label,
+    get_job,
+    init_db,
+    upsert_job,
+)
+
+
+def _seed_jobs(db_path: str, count: int) -> list[str]:
+    init_db(db_path)
+    keys = []
+    for index in range(count):
+        key = f"job-{index}"
+        upsert_job(db_path, {"job_key": key, "platform": "linkedin", "title": f"Job {index}"}, status="review")
+        keys.append(key)
+    return keys
+
+
+def test_bulk_record_feedback_reports_changes():
+    """Only keys whose label actually changed are returned."""
+    print("\n=== Bulk Feedback Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        keys = _seed_jobs(db_path, 6)
+
+        changed = bulk_record_feedback(db_path, keys[:3] + [keys[0], ""], "approved", source="bulk")
+        assert changed == keys[:3]
+        assert get_feedback_label(db_path, keys[1]) == "approved"
+        print(f"✓ New labels recorded for {len(changed)} jobs")
+
+        changed = bulk_record_feedback(db_path, keys, "approved")
+        assert changed == keys[3:]
+        changed = bulk_record_feedback(db_path, keys[:2], "rejected")
+        assert changed == keys[:2]
+        assert bulk_record_feedback(db_path, [], "approved") == []
+        print("✓ Unchanged labels are not reported")
+
+
+def test_bulk_update_status():
+    """Statuses are updated together and applied_at is stamped for applied jobs."""
+    print("\n=== Bulk Status Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        keys = _seed_jobs(db_path, 4)
+
+        bulk_update_status(db_path, keys[:2], "rejected")
+        bulk_update_status(db_path, keys[2:], "applied")
+        assert [get_job(db_path, key)["status"] for key in keys] == ["rejected", "rejected", "applied", "applied"]
+        assert get_job(db_path, keys[0])["applied_at"] in (None, "")
+        assert get_job(db_path, keys[3])["applied_at"]
+        print("✓ Statuses updated in one pass")
+
+
+def test_bulk_feedback_with_status():
+    """Feedback and status land together in one call."""
+    print("\n=== Bulk Feedback With Status Test ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        keys = _seed_jobs(db_path, 3)
+
+        changed = bulk_record_feedback(db_path, keys[:2], "approved", source="bulk", status="queued")
+        assert changed == keys[:2]
+        assert [get_job(db_path, key)["status"] for key in keys] == ["queued", "queued", "review"]
+        assert get_feedback_label(db_path, keys[2]) is None
+        print("✓ Labels and statuses written together")
+
+
+def test_bulk_writes_benchmark_500():
+    """Benchmark bulk writes for a 500-job selection."""
+    print("\n=== Bulk Write Benchmark (500 jobs) ===\n")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "jobs.db")
+        keys = _seed_jobs(db_path, 500)
+
+        start = time.perf_counter()
+        changed = bulk_record_feedback(db_path, keys, "rejected", source="bulk", status="rejected")
+        elapsed = time.perf_counter() - start
+
+        assert len(changed) == 500
+        print(f"  - bulk feedback + status: {elapsed * 1000:.1f}ms")
+        print("✓ Benchmark complete")
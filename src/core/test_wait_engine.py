@@ -0,0 +1,143 @@
+"""
+Tests for the condition-based wait engine.
+
+Validates:
+- Waits return as soon as their condition holds instead of sleeping
+- Network idle tracks in-flight requests from page events
+- Budgets cap waits whose condition never holds
+- Pacing jitter is separate and can be disabled
+- Timings are recorded per flow and label
+"""
+
+import asyncio
+import time
+
+from src.core.wait_engine import WaitEngine, get_wait_stats, reset_wait_stats
+
+
+class _FakeLocator:
+    def __init__(self, page, selector):
+        self._page = page
+        self._selector = selector
+
+    @property
+    def first(self):
+        return self
+
+    async def is_visible(self):
+        return self._selector in self._page.visible
+
+
+class _FakeRequest:
+    resource_type = "xhr"
+
+
+class _FakePage:
+    def __init__(self):
+        self.visible = set()
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def emit(self, event, payload):
+        for handler in self.handlers.get(event, []):
+            handler(payload)
+
+    def locator(self, selector):
+        return _FakeLocator(self, selector)
+
+
+FAST_SETTINGS = {"app": {"waits": {"poll_ms": 10, "network_idle_ms": 50, "pacing_max_ms": 0}}}
+
+
+def test_visible_wait_returns_early():
+    """A selector wait ends as soon as the element appears."""
+    print("\n=== Wait Engine Visible Test ===\n")
+    reset_wait_stats()
+
+    async def _run():
+        page = _FakePage()
+        waits = WaitEngine(page, "test_flow", FAST_SETTINGS)
+
+        async def _show_later():
+            await asyncio.sleep(0.05)
+            page.visible.add("button.apply")
+
+        asyncio.ensure_future(_show_later())
+        started = time.monotonic()
+        met = await waits.for_visible(["#missing", "button.apply"], "apply_button", budget_ms=2000)
+        return met, time.monotonic() - started, waits
+
+    met, elapsed, waits = asyncio.run(_run())
+    assert met
+    assert elapsed < 0.5
+    assert waits.records[0]["label"] == "apply_button"
+    assert get_wait_stats()["test_flow.apply_button"]["met"] == 1
+    print(f"✓ Met after {elapsed * 1000:.0f}ms (budget 2000ms)")
+
+
+def test_network_idle_tracks_requests():
+    """Network idle waits for in-flight requests to finish plus the quiet period."""
+    print("\n=== Wait Engine Network Idle Test ===\n")
+
+    async def _run():
+        page = _FakePage()
+        waits = WaitEngine(page, "test_flow", FAST_SETTINGS)
+        request = _FakeRequest()
+        page.emit("request", request)
+
+        async def _finish_later():
+            await asyncio.sleep(0.1)
+            page.emit("requestfinished", request)
+
+        asyncio.ensure_future(_finish_later())
+        started = time.monotonic()
+        met = await waits.for_network_idle("xhr_done", budget_ms=2000)
+        return met, time.monotonic() - started
+
+    met, elapsed = asyncio.run(_run())
+    assert met
+    assert 0.15 <= elapsed < 1.0
+    print(f"✓ Idle after {elapsed * 1000:.0f}ms")
+
+
+def test_budget_and_change_waits():
+    """Budgets cap unmet waits; change waits stop on a probe change or stop condition."""
+    print("\n=== Wait Engine Budget Test ===\n")
+    reset_wait_stats()
+
+    async def _run():
+        page = _FakePage()
+        waits = WaitEngine(page, "test_flow", FAST_SETTINGS)
+        missed = await waits.for_visible(["#never"], "never", budget_ms=60)
+
+        state = {"step": "1"}
+
+        async def _advance():
+            await asyncio.sleep(0.03)
+            state["step"] = "2"
+
+        async def _probe():
+            return state["step"]
+
+        asyncio.ensure_future(_advance())
+        changed = await waits.for_change(_probe, "1", "next_step", budget_ms=2000)
+
+        async def _error_visible():
+            return True
+
+        stopped = await waits.for_change(_probe, "2", "error_stop", budget_ms=2000, stop=_error_visible)
+        await waits.pace()
+        return missed, changed, stopped, waits
+
+    missed, changed, stopped, waits = asyncio.run(_run())
+    assert missed is False
+    assert changed and stopped
+    assert waits.records[0]["elapsed_ms"] >= 60
+    assert "budget_exhausted=['never']" in waits.summary()
+    assert len(waits.records) == 3
+    stats = get_wait_stats()
+    assert stats["test_flow.never"]["met"] == 0
+    assert stats["test_flow.next_step"]["count"] == 1
+    print(f"✓ {waits.summary()}")
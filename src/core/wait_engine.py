@@ -0,0 +1,190 @@
+"""
+Condition-based Wait Engine
+
+Replaces fixed wait_for_timeout sleeps in browser flows with waits on
+explicit conditions (selector visible, network idle for N ms, a probe value
+changing), each capped by a budget. Human pacing is a separate jitter layer
+so it can be tuned or switched off without touching readiness waits.
+
+Every wait is timed and aggregated per flow and label, so defaults can be
+tuned from get_wait_stats() instead of guessed.
+
+Settings (app.waits):
+    max_budget_ms: Budget for condition waits that do not set one (default 10000)
+    poll_ms: Condition polling interval (default 100)
+    network_idle_ms: Quiet period that counts as network idle (default 500)
+    pacing_min_ms / pacing_max_ms: Human pacing jitter range (default 150-600)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+
+DEFAULT_MAX_BUDGET_MS = 10000
+DEFAULT_POLL_MS = 100
+DEFAULT_NETWORK_IDLE_MS = 500
+DEFAULT_PACING_MIN_MS = 150
+DEFAULT_PACING_MAX_MS = 600
+
+# Long-lived connections never "finish" and would block network idle forever.
+_IGNORED_RESOURCE_TYPES = {"websocket", "eventsource"}
+
+_STATS: dict[str, dict] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def _record(key: str, elapsed_ms: float, met: bool) -> None:
+    with _STATS_LOCK:
+        stats = _STATS.setdefault(key, {"count": 0, "met": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["count"] += 1
+        stats["met"] += int(met)
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+
+def get_wait_stats() -> dict:
+    """Per "flow.label" wait counts, hit rate and timing since start-up."""
+    with _STATS_LOCK:
+        return {
+            key: {
+                **stats,
+                "avg_ms": round(stats["total_ms"] / stats["count"], 1) if stats["count"] else 0.0,
+            }
+            for key, stats in _STATS.items()
+        }
+
+
+def reset_wait_stats() -> None:
+    with _STATS_LOCK:
+        _STATS.clear()
+
+
+class WaitEngine:
+    """
+    Budgeted condition waits for one page.
+
+    Args:
+        page: Playwright page (only on(), locator() and evaluate() are used)
+        flow: Name used to group recorded timings, e.g. "linkedin_apply"
+        settings: App settings; reads app.waits
+    """
+
+    def __init__(self, page, flow: str, settings: dict | None = None):
+        config = ((settings or {}).get("app", {}) or {}).get("waits", {}) or {}
+        self.page = page
+        self.flow = flow
+        self.max_budget_ms = int(config.get("max_budget_ms", DEFAULT_MAX_BUDGET_MS))
+        self.poll_ms = int(config.get("poll_ms", DEFAULT_POLL_MS))
+        self.network_idle_ms = int(config.get("network_idle_ms", DEFAULT_NETWORK_IDLE_MS))
+        self.pacing_min_ms = int(config.get("pacing_min_ms", DEFAULT_PACING_MIN_MS))
+        self.pacing_max_ms = int(config.get("pacing_max_ms", DEFAULT_PACING_MAX_MS))
+        self.records: list[dict] = []
+        self._inflight: set = set()
+        self._last_network_activity = time.monotonic()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    def _on_request(self, request) -> None:
+        if getattr(request, "resource_type", "") in _IGNORED_RESOURCE_TYPES:
+            return
+        self._inflight.add(request)
+        self._last_network_activity = time.monotonic()
+
+    def _on_request_done(self, request) -> None:
+        self._inflight.discard(request)
+        self._last_network_activity = time.monotonic()
+
+    def _finish(self, label: str, kind: str, started: float, met: bool) -> bool:
+        elapsed_ms = (time.monotonic() - started) * 1000
+        self.records.append({"label": label, "kind": kind, "elapsed_ms": round(elapsed_ms, 1), "met": met})
+        _record(f"{self.flow}.{label}", elapsed_ms, met)
+        return met
+
+    async def until(
+        self,
+        condition: Callable[[], Awaitable[Any]],
+        label: str,
+        budget_ms: int | None = None,
+        kind: str = "condition",
+    ) -> bool:
+        """
+        Poll an async condition until it is truthy or the budget runs out.
+
+        Exceptions raised by the condition (e.g. mid-navigation) count as
+        not met yet.
+
+        Returns: True if the condition was met within the budget
+        """
+        budget = (budget_ms or self.max_budget_ms) / 1000
+        started = time.monotonic()
+        while True:
+            try:
+                if await condition():
+                    return self._finish(label, kind, started, True)
+            except Exception:
+                pass
+            if time.monotonic() - started >= budget:
+                return self._finish(label, kind, started, False)
+            await asyncio.sleep(self.poll_ms / 1000)
+
+    async def _any_visible(self, selectors: list[str]) -> bool:
+        for selector in selectors:
+            try:
+                if await self.page.locator(selector).first.is_visible():
+                    return True
+            except Exception:
+                continue
+        return False
+
+    async def for_visible(self, selectors: list[str], label: str, budget_ms: int | None = None) -> bool:
+        """Wait until any of the selectors is visible."""
+        return await self.until(lambda: self._any_visible(selectors), label, budget_ms, kind="visible")
+
+    async def for_network_idle(self, label: str, idle_ms: int | None = None, budget_ms: int | None = None) -> bool:
+        """Wait until no request has been in flight for idle_ms."""
+        idle = (idle_ms if idle_ms is not None else self.network_idle_ms) / 1000
+
+        async def _idle() -> bool:
+            return not self._inflight and time.monotonic() - self._last_network_activity >= idle
+
+        return await self.until(_idle, label, budget_ms, kind="network_idle")
+
+    async def for_change(
+        self,
+        probe: Callable[[], Awaitable[Any]],
+        initial: Any,
+        label: str,
+        budget_ms: int | None = None,
+        stop: Callable[[], Awaitable[Any]] | None = None,
+    ) -> bool:
+        """
+        Wait until probe() returns something other than initial, e.g. a modal
+        moving to its next step. An optional stop condition (such as a
+        validation error appearing) ends the wait early.
+        """
+        async def _changed() -> bool:
+            if await probe() != initial:
+                return True
+            return bool(stop and await stop())
+
+        return await self.until(_changed, label, budget_ms, kind="change")
+
+    async def pace(self, min_ms: int | None = None, max_ms: int | None = None) -> None:
+        """Human pacing jitter, kept apart from readiness waits."""
+        low = self.pacing_min_ms if min_ms is None else min_ms
+        high = self.pacing_max_ms if max_ms is None else max_ms
+        if high <= 0:
+            return
+        await asyncio.sleep(random.uniform(max(0, low), max(low, high)) / 1000)
+
+    def summary(self) -> str:
+        waited_ms = sum(record["elapsed_ms"] for record in self.records)
+        missed = [record["label"] for record in self.records if not record["met"]]
+        text = f"Waits {self.flow}: count={len(self.records)} total={waited_ms / 1000:.1f}s"
+        if missed:
+            text += f" budget_exhausted={missed}"
+        return text
@@ -4,7 +4,9 @@ import random
 from src.core.async_runner import run
 from src.core.browser import close_context, open_context
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
 from src.core.session import ensure_session, get_session_path
+from src.core.wait_engine import WaitEngine
 
 
 async def human_delay(page, min_ms: int = 500, max_ms: int = 2000):
@@ -51,18 +53,13 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
         playwright, browser, context = await open_context(
             headless=headless,
             storage_state_path=session_path,
-            browser_type=browser_type
+            browser_type=browser_type,
+            resource_policy=build_resource_policy("apply", settings),
         )
+        waits = None
         try:
             page = await context.new_page()
-
-            # Navigate with random delay
-            await page.goto(job_url, wait_until="domcontentloaded")
-            await page.wait_for_timeout(random.randint(2000, 4000))
-
-            # Random mouse movements to simulate human behavior
-            await page.mouse.move(random.randint(100, 500), random.randint(100, 500))
-            await page.wait_for_timeout(random.randint(300, 800))
+            waits = WaitEngine(page, "indeed_apply", settings)
 
             # Look for apply button with multiple selectors
             apply_selectors = [
@@ -74,6 +71,15 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                 "#indeedApplyButton"
             ]
 
+            # Navigate, then wait for the apply button rather than a fixed pause
+            await page.goto(job_url, wait_until="domcontentloaded")
+            await waits.for_visible(apply_selectors, "job_page", budget_ms=8000)
+            await waits.pace()
+
+            # Random mouse movements to simulate human behavior
+            await page.mouse.move(random.randint(100, 500), random.randint(100, 500))
+            await waits.pace(300, 800)
+
             apply_button = None
             for selector in apply_selectors:
                 apply_button = await page.query_selector(selector)
@@ -86,7 +92,7 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
 
             # Smooth scroll to button
             await smooth_scroll(page, selector)
-            await page.wait_for_timeout(random.randint(500, 1000))
+            await waits.pace(500, 1000)
 
             try:
                 if not await apply_button.is_visible():
@@ -95,19 +101,20 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
 
                 # Hover before clicking
                 await apply_button.hover()
-                await page.wait_for_timeout(random.randint(200, 500))
+                await waits.pace(200, 500)
                 await apply_button.click()
             except Exception as e:
                 log(f"Indeed apply: Failed to click apply button: {e}")
                 return ("review", 0)
 
-            await page.wait_for_timeout(random.randint(1500, 3000))
+            await waits.for_network_idle("apply_click")
+            await waits.pace()
 
             # Handle resume upload
             file_input = await page.query_selector("input[type='file']")
             if file_input and os.path.exists(resume_path):
                 await file_input.set_input_files(resume_path)
-                await page.wait_for_timeout(random.randint(1000, 2000))
+                await waits.for_network_idle("resume_upload")
                 log(f"Indeed apply: Resume uploaded for {job_url}")
 
             # Look for submit button with multiple selectors
@@ -127,9 +134,9 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
 
             if submit_button:
                 await submit_button.hover()
-                await page.wait_for_timeout(random.randint(300, 700))
+                await waits.pace(300, 700)
                 await submit_button.click()
-                await page.wait_for_timeout(random.randint(2000, 4000))
+                await waits.for_network_idle("submit")
                 log(f"Indeed apply: Application submitted for {job_url}")
                 return ("applied", 1)
 
@@ -139,6 +146,8 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
             log(f"Indeed apply: Error during application: {e}")
             return ("review", 0)
         finally:
+            if waits is not None:
+                log(waits.summary())
             await close_context(playwright, browser, context)
 
     return run(_apply())
@@ -1,9 +1,13 @@
 import os
 from urllib.parse import quote_plus
+from xml.etree import ElementTree
 
 from src.core.async_runner import run
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
 from src.core.session import ensure_session, get_session_path
+from src.core.wait_engine import WaitEngine
+from src.platforms.indeed.rss import fetch_rss_jobs, parse_feed
 
 
 def collect_jobs(settings: dict, profile: dict) -> list:
@@ -16,7 +20,21 @@ def collect_jobs(settings: dict, profile: dict) -> list:
     if not keywords:
         return []
 
+    query = quote_plus(" ".join(keywords))
+    loc = quote_plus(location) if location else ""
+
+    # Try Indeed RSS feed first (bypasses Cloudflare)
+    rss_url = f"https://www.indeed.com/rss?q={query}&l={loc}"
+    url = f"https://www.indeed.com/jobs?q={query}&l={loc}"
+
     log("Indeed: starting collection")
+    if platform_settings.get("rss_http", True):
+        jobs = fetch_rss_jobs(rss_url, max_results, location)
+        if jobs:
+            log(f"Indeed: collected {len(jobs)} jobs from RSS over HTTP")
+            return jobs
+        log("Indeed: RSS over HTTP returned nothing, falling back to browser")
+
     session_path = ensure_session(settings, "indeed", "https://www.indeed.com/account/login")
 
     headless = settings.get("app", {}).get("headless", False)
@@ -27,55 +45,43 @@ def collect_jobs(settings: dict, profile: dict) -> list:
         if not os.path.exists(session_path):
             return []
 
-    query = quote_plus(" ".join(keywords))
-    loc = quote_plus(location) if location else ""
-
-    # Try Indeed RSS feed first (bypasses Cloudflare)
-    rss_url = f"https://www.indeed.com/rss?q={query}&l={loc}"
-    url = f"https://www.indeed.com/jobs?q={query}&l={loc}"
-
     async def _collect():
         from src.core.browser import open_context, close_context
 
         playwright, browser, context = await open_context(
             headless=headless,
             storage_state_path=session_path,
-            browser_type=browser_type
+            browser_type=browser_type,
+            resource_policy=build_resource_policy("collect", settings),
         )
         try:
             page = await context.new_page()
             page.set_default_timeout(30000)
+            waits = WaitEngine(page, "indeed_collect", settings)
 
             # Try RSS feed first (no Cloudflare)
             log(f"Indeed: trying RSS feed first")
-            await page.goto(rss_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(2000)
-
-            page_content = await page.content()
+            response = await page.goto(rss_url, wait_until="domcontentloaded", timeout=30000)
+            body = await response.body() if response else b""
 
             # Check if RSS feed worked (contains XML)
-            if "<rss" in page_content.lower() or "<feed" in page_content.lower():
+            if b"<rss" in body[:2048].lower() or b"<feed" in body[:2048].lower():
                 log(f"Indeed: RSS feed accessible, parsing jobs")
-                # Parse RSS feed for job links
-                items = await page.query_selector_all("item link, entry link")
+                try:
+                    items = parse_feed([body], location)
+                except ElementTree.ParseError as exc:
+                    log(f"Indeed: failed to parse RSS feed: {exc}")
+                    items = []
                 if len(items) > 0:
                     log(f"Indeed: found {len(items)} jobs from RSS feed")
                     jobs = []
                     seen = set()
-                    for item in items[:max_results]:
-                        link_text = await item.text_content()
-                        if link_text and link_text not in seen:
-                            seen.add(link_text)
-                            jobs.append({
-                                "platform": "indeed",
-                                "title": "Indeed job",
-                                "company": "",
-                                "location": location,
-                                "description": "",
-                                "job_url": link_text.strip(),
-                                "posted_at": None,
-                                "posted_text": None,
-                            })
+                    for item in items:
+                        if item["job_url"] not in seen:
+                            seen.add(item["job_url"])
+                            jobs.append(item)
+                        if len(jobs) >= max_results:
+                            break
                     log(f"Indeed: collected {len(jobs)} jobs from RSS")
                     return jobs
 
@@ -83,23 +89,19 @@ def collect_jobs(settings: dict, profile: dict) -> list:
             log(f"Indeed: RSS not available, trying regular page")
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-            # Wait longer for Cloudflare challenge to complete
-            await page.wait_for_timeout(5000)
+            await waits.for_network_idle("search_page")
+
+            async def _challenge_passed() -> bool:
+                title = await page.title()
+                return "Just a moment" not in title and "Cloudflare" not in title
 
             # Check if we're still on Cloudflare challenge page
-            page_title = await page.title()
-            if "Just a moment" in page_title or "Cloudflare" in page_title:
+            if not await _challenge_passed():
                 log(f"Indeed: Cloudflare challenge detected, waiting...")
                 # Wait up to 15 seconds for challenge to complete
-                for i in range(15):
-                    await page.wait_for_timeout(1000)
-                    page_title = await page.title()
-                    if "Just a moment" not in page_title and "Cloudflare" not in page_title:
-                        log(f"Indeed: Cloudflare challenge passed after {i+1} seconds")
-                        break
-
-            # Additional wait after page load
-            await page.wait_for_timeout(2000)
+                if await waits.until(_challenge_passed, "cloudflare_challenge", budget_ms=15000):
+                    log(f"Indeed: Cloudflare challenge passed after {waits.records[-1]['elapsed_ms'] / 1000:.1f} seconds")
+                await waits.for_network_idle("search_results")
 
             # Debug: log page title and URL
             page_title = await page.title()
@@ -0,0 +1,251 @@
+"""
+Indeed RSS Fetcher
+
+Fetches the Indeed RSS search feed with a plain HTTP client instead of a
+browser. Connections are kept alive and reused per host, repeat fetches are
+revalidated with ETag / If-Modified-Since, and feed items are parsed
+incrementally while the body streams in. The collector only launches a
+browser when this path yields nothing.
+"""
+
+import html
+import http.client
+import re
+import threading
+import zlib
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlsplit
+from xml.etree import ElementTree
+
+
+DEFAULT_TIMEOUT_SECONDS = 10
+MAX_REDIRECTS = 3
+
+_CHUNK_SIZE = 16 * 1024
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0"
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _strip_html(text: str) -> str:
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", text or ""))).strip()
+
+
+def _parse_pub_date(value: str) -> str | None:
+    try:
+        return parsedate_to_datetime(value).isoformat() if value else None
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _item_to_job(item: ElementTree.Element, location: str) -> dict:
+    fields = {_local_name(child.tag): (child.text or "").strip() for child in item}
+    raw_title = fields.get("title", "")
+    company = fields.get("source", "")
+    title = raw_title
+    job_location = location
+    # Indeed formats item titles as "Title - Company - Location".
+    parts = [part.strip() for part in raw_title.split(" - ")]
+    if len(parts) >= 3:
+        title, company, job_location = " - ".join(parts[:-2]), company or parts[-2], parts[-1]
+    elif len(parts) == 2 and not company:
+        title, company = parts
+    return {
+        "platform": "indeed",
+        "title": title or "Indeed job",
+        "company": company,
+        "location": job_location,
+        "description": _strip_html(fields.get("description", "")),
+        "job_url": fields.get("link", "") or fields.get("guid", ""),
+        "posted_at": _parse_pub_date(fields.get("pubDate", "")),
+        "posted_text": None,
+    }
+
+
+def parse_feed(chunks, location: str = "") -> list[dict]:
+    """
+    Parse RSS items from an iterable of byte chunks.
+
+    Items are converted and released as soon as their closing tag is seen, so
+    memory stays flat regardless of feed size.
+    """
+    parser = ElementTree.XMLPullParser(events=("end",))
+    jobs = []
+
+    def _drain():
+        for _event, elem in parser.read_events():
+            if _local_name(elem.tag) in ("item", "entry"):
+                job = _item_to_job(elem, location)
+                if job["job_url"]:
+                    jobs.append(job)
+                elem.clear()
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        _drain()
+    parser.close()
+    _drain()
+    return jobs
+
+
+class FeedFetcher:
+    """HTTP feed client with per-host keep-alive connections and conditional GETs."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self.stats = {"requests": 0, "not_modified": 0, "bytes": 0}
+        self._connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+        self._validators: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        key = (scheme, netloc)
+        conn = self._connections.get(key)
+        if conn is None:
+            conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_cls(netloc, timeout=self.timeout)
+            self._connections[key] = conn
+        return conn
+
+    def _drop_connection(self, scheme: str, netloc: str) -> None:
+        conn = self._connections.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def _request(self, url: str, headers: dict) -> tuple[http.client.HTTPResponse, str, str]:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        for attempt in range(2):
+            conn = self._connection(parts.scheme, parts.netloc)
+            try:
+                conn.request("GET", path, headers=headers)
+                return conn.getresponse(), parts.scheme, parts.netloc
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server closed an idle keep-alive connection; reconnect once.
+                self._drop_connection(parts.scheme, parts.netloc)
+                if attempt:
+                    raise
+            except BaseException:
+                # A timeout or protocol error leaves the connection mid-request;
+                # reusing it would fail every later request with CannotSendRequest.
+                self._drop_connection(parts.scheme, parts.netloc)
+                raise
+        raise http.client.HTTPException("unreachable")
+
+    def _stream_body(self, response: http.client.HTTPResponse):
+        decoder = None
+        if (response.getheader("Content-Encoding") or "").lower() == "gzip":
+            decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        while True:
+            chunk = response.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            self.stats["bytes"] += len(chunk)
+            yield decoder.decompress(chunk) if decoder else chunk
+        if decoder:
+            yield decoder.flush()
+
+    def fetch(self, url: str, location: str = "") -> list[dict]:
+        """
+        Fetch and parse a feed, revalidating against the previous response.
+
+        Returns:
+            Parsed job dicts; the cached items when the server answers 304
+
+        Raises:
+            OSError, zlib.error, http.client.HTTPException or
+            ElementTree.ParseError when the feed cannot be fetched, decoded
+            or parsed
+        """
+        with self._lock:
+            cached = self._validators.get(url)
+            headers = {
+                "User-Agent": _USER_AGENT,
+                "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.1",
+                "Accept-Encoding": "gzip",
+                "Connection": "keep-alive",
+            }
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            target = url
+            for _redirect in range(MAX_REDIRECTS + 1):
+                self.stats["requests"] += 1
+                response, scheme, netloc = self._request(target, headers)
+                if response.status in _REDIRECT_STATUSES and response.getheader("Location"):
+                    try:
+                        response.read()
+                    except BaseException:
+                        self._drop_connection(scheme, netloc)
+                        raise
+                    target = urljoin(target, response.getheader("Location"))
+                    continue
+                break
+            try:
+                if response.status == 304 and cached:
+                    response.read()
+                    self.stats["not_modified"] += 1
+                    return list(cached["items"])
+                if response.status != 200:
+                    response.read()
+                    raise http.client.HTTPException(f"feed returned HTTP {response.status}")
+                items = parse_feed(self._stream_body(response), location)
+            except BaseException:
+                self._drop_connection(scheme, netloc)
+                raise
+            finally:
+                if response.will_close:
+                    self._drop_connection(scheme, netloc)
+
+            self._validators[url] = {
+                "etag": response.getheader("ETag"),
+                "last_modified": response.getheader("Last-Modified"),
+                "items": items,
+            }
+            return list(items)
+
+    def close(self) -> None:
+        with self._lock:
+            for key in list(self._connections):
+                self._drop_connection(*key)
+
+
+_FETCHER = FeedFetcher()
+
+
+def fetch_rss_jobs(url: str, max_results: int, location: str = "", fetcher: FeedFetcher | None = None) -> list[dict]:
+    """
+    Collect Indeed jobs from the RSS feed without a browser.
+
+    Returns:
+        Up to max_results de-duplicated jobs, or an empty list on any failure
+        so the caller can fall back to the browser
+    """
+    from src.core.logger import log
+
+    try:
+        items = (fetcher or _FETCHER).fetch(url, location)
+    except (OSError, zlib.error, http.client.HTTPException, ElementTree.ParseError) as exc:
+        log(f"Indeed: RSS HTTP fetch failed: {exc}")
+        return []
+
+    jobs = []
+    seen = set()
+    for job in items:
+        if job["job_url"] in seen:
+            continue
+        seen.add(job["job_url"])
+        jobs.append(job)
+        if len(jobs) >= max_results:
+            break
+    return jobs
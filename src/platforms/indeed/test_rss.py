@@ -0,0 +1,191 @@
+"""
+Tests for the Indeed RSS HTTP fetcher.
+
+Runs against a local stand-in server and validates:
+- Feed items are parsed into job dicts (title, company, pubDate, description)
+- Repeat fetches revalidate with ETag and reuse the cached items on 304
+- One keep-alive connection serves every request
+- Gzip bodies are decoded while streaming
+- A timed-out connection is discarded so later fetches still succeed
+"""
+
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.platforms.indeed.rss import FeedFetcher, fetch_rss_jobs, parse_feed
+
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Indeed jobs</title>
+    <item>
+      <title>SOC Analyst - Acme Security - Bengaluru, Karnataka</title>
+      <link>https://www.indeed.com/viewjob?jk=111</link>
+      <source>Acme Security</source>
+      <pubDate>Mon, 19 Oct 2026 04:00:00 GMT</pubDate>
+      <description>&lt;b&gt;Monitor&lt;/b&gt; Splunk alerts &amp;amp; triage</description>
+    </item>
+    <item>
+      <title>Junior Pentester - Redline - Remote</title>
+      <link>https://www.indeed.com/viewjob?jk=222</link>
+      <pubDate>Sun, 18 Oct 2026 10:30:00 GMT</pubDate>
+      <description>Web application testing</description>
+    </item>
+    <item>
+      <title>Duplicate - Redline - Remote</title>
+      <link>https://www.indeed.com/viewjob?jk=222</link>
+    </item>
+  </channel>
+</rss>
+"""
+ETAG = '"feed-v1"'
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    statuses = []
+    # Faults for upcoming requests: stall at "headers" or "body", or send a
+    # "corrupt" gzip body
+    stalls = []
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        stall = type(self).stalls.pop(0) if type(self).stalls else None
+        if stall == "headers":
+            time.sleep(1.5)
+        if self.headers.get("If-None-Match") == ETAG:
+            type(self).statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = FEED
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", ETAG)
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            if stall == "corrupt":
+                # Valid gzip header followed by an invalid deflate block
+                body = body[:10] + b"\xff" * 40
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if stall == "body":
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            time.sleep(1.5)
+        self.wfile.write(body)
+        type(self).statuses.append(200)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    _FeedHandler.connections = set()
+    _FeedHandler.statuses = []
+    _FeedHandler.stalls = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/rss?q=soc+analyst&l=India"
+
+
+def test_parse_feed_fields():
+    """Feed items become job dicts with the extra RSS fields filled in."""
+    print("\n=== Indeed RSS Parse Test ===\n")
+
+    chunks = [FEED[index:index + 64] for index in range(0, len(FEED), 64)]
+    jobs = parse_feed(chunks, location="India")
+
+    assert len(jobs) == 3
+    first = jobs[0]
+    assert first["title"] == "SOC Analyst"
+    assert first["company"] == "Acme Security"
+    assert first["location"] == "Bengaluru, Karnataka"
+    assert first["description"] == "Monitor Splunk alerts & triage"
+    assert first["posted_at"] == "2026-10-19T04:00:00+00:00"
+    assert jobs[1]["company"] == "Redline"
+    print("✓ Title, company, location, pubDate and description parsed")
+
+
+def test_fetch_conditional_get_and_keep_alive():
+    """The second fetch is a 304 on the same connection and reuses cached items."""
+    print("\n=== Indeed RSS Conditional GET Test ===\n")
+
+    server, url = _serve()
+    fetcher = FeedFetcher(timeout=5)
+    try:
+        first = fetch_rss_jobs(url, max_results=10, location="India", fetcher=fetcher)
+        second = fetch_rss_jobs(url, max_results=10, location="India", fetcher=fetcher)
+    finally:
+        fetcher.close()
+        server.shutdown()
+        server.server_close()
+
+    assert [job["job_url"] for job in first] == [
+        "https://www.indeed.com/viewjob?jk=111",
+        "https://www.indeed.com/viewjob?jk=222",
+    ]
+    assert second == first
+    assert _FeedHandler.statuses == [200, 304]
+    assert fetcher.stats["not_modified"] == 1
+    assert len(_FeedHandler.connections) == 1
+    print(f"✓ {fetcher.stats['requests']} requests, {fetcher.stats['bytes']} bytes, one connection")
+
+
+def test_fetch_failure_returns_empty():
+    """Network failures return an empty list so the browser fallback runs."""
+    print("\n=== Indeed RSS Failure Test ===\n")
+
+    server, url = _serve()
+    server.shutdown()
+    server.server_close()
+
+    fetcher = FeedFetcher(timeout=2)
+    assert fetch_rss_jobs(url, max_results=10, fetcher=fetcher) == []
+    print("✓ Unreachable feed falls back cleanly")
+
+
+def test_timeout_discards_connection():
+    """A timeout before or during the body does not poison later fetches."""
+    print("\n=== Indeed RSS Timeout Test ===\n")
+
+    server, url = _serve()
+    fetcher = FeedFetcher(timeout=0.5)
+    try:
+        for stall in ("headers", "body"):
+            _FeedHandler.stalls = [stall]
+            assert fetch_rss_jobs(url, max_results=10, fetcher=fetcher) == []
+            assert fetcher._connections == {}
+            jobs = fetch_rss_jobs(url, max_results=10, fetcher=fetcher)
+            assert len(jobs) == 2
+            fetcher._validators.clear()
+    finally:
+        fetcher.close()
+        server.shutdown()
+        server.server_close()
+    print("✓ Fetches recover after header and body timeouts")
+
+
+def test_corrupt_gzip_returns_empty():
+    """A corrupt gzip body falls back like any other fetch failure."""
+    print("\n=== Indeed RSS Corrupt Body Test ===\n")
+
+    server, url = _serve()
+    fetcher = FeedFetcher(timeout=2)
+    try:
+        _FeedHandler.stalls = ["corrupt"]
+        assert fetch_rss_jobs(url, max_results=10, fetcher=fetcher) == []
+        assert fetcher._connections == {}
+        assert len(fetch_rss_jobs(url, max_results=10, fetcher=fetcher)) == 2
+    finally:
+        fetcher.close()
+        server.shutdown()
+        server.server_close()
+    print("✓ zlib error returns no jobs and the next fetch succeeds")
@@ -0,0 +1,157 @@
+"""
+Decode LinkedIn job-search API (Voyager) responses into collector job dicts.
+
+The jobs search page loads its result cards as normalized JSON: an
+"included" list of JobPostingCard / JobPosting entities that reference each
+other by URN. These helpers read the card fields the DOM scraper used to pull
+element by element, plus the listed timestamp, applicant count and apply
+method.
+"""
+
+import re
+from datetime import datetime, timezone
+
+from src.platforms.linkedin.url_utils import LINKEDIN_BASE_URL
+
+
+JOBS_API_PATTERNS = (
+    "/voyager/api/voyagerJobsDashJobCards",
+    "/voyager/api/search/dash/clusters",
+    "/voyager/api/jobs/search",
+)
+
+_JOB_ID_RE = re.compile(r"urn:li:[A-Za-z_]*[jJ]obPosting(?:Card)?:\(?(\d+)")
+_APPLICANTS_RE = re.compile(r"([\d,]+)\+?\s+applicants?", re.IGNORECASE)
+
+
+def _job_id(*urns) -> str | None:
+    for urn in urns:
+        match = _JOB_ID_RE.search(urn or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def _text(value) -> str:
+    if isinstance(value, dict):
+        value = value.get("text")
+    return (value or "").strip() if isinstance(value, str) else ""
+
+
+def _epoch_ms_to_iso(value) -> str | None:
+    try:
+        return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc).isoformat()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _applicant_count(*texts) -> int | None:
+    for text in texts:
+        match = _APPLICANTS_RE.search(text or "")
+        if match:
+            return int(match.group(1).replace(",", ""))
+    return None
+
+
+def _job(job_id: str, **fields) -> dict:
+    apply_type = fields.get("apply_type")
+    return {
+        "platform": "linkedin",
+        "title": fields.get("title") or "LinkedIn job",
+        "company": fields.get("company") or "",
+        "location": fields.get("location") or "",
+        "description": "",
+        "job_url": f"{LINKEDIN_BASE_URL}/jobs/view/{job_id}/",
+        "easy_apply": 1 if apply_type == "easy_apply" else 0,
+        "posted_at": fields.get("posted_at"),
+        "posted_text": None,
+        "applicant_count": fields.get("applicant_count"),
+        "apply_type": apply_type,
+    }
+
+
+def _from_card(card: dict) -> tuple[str | None, dict]:
+    job_id = _job_id(card.get("jobPostingUrn"), card.get("entityUrn"), card.get("*jobPosting"))
+    posted_at = None
+    apply_type = None
+    footer_texts = []
+    for item in card.get("footerItems") or []:
+        item_type = (item.get("type") or "").upper()
+        if item_type == "LISTED_DATE" and item.get("timeAt"):
+            posted_at = _epoch_ms_to_iso(item.get("timeAt"))
+        elif item_type == "EASY_APPLY_TEXT":
+            apply_type = "easy_apply"
+        footer_texts.append(_text(item.get("text")))
+    tertiary = _text(card.get("tertiaryDescription"))
+    return job_id, {
+        "title": _text(card.get("jobPostingTitle")) or _text(card.get("title")),
+        "company": _text(card.get("primaryDescription")),
+        "location": _text(card.get("secondaryDescription")),
+        "posted_at": posted_at,
+        "apply_type": apply_type,
+        "applicant_count": _applicant_count(tertiary, *footer_texts),
+    }
+
+
+def _from_posting(posting: dict) -> tuple[str | None, dict]:
+    job_id = _job_id(posting.get("entityUrn"), posting.get("jobPostingUrn"), posting.get("dashEntityUrn"))
+    apply_method = posting.get("applyMethod") or {}
+    method_type = apply_method.get("$type", "") if isinstance(apply_method, dict) else ""
+    apply_type = None
+    if "OnsiteApply" in method_type:
+        apply_type = "easy_apply"
+    elif "OffsiteApply" in method_type:
+        apply_type = "external"
+    company = posting.get("companyDetails")
+    company_name = ""
+    if isinstance(company, dict):
+        nested = company.get("company")
+        company_name = _text(company.get("companyName"))
+        if not company_name and isinstance(nested, dict):
+            company_name = _text(nested.get("name"))
+    applies = posting.get("applies")
+    return job_id, {
+        "title": _text(posting.get("title")),
+        "company": company_name,
+        "location": _text(posting.get("formattedLocation")),
+        "posted_at": _epoch_ms_to_iso(posting.get("listedAt")) if posting.get("listedAt") else None,
+        "apply_type": apply_type,
+        "applicant_count": int(applies) if isinstance(applies, int) else None,
+    }
+
+
+def decode_job_cards(payload) -> list[dict]:
+    """
+    Turn one Voyager jobs-search response into job dicts, in result order.
+
+    Card fields win; JobPosting entities fill in whatever the card left empty.
+    """
+    if not isinstance(payload, dict):
+        return []
+    included = payload.get("included")
+    if included is None and isinstance(payload.get("data"), dict):
+        included = payload["data"].get("included")
+
+    order: list[str] = []
+    fields: dict[str, dict] = {}
+    for entity in included or []:
+        if not isinstance(entity, dict):
+            continue
+        entity_type = entity.get("$type") or ""
+        if "jobPostingTitle" in entity or entity_type.endswith("JobPostingCard"):
+            job_id, values = _from_card(entity)
+        elif entity_type.endswith("JobPosting"):
+            job_id, values = _from_posting(entity)
+        else:
+            continue
+        if not job_id:
+            continue
+        if job_id not in fields:
+            order.append(job_id)
+            fields[job_id] = {}
+        merged = fields[job_id]
+        for key, value in values.items():
+            if value and not merged.get(key):
+                merged[key] = value
+
+    return [_job(job_id, **fields[job_id]) for job_id in order]
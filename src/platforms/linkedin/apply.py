@@ -5,7 +5,9 @@ from src.core.config import load_profile
 from src.core.async_runner import run
 from src.core.browser import close_context, open_context
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
 from src.core.session import ensure_session, get_session_path
+from src.core.wait_engine import WaitEngine
 from src.platforms.linkedin.url_utils import normalize_job_url
 
 
@@ -52,6 +54,20 @@ ERROR_SELECTORS = [
 ]
 LOGIN_GUARDS = ["login", "checkpoint", "challenge", "authwall"]
 
+_MODAL_SIGNATURE_JS = """
+() => {
+    const modal = document.querySelector('div.jobs-easy-apply-modal, div[role="dialog"]');
+    if (!modal) { return ''; }
+    const progress = modal.querySelector('progress, [role="progressbar"]');
+    const heading = modal.querySelector('h3, h2');
+    return [
+        progress ? (progress.value || progress.getAttribute('aria-valuenow') || '') : '',
+        heading ? heading.textContent.trim() : '',
+        modal.querySelectorAll('input, select, textarea').length,
+    ].join('|');
+}
+"""
+
 
 def _debug_artifact_path(base_dir: str, filename: str) -> str:
     data_dir = os.path.join(base_dir, "data")
@@ -93,6 +109,26 @@ async def _has_visible(page, selectors: list[str]) -> bool:
     return await _first_visible_locator(page, selectors) is not None
 
 
+async def _job_page_ready(page) -> bool:
+    current_url = (page.url or "").lower()
+    if any(token in current_url for token in LOGIN_GUARDS):
+        return True
+    return await _has_visible(page, EASY_APPLY_SELECTORS + SUCCESS_SELECTORS)
+
+
+async def _submit_settled(page) -> bool:
+    if await _has_visible(page, SUCCESS_SELECTORS + ERROR_SELECTORS):
+        return True
+    return not await _has_visible(page, MODAL_SELECTORS)
+
+
+async def _modal_signature(page) -> str:
+    try:
+        return await page.evaluate(_MODAL_SIGNATURE_JS)
+    except Exception:
+        return ""
+
+
 async def _upload_resume(page, resume_path: str) -> bool:
     uploaded = False
     file_inputs = page.locator("input[type='file']")
@@ -146,13 +182,17 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
         playwright, browser, context = await open_context(
             headless=headless,
             storage_state_path=session_path,
-            browser_type=browser_type
+            browser_type=browser_type,
+            resource_policy=build_resource_policy("apply", settings),
         )
+        waits = None
         try:
             page = await context.new_page()
             page.set_default_timeout(30000)
+            waits = WaitEngine(page, "linkedin_apply", settings)
             await page.goto(job_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(2500)
+            await waits.until(lambda: _job_page_ready(page), "job_page", budget_ms=8000)
+            await waits.pace()
 
             current_url = (page.url or "").lower()
             if any(token in current_url for token in LOGIN_GUARDS):
@@ -169,7 +209,8 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                 await _save_debug_artifacts(page, base_dir, "linkedin_apply_no_button")
                 return ("review", 0)
 
-            await page.wait_for_timeout(1500)
+            await waits.for_visible(MODAL_SELECTORS, "modal_open", budget_ms=5000)
+            await waits.pace()
             uploaded_resume = False
 
             for step in range(1, 8):
@@ -188,7 +229,7 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                     if await _upload_resume(page, resume_path):
                         uploaded_resume = True
                         log(f"LinkedIn apply: uploaded resume on step {step}.")
-                        await page.wait_for_timeout(1200)
+                        await waits.for_network_idle("resume_upload")
 
                 agent_result = await fill_application_form(
                     page,
@@ -203,16 +244,25 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                         f"step={step} filled={agent_result['filled_count']} "
                         f"prompts={agent_result['filled_prompts']}"
                     )
-                    await page.wait_for_timeout(1200)
+                    await waits.for_network_idle("form_fill", idle_ms=300)
+                    await waits.pace()
 
                 if await _click_first(page, SUBMIT_SELECTORS):
                     log(f"LinkedIn apply: clicked submit on step {step}.")
-                    await page.wait_for_timeout(2200)
+                    await waits.until(lambda: _submit_settled(page), "submit")
                     continue
 
+                signature = await _modal_signature(page)
                 if await _click_first(page, NEXT_SELECTORS):
                     log(f"LinkedIn apply: advanced modal step {step}.")
-                    await page.wait_for_timeout(1800)
+                    await waits.for_change(
+                        lambda: _modal_signature(page),
+                        signature,
+                        "next_step",
+                        budget_ms=6000,
+                        stop=lambda: _has_visible(page, ERROR_SELECTORS),
+                    )
+                    await waits.pace()
                     continue
 
                 if await _has_visible(page, ERROR_SELECTORS):
@@ -242,12 +292,14 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                     return ("review", 1)
 
                 log(f"LinkedIn apply: unresolved modal state on step {step}.")
-                await page.wait_for_timeout(1000)
+                await waits.for_network_idle("unresolved_state")
 
             log("LinkedIn apply: reached step limit without submission.")
             await _save_debug_artifacts(page, base_dir, "linkedin_apply_step_limit")
             return ("review", 1)
         finally:
+            if waits is not None:
+                log(waits.summary())
             await close_context(playwright, browser, context)
 
     return run(_apply())
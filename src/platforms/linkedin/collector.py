@@ -3,10 +3,24 @@ from urllib.parse import quote_plus
 
 from src.core.async_runner import run
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
+from src.core.response_harvester import ResponseHarvester
 from src.core.session import ensure_session, get_session_path
+from src.core.wait_engine import WaitEngine
+from src.platforms.linkedin.api_decoder import JOBS_API_PATTERNS, decode_job_cards
 from src.platforms.linkedin.url_utils import normalize_job_url
 
 
+_SCROLL_RESULTS_JS = """
+() => {
+    const list = document.querySelector(
+        'div.scaffold-layout__list-container, div.jobs-search-results-list, ul.jobs-search__results-list'
+    );
+    if (list) { list.scrollBy(0, list.scrollHeight); } else { window.scrollBy(0, document.body.scrollHeight); }
+}
+"""
+
+
 async def _text_or_empty(el) -> str:
     if not el:
         return ""
@@ -65,6 +79,7 @@ def collect_jobs(settings: dict, profile: dict) -> list:
     max_results = int(search.get("max_results", 10))
     tpr_seconds = int(search.get("tpr_seconds", 0))
     easy_apply_only = bool(search.get("easy_apply_only", False))
+    intercept_api = bool(search.get("intercept_api", True))
 
     if not keywords:
         return []
@@ -101,13 +116,35 @@ def collect_jobs(settings: dict, profile: dict) -> list:
         playwright, browser, context = await open_context(
             headless=headless,
             storage_state_path=session_path,
-            browser_type=browser_type
+            browser_type=browser_type,
+            resource_policy=build_resource_policy("collect", settings),
         )
         try:
             page = await context.new_page()
             page.set_default_timeout(30000)
+            waits = WaitEngine(page, "linkedin_collect", settings)
+            harvester = None
+            if intercept_api:
+                harvester = ResponseHarvester(JOBS_API_PATTERNS, decode_job_cards).attach(page)
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(2000)
+            await waits.for_network_idle("search_page", budget_ms=6000)
+
+            if harvester:
+                jobs = await harvester.collect(
+                    page,
+                    max_results,
+                    scroll_script=_SCROLL_RESULTS_JS,
+                    accept=(lambda job: job.get("easy_apply")) if easy_apply_only else None,
+                )
+                harvester.detach(page)
+                if jobs:
+                    log(
+                        "LinkedIn: collected from search API "
+                        f"responses={harvester.responses} jobs={len(jobs)} "
+                        f"easy_apply={sum(job.get('easy_apply', 0) for job in jobs)}"
+                    )
+                    return jobs
+                log("LinkedIn: no search API data intercepted, scraping job cards")
 
             jobs: list = []
             seen = set()
@@ -205,7 +242,7 @@ def collect_jobs(settings: dict, profile: dict) -> list:
                 else:
                     await page.mouse.wheel(0, 2000)
                     await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(1200)
+                await waits.for_network_idle("scroll", idle_ms=400, budget_ms=3000)
 
             log(
                 "LinkedIn: search summary: "
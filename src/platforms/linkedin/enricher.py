@@ -3,10 +3,21 @@ import os
 from src.core.async_runner import run
 from src.core.browser import close_context, open_context
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
 from src.core.session import ensure_session, get_session_path
+from src.core.wait_engine import WaitEngine
 from src.platforms.linkedin.url_utils import normalize_job_url
 
 
+DESCRIPTION_SELECTORS = [
+    "div.jobs-description__content",
+    "div.jobs-description-content__text",
+    "div.jobs-box__html-content",
+    "section#job-details",
+    "[data-test-job-description]",
+]
+
+
 async def _first_text(page, selectors: list[str]) -> str:
     for sel in selectors:
         el = await page.query_selector(sel)
@@ -36,23 +47,16 @@ def enrich_job(job: dict, settings: dict) -> dict:
         playwright, browser, context = await open_context(
             headless=headless,
             storage_state_path=session_path,
+            resource_policy=build_resource_policy("enrich", settings),
         )
         try:
             page = await context.new_page()
             page.set_default_timeout(30000)
+            waits = WaitEngine(page, "linkedin_enrich", settings)
             await page.goto(job_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(1500)
+            await waits.for_visible(DESCRIPTION_SELECTORS, "job_detail", budget_ms=6000)
 
-            description = await _first_text(
-                page,
-                [
-                    "div.jobs-description__content",
-                    "div.jobs-description-content__text",
-                    "div.jobs-box__html-content",
-                    "section#job-details",
-                    "[data-test-job-description]",
-                ],
-            )
+            description = await _first_text(page, DESCRIPTION_SELECTORS)
 
             company = await _first_text(
                 page,
@@ -0,0 +1,74 @@
+"""
+Decode Naukri search API responses into collector job dicts.
+
+The Naukri results page fetches its listings from /jobapi/v3/search as JSON
+("jobDetails"), which already carries the posting timestamp, description
+snippet, location and apply redirect that the DOM scraper never saw.
+"""
+
+import html
+import re
+from datetime import datetime, timezone
+
+
+JOBS_API_PATTERNS = ("/jobapi/v3/search", "/jobapi/v4/search")
+NAUKRI_BASE_URL = "https://www.naukri.com"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _strip_html(text: str) -> str:
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", text or ""))).strip()
+
+
+def _epoch_ms_to_iso(value) -> str | None:
+    try:
+        return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc).isoformat()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _placeholder(details: dict, kind: str) -> str:
+    for item in details.get("placeholders") or []:
+        if isinstance(item, dict) and item.get("type") == kind:
+            return (item.get("label") or "").strip()
+    return ""
+
+
+def _job_url(details: dict) -> str:
+    url = (details.get("jdURL") or "").strip()
+    if url.startswith("/"):
+        url = f"{NAUKRI_BASE_URL}{url}"
+    return url.split("?", 1)[0]
+
+
+def decode_search_results(payload) -> list[dict]:
+    """Turn one Naukri search response into job dicts, in result order."""
+    if not isinstance(payload, dict):
+        return []
+    jobs = []
+    for details in payload.get("jobDetails") or []:
+        if not isinstance(details, dict):
+            continue
+        job_url = _job_url(details)
+        title = (details.get("title") or "").strip()
+        if not job_url or not title:
+            continue
+        external = details.get("applyRedirectUrl") or details.get("companyApplyUrl")
+        applicants = details.get("applyCount")
+        jobs.append(
+            {
+                "platform": "naukri",
+                "title": title,
+                "company": (details.get("companyName") or "").strip(),
+                "location": _placeholder(details, "location"),
+                "description": _strip_html(details.get("jobDescription") or ""),
+                "job_url": job_url,
+                "posted_at": _epoch_ms_to_iso(details.get("createdDate")) if details.get("createdDate") else None,
+                "posted_text": (details.get("footerPlaceholderLabel") or "").strip() or None,
+                "applicant_count": int(applicants) if isinstance(applicants, int) else None,
+                "apply_type": "external" if external else "naukri",
+            }
+        )
+    return jobs
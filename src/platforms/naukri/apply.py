@@ -5,7 +5,9 @@ from src.core.config import load_profile
 from src.core.async_runner import run
 from src.core.browser import close_context, open_context
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
 from src.core.session import ensure_session, get_session_path
+from src.core.wait_engine import WaitEngine
 
 
 APPLY_BUTTON_SELECTORS = [
@@ -67,12 +69,16 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
         playwright, browser, context = await open_context(
             headless=headless,
             storage_state_path=session_path,
-            browser_type=browser_type
+            browser_type=browser_type,
+            resource_policy=build_resource_policy("apply", settings),
         )
+        waits = None
         try:
             page = await context.new_page()
+            waits = WaitEngine(page, "naukri_apply", settings)
             await page.goto(job_url, wait_until="domcontentloaded")
-            await page.wait_for_timeout(2000)
+            await waits.for_visible(APPLY_BUTTON_SELECTORS + SUCCESS_SELECTORS, "job_page", budget_ms=8000)
+            await waits.pace()
 
             apply_button = await _first_visible(page, APPLY_BUTTON_SELECTORS)
             if not apply_button:
@@ -82,7 +88,8 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                 await apply_button.click()
             except Exception:
                 return ("review", 0)
-            await page.wait_for_timeout(1500)
+            await waits.for_visible(FORM_SCOPES + SUCCESS_SELECTORS, "apply_click", budget_ms=6000)
+            await waits.pace()
 
             easy_apply = 1
             for step in range(1, 7):
@@ -91,7 +98,7 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                     try:
                         await file_input.set_input_files(resume_path)
                         log(f"Naukri apply: uploaded resume on step {step}.")
-                        await page.wait_for_timeout(1000)
+                        await waits.for_network_idle("resume_upload")
                     except Exception:
                         pass
 
@@ -108,13 +115,14 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
                         f"step={step} filled={agent_result['filled_count']} "
                         f"prompts={agent_result['filled_prompts']}"
                     )
-                    await page.wait_for_timeout(1000)
+                    await waits.for_network_idle("form_fill", idle_ms=300)
+                    await waits.pace()
 
                 submit_button = await _first_visible(page, SUBMIT_BUTTON_SELECTORS)
                 if submit_button:
                     try:
                         await submit_button.click()
-                        await page.wait_for_timeout(1500)
+                        await waits.for_network_idle("submit")
                     except Exception:
                         pass
 
@@ -130,6 +138,8 @@ def apply(job: dict, resume_path: str, settings: dict) -> tuple[str, int] | None
 
             return ("review", easy_apply)
         finally:
+            if waits is not None:
+                log(waits.summary())
             await close_context(playwright, browser, context)
 
     return run(_apply())
@@ -3,7 +3,11 @@ from urllib.parse import quote_plus
 
 from src.core.async_runner import run
 from src.core.logger import log
+from src.core.resource_policy import build_resource_policy
+from src.core.response_harvester import ResponseHarvester
 from src.core.session import ensure_session, get_session_path
+from src.core.wait_engine import WaitEngine
+from src.platforms.naukri.api_decoder import JOBS_API_PATTERNS, decode_search_results
 
 
 async def _text_or_empty(el) -> str:
@@ -24,6 +28,7 @@ def collect_jobs(settings: dict, profile: dict) -> list:
     keywords = search.get("keywords", [])
     location = search.get("location", "")
     max_results = int(search.get("max_results", 10))
+    intercept_api = bool(search.get("intercept_api", True))
 
     if not keywords:
         return []
@@ -48,15 +53,30 @@ def collect_jobs(settings: dict, profile: dict) -> list:
         playwright, browser, context = await open_context(
             headless=headless,
             storage_state_path=session_path,
+            resource_policy=build_resource_policy("collect", settings),
         )
         try:
             page = await context.new_page()
             page.set_default_timeout(30000)
+            waits = WaitEngine(page, "naukri_collect", settings)
+            harvester = None
+            if intercept_api:
+                harvester = ResponseHarvester(JOBS_API_PATTERNS, decode_search_results).attach(page)
             await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(3000)
+            await waits.for_network_idle("search_page", budget_ms=8000)
+
+            if harvester:
+                # Naukri paginates by page rather than on scroll, so one
+                # search response is all this page load will produce.
+                jobs = await harvester.collect(page, max_results)
+                harvester.detach(page)
+                if jobs:
+                    log(f"Naukri: collected from search API responses={harvester.responses} jobs={len(jobs)}")
+                    return jobs
+                log("Naukri: no search API data intercepted, scraping job cards")
 
             await page.mouse.wheel(0, 2000)
-            await page.wait_for_timeout(2000)
+            await waits.for_network_idle("scroll", idle_ms=400, budget_ms=3000)
 
             # Try multiple selector patterns for job cards
             items = await page.query_selector_all("article.jobTuple, div.jobTuple, div[class*='jobTuple'], article[class*='job'], div.srp-jobtuple-wrapper")